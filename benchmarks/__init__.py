@@ -0,0 +1,8 @@
+"""Performance benchmarks for ProtonFetcher.
+
+These are not part of the test suite. Run them from the repository root
+with ``src`` on the import path, e.g.::
+
+    PYTHONPATH=src python -m benchmarks.bench_fetch
+    python -m benchmarks.compare benchmarks/results/OLD.json benchmarks/results/NEW.json
+"""
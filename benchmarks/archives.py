@@ -0,0 +1,193 @@
+"""Deterministic Proton-like release archives for benchmarking.
+
+A generated archive has the shape of a real Proton build: a top-level
+directory named after the asset, launcher scripts and VDF manifests,
+Wine PE and Unix libraries of a few KiB to several MiB, and thousands of
+small prefix and font files, plus a few symlinks. File contents mix seeded
+random bytes with repetitive runs, so the archive compresses at roughly
+the ratio of a real build and decompression cost is realistic.
+
+Archives are cached by their parameters, so a benchmark run only pays the
+(slow, especially for xz) generation once.
+"""
+
+import io
+import math
+import random
+import tarfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from protonfetcher.common import ForkName
+from protonfetcher.utils import get_proton_asset_name
+
+MIB = 1024 * 1024
+
+# Fraction of the bytes in small (prefix, font, locale) files
+_SMALL_FILE_SHARE = 0.05
+_SMALL_FILE_SIZES = (512, 16 * 1024)
+_LIBRARY_SIZES = (8 * 1024, 8 * MIB)
+_LIBRARY_DIRS = (
+    "files/lib/wine/x86_64-windows",
+    "files/lib/wine/i386-windows",
+    "files/lib/wine/x86_64-unix",
+    "files/lib/wine/i386-unix",
+    "files/lib/wine/dxvk",
+    "files/lib/wine/vkd3d-proton",
+)
+_SMALL_DIRS = (
+    "files/share/default_pfx/drive_c/windows/system32",
+    "files/share/default_pfx/drive_c/windows/Fonts",
+    "files/share/wine/fonts",
+    "files/share/wine/nls",
+    "files/share/locale",
+)
+_TOP_LEVEL = {
+    "compatibilitytool.vdf": 512,
+    "toolmanifest.vdf": 256,
+    "version": 32,
+    "user_settings.sample.py": 4 * 1024,
+    "proton": 80 * 1024,
+    "LICENSE": 60 * 1024,
+}
+
+# Tags used for generated releases; high build numbers sort above real ones
+BENCH_TAGS: dict[ForkName, str] = {
+    ForkName.GE_PROTON: "GE-Proton10-99",
+    ForkName.PROTON_EM: "EM-10.0-99",
+}
+
+
+@dataclass(frozen=True)
+class ArchiveSpec:
+    """Parameters of a generated release archive.
+
+    Attributes:
+        fork: Fork whose tag and asset naming (and so compression) to use
+        size_mb: Approximate uncompressed size in MiB
+        seed: Seed for file sizes and contents
+        compressibility: Share of each file made of repetitive runs (0-1)
+    """
+
+    fork: ForkName = ForkName.GE_PROTON
+    size_mb: int = 256
+    seed: int = 0
+    compressibility: float = 0.6
+
+    @property
+    def tag(self) -> str:
+        return BENCH_TAGS[self.fork]
+
+    @property
+    def asset_name(self) -> str:
+        return get_proton_asset_name(self.tag, self.fork)
+
+    @property
+    def root_name(self) -> str:
+        name = self.asset_name
+        for suffix in (".tar.gz", ".tar.xz"):
+            name = name.removesuffix(suffix)
+        return name
+
+    @property
+    def cache_key(self) -> str:
+        return (
+            f"{self.root_name}-{self.size_mb}m-s{self.seed}"
+            f"-c{int(self.compressibility * 100)}"
+        )
+
+
+def _content(rng: random.Random, size: int, compressibility: float) -> bytes:
+    """Return size bytes: random blocks interleaved with repetitive runs."""
+    out = bytearray()
+    block = 4096
+    while len(out) < size:
+        n = min(block, size - len(out))
+        if rng.random() < compressibility:
+            out += bytes([rng.randrange(256)]) * (n // 2) + b"\x00" * (n - n // 2)
+        else:
+            out += rng.randbytes(n)
+    return bytes(out)
+
+
+def _log_uniform(rng: random.Random, low: int, high: int) -> int:
+    return int(math.exp(rng.uniform(math.log(low), math.log(high))))
+
+
+def _file_plan(spec: ArchiveSpec, rng: random.Random) -> list[tuple[str, int]]:
+    """Choose relative paths and sizes adding up to about spec.size_mb."""
+    total = spec.size_mb * MIB
+    plan = list(_TOP_LEVEL.items())
+    budget = total - sum(size for _, size in plan)
+
+    small_budget = int(budget * _SMALL_FILE_SHARE)
+    index = 0
+    while small_budget > 0:
+        size = min(_log_uniform(rng, *_SMALL_FILE_SIZES), small_budget)
+        directory = _SMALL_DIRS[index % len(_SMALL_DIRS)]
+        plan.append((f"{directory}/f{index:05d}.dat", size))
+        small_budget -= size
+        index += 1
+
+    large_budget = budget - int(budget * _SMALL_FILE_SHARE)
+    index = 0
+    while large_budget > 0:
+        size = min(_log_uniform(rng, *_LIBRARY_SIZES), large_budget)
+        directory = _LIBRARY_DIRS[index % len(_LIBRARY_DIRS)]
+        suffix = ".so" if directory.endswith("-unix") else ".dll"
+        plan.append((f"{directory}/lib{index:04d}{suffix}", size))
+        large_budget -= size
+        index += 1
+    return plan
+
+
+def _add_directories(tar: tarfile.TarFile, root: str, paths: list[str]) -> None:
+    seen: set[str] = set()
+    for path in paths:
+        parts = path.split("/")[:-1]
+        for depth in range(len(parts) + 1):
+            directory = "/".join([root, *parts[:depth]])
+            if directory not in seen:
+                seen.add(directory)
+                info = tarfile.TarInfo(directory)
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                tar.addfile(info)
+
+
+def write_archive(spec: ArchiveSpec, path: Path) -> Path:
+    """Generate the archive described by spec at path."""
+    rng = random.Random(spec.seed)
+    plan = _file_plan(spec, rng)
+    mode = "w:xz" if spec.asset_name.endswith(".tar.xz") else "w:gz"
+    root = spec.root_name
+
+    tmp = path.with_name(path.name + ".tmp")
+    with tarfile.open(tmp, mode) as tar:  # type: ignore[call-overload]
+        _add_directories(tar, root, [p for p, _ in plan])
+        for relative, size in plan:
+            info = tarfile.TarInfo(f"{root}/{relative}")
+            info.size = size
+            info.mode = 0o755 if relative == "proton" else 0o644
+            info.mtime = 1_700_000_000
+            tar.addfile(info, io.BytesIO(_content(rng, size, spec.compressibility)))
+        for name, target in (("dist", "files"), ("files/lib64", "lib")):
+            info = tarfile.TarInfo(f"{root}/{name}")
+            info.type = tarfile.SYMTYPE
+            info.linkname = target
+            tar.addfile(info)
+    tmp.replace(path)
+    return path
+
+
+def build_archive(spec: ArchiveSpec, cache_dir: Path) -> Path:
+    """Return a cached archive for spec, generating it on first use.
+
+    The file is named like the real release asset, inside a per-spec
+    directory of cache_dir.
+    """
+    path = cache_dir / spec.cache_key / spec.asset_name
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_archive(spec, path)
+    return path
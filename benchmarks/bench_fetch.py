@@ -0,0 +1,299 @@
+"""End-to-end ``fetch_and_extract`` benchmark against a local release server.
+
+Run from the repository root::
+
+    PYTHONPATH=src python -m benchmarks.bench_fetch --size-mb 256 \\
+        --forks GE-Proton,Proton-EM --backends curl,http --repeat 3
+
+Every combination of fork (GE-Proton gives a ``.tar.gz``, Proton-EM a
+``.tar.xz``), network backend, decompressor, connection count and
+download mode is run ``--repeat`` times from a cold state: fresh download
+and extract directories and an empty metadata cache. Each run records the
+wall time of the whole fetch and of its phases (release resolution, asset
+lookup, size check, download, extraction, linking) together with the
+requests the server answered. Results are written as JSON, by default to
+``benchmarks/results/fetch-<timestamp>-<commit>.json``; compare two result files
+with ``python -m benchmarks.compare``.
+"""
+
+import argparse
+import functools
+import logging
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from protonfetcher.common import FORKS, ForkName
+from protonfetcher.github_fetcher import GitHubReleaseFetcher
+from protonfetcher.network import NETWORK_BACKENDS, create_network_client
+from protonfetcher.platform_adapters import GitHubPlatformAdapter
+
+from .archives import ArchiveSpec, build_archive
+from .fake_server import FakeRelease, FakeReleaseServer, write_sha512sum
+from .report import write_report
+
+DEFAULT_ARCHIVE_CACHE = Path(tempfile.gettempdir()) / "protonfetcher-bench-archives"
+
+# (component attribute, method) -> phase name
+PHASES: dict[tuple[str, str], str] = {
+    ("release_manager", "resolve_release"): "resolve_release",
+    ("release_manager", "fetch_latest_tag"): "resolve_tag",
+    ("release_manager", "find_asset_by_name"): "find_asset",
+    ("release_manager", "get_remote_asset_size"): "asset_size",
+    ("asset_downloader", "fetch_published_checksum"): "checksum_lookup",
+    ("asset_downloader", "download_asset"): "download",
+    ("archive_extractor", "extract_archive"): "extract",
+    ("archive_extractor", "extract_stream"): "stream",
+    ("link_manager", "manage_proton_links"): "link",
+}
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """One point of the benchmark matrix."""
+
+    fork: str
+    backend: str
+    decompressor: str
+    connections: int
+    stream: bool
+
+    @property
+    def label(self) -> str:
+        mode = "stream" if self.stream else f"{self.connections}conn"
+        return f"{self.fork}/{self.backend}/{self.decompressor}/{mode}"
+
+
+@dataclass
+class RunResult:
+    """Timings and request counts of a single cold fetch."""
+
+    config: str
+    run: int
+    total: float
+    archive_bytes: int
+    phases: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+    requests: dict[str, int] = field(default_factory=dict)
+    bytes_served: int = 0
+
+
+class PhaseTimer:
+    """Times selected methods of a fetcher's components.
+
+    The methods are replaced on the component instances only, so the
+    fetcher runs its normal code path.
+    """
+
+    def __init__(self, fetcher: GitHubReleaseFetcher) -> None:
+        self.elapsed: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+        for (component, method), phase in PHASES.items():
+            target = getattr(fetcher, component)
+            original = getattr(target, method, None)
+            if original is not None:
+                setattr(target, method, self._wrap(phase, original))
+
+    def _wrap(self, phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            began = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.elapsed[phase] += time.perf_counter() - began
+                self.calls[phase] += 1
+
+        return timed
+
+
+def _point_at_server(fetcher: GitHubReleaseFetcher, server: FakeReleaseServer) -> None:
+    adapter = GitHubPlatformAdapter()
+    adapter.api_base = server.api_base
+    adapter.host_base = server.origin
+    fetcher.release_manager.platform_adapter = adapter
+
+
+def run_once(
+    config: BenchConfig,
+    server: FakeReleaseServer,
+    archive: Path,
+    run: int,
+    extract_threads: Optional[int] = None,
+) -> RunResult:
+    """Fetch the served release once into fresh directories."""
+    fork = ForkName(config.fork)
+    with tempfile.TemporaryDirectory(prefix="protonfetcher-bench-") as tmp:
+        root = Path(tmp)
+        output_dir, extract_dir = root / "downloads", root / "compatibilitytools.d"
+        output_dir.mkdir()
+        extract_dir.mkdir()
+        # The metadata cache location is read when the fetcher is created
+        previous_cache = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = str(root / "cache")
+        try:
+            options: dict[str, Any] = {
+                "download_connections": config.connections,
+                "decompressor": config.decompressor,
+            }
+            if extract_threads is not None:
+                options["extract_threads"] = extract_threads
+            fetcher = GitHubReleaseFetcher(
+                network_client=create_network_client(config.backend), **options
+            )
+            _point_at_server(fetcher, server)
+            timer = PhaseTimer(fetcher)
+            server.reset_counters()
+
+            began = time.perf_counter()
+            fetcher.fetch_and_extract(
+                FORKS[fork].repo,
+                output_dir,
+                extract_dir,
+                fork=fork,
+                show_progress=False,
+                show_file_details=False,
+                stream=config.stream,
+            )
+            total = time.perf_counter() - began
+        finally:
+            if previous_cache is None:
+                os.environ.pop("XDG_CACHE_HOME", None)
+            else:
+                os.environ["XDG_CACHE_HOME"] = previous_cache
+
+    return RunResult(
+        config=config.label,
+        run=run,
+        total=total,
+        archive_bytes=archive.stat().st_size,
+        phases=dict(timer.elapsed),
+        calls=dict(timer.calls),
+        requests=dict(server.requests),
+        bytes_served=server.bytes_sent,
+    )
+
+
+def summarize(results: list[RunResult]) -> list[dict[str, Any]]:
+    """Median total and per-phase times for each configuration."""
+    by_config: dict[str, list[RunResult]] = defaultdict(list)
+    for result in results:
+        by_config[result.config].append(result)
+
+    summary = []
+    for config, runs in by_config.items():
+        phases = sorted({phase for run in runs for phase in run.phases})
+        total = statistics.median(run.total for run in runs)
+        download = statistics.median(run.phases.get("download", 0.0) for run in runs)
+        summary.append(
+            {
+                "config": config,
+                "runs": len(runs),
+                "median_total": total,
+                "min_total": min(run.total for run in runs),
+                "phases": {
+                    phase: statistics.median(run.phases.get(phase, 0.0) for run in runs)
+                    for phase in phases
+                },
+                "download_bytes_per_s": (
+                    runs[0].archive_bytes / download if download else None
+                ),
+            }
+        )
+    return summary
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_fetch",
+        description="Time fetch_and_extract end to end against a local release server",
+    )
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--forks",
+        type=_csv,
+        default=[ForkName.GE_PROTON.value, ForkName.PROTON_EM.value],
+        help="GE-Proton serves a .tar.gz, Proton-EM a .tar.xz",
+    )
+    parser.add_argument("--backends", type=_csv, default=list(NETWORK_BACKENDS))
+    parser.add_argument("--decompressors", type=_csv, default=["auto"])
+    parser.add_argument(
+        "--connections", type=lambda v: [int(c) for c in _csv(v)], default=[1]
+    )
+    parser.add_argument(
+        "--stream", action="store_true", help="Also benchmark streaming extraction"
+    )
+    parser.add_argument("--extract-threads", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        default=None,
+        help="Per-connection bandwidth limit in MiB/s (default: unlimited)",
+    )
+    parser.add_argument("--archive-cache", type=Path, default=DEFAULT_ARCHIVE_CACHE)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    releases, archives = [], {}
+    for fork_name in args.forks:
+        spec = ArchiveSpec(ForkName(fork_name), args.size_mb, args.seed)
+        print(f"Preparing {spec.asset_name} ({args.size_mb} MiB)...", flush=True)
+        archive = build_archive(spec, args.archive_cache)
+        assets = {spec.asset_name: archive}
+        if spec.fork == ForkName.GE_PROTON:
+            checksum = write_sha512sum(archive)
+            assets[checksum.name] = checksum
+        releases.append(FakeRelease(FORKS[spec.fork].repo, spec.tag, assets))
+        archives[fork_name] = archive
+
+    configs = [
+        BenchConfig(fork, backend, decompressor, connections, stream)
+        for fork in args.forks
+        for backend in args.backends
+        for decompressor in args.decompressors
+        for connections in args.connections
+        for stream in ([False, True] if args.stream else [False])
+        if not (stream and connections > 1)
+    ]
+
+    bandwidth = args.bandwidth_mbps * 1024 * 1024 if args.bandwidth_mbps else None
+    results: list[RunResult] = []
+    with FakeReleaseServer(releases, args.latency_ms / 1000, bandwidth) as server:
+        for config in configs:
+            for run in range(args.repeat):
+                result = run_once(
+                    config, server, archives[config.fork], run, args.extract_threads
+                )
+                results.append(result)
+                print(f"{config.label:<40} run {run + 1}: {result.total:7.2f}s")
+
+    output = write_report(
+        "fetch",
+        args,
+        summarize(results),
+        [asdict(result) for result in results],
+        args.output,
+    )
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,243 @@
+"""Scale benchmark for link management, version discovery and pruning.
+
+Run from the repository root::
+
+    PYTHONPATH=src python -m benchmarks.bench_links --entries 10000 --repeat 3
+
+A ``compatibilitytools.d`` with ``--entries`` entries is built in a
+``MemoryFileSystem``: releases of every fork (some installed under both
+naming conventions), unrelated tools, stray files and the managed links.
+The ``--ls``, ``--relink`` and ``--prune`` code paths then run against it
+through the normal fetcher objects, and each scenario reports its wall
+time and the system calls the real filesystem client would have made.
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from protonfetcher.common import FORKS, ForkName
+from protonfetcher.github_fetcher import GitHubReleaseFetcher
+from protonfetcher.version_finder import invalidate_directory_index
+
+from .memfs import MemoryFileSystem
+from .report import write_report
+
+EXTRACT_DIR = Path("/home/user/.steam/steam/compatibilitytools.d")
+
+# Share of the entries given to each fork; the rest are unrelated
+_FORK_SHARE: dict[ForkName, float] = {
+    ForkName.GE_PROTON: 0.40,
+    ForkName.PROTON_EM: 0.20,
+    ForkName.CACHYOS: 0.15,
+    ForkName.DW_PROTON: 0.15,
+}
+
+
+def _release_dir_names(fork: ForkName, count: int, rng: random.Random) -> list[str]:
+    """Directory names of count distinct releases of a fork."""
+    names = []
+    for i in range(count):
+        major, build = 7 + i % 4, i // 4 + 1
+        if fork == ForkName.GE_PROTON:
+            names.append(f"GE-Proton{major}-{build}")
+        elif fork == ForkName.PROTON_EM:
+            # A few builds are installed under both names
+            names.append(f"proton-EM-{major}.0-{build}")
+            if rng.random() < 0.05:
+                names.append(f"EM-{major}.0-{build}")
+        elif fork == ForkName.CACHYOS:
+            names.append(f"proton-cachyos-{major}.0-{20240000 + build}-slr-x86_64")
+        else:
+            names.append(f"dwproton-{major}.0-{build}-x86_64")
+    return names
+
+
+def build_layout(
+    fs: MemoryFileSystem, extract_dir: Path, entries: int, seed: int = 0
+) -> int:
+    """Populate extract_dir with about entries top-level entries.
+
+    Returns:
+        Number of release directories created
+    """
+    rng = random.Random(seed)
+    fs.mkdir(extract_dir, parents=True)
+    releases = 0
+    for fork, share in _FORK_SHARE.items():
+        names = _release_dir_names(fork, int(entries * share), rng)
+        for name in names:
+            release = extract_dir / name
+            fs.mkdir(release / "files" / "lib", parents=True)
+            fs.write(release / "proton", b"#!/usr/bin/env python3\n")
+            fs.write(release / "version", name.encode())
+            releases += 1
+        # Links to two random builds, so relinking has work to do, and a
+        # dangling fallback link
+        links = FORKS[fork].link_names
+        for link, name in zip(links, rng.sample(names, 2)):
+            fs.symlink_to(extract_dir / link, Path(name))
+        fs.symlink_to(extract_dir / links[2], Path(f"{names[0]}-removed"))
+
+    for i in range(entries - releases - 3 * len(_FORK_SHARE)):
+        if i % 2:
+            fs.mkdir(extract_dir / f"SomeTool-{i}")
+        else:
+            fs.write(extract_dir / f"notes-{i}.txt", b"")
+    # A settled directory, as on a real system between runs
+    fs.backdate(3600)
+    return releases
+
+
+@dataclass
+class ScenarioResult:
+    """Wall time and system calls of one scenario run."""
+
+    config: str
+    run: int
+    total: float
+    ops: dict[str, int] = field(default_factory=dict)
+
+
+def _fetcher(fs: MemoryFileSystem) -> GitHubReleaseFetcher:
+    return GitHubReleaseFetcher(file_system_client=fs)
+
+
+def _ls(fetcher: GitHubReleaseFetcher, extract_dir: Path) -> None:
+    fetcher.link_manager.snapshot_links(extract_dir)
+
+
+def _relink(fetcher: GitHubReleaseFetcher, extract_dir: Path) -> None:
+    for fork in FORKS:
+        fetcher.relink_fork(extract_dir, fork)
+
+
+def _link_new(fetcher: GitHubReleaseFetcher, extract_dir: Path) -> None:
+    # What runs after a fresh extraction: link the newest build of each fork
+    for fork in FORKS:
+        candidates = fetcher.link_manager.find_version_candidates(extract_dir, fork)
+        newest = max(candidates, key=lambda c: c[0])[1]
+        fetcher.link_manager.manage_proton_links(extract_dir, newest.name, fork)
+
+
+def _prune(dry_run: bool, keep: int) -> Callable[[GitHubReleaseFetcher, Path], None]:
+    def run(fetcher: GitHubReleaseFetcher, extract_dir: Path) -> None:
+        for fork in FORKS:
+            fetcher.prune_releases(extract_dir, fork, keep=keep, dry_run=dry_run)
+
+    return run
+
+
+# name -> (action, whether the directory index starts warm)
+SCENARIOS: dict[str, tuple[Callable[[GitHubReleaseFetcher, Path], None], bool]] = {
+    "ls-cold": (_ls, False),
+    "ls-warm": (_ls, True),
+    "relink": (_relink, False),
+    "link-new": (_link_new, False),
+    "prune-dry-run": (_prune(True, 3), False),
+    "prune": (_prune(False, 3), False),
+}
+
+
+def run_scenario(name: str, entries: int, run: int, seed: int = 0) -> ScenarioResult:
+    """Run one scenario against a freshly built layout."""
+    action, warm = SCENARIOS[name]
+    fs = MemoryFileSystem()
+    build_layout(fs, EXTRACT_DIR, entries, seed)
+    fetcher = _fetcher(fs)
+    invalidate_directory_index()
+    if warm:
+        _ls(fetcher, EXTRACT_DIR)
+    fs.reset_counts()
+
+    began = time.perf_counter()
+    action(fetcher, EXTRACT_DIR)
+    total = time.perf_counter() - began
+    return ScenarioResult(f"{name}/{entries}", run, total, dict(fs.ops))
+
+
+def summarize(results: list[ScenarioResult]) -> list[dict[str, Any]]:
+    """Median wall time and system calls for each scenario."""
+    by_config: dict[str, list[ScenarioResult]] = {}
+    for result in results:
+        by_config.setdefault(result.config, []).append(result)
+    summary = []
+    for config, runs in by_config.items():
+        ops = sorted({op for run in runs for op in run.ops})
+        summary.append(
+            {
+                "config": config,
+                "runs": len(runs),
+                "median_total": statistics.median(run.total for run in runs),
+                "min_total": min(run.total for run in runs),
+                "phases": {},
+                "ops": {
+                    op: int(statistics.median(run.ops.get(op, 0) for run in runs))
+                    for op in ops
+                },
+            }
+        )
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_links",
+        description="Time --ls, --relink and --prune logic on a large in-memory layout",
+    )
+    parser.add_argument(
+        "--entries",
+        type=lambda v: [int(n) for n in v.split(",")],
+        default=[10_000],
+        help="Comma-separated layout sizes (default: 10000)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda v: v.split(","),
+        default=list(SCENARIOS),
+        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results: list[ScenarioResult] = []
+    for entries in args.entries:
+        for name in args.scenarios:
+            for run in range(args.repeat):
+                results.append(run_scenario(name, entries, run, args.seed))
+
+    summary = summarize(results)
+    print(f"{'scenario':<24} {'median':>10} {'syscalls':>9}  top calls")
+    for entry in summary:
+        ops = entry["ops"]
+        top = ", ".join(
+            f"{op}={count}"
+            for op, count in sorted(ops.items(), key=lambda item: -item[1])[:4]
+        )
+        print(
+            f"{entry['config']:<24} {entry['median_total'] * 1000:8.1f}ms "
+            f"{sum(ops.values()):>9}  {top}"
+        )
+
+    output = write_report(
+        "links", args, summary, [asdict(result) for result in results], args.output
+    )
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
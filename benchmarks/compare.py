@@ -0,0 +1,85 @@
+"""Compare two benchmark result files.
+
+Usage::
+
+    python -m benchmarks.compare BASE.json NEW.json [--fail-above PCT]
+
+Prints the median total and per-phase times of every configuration found
+in both files with the relative change, followed by system call counts
+where the benchmark records them (``ops:<call>`` rows). With
+``--fail-above``, exits with status 1 when any total got slower, or any
+call count grew, by more than PCT percent.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+
+def _load(path: Path) -> dict[str, Any]:
+    report = json.loads(path.read_text())
+    return {entry["config"]: entry for entry in report.get("summary", [])}
+
+
+def _change(base: float, new: float) -> float:
+    return (new - base) / base * 100 if base else 0.0
+
+
+def compare(
+    base: dict[str, Any], new: dict[str, Any]
+) -> list[tuple[str, str, float, float]]:
+    """Return (config, metric, base value, new value) rows.
+
+    Values are seconds, except for ``ops:`` metrics, which are call counts.
+    """
+    rows = []
+    for config in sorted(base.keys() & new.keys()):
+        b, n = base[config], new[config]
+        rows.append((config, "total", b["median_total"], n["median_total"]))
+        for phase in sorted(b["phases"].keys() | n["phases"].keys()):
+            rows.append(
+                (
+                    config,
+                    phase,
+                    b["phases"].get(phase, 0.0),
+                    n["phases"].get(phase, 0.0),
+                )
+            )
+        base_ops, new_ops = b.get("ops", {}), n.get("ops", {})
+        for op in sorted(base_ops.keys() | new_ops.keys()):
+            rows.append((config, f"ops:{op}", base_ops.get(op, 0), new_ops.get(op, 0)))
+    return rows
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--fail-above", type=float, default=None, metavar="PCT")
+    args = parser.parse_args(argv)
+
+    rows = compare(_load(args.base), _load(args.new))
+    if not rows:
+        print("No configurations in common")
+        return 1
+
+    regressed = False
+    print(f"{'configuration':<40} {'metric':<16} {'base':>9} {'new':>9} {'change':>8}")
+    for config, metric, base, new in rows:
+        change = _change(base, new)
+        if metric.startswith("ops:"):
+            print(f"{config:<40} {metric:<16} {base:9d} {new:9d} {change:+7.1f}%")
+        else:
+            print(f"{config:<40} {metric:<16} {base:8.3f}s {new:8.3f}s {change:+7.1f}%")
+        if (
+            (metric == "total" or metric.startswith("ops:"))
+            and args.fail_above is not None
+            and change > args.fail_above
+        ):
+            regressed = True
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,333 @@
+"""Local stand-in for the GitHub/Forgejo release endpoints ProtonFetcher uses.
+
+One threaded HTTP/1.1 server plays both the API host and the download host:
+
+- ``HEAD/GET /{owner}/{repo}/releases/latest`` redirects to
+  ``/{owner}/{repo}/releases/tag/{tag}``, which returns a small HTML page
+  naming the assets (the HTML fallback)
+- ``GET /api/repos/{owner}/{repo}/releases[/latest|/tags/{tag}]`` returns
+  release JSON with asset names, sizes and download URLs
+- ``/{owner}/{repo}/releases/download/{tag}/{name}`` redirects to
+  ``/objects/{tag}/{name}`` like GitHub's CDN hand-off; objects answer
+  ``HEAD``, ``GET`` and single ``Range`` requests with an ETag
+
+Every response is delayed by ``latency`` seconds, and bodies are paced to
+``bandwidth`` bytes per second per connection. Requests are counted by
+endpoint and status.
+"""
+
+import hashlib
+import html
+import json
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import unquote
+
+_CHUNK_SIZE = 64 * 1024
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass
+class FakeRelease:
+    """A release served by the fake server."""
+
+    repo: str
+    tag: str
+    assets: dict[str, Path] = field(default_factory=dict)
+
+
+class FakeReleaseServer:
+    """Threaded release server; use as a context manager.
+
+    Args:
+        releases: Releases to serve; the last one per repo is "latest"
+        latency: Delay before every response, in seconds
+        bandwidth: Per-connection body rate limit in bytes/s (None: unlimited)
+        redirect_downloads: Whether download URLs redirect to /objects/
+    """
+
+    def __init__(
+        self,
+        releases: list[FakeRelease],
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        redirect_downloads: bool = True,
+    ) -> None:
+        self.releases = releases
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.redirect_downloads = redirect_downloads
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def origin(self) -> str:
+        assert self._httpd is not None, "server is not running"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base(self) -> str:
+        return f"{self.origin}/api"
+
+    def start(self) -> "FakeReleaseServer":
+        handler = type("Handler", (_Handler,), {"server_state": self})
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-release-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FakeReleaseServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.bytes_sent = 0
+
+    def count(self, endpoint: str, status: int, sent: int = 0) -> None:
+        with self._lock:
+            self.requests[f"{endpoint} {status}"] += 1
+            self.bytes_sent += sent
+
+    def find(self, repo: str, tag: Optional[str] = None) -> Optional[FakeRelease]:
+        matches = [r for r in self.releases if r.repo == repo]
+        if tag is None:
+            return matches[-1] if matches else None
+        return next((r for r in matches if r.tag == tag), None)
+
+    def release_json(self, release: FakeRelease) -> dict:
+        base = f"{self.origin}/{release.repo}/releases/download/{release.tag}"
+        return {
+            "tag_name": release.tag,
+            "name": release.tag,
+            "assets": [
+                {
+                    "name": name,
+                    "size": path.stat().st_size,
+                    "browser_download_url": f"{base}/{name}",
+                }
+                for name, path in release.assets.items()
+            ],
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_state: FakeReleaseServer
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass  # Keep benchmark output clean
+
+    def do_HEAD(self) -> None:
+        self._route(head=True)
+
+    def do_GET(self) -> None:
+        self._route(head=False)
+
+    def _route(self, head: bool) -> None:
+        state = self.server_state
+        if state.latency:
+            time.sleep(state.latency)
+        path = unquote(self.path.split("?", 1)[0])
+        parts = [p for p in path.split("/") if p]
+
+        if parts[:2] == ["api", "repos"] and len(parts) >= 5:
+            self._api(head, "/".join(parts[2:4]), parts[4:])
+        elif len(parts) >= 4 and parts[2] == "releases":
+            self._host(head, "/".join(parts[:2]), parts[3:])
+        elif len(parts) == 3 and parts[0] == "objects":
+            self._object(head, parts[1], parts[2])
+        else:
+            self._send_bytes(head, "other", 404, b"Not Found", "text/plain")
+
+    def _api(self, head: bool, repo: str, rest: list[str]) -> None:
+        state = self.server_state
+        if rest == ["releases"]:
+            body = [
+                state.release_json(r)
+                for r in reversed(state.releases)
+                if r.repo == repo
+            ]
+            self._send_json(head, "api/releases", body)
+            return
+        tag = None
+        if rest == ["releases", "latest"]:
+            endpoint = "api/latest"
+        elif len(rest) == 3 and rest[:2] == ["releases", "tags"]:
+            endpoint, tag = "api/tag", rest[2]
+        else:
+            self._send_bytes(head, "api/other", 404, b"{}", "application/json")
+            return
+        release = state.find(repo, tag)
+        if release is None:
+            self._send_bytes(head, endpoint, 404, b"{}", "application/json")
+        else:
+            self._send_json(head, endpoint, state.release_json(release))
+
+    def _host(self, head: bool, repo: str, rest: list[str]) -> None:
+        state = self.server_state
+        if rest == ["latest"]:
+            release = state.find(repo)
+            if release is None:
+                self._send_bytes(head, "latest", 404, b"", "text/plain")
+            else:
+                self._redirect(
+                    "latest", f"{state.origin}/{repo}/releases/tag/{release.tag}"
+                )
+        elif len(rest) == 2 and rest[0] == "tag":
+            release = state.find(repo, rest[1])
+            if release is None:
+                self._send_bytes(head, "tag-page", 404, b"", "text/html")
+                return
+            links = "".join(
+                f'<a href="/{repo}/releases/download/{release.tag}/{html.escape(n)}">'
+                f"{html.escape(n)}</a>\n"
+                for n in release.assets
+            )
+            self._send_bytes(
+                head, "tag-page", 200, f"<html>{links}</html>".encode(), "text/html"
+            )
+        elif len(rest) == 3 and rest[0] == "download":
+            tag, name = rest[1], rest[2]
+            release = state.find(repo, tag)
+            if release is None or name not in release.assets:
+                self._send_bytes(head, "download", 404, b"Not Found", "text/plain")
+            elif state.redirect_downloads:
+                self._redirect("download", f"{state.origin}/objects/{tag}/{name}")
+            else:
+                self._serve_file(head, "download", release.assets[name])
+        else:
+            self._send_bytes(head, "other", 404, b"Not Found", "text/plain")
+
+    def _object(self, head: bool, tag: str, name: str) -> None:
+        for release in self.server_state.releases:
+            if release.tag == tag and name in release.assets:
+                self._serve_file(head, "object", release.assets[name])
+                return
+        self._send_bytes(head, "object", 404, b"Not Found", "text/plain")
+
+    def _redirect(self, endpoint: str, location: str) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.server_state.count(endpoint, 302)
+
+    def _send_json(self, head: bool, endpoint: str, body: object) -> None:
+        self._send_bytes(
+            head, endpoint, 200, json.dumps(body).encode(), "application/json"
+        )
+
+    def _send_bytes(
+        self, head: bool, endpoint: str, status: int, body: bytes, content_type: str
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+        self.server_state.count(endpoint, status, 0 if head else len(body))
+
+    def _serve_file(self, head: bool, endpoint: str, path: Path) -> None:
+        st = path.stat()
+        size = st.st_size
+        start, end, status = 0, size - 1, 200
+        match = _RANGE.match(self.headers.get("Range", ""))
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2) or end), size - 1)
+            else:
+                start = max(0, size - int(match.group(2)))
+            if start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                self.server_state.count(endpoint, 416)
+                return
+            status = 206
+
+        length = end - start + 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", f'"{st.st_size:x}-{st.st_mtime_ns:x}"')
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if head:
+            self.server_state.count(endpoint, status)
+            return
+
+        sent = 0
+        try:
+            for chunk in self._paced(_read_range(path, start, length)):
+                self.wfile.write(chunk)
+                sent += len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        self.server_state.count(endpoint, status, sent)
+
+    def _paced(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        bandwidth = self.server_state.bandwidth
+        if not bandwidth:
+            yield from chunks
+            return
+        began, total = time.monotonic(), 0
+        for chunk in chunks:
+            total += len(chunk)
+            ahead = total / bandwidth - (time.monotonic() - began)
+            if ahead > 0:
+                time.sleep(ahead)
+            yield chunk
+
+
+def _read_range(path: Path, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(_CHUNK_SIZE, length))
+            if not chunk:
+                return
+            length -= len(chunk)
+            yield chunk
+
+
+def write_sha512sum(archive: Path) -> Path:
+    """Write a GE-Proton style ``.sha512sum`` file next to an archive."""
+    hasher = hashlib.sha512()
+    with open(archive, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            hasher.update(chunk)
+    stem = archive.name
+    for suffix in (".tar.gz", ".tar.xz"):
+        if stem.endswith(suffix):
+            stem = stem[: -len(suffix)]
+    out = archive.with_name(f"{stem}.sha512sum")
+    out.write_text(f"{hasher.hexdigest()}  {archive.name}\n")
+    return out
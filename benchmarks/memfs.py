@@ -0,0 +1,324 @@
+"""In-memory FileSystemClientProtocol implementation that counts syscalls.
+
+``MemoryFileSystem`` keeps a tree of directories, files and symlinks in
+dictionaries and behaves like ``FileSystemClient`` on it: symlinks are
+followed where pathlib follows them, the same exception types are raised,
+and directory mtimes change when entries are added, removed or renamed.
+
+Every call is also charged with the system calls the real client would
+make (``stat``, ``lstat``, ``readlink``, ``getdents`` ...). The counts in
+``MemoryFileSystem.ops`` make changes in filesystem traffic visible at a
+scale where MagicMock-based fakes are far too slow.
+"""
+
+import errno
+import os
+import posixpath
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from protonfetcher.common import ScanEntry
+
+_MAX_SYMLINK_HOPS = 40
+
+
+@dataclass
+class _Node:
+    kind: str  # "dir", "file" or "symlink"
+    mtime: float
+    data: bytes = b""
+    target: str = ""
+    children: dict[str, "_Node"] = field(default_factory=dict)
+
+
+def _error(cls: type[OSError], code: int, path: object) -> OSError:
+    return cls(code, os.strerror(code), str(path))
+
+
+class MemoryFileSystem:
+    """Thread-safe in-memory filesystem with syscall accounting.
+
+    Args:
+        clock: Source of modification times (default: ``time.time``)
+    """
+
+    PROTOCOL_VERSION: str = "1.0"
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self.clock = clock
+        self.ops: Counter[str] = Counter()
+        self._root = _Node("dir", clock())
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.ops.clear()
+
+    @property
+    def total_ops(self) -> int:
+        return sum(self.ops.values())
+
+    def backdate(self, seconds: float) -> None:
+        """Move every mtime into the past, as if the tree had settled."""
+        with self._lock:
+            stack = [self._root]
+            while stack:
+                node = stack.pop()
+                node.mtime -= seconds
+                stack.extend(node.children.values())
+
+    # ------------------------------------------------------------------
+    # Path lookup
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _parts(path: Path | str) -> list[str]:
+        normalized = posixpath.normpath(posixpath.join("/", str(path)))
+        return [part for part in normalized.split("/") if part]
+
+    def _walk(
+        self, path: Path | str, follow: bool, hops: int = 0, count_links: bool = False
+    ) -> tuple[Optional[_Node], str]:
+        """Find the node at path.
+
+        The kernel follows symlinks inside a single stat; only realpath-style
+        callers pass count_links to be charged a readlink per symlink.
+
+        Returns:
+            (node or None, canonical path of the node or of where it would be)
+        """
+        parts = self._parts(path)
+        node, current = self._root, "/"
+        for index, name in enumerate(parts):
+            if node.kind != "dir":
+                raise _error(NotADirectoryError, errno.ENOTDIR, path)
+            child = node.children.get(name)
+            child_path = posixpath.join(current, name)
+            last = index == len(parts) - 1
+            if child is None:
+                rest = parts[index + 1 :]
+                if rest:
+                    return None, posixpath.join(child_path, *rest)
+                return None, child_path
+            if child.kind == "symlink" and (follow or not last):
+                if hops >= _MAX_SYMLINK_HOPS:
+                    raise _error(OSError, errno.ELOOP, path)
+                if count_links:
+                    self.ops["readlink"] += 1
+                target = posixpath.join(current, child.target)
+                rest = parts[index + 1 :]
+                return self._walk(
+                    posixpath.join(target, *rest), follow, hops + 1, count_links
+                )
+            node, current = child, child_path
+        return node, current
+
+    def _node(self, path: Path, follow: bool = True) -> _Node:
+        node, _ = self._walk(path, follow)
+        if node is None:
+            raise _error(FileNotFoundError, errno.ENOENT, path)
+        return node
+
+    def _parent_dir(self, path: Path) -> tuple[_Node, str]:
+        parts = self._parts(path)
+        if not parts:
+            raise _error(FileExistsError, errno.EEXIST, path)
+        parent = self._node(Path("/" + "/".join(parts[:-1])))
+        if parent.kind != "dir":
+            raise _error(NotADirectoryError, errno.ENOTDIR, path)
+        return parent, parts[-1]
+
+    def _add(self, path: Path, node: _Node) -> None:
+        parent, name = self._parent_dir(path)
+        if name in parent.children:
+            raise _error(FileExistsError, errno.EEXIST, path)
+        parent.children[name] = node
+        parent.mtime = node.mtime
+
+    def _stat(self, path: Path, follow: bool = True) -> Optional[_Node]:
+        self.ops["stat" if follow else "lstat"] += 1
+        try:
+            node, _ = self._walk(path, follow)
+        except OSError:
+            return None
+        return node
+
+    # ------------------------------------------------------------------
+    # FileSystemClientProtocol
+    # ------------------------------------------------------------------
+
+    def exists(self, path: Path) -> bool:
+        with self._lock:
+            return self._stat(path) is not None
+
+    def is_dir(self, path: Path) -> bool:
+        with self._lock:
+            node = self._stat(path)
+            return node is not None and node.kind == "dir"
+
+    def is_symlink(self, path: Path) -> bool:
+        with self._lock:
+            node = self._stat(path, follow=False)
+            return node is not None and node.kind == "symlink"
+
+    def mkdir(self, path: Path, parents: bool = False, exist_ok: bool = False) -> None:
+        with self._lock:
+            self.ops["mkdir"] += 1
+            existing, _ = self._walk(path, follow=True)
+            if existing is not None:
+                if exist_ok and existing.kind == "dir":
+                    return
+                raise _error(FileExistsError, errno.EEXIST, path)
+            try:
+                self._add(path, _Node("dir", self.clock()))
+            except FileNotFoundError:
+                if not parents:
+                    raise
+                self.mkdir(path.parent, parents=True, exist_ok=True)
+                self._add(path, _Node("dir", self.clock()))
+
+    def write(self, path: Path, data: bytes) -> None:
+        with self._lock:
+            self.ops["open"] += 1
+            self.ops["write"] += 1
+            node, canonical = self._walk(path, follow=True)
+            if node is None:
+                self._add(
+                    Path(canonical), _Node("file", self.clock(), data=bytes(data))
+                )
+            elif node.kind == "dir":
+                raise _error(IsADirectoryError, errno.EISDIR, path)
+            else:
+                node.data, node.mtime = bytes(data), self.clock()
+
+    def read(self, path: Path) -> bytes:
+        with self._lock:
+            self.ops["open"] += 1
+            self.ops["read"] += 1
+            node = self._node(path)
+            if node.kind == "dir":
+                raise _error(IsADirectoryError, errno.EISDIR, path)
+            return node.data
+
+    def size(self, path: Path) -> int:
+        with self._lock:
+            self.ops["stat"] += 1
+            node = self._node(path)
+            return len(node.data) if node.kind == "file" else 4096
+
+    def mtime(self, path: Path) -> float:
+        with self._lock:
+            self.ops["stat"] += 1
+            return self._node(path).mtime
+
+    def symlink_to(
+        self, link_path: Path, target_path: Path, target_is_directory: bool = True
+    ) -> None:
+        with self._lock:
+            self.ops["symlink"] += 1
+            self._add(
+                link_path, _Node("symlink", self.clock(), target=str(target_path))
+            )
+
+    def resolve(self, path: Path) -> Path:
+        with self._lock:
+            # realpath: one lstat per component, plus a readlink per symlink
+            self.ops["lstat"] += len(self._parts(path))
+            try:
+                _, canonical = self._walk(path, follow=True, count_links=True)
+            except OSError:
+                return Path(posixpath.normpath(posixpath.join("/", str(path))))
+            return Path(canonical)
+
+    def readlink(self, path: Path) -> Path:
+        with self._lock:
+            self.ops["readlink"] += 1
+            node = self._node(path, follow=False)
+            if node.kind != "symlink":
+                raise _error(OSError, errno.EINVAL, path)
+            return Path(node.target)
+
+    def unlink(self, path: Path) -> None:
+        with self._lock:
+            self.ops["unlink"] += 1
+            parent, name = self._parent_dir(path)
+            node = parent.children.get(name)
+            if node is None:
+                raise _error(FileNotFoundError, errno.ENOENT, path)
+            if node.kind == "dir":
+                raise _error(IsADirectoryError, errno.EISDIR, path)
+            del parent.children[name]
+            parent.mtime = self.clock()
+
+    def rmtree(self, path: Path) -> None:
+        with self._lock:
+            parent, name = self._parent_dir(path)
+            node = parent.children.get(name)
+            self.ops["lstat"] += 1
+            if node is None:
+                raise _error(FileNotFoundError, errno.ENOENT, path)
+            if node.kind != "dir":
+                raise _error(NotADirectoryError, errno.ENOTDIR, path)
+            self._count_rmtree(node)
+            del parent.children[name]
+            parent.mtime = self.clock()
+
+    def _count_rmtree(self, node: _Node) -> None:
+        # shutil.rmtree: open + getdents per directory, unlink per entry
+        self.ops["open"] += 1
+        self.ops["getdents"] += 1
+        for child in node.children.values():
+            if child.kind == "dir":
+                self._count_rmtree(child)
+            else:
+                self.ops["unlink"] += 1
+        self.ops["rmdir"] += 1
+
+    def iterdir(self, path: Path) -> Iterator[Path]:
+        with self._lock:
+            self.ops["open"] += 1
+            self.ops["getdents"] += 1
+            node = self._node(path)
+            if node.kind != "dir":
+                raise _error(NotADirectoryError, errno.ENOTDIR, path)
+            names = list(node.children)
+        return iter([path / name for name in names])
+
+    def scandir(self, path: Path) -> list[ScanEntry]:
+        with self._lock:
+            self.ops["open"] += 1
+            self.ops["getdents"] += 1
+            node = self._node(path)
+            if node.kind != "dir":
+                raise _error(NotADirectoryError, errno.ENOTDIR, path)
+            return [
+                ScanEntry(path / name, child.kind == "dir", child.kind == "symlink")
+                for name, child in node.children.items()
+            ]
+
+    def rename(self, source: Path, destination: Path) -> None:
+        with self._lock:
+            self.ops["rename"] += 1
+            src_parent, src_name = self._parent_dir(source)
+            node = src_parent.children.get(src_name)
+            if node is None:
+                raise _error(FileNotFoundError, errno.ENOENT, source)
+            dst_parent, dst_name = self._parent_dir(destination)
+            existing = dst_parent.children.get(dst_name)
+            if existing is not None and existing.kind == "dir":
+                if node.kind != "dir":
+                    raise _error(IsADirectoryError, errno.EISDIR, destination)
+                if existing.children:
+                    raise _error(OSError, errno.ENOTEMPTY, destination)
+            del src_parent.children[src_name]
+            dst_parent.children[dst_name] = node
+            now = self.clock()
+            src_parent.mtime = dst_parent.mtime = now
@@ -0,0 +1,85 @@
+"""Result files shared by the benchmarks.
+
+Every benchmark writes one JSON document with the same envelope: the
+commit it ran on, the machine, the settings, a per-configuration
+``summary`` (what ``benchmarks.compare`` reads) and the raw ``runs``.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def git_commit() -> tuple[str, bool]:
+    """Return the checked-out commit and whether tracked files are modified."""
+    root = Path(__file__).resolve().parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=root,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, dirty
+
+
+def write_report(
+    benchmark: str,
+    args: argparse.Namespace,
+    summary: list[dict[str, Any]],
+    runs: list[dict[str, Any]],
+    output: Optional[Path] = None,
+) -> Path:
+    """Write a result file and return its path.
+
+    Args:
+        benchmark: Name of the benchmark, also used in the default file name
+        args: Parsed command line, stored as the settings
+        summary: One entry per configuration with ``config`` and
+            ``median_total`` keys
+        runs: Raw per-run results
+        output: Where to write (default: benchmarks/results/<name>-<time>-<commit>.json)
+    """
+    commit, dirty = git_commit()
+    report = {
+        "schema": 1,
+        "benchmark": benchmark,
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            key: (str(value) if isinstance(value, Path) else value)
+            for key, value in vars(args).items()
+        },
+        "summary": summary,
+        "runs": runs,
+    }
+    if output is None:
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"{benchmark}-{stamp}-{commit[:10]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    return output
@@ -1,7 +1,5 @@
 """Version information for ProtonFetcher."""
 
-from importlib.metadata import PackageNotFoundError, version
-
 # This value is replaced at build time by the Makefile
 __version__ = "1.3.0"
 
@@ -10,6 +8,8 @@ def _get_version() -> str:
     """Get version from embedded value or package metadata fallback."""
     if __version__ != "DEV":
         return __version__
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("protonge-fetcher")
     except PackageNotFoundError:
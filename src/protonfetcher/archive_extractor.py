@@ -1,18 +1,73 @@
 """Archive extractor implementation for ProtonFetcher."""
 
+import contextlib
 import logging
+import os
+import secrets
 import subprocess
 import tarfile
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Iterator, Optional
 
+from . import tracing
 from .common import DEFAULT_TIMEOUT, FileSystemClientProtocol
+from .decompression import DecompressionBackend, select_decompressor
 from .exceptions import ExtractionError, ProtonFetcherError
+from .parallel_extract import DEFAULT_WRITERS, extract_members
 from .spinner import Spinner
 from .utils import format_bytes
 
 logger = logging.getLogger(__name__)
 
+# Hidden directories inside extract_dir that releases are unpacked into
+# before being renamed into place: <prefix><pid>-<random>
+STAGING_PREFIX = ".protonfetcher-staging-"
+
+
+def _stage_owner_alive(name: str) -> bool:
+    """Return True if the process that created a staging directory still runs."""
+    pid_text = name[len(STAGING_PREFIX) :].split("-", 1)[0]
+    try:
+        pid = int(pid_text)
+    except ValueError:
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Running under another user
+    return True
+
+
+class _ArchiveReader:
+    """Read-only archive file that counts the compressed bytes consumed.
+
+    The file is opened on the first read, so nothing touches the disk if
+    the tar reader is never driven.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.bytes_read = 0
+        self.size = 0
+        self._file: Optional[BinaryIO] = None
+
+    def read(self, size: int = -1) -> bytes:
+        if self._file is None:
+            self._file = open(self.path, "rb")
+            self.size = os.fstat(self._file.fileno()).st_size
+        chunk = self._file.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
 
 class ArchiveExtractor:
     """Handles archive extraction."""
@@ -21,36 +76,104 @@ class ArchiveExtractor:
         self,
         file_system_client: FileSystemClientProtocol,
         timeout: int = DEFAULT_TIMEOUT,
+        decompressor: Optional[str] = None,
+        writers: int = DEFAULT_WRITERS,
     ) -> None:
         self.file_system_client = file_system_client
         self.timeout = timeout
+        self.decompressor = decompressor
+        self.writers = writers
+        self.last_decompressor: Optional[DecompressionBackend] = None
+
+    def _select_backend(self, format_type: str) -> DecompressionBackend:
+        """Resolve and record the decompression backend for an archive format."""
+        try:
+            backend = select_decompressor(format_type, self.decompressor)
+        except ValueError as e:
+            raise ExtractionError(str(e))
+        self.last_decompressor = backend
+        return backend
+
+    @contextlib.contextmanager
+    def staging_directory(self, extract_dir: Path) -> Iterator[Path]:
+        """Provide a hidden directory to extract into, committed on success.
+
+        The staging directory lives inside ``extract_dir`` so that committing
+        is a plain ``rename`` on the same filesystem: each top-level entry
+        (normally the single release directory) appears in ``extract_dir``
+        complete or not at all. If the block raises, the stage is removed and
+        nothing is committed; a crash leaves it for ``sweep_stale_stages``.
 
-    def get_archive_info(self, archive_path: Path) -> Dict[str, int]:
+        Args:
+            extract_dir: Directory the release is being installed into
+
+        Yields:
+            Path of the staging directory
         """
-        Get information about the archive without fully extracting it.
+        stage = extract_dir / f"{STAGING_PREFIX}{os.getpid()}-{secrets.token_hex(4)}"
+        self.file_system_client.mkdir(stage, parents=True)
+        try:
+            yield stage
+            self._commit_stage(stage, extract_dir)
+        finally:
+            if self.file_system_client.exists(stage):
+                self.file_system_client.rmtree(stage)
+
+    @tracing.traced("commit_stage")
+    def _commit_stage(self, stage: Path, extract_dir: Path) -> None:
+        """Rename the staged release entries into extract_dir."""
+        for entry in list(self.file_system_client.iterdir(stage)):
+            destination = extract_dir / entry.name
+            if self.file_system_client.exists(destination):
+                # Installed concurrently (e.g. by another run); it is complete
+                # by construction, so keep it and drop the staged copy
+                logger.warning(
+                    f"{destination} appeared during extraction, keeping the existing copy"
+                )
+                continue
+            self.file_system_client.rename(entry, destination)
+            logger.debug(f"Committed {entry.name} into {extract_dir}")
+
+    @tracing.traced("sweep_stages")
+    def sweep_stale_stages(self, extract_dir: Path) -> int:
+        """Remove staging directories left behind by interrupted runs.
+
+        Stages owned by a process that is still running are left alone, so a
+        concurrent run's extraction is never disturbed.
 
         Returns:
-            Dictionary with archive info: {"file_count": int, "total_size": int}
+            Number of staging directories removed
         """
+        removed = 0
         try:
-            with tarfile.open(archive_path, "r:*") as tar:
-                members = tar.getmembers()
-                total_files = len(members)
-                total_size = sum(m.size for m in members)
-                return {"file_count": total_files, "total_size": total_size}
-        except Exception as e:
-            raise ExtractionError(f"Error reading archive: {e}")
+            entries = list(self.file_system_client.iterdir(extract_dir))
+        except OSError:
+            return 0
+        for entry in entries:
+            if not entry.name.startswith(STAGING_PREFIX):
+                continue
+            if _stage_owner_alive(entry.name):
+                continue
+            try:
+                self.file_system_client.rmtree(entry)
+                removed += 1
+                logger.info(f"Removed incomplete extraction {entry}")
+            except OSError as e:
+                logger.warning(f"Could not remove incomplete extraction {entry}: {e}")
+        return removed
 
     def _get_archive_format(self, archive_path: Path) -> str:
         """Determine archive format from filename.
 
         Returns:
-            Format string: 'tar.gz', 'tar.xz', or 'other'
+            Format string: 'tar.gz', 'tar.xz', 'tar.zst', or 'other'
         """
         if archive_path.name.endswith(".tar.gz"):
             return "tar.gz"
         elif archive_path.name.endswith(".tar.xz"):
             return "tar.xz"
+        elif archive_path.name.endswith(".tar.zst"):
+            return "tar.zst"
         else:
             return "other"
 
@@ -106,6 +229,7 @@ class ArchiveExtractor:
         "tar.xz": "extract_xz_archive",
     }
 
+    @tracing.traced("extract")
     def extract_archive(
         self,
         archive_path: Path,
@@ -129,6 +253,7 @@ class ArchiveExtractor:
             FetchError: If extraction fails
         """
         format_type = self._get_archive_format(archive_path)
+        tracing.annotate(archive=archive_path.name, writers=self.writers)
         method_name = self._EXTRACT_METHODS.get(format_type)
         if method_name:
             fallback = getattr(self, method_name)
@@ -188,38 +313,36 @@ class ArchiveExtractor:
         show_progress: bool = True,
         show_file_details: bool = True,
     ) -> Path:
-        """Extract archive using tarfile library."""
-        self.file_system_client.mkdir(target_dir, parents=True, exist_ok=True)
+        """Extract archive using tarfile library in a single pass.
 
-        # Get archive info
-        try:
-            archive_info = self.get_archive_info(archive_path)
-            total_files = archive_info["file_count"]
-            total_size = archive_info["total_size"]
-            logger.info(
-                f"Archive contains {total_files} files, total size: {format_bytes(total_size)}"
-            )
-        except Exception as e:
-            logger.error(f"Error reading archive: {e}")
-            raise ExtractionError(f"Failed to read archive {archive_path}: {e}")
+        The archive is decompressed exactly once: members are extracted in
+        archive order as they are decoded, with no up-front member count.
+        Progress is measured in compressed bytes read from the archive file.
+        """
+        self.file_system_client.mkdir(target_dir, parents=True, exist_ok=True)
 
         # Initialize spinner
         spinner = Spinner(
             desc=f"Extracting {archive_path.name}",
-            disable=False,
+            unit="B",
+            disable=not (show_progress or show_file_details),
             fps_limit=10.0,  # Reduced FPS to prevent excessive terminal updates
             show_progress=show_progress,
         )
 
+        format_type = self._get_archive_format(archive_path)
+        backend = self._select_backend(format_type)
+        logger.info(f"Decompressing {archive_path.name} with {backend.description}")
+
+        source = _ArchiveReader(archive_path)
         try:
             with spinner:
-                with tarfile.open(archive_path, "r:*") as tar:
+                with backend.open_tar_stream(source, format_type) as tar:
                     extracted_files = 0
                     extracted_size = 0
 
-                    for member in tar:
-                        # Extract the file
-                        tar.extract(member, path=target_dir, filter="data")
+                    def _report(member: tarfile.TarInfo) -> None:
+                        nonlocal extracted_files, extracted_size
                         extracted_files += 1
                         extracted_size += member.size
 
@@ -231,27 +354,101 @@ class ArchiveExtractor:
                         # Update the spinner with current progress
                         if show_file_details:
                             spinner.update_progress(
-                                extracted_files,
-                                total_files,
+                                source.bytes_read,
+                                source.size,
                                 prefix=filename,  # Just show the filename, not "Extracting: ..."
-                                suffix=f"({extracted_files}/{total_files}) [{format_bytes(extracted_size)}/{format_bytes(total_size)}]",
+                                suffix=f"({extracted_files} files) [{format_bytes(source.bytes_read)}/{format_bytes(source.size)}]",
                             )
                         else:
-                            spinner.update_progress(
-                                extracted_files,
-                                total_files,
-                            )
+                            spinner.update_progress(source.bytes_read, source.size)
+
+                    extract_members(tar, target_dir, self.writers, _report)
 
                 # Ensure the spinner shows 100% completion
                 spinner.finish()
 
-            logger.info(f"Extracted {archive_path} to {target_dir}")
+            logger.info(
+                f"Extracted {extracted_files} files ({format_bytes(extracted_size)}) "
+                f"from {archive_path} to {target_dir}"
+            )
+            tracing.annotate(
+                decompressor=backend.description,
+                files=extracted_files,
+                extracted_bytes=extracted_size,
+            )
         except Exception as e:
             logger.error(f"Error extracting archive: {e}")
             raise ExtractionError(f"Failed to extract archive {archive_path}: {e}")
+        finally:
+            source.close()
 
         return target_dir
 
+    @tracing.traced("extract_stream")
+    def extract_stream(
+        self, fileobj: BinaryIO, target_dir: Path, archive_name: str
+    ) -> Path:
+        """Extract a tar archive from a non-seekable stream as bytes arrive.
+
+        Members are extracted in archive order while the source is still being
+        read, so extraction finishes shortly after the last byte is received.
+
+        Args:
+            fileobj: Readable stream yielding the compressed archive
+            target_dir: Directory to extract into
+            archive_name: Archive filename, used to pick the decompressor
+
+        Returns:
+            Path to the target directory where archive was extracted
+
+        Raises:
+            ExtractionError: If the stream cannot be decompressed or extracted
+        """
+        self.file_system_client.mkdir(target_dir, parents=True, exist_ok=True)
+        format_type = self._get_archive_format(Path(archive_name))
+        backend = self._select_backend(format_type)
+        logger.info(f"Decompressing {archive_name} with {backend.description}")
+
+        try:
+            extracted_files = 0
+            extracted_size = 0
+            with backend.open_tar_stream(fileobj, format_type) as tar:
+
+                def _count(member: tarfile.TarInfo) -> None:
+                    nonlocal extracted_files, extracted_size
+                    extracted_files += 1
+                    extracted_size += member.size
+
+                extract_members(tar, target_dir, self.writers, _count)
+        except Exception as e:
+            logger.error(f"Error extracting stream: {e}")
+            raise ExtractionError(f"Failed to extract stream {archive_name}: {e}")
+
+        logger.info(
+            f"Extracted {extracted_files} files ({format_bytes(extracted_size)}) "
+            f"from {archive_name} to {target_dir}"
+        )
+        tracing.annotate(
+            archive=archive_name,
+            decompressor=backend.description,
+            files=extracted_files,
+            extracted_bytes=extracted_size,
+        )
+        return target_dir
+
+    def _tar_decompress_flags(self, format_type: str, default_flag: str) -> list[str]:
+        """Return tar flags that decompress with the selected backend.
+
+        External backends are handed to tar via --use-compress-program so the
+        fallback path gets the same out-of-process decompression as the main one.
+        """
+        backend = self._select_backend(format_type)
+        program = backend.tar_program
+        if program is None:
+            return [default_flag]
+        logger.info(f"Decompressing with {backend.description}")
+        return [f"--use-compress-program={program}", "-xf"]
+
     def extract_gz_archive(self, archive_path: Path, target_dir: Path) -> Path:
         """Extract .tar.gz archive using system tar command with checkpoint features.
 
@@ -272,7 +469,7 @@ class ArchiveExtractor:
             "tar",
             "--checkpoint=1",  # Show progress every 1 record
             "--checkpoint-action=dot",  # Show dot for progress
-            "-xzf",  # Extract gzipped tar
+            *self._tar_decompress_flags("tar.gz", "-xzf"),
             str(archive_path),
             "-C",  # Extract to target directory
             str(target_dir),
@@ -307,7 +504,7 @@ class ArchiveExtractor:
             "tar",
             "--checkpoint=1",  # Show progress every 1 record
             "--checkpoint-action=dot",  # Show dot for progress
-            "-xJf",  # Extract xzipped tar
+            *self._tar_decompress_flags("tar.xz", "-xJf"),
             str(archive_path),
             "-C",  # Extract to target directory
             str(target_dir),
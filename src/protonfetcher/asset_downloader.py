@@ -1,10 +1,27 @@
 """Asset downloader implementation for ProtonFetcher."""
 
+import contextlib
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Iterator, Optional
+from urllib.parse import urlsplit
 
+from . import tracing
+from .checksums import (
+    ChecksumManifest,
+    ManifestEntry,
+    checksum_asset_name,
+    hash_file,
+    parse_checksum_file,
+)
 from .common import (
     DEFAULT_TIMEOUT,
     DEFAULT_USER_AGENT,
@@ -19,6 +36,105 @@ from .utils import format_bytes
 
 logger = logging.getLogger(__name__)
 
+# Range downloads are split into segments of this size; a resumed transfer
+# re-fetches at most one partially written segment per connection.
+SEGMENT_SIZE = 16 * 1024 * 1024
+_RANGE_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class RangeDownloadState:
+    """Progress of a segmented download, persisted next to the partial file."""
+
+    url: str
+    size: int
+    validator: str
+    segment_size: int
+    completed: set[int] = field(default_factory=set)
+
+    @property
+    def segment_count(self) -> int:
+        return -(-self.size // self.segment_size)
+
+    def segment_bounds(self, index: int) -> tuple[int, int]:
+        """Return the inclusive byte range covered by a segment."""
+        start = index * self.segment_size
+        return start, min(start + self.segment_size, self.size) - 1
+
+    def pending(self) -> list[int]:
+        return [i for i in range(self.segment_count) if i not in self.completed]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "url": self.url,
+                "size": self.size,
+                "validator": self.validator,
+                "segment_size": self.segment_size,
+                "completed": sorted(self.completed),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "RangeDownloadState":
+        data = json.loads(text)
+        return cls(
+            url=data["url"],
+            size=int(data["size"]),
+            validator=data["validator"],
+            segment_size=int(data["segment_size"]),
+            completed={int(i) for i in data["completed"]},
+        )
+
+
+def range_download_paths(output_path: Path) -> tuple[Path, Path]:
+    """Return the partial-data and sidecar state paths for a download."""
+    part_path = output_path.with_name(output_path.name + ".part")
+    return part_path, part_path.with_name(part_path.name + ".json")
+
+
+class StreamingDownload:
+    """Readable file-like view of an HTTP response body.
+
+    Every chunk handed to the consumer (e.g. a ``tarfile`` stream) is also
+    written to an optional tee file, hashed, and reported to the progress
+    spinner, so the archive can be extracted, saved and verified in a
+    single pass. ``read_ns`` is the time spent inside ``read``, i.e. the
+    transfer without the consumer's work between reads.
+    """
+
+    def __init__(
+        self, response: Any, tee: Optional[BinaryIO], spinner: Spinner
+    ) -> None:
+        self._response = response
+        self._tee = tee
+        self._spinner = spinner
+        self._hasher = hashlib.sha512()
+        self.bytes_read = 0
+        self.read_ns = 0
+
+    @property
+    def sha512(self) -> str:
+        """Hex SHA-512 digest of the bytes read so far."""
+        return self._hasher.hexdigest()
+
+    def read(self, size: int = -1) -> bytes:
+        start = time.perf_counter_ns()
+        chunk = self._response.read(size) if size > 0 else self._response.read()
+        if chunk:
+            if self._tee is not None:
+                self._tee.write(chunk)
+            self._hasher.update(chunk)
+            self.bytes_read += len(chunk)
+            self._spinner.update(len(chunk))
+        self.read_ns += time.perf_counter_ns() - start
+        return chunk
+
+    def drain(self, chunk_size: int = 65536) -> None:
+        """Consume whatever the consumer left unread (tar padding, trailers)."""
+        while self.read(chunk_size):
+            pass
+
 
 class AssetDownloader:
     """Manages asset downloads."""
@@ -28,26 +144,48 @@ class AssetDownloader:
         network_client: NetworkClientProtocol,
         file_system_client: FileSystemClientProtocol,
         timeout: int = DEFAULT_TIMEOUT,
+        connections: int = 1,
     ) -> None:
         self.network_client = network_client
         self.file_system_client = file_system_client
         self.timeout = timeout
+        self.connections = connections
+        self.segment_size = SEGMENT_SIZE
 
     def download_with_spinner(
-        self, url: str, output_path: Path, headers: Optional[Headers] = None
-    ) -> None:
-        """Download a file with progress spinner using urllib."""
+        self,
+        url: str,
+        output_path: Path,
+        headers: Optional[Headers] = None,
+        show_progress: bool = True,
+    ) -> str:
+        """Download a file with progress spinner using urllib.
+
+        Args:
+            url: URL to download from
+            output_path: Destination path for the downloaded file
+            headers: Optional request headers
+            show_progress: Whether to draw the spinner (disabled for parallel updates)
+
+        Returns:
+            Hex SHA-512 digest of the downloaded bytes, computed as they arrive
+        """
 
         # Create a request with headers
         req = urllib.request.Request(url, headers=headers or {})
 
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            with (
+                tracing.request_span("GET", url) as trace_span,
+                urllib.request.urlopen(req, timeout=self.timeout) as response,
+            ):
+                trace_span.set(status=getattr(response, "status", None))
                 total_size = int(response.headers.get("Content-Length", 0))
 
                 with open(output_path, "wb") as f:
                     chunk_size = 8192
                     downloaded = 0
+                    hasher = hashlib.sha512()
 
                     # Create spinner with total size if available
                     with (
@@ -56,7 +194,7 @@ class AssetDownloader:
                             total=total_size,
                             unit="B",
                             unit_scale=True,
-                            disable=False,
+                            disable=not show_progress,
                             fps_limit=10.0,  # Limit to 10 FPS during download to prevent excessive terminal updates
                             show_progress=True,
                         ) as spinner
@@ -67,13 +205,442 @@ class AssetDownloader:
                                 break
 
                             f.write(chunk)
+                            hasher.update(chunk)
                             downloaded += len(chunk)
                             # Update spinner with the amount downloaded since last call
                             spinner.update(len(chunk))
 
+                tracing.count(bytes=downloaded)
+
         except Exception as e:
             raise NetworkError(f"Failed to download {url}: {str(e)}")
+        return hasher.hexdigest()
+
+    def _probe_range_support(
+        self, url: str, headers: Headers
+    ) -> tuple[int, str] | None:
+        """Ask for the first byte to learn whether the server honours Range.
+
+        Returns:
+            (total size, ETag/Last-Modified validator), or None if the server
+            answered without a satisfiable partial response
+        """
+        req = urllib.request.Request(url, headers={**headers, "Range": "bytes=0-0"})
+        with (
+            tracing.request_span("GET", url) as trace_span,
+            urllib.request.urlopen(req, timeout=self.timeout) as response,
+        ):
+            status = response.status
+            trace_span.set(status=status)
+            content_range = response.headers.get("Content-Range") or ""
+            validator = (
+                response.headers.get("ETag")
+                or response.headers.get("Last-Modified")
+                or ""
+            )
+
+        total = content_range.rpartition("/")[2]
+        if status != 206 or not total.isdigit():
+            return None
+        return int(total), validator
+
+    def _load_range_state(
+        self,
+        state_path: Path,
+        part_path: Path,
+        url: str,
+        size: int,
+        validator: str,
+    ) -> RangeDownloadState | None:
+        """Load resumable state, discarding it if the remote file changed."""
+        try:
+            state = RangeDownloadState.from_json(state_path.read_text())
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if (
+            state.url != url
+            or state.size != size
+            or state.validator != validator
+            or not part_path.exists()
+            or part_path.stat().st_size != size
+        ):
+            logger.info(
+                "Remote asset changed since the interrupted download, restarting"
+            )
+            return None
+        return state
+
+    @staticmethod
+    def _save_range_state(state_path: Path, state: RangeDownloadState) -> None:
+        """Atomically persist download progress."""
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        tmp_path.write_text(state.to_json())
+        os.replace(tmp_path, state_path)
+
+    @staticmethod
+    def _preallocate(part_path: Path, size: int) -> None:
+        """Create the partial file at its final size so segments can be pwritten."""
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+    def _fetch_segment(
+        self,
+        url: str,
+        headers: Headers,
+        fd: int,
+        index: int,
+        state: RangeDownloadState,
+        state_path: Path,
+        spinner: Spinner,
+        lock: threading.Lock,
+        abort: threading.Event,
+    ) -> None:
+        """Download one segment into its slot of the partial file."""
+        if abort.is_set():
+            return
+        try:
+            self._fetch_segment_range(
+                url, headers, fd, index, state, state_path, spinner, lock
+            )
+        except BaseException:
+            # Stop queued segments from starting once one has failed
+            abort.set()
+            raise
+
+    def _fetch_segment_range(
+        self,
+        url: str,
+        headers: Headers,
+        fd: int,
+        index: int,
+        state: RangeDownloadState,
+        state_path: Path,
+        spinner: Spinner,
+        lock: threading.Lock,
+    ) -> None:
+        start, end = state.segment_bounds(index)
+        req = urllib.request.Request(
+            url, headers={**headers, "Range": f"bytes={start}-{end}"}
+        )
+        offset = start
+        with (
+            tracing.span("segment", "download", index=index),
+            tracing.request_span("GET", url) as trace_span,
+            urllib.request.urlopen(req, timeout=self.timeout) as response,
+        ):
+            trace_span.set(status=response.status, range=f"{start}-{end}")
+            if response.status != 206:
+                raise NetworkError(
+                    f"Server ignored range request for bytes {start}-{end}"
+                )
+            while chunk := response.read(_RANGE_CHUNK_SIZE):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+                with lock:
+                    spinner.update(len(chunk))
+            tracing.count(bytes=offset - start)
+
+        if offset != end + 1:
+            raise NetworkError(f"Segment {start}-{end} truncated at byte {offset}")
+
+        with lock:
+            state.completed.add(index)
+            self._save_range_state(state_path, state)
+
+    def download_with_ranges(
+        self,
+        url: str,
+        output_path: Path,
+        headers: Optional[Headers] = None,
+        show_progress: bool = True,
+    ) -> str:
+        """Download a file as parallel HTTP Range segments, resuming if possible.
+
+        Segments are written into a preallocated ``<output>.part`` file and
+        completed segment indices are recorded in ``<output>.part.json`` after
+        each one finishes, so an interrupted transfer picks up where it left
+        off. Servers that don't honour Range, and files no larger than one
+        segment, fall back to `download_with_spinner`.
+
+        Args:
+            url: URL to download from
+            output_path: Destination path for the downloaded file
+            headers: Optional request headers
+            show_progress: Whether to draw the spinner
+
+        Returns:
+            Hex SHA-512 digest of the downloaded file. Segments arrive out of
+            order, so this is computed from the completed file.
+
+        Raises:
+            NetworkError: If any segment fails; the partial state is kept for resume
+        """
+        headers = dict(headers or {})
+        part_path, state_path = range_download_paths(output_path)
+
+        try:
+            probe = self._probe_range_support(url, headers)
+        except Exception as e:
+            raise NetworkError(f"Failed to download {url}: {e}")
+
+        if probe is None or probe[0] <= self.segment_size:
+            logger.debug("Range download not applicable, using a single stream")
+            return self.download_with_spinner(url, output_path, headers, show_progress)
 
+        size, validator = probe
+        state = self._load_range_state(state_path, part_path, url, size, validator)
+        if state is None:
+            state = RangeDownloadState(url, size, validator, self.segment_size)
+            self._preallocate(part_path, size)
+            self._save_range_state(state_path, state)
+        else:
+            logger.info(
+                f"Resuming {output_path.name}: {len(state.completed)}/"
+                f"{state.segment_count} segments already downloaded"
+            )
+
+        pending = state.pending()
+        done_bytes = size - sum(
+            end - start + 1 for start, end in map(state.segment_bounds, pending)
+        )
+        workers = max(1, min(self.connections, len(pending)))
+        logger.debug(f"Downloading {len(pending)} segments over {workers} connections")
+
+        lock = threading.Lock()
+        abort = threading.Event()
+        fd = os.open(part_path, os.O_WRONLY)
+        try:
+            with (
+                Spinner(
+                    desc=f"Downloading {output_path.name}",
+                    total=size,
+                    unit="B",
+                    unit_scale=True,
+                    disable=not show_progress,
+                    fps_limit=10.0,
+                    show_progress=True,
+                ) as spinner,
+                ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="range-download"
+                ) as executor,
+            ):
+                spinner.update(done_bytes)
+                # Segments request the original URL: GitHub redirects assets to
+                # signed CDN URLs that expire within minutes, so each segment
+                # follows the redirect to a fresh signature
+                futures = [
+                    executor.submit(
+                        self._fetch_segment,
+                        url,
+                        headers,
+                        fd,
+                        index,
+                        state,
+                        state_path,
+                        spinner,
+                        lock,
+                        abort,
+                    )
+                    for index in pending
+                ]
+                for future in futures:
+                    future.result()
+        except NetworkError:
+            raise
+        except Exception as e:
+            raise NetworkError(f"Failed to download {url}: {e}")
+        finally:
+            os.close(fd)
+
+        # Segments are traced on the pool threads; count them for this one too
+        tracing.count(bytes=size - done_bytes, requests=len(pending))
+        tracing.annotate(segments=len(pending), connections=workers)
+        os.replace(part_path, output_path)
+        state_path.unlink(missing_ok=True)
+        return hash_file(output_path)
+
+    @contextlib.contextmanager
+    def open_stream(
+        self,
+        url: str,
+        tee_path: Optional[Path] = None,
+        headers: Optional[Headers] = None,
+        show_progress: bool = True,
+        expected_sha512: Optional[str] = None,
+    ) -> Iterator[StreamingDownload]:
+        """Open a download as a readable stream, optionally saving it to disk.
+
+        The archive is written to ``<tee_path>.part`` while streaming and
+        renamed into place only once the whole body has arrived, so an
+        interrupted transfer never leaves a truncated archive behind. The
+        body is hashed as it is read; a saved copy is recorded in the
+        checksum manifest.
+
+        Args:
+            url: URL to download from
+            tee_path: Where to keep a copy of the downloaded bytes (None to discard)
+            headers: Optional request headers
+            show_progress: Whether to show the download spinner
+            expected_sha512: Published digest the body must match, if known
+
+        Yields:
+            A StreamingDownload to read the response body from
+
+        Raises:
+            NetworkError: If the request fails, the body is truncated, or it
+                does not match ``expected_sha512``
+        """
+        # The span covers the consumer's work too; transfer_seconds does not
+        with tracing.span("transfer_stream", "download", host=urlsplit(url).netloc):
+            req = urllib.request.Request(
+                url, headers={"User-Agent": DEFAULT_USER_AGENT, **(headers or {})}
+            )
+            try:
+                with tracing.request_span("GET", url) as trace_span:
+                    response = urllib.request.urlopen(req, timeout=self.timeout)
+                    trace_span.set(status=getattr(response, "status", None))
+            except Exception as e:
+                raise NetworkError(f"Failed to download {url}: {e}")
+
+            part_path = (
+                tee_path.with_name(tee_path.name + ".part") if tee_path else None
+            )
+            total_size = int(response.headers.get("Content-Length", 0) or 0)
+            name = tee_path.name if tee_path else url.rsplit("/", 1)[-1]
+
+            with (
+                response,
+                Spinner(
+                    desc=f"Streaming {name}",
+                    total=total_size,
+                    unit="B",
+                    unit_scale=True,
+                    disable=not show_progress,
+                    fps_limit=10.0,
+                    show_progress=True,
+                ) as spinner,
+            ):
+                tee = open(part_path, "wb") if part_path else None
+                try:
+                    stream = StreamingDownload(response, tee, spinner)
+                    try:
+                        yield stream
+                        stream.drain()
+                    finally:
+                        tracing.annotate(transfer_seconds=stream.read_ns / 1e9)
+                    tracing.count(bytes=stream.bytes_read)
+                    if total_size and stream.bytes_read != total_size:
+                        raise NetworkError(
+                            f"Download of {url} truncated: got {format_bytes(stream.bytes_read)} "
+                            f"of {format_bytes(total_size)}"
+                        )
+                    if expected_sha512 and stream.sha512 != expected_sha512:
+                        raise NetworkError(
+                            f"Checksum mismatch for {name}: expected {expected_sha512[:16]}..., "
+                            f"got {stream.sha512[:16]}..."
+                        )
+                except BaseException:
+                    if tee is not None and part_path is not None:
+                        tee.close()
+                        part_path.unlink(missing_ok=True)
+                    raise
+                if tee is not None and part_path is not None and tee_path is not None:
+                    tee.close()
+                    os.replace(part_path, tee_path)
+                    logger.info(f"Saved streamed asset to: {tee_path}")
+                    self._record_digest(tee_path, stream.sha512, bool(expected_sha512))
+
+    @tracing.traced("checksum_lookup")
+    def fetch_published_checksum(
+        self, download_url: str, asset_name: str
+    ) -> Optional[str]:
+        """Fetch the ``.sha512sum`` published alongside a release asset.
+
+        Returns:
+            The published digest, or None if the release has no usable
+            checksum file (most forks other than GE-Proton)
+        """
+        base_url = download_url.rsplit("/", 1)[0]
+        checksum_url = f"{base_url}/{checksum_asset_name(asset_name)}"
+        try:
+            result = self.network_client.get(checksum_url)
+        except Exception as e:
+            logger.debug(f"Could not fetch {checksum_url}: {e}")
+            return None
+        if result.returncode != 0 or not isinstance(result.stdout, str):
+            logger.debug(f"No published checksum at {checksum_url}")
+            return None
+        return parse_checksum_file(result.stdout, asset_name)
+
+    def _record_digest(self, path: Path, sha512: str, verified: bool) -> None:
+        """Store an archive's digest and current file state in the manifest."""
+        try:
+            size = self.file_system_client.size(path)
+            mtime = self.file_system_client.mtime(path)
+        except OSError as e:
+            logger.debug(f"Not recording digest for {path}: {e}")
+            return
+        ChecksumManifest(self.file_system_client, path.parent).record(
+            path.name, ManifestEntry(sha512, size, mtime, verified)
+        )
+
+    def _is_cached_archive_intact(self, path: Path) -> Optional[bool]:
+        """Validate a cached archive against the manifest, offline.
+
+        Returns:
+            True if the manifest vouches for the file, False if the file no
+            longer matches its recorded digest, None if it was never recorded
+        """
+        manifest = ChecksumManifest(self.file_system_client, path.parent)
+        entry = manifest.get(path.name)
+        if entry is None:
+            return None
+        size = self.file_system_client.size(path)
+        mtime = self.file_system_client.mtime(path)
+        if entry.matches(size, mtime):
+            return True
+        # The file was touched since it was recorded; re-hash it locally
+        try:
+            intact = hash_file(path) == entry.sha512
+        except OSError:
+            return False
+        if intact:
+            manifest.record(
+                path.name, ManifestEntry(entry.sha512, size, mtime, entry.verified)
+            )
+        else:
+            manifest.remove(path.name)
+        return intact
+
+    @tracing.traced("verify")
+    def _verify_download(
+        self, out_path: Path, sha512: str, download_url: str, asset_name: str
+    ) -> None:
+        """Check a fresh download against the published checksum and record it.
+
+        Raises:
+            NetworkError: If the published checksum does not match; the
+                corrupt file is removed
+        """
+        expected = self.fetch_published_checksum(download_url, asset_name)
+        if expected is not None and expected != sha512:
+            self.file_system_client.unlink(out_path)
+            raise NetworkError(
+                f"Checksum mismatch for {asset_name}: expected {expected[:16]}..., "
+                f"got {sha512[:16]}..."
+            )
+        if expected is not None:
+            logger.info(f"Verified SHA-512 checksum of {asset_name}")
+        self._record_digest(out_path, sha512, expected is not None)
+
+    @tracing.traced("download")
     def download_asset(
         self,
         repo: str,
@@ -82,9 +649,12 @@ class AssetDownloader:
         out_path: Path,
         release_manager: ReleaseManager,
         download_url: str | None = None,
+        show_progress: bool = True,
     ) -> Path:
         """Download a specific asset from a release with progress bar.
-        If a local file with the same name and size already exists, skip download.
+        If a local file matches its recorded checksum, or has the same size as
+        the remote asset, skip download. Fresh downloads are checked against
+        the release's published ``.sha512sum`` when there is one.
 
         Args:
             repo: Repository in format 'owner/repo'
@@ -93,6 +663,7 @@ class AssetDownloader:
             out_path: Path where the asset will be saved
             release_manager: ReleaseManager instance to get remote asset size
             download_url: Optional custom download URL (defaults to GitHub URL)
+            show_progress: Whether to show the download spinner
 
         Returns:
             Path to the downloaded file
@@ -105,9 +676,25 @@ class AssetDownloader:
                 f"https://github.com/{repo}/releases/download/{tag}/{asset_name}"
             )
         logger.info(f"Checking if asset needs download from: {download_url}")
+        tracing.annotate(asset=asset_name, connections=self.connections)
 
-        # Check if local file already exists and has the same size as remote
+        # A recorded digest lets us trust the cached archive without any request
+        intact: Optional[bool] = None
         if self.file_system_client.exists(out_path):
+            intact = self._is_cached_archive_intact(out_path)
+            if intact:
+                logger.info(
+                    f"Local asset {out_path} matches its recorded checksum, skipping download"
+                )
+                tracing.annotate(local="checksum-match")
+                return out_path
+            if intact is False:
+                logger.info(
+                    f"Local asset {out_path} no longer matches its recorded checksum, downloading again"
+                )
+
+        # Check if local file already exists and has the same size as remote
+        if self.file_system_client.exists(out_path) and intact is None:
             local_size = self.file_system_client.size(out_path)
             remote_size = release_manager.get_remote_asset_size(repo, tag, asset_name)
 
@@ -115,6 +702,7 @@ class AssetDownloader:
                 logger.info(
                     f"Local asset {out_path} already exists with matching size ({format_bytes(local_size)}), skipping download"
                 )
+                tracing.annotate(local="size-match")
                 return out_path
             else:
                 logger.info(
@@ -130,9 +718,41 @@ class AssetDownloader:
             "User-Agent": DEFAULT_USER_AGENT,
         }
 
+        with tracing.span("transfer", "download", host=urlsplit(download_url).netloc):
+            sha512 = self._transfer(
+                download_url, out_path, headers, asset_name, show_progress
+            )
+
+        logger.info(f"Downloaded asset to: {out_path}")
+        self._verify_download(out_path, sha512, download_url, asset_name)
+        return out_path
+
+    def _transfer(
+        self,
+        download_url: str,
+        out_path: Path,
+        headers: Headers,
+        asset_name: str,
+        show_progress: bool,
+    ) -> str:
+        """Download the asset body to out_path and return its SHA-512."""
+        if self.connections > 1:
+            try:
+                return self.download_with_ranges(
+                    download_url, out_path, headers, show_progress
+                )
+            except NetworkError as e:
+                # No curl fallback here: it would restart from byte 0 and
+                # discard the resumable state.
+                raise NetworkError(
+                    f"Failed to download {asset_name}: {e} (run again to resume)"
+                )
+
         try:
             # Use the new spinner-based download method
-            self.download_with_spinner(download_url, out_path, headers)
+            sha512 = self.download_with_spinner(
+                download_url, out_path, headers, show_progress
+            )
         except Exception as e:
             # Fallback to original curl method for compatibility
             logger.warning(f"Spinner download failed: {e}, falling back to curl")
@@ -146,6 +766,9 @@ class AssetDownloader:
                     )
             except Exception as fallback_error:
                 raise NetworkError(f"Failed to download {asset_name}: {fallback_error}")
-
-        logger.info(f"Downloaded asset to: {out_path}")
-        return out_path
+            try:
+                sha512 = hash_file(out_path)
+            except OSError as e:
+                raise NetworkError(f"Failed to read downloaded {asset_name}: {e}")
+            tracing.count(bytes=self.file_system_client.size(out_path))
+        return sha512
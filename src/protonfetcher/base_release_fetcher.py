@@ -2,17 +2,25 @@
 
 Defines the common interface and shared logic for GitHub and Forgejo release fetchers.
 Concrete subclasses implement platform-specific methods.
+
+Components are built on first use and the download, extraction and network
+modules are imported there, so operations that only inspect the extract
+directory (``--ls``, ``--rm``, ...) never load them.
 """
 
+from __future__ import annotations
+
 import logging
-import shutil
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Sequence, TypeVar
 
-from .archive_extractor import ArchiveExtractor
-from .asset_downloader import AssetDownloader
+from . import tracing
 from .common import (
+    DEFAULT_REMOVE_WORKERS,
     DEFAULT_TIMEOUT,
+    DEFAULT_WRITERS,
+    FORKS,
     DirectoryTuple,
     ExistenceCheckResult,
     FileSystemClientProtocol,
@@ -23,15 +31,63 @@ from .common import (
     ReleaseTagsList,
 )
 from .exceptions import LinkManagementError, NetworkError, ProtonFetcherError
-from .filesystem import FileSystemClient
+from .filesystem import FileSystemClient, is_real_filesystem
 from .link_manager import LinkManager, resolve_directory, resolve_directory_candidates
-from .network import NetworkClient
 from .platform_adapters import forgejo_adapter, github_adapter
-from .release_manager import ReleaseManager
 from .utils import format_bytes, parse_version
 
+if TYPE_CHECKING:
+    from .archive_extractor import ArchiveExtractor
+    from .asset_downloader import AssetDownloader
+    from .release_manager import ReleaseManager
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Guards the first construction of every lazily built component
+_component_lock = threading.RLock()
+
+
+class _component(Generic[T]):
+    """Attribute built on first access and then stored on the instance.
+
+    Like ``functools.cached_property``, but built at most once even when
+    parallel fork updates reach it at the same time. Assigning the
+    attribute (as tests do) replaces the component.
+    """
+
+    def __init__(self, build: Callable[[Any], T]) -> None:
+        self.build = build
+        self.name = build.__name__
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        with _component_lock:
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.build(instance)
+        return instance.__dict__[self.name]
+
+
+# Thread-local label used to prefix log lines while forks update in parallel
+_fork_label = threading.local()
+
+
+class _ForkLabelFilter(logging.Filter):
+    """Prefix log records emitted from a fork-update worker with the fork name."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        label = getattr(_fork_label, "value", None)
+        if label and isinstance(record.msg, str) and not hasattr(record, "fork"):
+            record.fork = label
+            record.msg = f"[{label}] {record.msg}"
+        return True
+
 
 class BaseReleaseFetcher:
     """Base class for release fetchers.
@@ -47,33 +103,90 @@ class BaseReleaseFetcher:
 
     platform: str = "github"
 
+    # Shared by every fetcher instance so symlink updates never interleave,
+    # even when forks are downloaded and extracted in parallel.
+    _link_lock = threading.RLock()
+
     def __init__(
         self,
         timeout: int = DEFAULT_TIMEOUT,
         network_client: Optional[NetworkClientProtocol] = None,
         file_system_client: Optional[FileSystemClientProtocol] = None,
         spinner_cls: Optional[Any] = None,
+        download_connections: int = 1,
+        decompressor: Optional[str] = None,
+        extract_threads: int = DEFAULT_WRITERS,
+        remove_workers: int = DEFAULT_REMOVE_WORKERS,
+        background_delete: bool = False,
+        dedup: Optional[str] = None,
     ) -> None:
         self.timeout = timeout
-        self.network_client = network_client or NetworkClient(timeout=timeout)
+        self.dedup = dedup
+        if network_client is not None:
+            self.network_client = network_client
         self.file_system_client = file_system_client or FileSystemClient()
+        self.download_connections = download_connections
+        self.decompressor = decompressor
+        self.extract_threads = extract_threads
+        self.remove_workers = remove_workers
+        self.background_delete = background_delete
+
+    # ------------------------------------------------------------------
+    # Components, built on first use
+    # ------------------------------------------------------------------
+
+    @_component
+    def network_client(self) -> NetworkClientProtocol:
+        """curl-based client, used when none was passed in."""
+        from .network import NetworkClient
+
+        return NetworkClient(timeout=self.timeout)
+
+    @_component
+    def release_manager(self) -> ReleaseManager:
+        from .release_manager import ReleaseManager
 
-        # Initialize the smaller, focused classes
         # Select platform adapter based on subclass platform attribute
         adapter: PlatformAdapter = (
             github_adapter if self.platform == "github" else forgejo_adapter
         )
-        self.release_manager = ReleaseManager(
+        return ReleaseManager(
             self.network_client,
             self.file_system_client,
-            timeout,
+            self.timeout,
             platform_adapter=adapter,
         )
-        self.asset_downloader = AssetDownloader(
-            self.network_client, self.file_system_client, timeout
+
+    @_component
+    def asset_downloader(self) -> AssetDownloader:
+        from .asset_downloader import AssetDownloader
+
+        return AssetDownloader(
+            self.network_client,
+            self.file_system_client,
+            self.timeout,
+            connections=self.download_connections,
+        )
+
+    @_component
+    def archive_extractor(self) -> ArchiveExtractor:
+        from .archive_extractor import ArchiveExtractor
+
+        return ArchiveExtractor(
+            self.file_system_client,
+            self.timeout,
+            decompressor=self.decompressor,
+            writers=self.extract_threads,
+        )
+
+    @_component
+    def link_manager(self) -> LinkManager:
+        return LinkManager(
+            self.file_system_client,
+            self.timeout,
+            remove_workers=self.remove_workers,
+            background_delete=self.background_delete,
         )
-        self.archive_extractor = ArchiveExtractor(self.file_system_client, timeout)
-        self.link_manager = LinkManager(self.file_system_client, timeout)
 
     # ------------------------------------------------------------------
     # Shared infrastructure (identical across platforms)
@@ -113,7 +226,10 @@ class BaseReleaseFetcher:
 
     def _validate_environment(self) -> None:
         """Validate that required tools and directories are available."""
-        if shutil.which("curl") is None:
+        import shutil
+
+        requires_curl = getattr(self.network_client, "requires_curl", True)
+        if requires_curl and shutil.which("curl") is None:
             raise NetworkError("curl is not available")
 
     def _ensure_directories_writable(self, output_dir: Path, extract_dir: Path) -> None:
@@ -141,15 +257,16 @@ class BaseReleaseFetcher:
         Returns:
             (True, directory) after ensuring symlinks are current
         """
-        if self.link_manager.are_links_up_to_date(
-            extract_dir, tag, fork, is_manual_release=is_manual_release
-        ):
-            logger.info("Symlinks are already up-to-date, skipping link management")
-            return True, directory
-
-        self.link_manager.manage_proton_links(
-            extract_dir, tag, fork, is_manual_release=is_manual_release
-        )
+        with self._link_lock:
+            if self.link_manager.are_links_up_to_date(
+                extract_dir, tag, fork, is_manual_release=is_manual_release
+            ):
+                logger.info("Symlinks are already up-to-date, skipping link management")
+                return True, directory
+
+            self.link_manager.manage_proton_links(
+                extract_dir, tag, fork, is_manual_release=is_manual_release
+            )
         return True, directory
 
     def _handle_existing_directory(
@@ -189,6 +306,7 @@ class BaseReleaseFetcher:
             )
         return False, extract_dir
 
+    @tracing.traced("relink", "links")
     def relink_fork(
         self,
         extract_dir: Path,
@@ -243,57 +361,41 @@ class BaseReleaseFetcher:
         """Remove a specific Proton fork release folder and its associated symbolic links."""
         return self.link_manager.remove_release(extract_dir, tag, fork)
 
-    def update_all_managed_forks(
-        self,
-        output_dir: Path,
-        extract_dir: Path,
-        dry_run: bool = False,
-    ) -> dict[ForkName, Path | None]:
-        """Update all forks that have managed symbolic links."""
-        from .common import FORKS
-
-        self._validate_environment()
-
-        if not dry_run:
-            self._ensure_directories_writable(output_dir, extract_dir)
-
-        results: dict[ForkName, Path | None] = {}
-        first_fork = True
-
-        for fork in FORKS.keys():
-            if FORKS[fork].platform != self.platform:
+    def get_managed_forks(self, extract_dir: Path) -> list[ForkName]:
+        """Return this platform's forks that have managed symbolic links."""
+        managed: list[ForkName] = []
+        for fork, cfg in FORKS.items():
+            if cfg.platform != self.platform:
                 logger.debug(f"Skipping {fork}: platform mismatch")
                 continue
             if not self.link_manager.has_managed_links(extract_dir, fork):
                 logger.debug(f"Skipping {fork}: no managed links found")
                 continue
+            managed.append(fork)
+        return managed
 
-            if not first_fork:
-                print()
-            first_fork = False
-
-            logger.info(f"Updating {fork}: fetching latest release...")
-            repo = FORKS[fork].repo
-
-            try:
-                result = self.fetch_and_extract(
-                    repo,
-                    output_dir,
-                    extract_dir,
-                    fork=fork,
-                    dry_run=dry_run,
-                )
-                results[fork] = result
-                logger.debug(f"Successfully updated {fork}")
-            except ProtonFetcherError as e:
-                logger.error(f"Failed to update {fork}: {e}")
-                results[fork] = None
-                continue
-
-        if not results:
-            logger.warning("No managed forks found to update")
+    def update_all_managed_forks(
+        self,
+        output_dir: Path,
+        extract_dir: Path,
+        dry_run: bool = False,
+        jobs: int = 1,
+        stream: bool = False,
+        keep_archive: bool = True,
+    ) -> dict[ForkName, Path | None]:
+        """Update all forks that have managed symbolic links.
 
-        return results
+        Args:
+            output_dir: Directory to download assets to
+            extract_dir: Directory to extract to
+            dry_run: If True, only show what would be done
+            jobs: Number of forks to fetch and extract concurrently
+            stream: If True, extract each release while it downloads
+            keep_archive: In stream mode, also save archives to output_dir
+        """
+        return update_managed_forks(
+            [self], output_dir, extract_dir, dry_run, jobs, stream, keep_archive
+        )
 
     def check_for_updates(self, extract_dir: Path, fork: ForkName) -> str | None:
         """Check if a newer release is available for the specified fork."""
@@ -309,6 +411,20 @@ class BaseReleaseFetcher:
         except Exception as e:
             raise ProtonFetcherError(f"Failed to check for updates for {fork}: {e}")
 
+    async def check_for_updates_async(
+        self, extract_dir: Path, fork: ForkName
+    ) -> str | None:
+        """Async variant of check_for_updates, for checking many forks at once."""
+        installed_versions = self.link_manager.get_installed_versions(extract_dir, fork)
+        repo = FORKS[fork].repo
+
+        try:
+            return await self.release_manager.check_for_newer_release_async(
+                repo, installed_versions, fork
+            )
+        except Exception as e:
+            raise ProtonFetcherError(f"Failed to check for updates for {fork}: {e}")
+
     # ------------------------------------------------------------------
     # Platform-agnostic directory helpers (identical across platforms)
     # ------------------------------------------------------------------
@@ -346,6 +462,10 @@ class BaseReleaseFetcher:
 
         Returns:
             Tuple of (exists, actual_path)
+
+        Note:
+            Releases are extracted into a staging directory and renamed into
+            place, so an existing directory is always a complete install.
         """
         if alternative and alternative.exists() and alternative.is_dir():
             return True, alternative
@@ -438,6 +558,9 @@ class BaseReleaseFetcher:
         Returns:
             Full download URL
         """
+        known = self.release_manager.get_known_asset(repo, tag, asset_name)
+        if known is not None:
+            return known.download_url
         return self.release_manager.platform_adapter.build_download_url(
             repo, tag, asset_name
         )
@@ -447,18 +570,29 @@ class BaseReleaseFetcher:
     # ------------------------------------------------------------------
 
     def _determine_release_tag(
-        self, repo: str, release_tag: str | None = None, **kwargs: Any
+        self,
+        repo: str,
+        release_tag: str | None = None,
+        fork: ForkName = ForkName.GE_PROTON,
+        **kwargs: Any,
     ) -> str:
-        """Determine the release tag to use."""
+        """Determine the release tag to use.
+
+        The latest release is resolved from the releases API, which also
+        describes its asset, so the rest of the fetch needs no lookups. The
+        latest-release redirect is used if the API is unavailable.
+        """
         manual_release_tag = kwargs.get("manual_release_tag", release_tag)
-        if manual_release_tag is None:
+        if manual_release_tag is not None:
+            return manual_release_tag
+        try:
+            return self.release_manager.resolve_release(repo, fork).tag
+        except ProtonFetcherError as e:
+            logger.debug(f"Release API lookup failed, following redirect: {e}")
             return self.fetch_latest_tag(repo)
-        return manual_release_tag
 
-    def _download_asset(
-        self, repo: str, release_tag: str, fork: ForkName, output_dir: Path
-    ) -> Path:
-        """Download the asset and return the archive path."""
+    def _resolve_asset_name(self, repo: str, release_tag: str, fork: ForkName) -> str:
+        """Find the release asset name, raising if the release has none."""
         try:
             asset_name = self.find_asset_by_name(repo, release_tag, fork)
         except ProtonFetcherError as e:
@@ -470,6 +604,18 @@ class BaseReleaseFetcher:
             raise ProtonFetcherError(
                 f"Could not find asset for release {release_tag} in {repo}"
             )
+        return asset_name
+
+    def _download_asset(
+        self,
+        repo: str,
+        release_tag: str,
+        fork: ForkName,
+        output_dir: Path,
+        show_progress: bool = True,
+    ) -> Path:
+        """Download the asset and return the archive path."""
+        asset_name = self._resolve_asset_name(repo, release_tag, fork)
 
         archive_path = output_dir / asset_name
         download_url = self._build_download_url(repo, release_tag, asset_name)
@@ -480,9 +626,11 @@ class BaseReleaseFetcher:
             archive_path,
             self.release_manager,
             download_url=download_url,
+            show_progress=show_progress,
         )
         return archive_path
 
+    @tracing.traced("dry_run")
     def _dry_run_workflow(
         self,
         repo: str,
@@ -493,17 +641,7 @@ class BaseReleaseFetcher:
         is_manual_release: bool,
     ) -> None:
         """Execute dry-run workflow: show what would be done without making changes."""
-        try:
-            asset_name = self.find_asset_by_name(repo, release_tag, fork)
-        except ProtonFetcherError as e:
-            raise ProtonFetcherError(
-                f"Could not find asset for release {release_tag} in {repo}: {e}"
-            )
-
-        if asset_name is None:
-            raise ProtonFetcherError(
-                f"Could not find asset for release {release_tag} in {repo}"
-            )
+        asset_name = self._resolve_asset_name(repo, release_tag, fork)
 
         try:
             remote_size = self.get_remote_asset_size(repo, release_tag, asset_name)
@@ -553,20 +691,99 @@ class BaseReleaseFetcher:
         show_file_details: bool,
     ) -> Path:
         """Extract the archive and manage symbolic links."""
-        self.archive_extractor.extract_archive(
-            archive_path, extract_dir, show_progress, show_file_details
+        with self.archive_extractor.staging_directory(extract_dir) as stage:
+            self.archive_extractor.extract_archive(
+                archive_path, stage, show_progress, show_file_details
+            )
+            self._deduplicate(extract_dir, stage)
+        return self._finish_extraction(
+            extract_dir, release_tag, fork, is_manual_release
         )
 
+    @tracing.traced("stream_and_extract")
+    def _stream_and_extract(
+        self,
+        repo: str,
+        release_tag: str,
+        fork: ForkName,
+        output_dir: Path,
+        extract_dir: Path,
+        keep_archive: bool,
+        show_progress: bool,
+    ) -> bool:
+        """Extract the release while it downloads, without a separate extract pass.
+
+        Returns:
+            True if the release was streamed into extract_dir, False if an
+            archive is already on disk and the regular path should reuse it
+        """
+        asset_name = self._resolve_asset_name(repo, release_tag, fork)
+        archive_path = output_dir / asset_name
+        if self.file_system_client.exists(archive_path):
+            logger.info(f"Archive already present, skipping streaming: {archive_path}")
+            return False
+
+        download_url = self._build_download_url(repo, release_tag, asset_name)
+        expected_sha512 = self.asset_downloader.fetch_published_checksum(
+            download_url, asset_name
+        )
+        logger.info(f"Streaming {asset_name} into {extract_dir}")
+        # The stage is committed only after the stream was verified complete
+        # and, where a checksum is published, intact
+        with self.archive_extractor.staging_directory(extract_dir) as stage:
+            with self.asset_downloader.open_stream(
+                download_url,
+                tee_path=archive_path if keep_archive else None,
+                show_progress=show_progress,
+                expected_sha512=expected_sha512,
+            ) as stream:
+                self.archive_extractor.extract_stream(stream, stage, asset_name)
+            self._deduplicate(extract_dir, stage)
+        return True
+
+    def _deduplicate(self, extract_dir: Path, stage: Path) -> None:
+        """Share identical files of a staged release with installed ones.
+
+        Only runs when deduplication was requested and the real filesystem is
+        used. A failure leaves the remaining files as extracted.
+        """
+        if self.dedup is None or not is_real_filesystem(self.file_system_client):
+            return
+        from .dedup import deduplicate_release
+
+        try:
+            with tracing.span("dedup", mode=self.dedup) as trace_span:
+                stats = deduplicate_release(extract_dir, stage, self.dedup)
+                trace_span.set(files=stats.files, bytes_saved=stats.bytes_saved)
+        except OSError as e:
+            logger.warning(f"Deduplication incomplete: {e}")
+            return
+        if stats.bytes_saved:
+            logger.info(
+                f"Deduplicated {stats.linked + stats.reflinked} files, "
+                f"saving {format_bytes(stats.bytes_saved)}"
+            )
+
+    def _finish_extraction(
+        self,
+        extract_dir: Path,
+        release_tag: str,
+        fork: ForkName,
+        is_manual_release: bool,
+    ) -> Path:
+        """Locate the extracted release and update its symbolic links."""
         # Find where the archive extracted to
         unpacked = self._find_extracted_directory(extract_dir, release_tag, fork)
 
         # Manage symbolic links
-        self.link_manager.manage_proton_links(
-            extract_dir, release_tag, fork, is_manual_release=is_manual_release
-        )
+        with self._link_lock:
+            self.link_manager.manage_proton_links(
+                extract_dir, release_tag, fork, is_manual_release=is_manual_release
+            )
 
         return unpacked
 
+    @tracing.traced("fetch_and_extract")
     def fetch_and_extract(
         self,
         repo: str,
@@ -577,6 +794,8 @@ class BaseReleaseFetcher:
         show_progress: bool = True,
         show_file_details: bool = True,
         dry_run: bool = False,
+        stream: bool = False,
+        keep_archive: bool = True,
     ) -> Path | None:
         """Fetch and extract a Proton release.
 
@@ -589,17 +808,22 @@ class BaseReleaseFetcher:
             show_progress: Whether to show the progress bar
             show_file_details: Whether to show file details during extraction
             dry_run: If True, only show what would be done without making changes
+            stream: If True, extract while downloading instead of afterwards
+            keep_archive: In stream mode, also save the archive to output_dir
 
         Returns:
             Path to the extract directory, or None in dry-run mode
         """
+        tracing.annotate(repo=repo, fork=str(fork), stream=stream)
         self._validate_environment()
 
         if not dry_run:
             self._ensure_directories_writable(output_dir, extract_dir)
+            self.archive_extractor.sweep_stale_stages(extract_dir)
 
         is_manual_release = release_tag is not None
-        release_tag = self._determine_release_tag(repo, release_tag)
+        release_tag = self._determine_release_tag(repo, release_tag, fork)
+        tracing.annotate(tag=release_tag)
 
         # Dry-run
         if dry_run:
@@ -620,10 +844,26 @@ class BaseReleaseFetcher:
                 extract_dir, release_tag, fork, actual_directory, is_manual_release
             )
             if skip_processing:
+                tracing.annotate(installed=True)
                 return result
 
+        if stream and self._stream_and_extract(
+            repo,
+            release_tag,
+            fork,
+            output_dir,
+            extract_dir,
+            keep_archive,
+            show_progress,
+        ):
+            return self._finish_extraction(
+                extract_dir, release_tag, fork, is_manual_release
+            )
+
         # Download
-        archive_path = self._download_asset(repo, release_tag, fork, output_dir)
+        archive_path = self._download_asset(
+            repo, release_tag, fork, output_dir, show_progress
+        )
 
         # Check if extracted during download (race condition)
         skip_processing, result = self._check_post_download_directory(
@@ -641,3 +881,187 @@ class BaseReleaseFetcher:
             show_progress,
             show_file_details,
         )
+
+
+# ----------------------------------------------------------------------
+# Multi-fork update engine
+# ----------------------------------------------------------------------
+
+
+def _update_fork(
+    fetcher: BaseReleaseFetcher,
+    fork: ForkName,
+    output_dir: Path,
+    extract_dir: Path,
+    dry_run: bool,
+    parallel: bool,
+    stream: bool = False,
+    keep_archive: bool = True,
+) -> Path | None:
+    """Fetch and extract the latest release of one fork, logging failures."""
+    logger.info(f"Updating {fork}: fetching latest release...")
+    try:
+        with tracing.span("update_fork", fork=str(fork)):
+            result = fetcher.fetch_and_extract(
+                FORKS[fork].repo,
+                output_dir,
+                extract_dir,
+                fork=fork,
+                show_progress=not parallel,
+                show_file_details=not parallel,
+                dry_run=dry_run,
+                stream=stream,
+                keep_archive=keep_archive,
+            )
+        logger.debug(f"Successfully updated {fork}")
+        return result
+    except ProtonFetcherError as e:
+        logger.error(f"Failed to update {fork}: {e}")
+        return None
+
+
+def _update_fork_labelled(
+    fetcher: BaseReleaseFetcher,
+    fork: ForkName,
+    output_dir: Path,
+    extract_dir: Path,
+    dry_run: bool,
+    stream: bool = False,
+    keep_archive: bool = True,
+) -> Path | None:
+    """Worker entry point: run `_update_fork` with the fork name as log prefix."""
+    _fork_label.value = fork.value
+    try:
+        return _update_fork(
+            fetcher, fork, output_dir, extract_dir, dry_run, True, stream, keep_archive
+        )
+    finally:
+        _fork_label.value = None
+
+
+async def _resolve_latest_releases(
+    tasks: Sequence[tuple[BaseReleaseFetcher, ForkName]],
+) -> None:
+    """Resolve the latest release of every fork concurrently.
+
+    The results are kept by each fetcher's ReleaseManager, so the per-fork
+    updates that follow need no further discovery requests. Failures are
+    left for those updates to report.
+    """
+    import asyncio
+
+    results = await asyncio.gather(
+        *(
+            fetcher.release_manager.resolve_release_async(FORKS[fork].repo, fork)
+            for fetcher, fork in tasks
+        ),
+        return_exceptions=True,
+    )
+    for (_, fork), result in zip(tasks, results):
+        if isinstance(result, BaseException):
+            logger.debug(
+                f"Could not resolve latest release of {fork} up front: {result}"
+            )
+
+
+def update_managed_forks(
+    fetchers: Sequence[BaseReleaseFetcher],
+    output_dir: Path,
+    extract_dir: Path,
+    dry_run: bool = False,
+    jobs: int = 1,
+    stream: bool = False,
+    keep_archive: bool = True,
+) -> dict[ForkName, Path | None]:
+    """Update every fork with managed links across the given fetchers.
+
+    With ``jobs > 1``, tag resolution, download and extraction for different
+    forks run on a thread pool. Symlink management stays serialized through
+    `BaseReleaseFetcher._link_lock`, progress spinners are suppressed, and
+    log lines are prefixed with the fork name so output stays readable.
+
+    With ``jobs == 1``, forks are updated one at a time, but their latest
+    releases are resolved concurrently first.
+
+    Args:
+        fetchers: Fetchers whose managed forks should be updated
+        output_dir: Directory to download assets to
+        extract_dir: Directory to extract to
+        dry_run: If True, only show what would be done
+        jobs: Maximum number of forks to process concurrently
+        stream: If True, extract each release while it downloads
+        keep_archive: In stream mode, also save archives to output_dir
+
+    Returns:
+        Mapping of fork to extracted path (None on failure or dry run)
+    """
+    for fetcher in fetchers:
+        fetcher._validate_environment()
+
+    if not dry_run and fetchers:
+        fetchers[0]._ensure_directories_writable(output_dir, extract_dir)
+
+    tasks = [
+        (fetcher, fork)
+        for fetcher in fetchers
+        for fork in fetcher.get_managed_forks(extract_dir)
+    ]
+
+    results: dict[ForkName, Path | None] = {}
+    if not tasks:
+        logger.warning("No managed forks found to update")
+        return results
+
+    if jobs <= 1 or len(tasks) == 1:
+        if len(tasks) > 1:
+            import asyncio
+
+            with tracing.span("resolve_latest_releases", forks=len(tasks)):
+                asyncio.run(_resolve_latest_releases(tasks))
+        for index, (fetcher, fork) in enumerate(tasks):
+            if index:
+                print()
+            results[fork] = _update_fork(
+                fetcher,
+                fork,
+                output_dir,
+                extract_dir,
+                dry_run,
+                False,
+                stream,
+                keep_archive,
+            )
+        return results
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(jobs, len(tasks))
+    logger.info(f"Updating {len(tasks)} forks with {workers} parallel jobs...")
+    label_filter = _ForkLabelFilter()
+    handlers = logging.getLogger().handlers
+    for handler in handlers:
+        handler.addFilter(label_filter)
+    try:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="fork-update"
+        ) as executor:
+            futures = {
+                fork: executor.submit(
+                    _update_fork_labelled,
+                    fetcher,
+                    fork,
+                    output_dir,
+                    extract_dir,
+                    dry_run,
+                    stream,
+                    keep_archive,
+                )
+                for fetcher, fork in tasks
+            }
+            for fork, future in futures.items():
+                results[fork] = future.result()
+    finally:
+        for handler in handlers:
+            handler.removeFilter(label_filter)
+
+    return results
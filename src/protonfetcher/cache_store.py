@@ -0,0 +1,265 @@
+"""Single-file cache store for ProtonFetcher.
+
+All cached data (asset sizes, release metadata) lives in one SQLite
+database under the XDG cache directory. Entries carry an optional expiry
+time and a last-access timestamp; the store evicts expired entries and,
+once over its size budget, the least recently used ones.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DB_NAME = "cache.sqlite3"
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Files written by the per-entry JSON cache that this store replaces
+_LEGACY_CACHE_FILE = re.compile(r"^(?:meta-)?[0-9a-f]{32}(?:\.json)?$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the ProtonFetcher cache directory ($XDG_CACHE_HOME/protonfetcher)."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "protonfetcher"
+    return Path.home() / ".cache" / "protonfetcher"
+
+
+@dataclass
+class CacheStats:
+    """Summary of the cache contents."""
+
+    path: Path
+    file_size: int
+    entries: int
+    expired: int
+    total_bytes: int
+    max_bytes: int
+    namespaces: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+class CacheStore:
+    """Key/value cache backed by a single SQLite file.
+
+    The database is opened on first use, so constructing a store costs
+    nothing for commands that never touch the cache. Every write runs in
+    its own transaction, and all methods are safe to call from multiple
+    threads. Cache failures are logged and treated as misses; they never
+    propagate to callers.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._unavailable = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open (and if necessary create) the database. Caller holds the lock."""
+        if self._conn is not None or self._unavailable:
+            return self._conn
+
+        created = not self.path.exists()
+        for attempt in range(2):
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+                break
+            except sqlite3.DatabaseError as e:
+                if attempt == 0 and self.path.exists():
+                    logger.debug(f"Recreating unreadable cache {self.path}: {e}")
+                    self.path.unlink(missing_ok=True)
+                    created = True
+                    continue
+                logger.debug(f"Cache unavailable at {self.path}: {e}")
+                self._unavailable = True
+                return None
+            except OSError as e:
+                logger.debug(f"Cache unavailable at {self.path}: {e}")
+                self._unavailable = True
+                return None
+
+        if created:
+            self._remove_legacy_files()
+        return self._conn
+
+    def _remove_legacy_files(self) -> None:
+        """Delete the per-entry JSON files left by older versions."""
+        try:
+            for entry in os.scandir(self.path.parent):
+                if entry.is_file() and _LEGACY_CACHE_FILE.match(entry.name):
+                    os.unlink(entry.path)
+        except OSError as e:
+            logger.debug(f"Could not remove legacy cache files: {e}")
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """Return a cached value, or None if missing or expired."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            now = self.clock()
+            try:
+                row = conn.execute(
+                    "SELECT value, expires FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+                if row is None:
+                    return None
+                value, expires = row
+                with conn:
+                    if expires is not None and expires <= now:
+                        conn.execute(
+                            "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                            (namespace, key),
+                        )
+                        return None
+                    conn.execute(
+                        "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                        (now, namespace, key),
+                    )
+                return value
+            except sqlite3.Error as e:
+                logger.debug(f"Cache read failed: {e}")
+                return None
+
+    def set(
+        self, namespace: str, key: str, value: str, ttl: Optional[float] = None
+    ) -> None:
+        """Store a value, replacing any previous one.
+
+        Args:
+            namespace: Logical group of entries (e.g. "asset-size")
+            key: Entry key within the namespace
+            value: Text to store
+            ttl: Lifetime in seconds, or None to keep until evicted
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            now = self.clock()
+            expires = None if ttl is None else now + ttl
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(namespace, key, value, size, expires, accessed) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (namespace, key, value, len(value), expires, now),
+                    )
+                    self._evict(conn, now)
+            except sqlite3.Error as e:
+                logger.debug(f"Cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then LRU entries until under the size budget."""
+        conn.execute(
+            "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,)
+        )
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims: list[tuple[str, str]] = []
+        for namespace, key, size in conn.execute(
+            "SELECT namespace, key, size FROM entries ORDER BY accessed"
+        ):
+            victims.append((namespace, key))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+        logger.debug(f"Evicted {len(victims)} least recently used cache entries")
+
+    def clear(self) -> int:
+        """Remove every entry and compact the database.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            try:
+                with conn:
+                    removed = conn.execute("DELETE FROM entries").rowcount
+                conn.execute("VACUUM")
+                return removed
+            except sqlite3.Error as e:
+                logger.debug(f"Cache clear failed: {e}")
+                return 0
+
+    def stats(self) -> CacheStats:
+        """Summarise entry counts and sizes per namespace."""
+        stats = CacheStats(
+            path=self.path,
+            file_size=0,
+            entries=0,
+            expired=0,
+            total_bytes=0,
+            max_bytes=self.max_bytes,
+        )
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return stats
+            now = self.clock()
+            try:
+                for namespace, count, size, expired in conn.execute(
+                    "SELECT namespace, COUNT(*), SUM(size), "
+                    "SUM(expires IS NOT NULL AND expires <= ?) "
+                    "FROM entries GROUP BY namespace ORDER BY namespace",
+                    (now,),
+                ):
+                    stats.namespaces[namespace] = (count, size)
+                    stats.entries += count
+                    stats.total_bytes += size
+                    stats.expired += expired
+            except sqlite3.Error as e:
+                logger.debug(f"Cache stats failed: {e}")
+        try:
+            stats.file_size = self.path.stat().st_size
+        except OSError:
+            pass
+        return stats
+
+    def close(self) -> None:
+        """Close the database connection (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
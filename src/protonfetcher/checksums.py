@@ -0,0 +1,142 @@
+"""SHA-512 verification of downloaded release archives.
+
+Digests are computed while the archive is downloaded and stored in a
+per-directory manifest next to the archives. A later run can then tell
+that a cached archive is intact from its size and mtime alone, without a
+network round trip, and re-hash it locally if the file was touched.
+Where a release publishes a ``.sha512sum`` asset, the digest is also
+checked against it.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from .common import FileSystemClientProtocol
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".protonfetcher-manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_ARCHIVE_SUFFIXES = (".tar.gz", ".tar.xz", ".tar.zst")
+_CHECKSUM_LINE = re.compile(r"^([0-9a-fA-F]{128})(?:\s+\*?(?:\./)?(\S.*?))?\s*$")
+
+
+def hash_file(path: Path) -> str:
+    """Return the hex SHA-512 digest of a file, reading it in chunks."""
+    hasher = hashlib.sha512()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def checksum_asset_name(asset_name: str) -> str:
+    """Return the name of the published checksum file for an archive.
+
+    GE-Proton publishes ``GE-Proton10-20.sha512sum`` next to
+    ``GE-Proton10-20.tar.gz``.
+    """
+    for suffix in _ARCHIVE_SUFFIXES:
+        if asset_name.endswith(suffix):
+            return asset_name[: -len(suffix)] + ".sha512sum"
+    return asset_name + ".sha512sum"
+
+
+def parse_checksum_file(text: str, asset_name: str) -> Optional[str]:
+    """Extract the digest for ``asset_name`` from ``sha512sum`` output.
+
+    Entries naming another file are ignored, so a checksum file published
+    for a different asset is never checked against this one.
+
+    Returns:
+        Lowercase hex digest, or None if the text has no usable entry
+    """
+    unnamed: list[str] = []
+    for line in text.splitlines():
+        match = _CHECKSUM_LINE.match(line.strip())
+        if not match:
+            continue
+        digest, filename = match.group(1).lower(), match.group(2)
+        if not filename:
+            unnamed.append(digest)
+        elif Path(filename).name == asset_name:
+            return digest
+    # A single bare digest describes the one archive it was published with
+    return unnamed[0] if len(unnamed) == 1 else None
+
+
+@dataclass
+class ManifestEntry:
+    """Recorded digest of an archive and the file state it was taken from."""
+
+    sha512: str
+    size: int
+    mtime: float
+    verified: bool = False
+
+    def matches(self, size: int, mtime: float) -> bool:
+        return self.size == size and self.mtime == mtime
+
+
+class ChecksumManifest:
+    """JSON manifest of archive digests stored in the download directory.
+
+    Reads and writes go through the filesystem client; writes replace the
+    file atomically. All instances share one lock because forks updated in
+    parallel write to the same download directory.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(
+        self, file_system_client: FileSystemClientProtocol, directory: Path
+    ) -> None:
+        self.file_system_client = file_system_client
+        self.path = directory / MANIFEST_NAME
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            if not self.file_system_client.exists(self.path):
+                return {}
+            data = json.loads(self.file_system_client.read(self.path))
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable checksum manifest {self.path}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: dict[str, dict]) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.file_system_client.write(
+                tmp_path, json.dumps(entries, indent=2, sort_keys=True).encode()
+            )
+            self.file_system_client.rename(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not update checksum manifest {self.path}: {e}")
+
+    def get(self, asset_name: str) -> Optional[ManifestEntry]:
+        with self._lock:
+            raw = self._load().get(asset_name)
+        try:
+            return ManifestEntry(**raw) if isinstance(raw, dict) else None
+        except TypeError:
+            return None
+
+    def record(self, asset_name: str, entry: ManifestEntry) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[asset_name] = asdict(entry)
+            self._save(entries)
+
+    def remove(self, asset_name: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(asset_name, None) is not None:
+                self._save(entries)
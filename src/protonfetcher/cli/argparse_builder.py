@@ -6,7 +6,17 @@ Extracted from cli.py to separate parser construction from dispatch logic.
 import argparse
 
 from protonfetcher.__version__ import __version__
-from protonfetcher.common import DEFAULT_FORK, FORKS
+from protonfetcher.common import (
+    DECOMPRESSOR_ENV,
+    DECOMPRESSORS,
+    DEDUP_MODES,
+    DEFAULT_FORK,
+    DEFAULT_REMOVE_WORKERS,
+    DEFAULT_WRITERS,
+    FORKS,
+    NETWORK_BACKEND_ENV,
+    NETWORK_BACKENDS,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -49,11 +59,93 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="N",
         help="Number of newest versions to keep when pruning (default: prune all)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of forks to download and extract in parallel when updating all forks with -f (default: 1)",
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Download each release as N parallel HTTP Range segments; interrupted downloads resume (default: 1, single stream)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Extract the release while it downloads instead of after the download finishes",
+    )
+    parser.add_argument(
+        "--no-keep-archive",
+        dest="keep_archive",
+        action="store_false",
+        help="With --stream, do not save the downloaded archive to the output directory",
+    )
+    parser.add_argument(
+        "--extract-threads",
+        type=int,
+        default=DEFAULT_WRITERS,
+        metavar="N",
+        help=f"Number of threads writing extracted files while the archive is decompressed; 1 extracts sequentially (default: {DEFAULT_WRITERS})",
+    )
+    parser.add_argument(
+        "--delete-threads",
+        type=int,
+        default=DEFAULT_REMOVE_WORKERS,
+        metavar="N",
+        help=f"Number of threads deleting old releases with --rm and --prune; 1 deletes each release with a single rmtree (default: {DEFAULT_REMOVE_WORKERS})",
+    )
+    parser.add_argument(
+        "--background-delete",
+        action="store_true",
+        help="Move removed releases aside and delete them in a detached background process",
+    )
+    parser.add_argument(
+        "--dedup",
+        nargs="?",
+        const="hardlink",
+        choices=DEDUP_MODES,
+        default=None,
+        help="Share files identical to already installed releases: 'hardlink' (the default when given without a mode) or 'reflink' where the filesystem supports it",
+    )
+    parser.add_argument(
+        "--decompressor",
+        choices=DECOMPRESSORS,
+        default=None,
+        help=f"Archive decompression backend: 'auto' decompresses out of process with pigz, multi-threaded xz or zstd when installed and more than one CPU is available, 'python' decompresses in-process (default: ${DECOMPRESSOR_ENV} or auto)",
+    )
+    parser.add_argument(
+        "--network-backend",
+        choices=NETWORK_BACKENDS,
+        default=None,
+        help=f"HTTP backend: 'curl' spawns curl per request, 'http' reuses pooled keep-alive connections (default: ${NETWORK_BACKEND_ENV} or curl)",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        default=None,
+        help="Write a Chrome trace of the run's phases and worker threads to FILE (open it in https://ui.perfetto.dev)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        default=None,
+        help="After the run, atomically write Prometheus metrics to PATH for node-exporter's textfile collector (name it *.prom)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print --ls output as JSON (links, installed and prunable builds per fork)",
+    )
 
     # Mutually exclusive operation group
     group = parser.add_mutually_exclusive_group()
@@ -78,6 +170,16 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Remove old releases for all forks, keeping the N newest (use with --fork for specific fork)",
     )
+    group.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Show the size and contents of the metadata cache",
+    )
+    group.add_argument(
+        "--cache-clear",
+        action="store_true",
+        help="Remove all entries from the metadata cache",
+    )
 
     # --release is not mutually exclusive; can be used with --rm
     parser.add_argument(
@@ -3,12 +3,14 @@
 Thin re-export shim that delegates to extracted submodules.
 """
 
+import contextlib
 import logging
 import sys
 from pathlib import Path
 from typing import Any
 
-from ..common import ForkName
+from .. import tracing
+from ..common import DEFAULT_REMOVE_WORKERS, DEFAULT_WRITERS, ForkName
 from ..exceptions import ProtonFetcherError
 from ..forgejo_fetcher import ForgejoReleaseFetcher
 from ..github_fetcher import GitHubReleaseFetcher
@@ -16,6 +18,7 @@ from ..github_fetcher import GitHubReleaseFetcher
 # Import from submodules (backward-compatible aliases)
 from .argparse_builder import build_parser, parse_args
 from .dispatch import (
+    OFFLINE_OPERATIONS,
     CLIContext,
     get_explicit_flags,
     get_operation_from_args,
@@ -33,6 +36,7 @@ from .fork_utils import (
     print_prunable_versions,
 )
 from .handlers import (
+    handle_cache_operation,
     handle_check_operation,
     handle_default_fetch,
     handle_fetch_with_fork,
@@ -213,9 +217,61 @@ def main() -> None:
     output_dir = Path(args.output).expanduser()
     setup_logging(args.debug)
 
+    trace_path = getattr(args, "trace", None)
+    trace_file = Path(trace_path).expanduser() if trace_path else None
+    metrics_path = getattr(args, "metrics_file", None)
+    metrics_file = Path(metrics_path).expanduser() if metrics_path else None
+    with tracing.record(
+        trace_file, force=metrics_file is not None, argv=argv_list
+    ) as tracer:
+        exporter: contextlib.AbstractContextManager[None] = contextlib.nullcontext()
+        if metrics_file is not None:
+            from .. import metrics
+
+            exporter = metrics.export(metrics_file, tracer, extract_dir)
+        with exporter:
+            _run(args, argv_list, explicit_flags, extract_dir, output_dir)
+
+
+def _run(
+    args: Any,
+    argv_list: list[str],
+    explicit_flags: dict[str, bool],
+    extract_dir: Path,
+    output_dir: Path,
+) -> None:
+    """Build the fetchers and run the requested operation."""
+    if args.cache_stats or args.cache_clear:
+        # Cache maintenance needs neither the network nor the fetchers
+        handle_cache_operation(args)
+        return
+
+    # Offline operations leave the fetchers to create a client if one is
+    # ever needed, which keeps the network stack out of --ls and friends
+    network_client = None
+    if get_operation_from_args(args, argv_list) not in OFFLINE_OPERATIONS:
+        from ..network import create_network_client
+
+        try:
+            network_client = create_network_client(args.network_backend)
+        except ValueError as e:
+            print(f"Error: {e}")
+            raise SystemExit(1) from e
+
     try:
-        fetcher = GitHubReleaseFetcher()
-        forgejo_fetcher = ForgejoReleaseFetcher()
+        # Both fetchers share one client so the pooled backend reuses connections
+        fetcher_options = {
+            "download_connections": getattr(args, "connections", 1),
+            "decompressor": getattr(args, "decompressor", None),
+            "extract_threads": getattr(args, "extract_threads", DEFAULT_WRITERS),
+            "remove_workers": getattr(args, "delete_threads", DEFAULT_REMOVE_WORKERS),
+            "background_delete": getattr(args, "background_delete", False),
+            "dedup": getattr(args, "dedup", None),
+        }
+        fetcher = GitHubReleaseFetcher(network_client=network_client, **fetcher_options)
+        forgejo_fetcher = ForgejoReleaseFetcher(
+            network_client=network_client, **fetcher_options
+        )
 
         ctx = CLIContext(
             fetcher=fetcher,
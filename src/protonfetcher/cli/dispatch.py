@@ -69,6 +69,10 @@ def has_explicit_fork(argv_list: list[str]) -> bool:
     return is_flag_passed(argv_list, "--fork", "-f")
 
 
+# Operations that only look at the extract directory
+OFFLINE_OPERATIONS = frozenset({"ls", "relink", "rm", "prune"})
+
+
 def get_operation_from_args(
     args: Any, argv_list: list[str] | None = None
 ) -> str | None:
@@ -138,6 +142,9 @@ def resolve_default_operation(ctx: CLIContext, argv_list: list[str]) -> None:
                 ctx.output_dir,
                 ctx.extract_dir,
                 ctx.args.dry_run,
+                getattr(ctx.args, "jobs", 1),
+                getattr(ctx.args, "stream", False),
+                getattr(ctx.args, "keep_archive", True),
             )
         else:
             fork = get_fork_from_args(ctx.args) or convert_fork_to_enum(None)
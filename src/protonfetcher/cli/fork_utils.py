@@ -10,6 +10,7 @@ from typing import Any, Union
 from protonfetcher.common import DEFAULT_FORK, FORKS, ForkName
 from protonfetcher.forgejo_fetcher import ForgejoReleaseFetcher
 from protonfetcher.github_fetcher import GitHubReleaseFetcher
+from protonfetcher.link_status import LinkSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +107,23 @@ def print_links_for_fork(
     return True
 
 
+def print_link_snapshot(snapshot: LinkSnapshot) -> None:
+    """Print a link snapshot in the same format as print_links_for_fork."""
+    for fork, state in snapshot.forks.items():
+        if not state.has_links and not state.prunable:
+            continue
+
+        print(f"Links for {fork.value}:")
+        for link in state.links:
+            target = link.resolved_target
+            print(f"  {link.name} -> {target if target else '(not found)'}")
+
+        if state.prunable:
+            print(f"\nPrunable {fork.value} versions ({len(state.prunable)}):")
+            for version in state.prunable:
+                print(f"  ○ {version}")
+
+
 def get_link_names_for_fork(
     extract_dir: Path, fork: ForkName
 ) -> tuple[Path, Path, Path]:
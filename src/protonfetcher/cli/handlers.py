@@ -7,10 +7,12 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from protonfetcher.base_release_fetcher import update_managed_forks
 from protonfetcher.common import DEFAULT_FORK, FORKS, ForkName
 from protonfetcher.exceptions import ProtonFetcherError
 from protonfetcher.forgejo_fetcher import ForgejoReleaseFetcher
 from protonfetcher.github_fetcher import GitHubReleaseFetcher
+from protonfetcher.utils import format_bytes
 
 from .fork_utils import (
     get_fork_fetcher,
@@ -28,15 +30,24 @@ def handle_ls_operation(
     extract_dir: Path,
     list_all_forks: bool = False,
 ) -> None:
-    """Handle the --ls operation to list symbolic links."""
-    from .fork_utils import get_forks_to_list, print_links_for_fork
+    """Handle the --ls operation to list symbolic links.
+
+    All forks are reported from one snapshot of the extract directory; with
+    --json the snapshot is printed as JSON instead of text.
+    """
+    from .fork_utils import get_forks_to_list, print_link_snapshot
 
-    print("Listing recognized links and their associated Proton fork folders...")
     forks_to_check = get_forks_to_list(args, list_all_forks)
-    for fork in forks_to_check:
-        lm = get_fork_fetcher(fetcher, forgejo_fetcher, fork).link_manager
-        if not print_links_for_fork(lm, extract_dir, fork, show_versions=True):
-            continue
+    snapshot = fetcher.link_manager.snapshot_links(extract_dir, forks_to_check)
+
+    if getattr(args, "json", False):
+        import json
+
+        print(json.dumps(snapshot.to_dict(), indent=2))
+        return
+
+    print("Listing recognized links and their associated Proton fork folders...")
+    print_link_snapshot(snapshot)
 
 
 def handle_list_operation(
@@ -266,32 +277,55 @@ def handle_prune_operation(
     print(f"\nPruned {total_pruned} release(s)")
 
 
-def _check_single_fork(
+async def _check_single_fork(
     fetcher: GitHubReleaseFetcher,
     forgejo_fetcher: ForgejoReleaseFetcher,
     extract_dir: Path,
     fork: ForkName,
     check_managed_only: bool,
-) -> bool:
-    """Check for updates on a single fork. Returns True if update available."""
+) -> tuple[bool, str | None]:
+    """Check for updates on a single fork.
+
+    Returns:
+        Whether an update is available, and the status line to print (None
+        if the fork was skipped or the check failed)
+    """
     if check_managed_only:
         lm = get_fork_fetcher(fetcher, forgejo_fetcher, fork).link_manager
         if not lm.has_managed_links(extract_dir, fork):
             logger.debug(f"Skipping {fork}: no managed links found")
-            return False
+            return False, None
 
     try:
         fork_fetcher = get_fork_fetcher(fetcher, forgejo_fetcher, fork)
-        newer_release = fork_fetcher.check_for_updates(extract_dir, fork)
+        newer_release = await fork_fetcher.check_for_updates_async(extract_dir, fork)
     except ProtonFetcherError as e:
         logger.error(f"Failed to check {fork}: {e}")
-        return False
+        return False, None
 
     if newer_release:
-        print(f"New release available for {fork}: {newer_release}!")
-        return True
-    print(f"{fork}: up-to-date")
-    return False
+        return True, f"New release available for {fork}: {newer_release}!"
+    return False, f"{fork}: up-to-date"
+
+
+async def _check_forks(
+    fetcher: GitHubReleaseFetcher,
+    forgejo_fetcher: ForgejoReleaseFetcher,
+    extract_dir: Path,
+    forks: list[ForkName],
+    check_managed_only: bool,
+) -> list[tuple[bool, str | None]]:
+    """Check every fork concurrently; results are in the order of forks."""
+    import asyncio
+
+    return await asyncio.gather(
+        *(
+            _check_single_fork(
+                fetcher, forgejo_fetcher, extract_dir, fork, check_managed_only
+            )
+            for fork in forks
+        )
+    )
 
 
 def handle_check_operation(
@@ -300,7 +334,11 @@ def handle_check_operation(
     args: Any,
     extract_dir: Path,
 ) -> None:
-    """Handle the --check operation flow."""
+    """Handle the --check operation flow.
+
+    All forks are checked at once, so the total wait is that of the slowest
+    fork rather than the sum of all of them.
+    """
     explicit_fork = get_fork_from_args(args)
     if explicit_fork:
         forks_to_check = [explicit_fork]
@@ -309,12 +347,17 @@ def handle_check_operation(
         forks_to_check = list(FORKS.keys())
         check_managed_only = True
 
-    updates_available = any(
-        _check_single_fork(
-            fetcher, forgejo_fetcher, extract_dir, fork, check_managed_only
+    import asyncio
+
+    results = asyncio.run(
+        _check_forks(
+            fetcher, forgejo_fetcher, extract_dir, forks_to_check, check_managed_only
         )
-        for fork in forks_to_check
     )
+    for _, line in results:
+        if line is not None:
+            print(line)
+    updates_available = any(available for available, _ in results)
 
     if updates_available:
         raise SystemExit(0)
@@ -337,6 +380,8 @@ def handle_default_fetch(
         release_tag=args.release,
         fork=actual_fork,
         dry_run=args.dry_run,
+        stream=getattr(args, "stream", False),
+        keep_archive=getattr(args, "keep_archive", True),
     )
 
 
@@ -360,6 +405,8 @@ def handle_fetch_with_fork(
         release_tag=args.release,
         fork=fork,
         dry_run=args.dry_run,
+        stream=getattr(args, "stream", False),
+        keep_archive=getattr(args, "keep_archive", True),
     )
 
 
@@ -369,9 +416,62 @@ def handle_multi_fork_update(
     output_dir: Path,
     extract_dir: Path,
     dry_run: bool,
+    jobs: int = 1,
+    stream: bool = False,
+    keep_archive: bool = True,
 ) -> None:
-    """Handle multi-fork update mode (-f without value)."""
+    """Handle multi-fork update mode (-f without value).
+
+    With ``jobs > 1`` the GitHub and Forgejo forks share one worker pool, so
+    all managed forks download and extract concurrently.
+    """
     logger.info("Updating all forks with managed links...")
-    fetcher.update_all_managed_forks(output_dir, extract_dir, dry_run=dry_run)
-    forgejo_fetcher.update_all_managed_forks(output_dir, extract_dir, dry_run=dry_run)
+    if jobs > 1:
+        update_managed_forks(
+            [fetcher, forgejo_fetcher],
+            output_dir,
+            extract_dir,
+            dry_run,
+            jobs,
+            stream,
+            keep_archive,
+        )
+    else:
+        fetcher.update_all_managed_forks(
+            output_dir,
+            extract_dir,
+            dry_run=dry_run,
+            stream=stream,
+            keep_archive=keep_archive,
+        )
+        forgejo_fetcher.update_all_managed_forks(
+            output_dir,
+            extract_dir,
+            dry_run=dry_run,
+            stream=stream,
+            keep_archive=keep_archive,
+        )
     print("Done.")
+
+
+def handle_cache_operation(args: Any) -> None:
+    """Handle the --cache-stats and --cache-clear operations."""
+    from protonfetcher.cache_store import CACHE_DB_NAME, CacheStore, default_cache_dir
+
+    store = CacheStore(default_cache_dir() / CACHE_DB_NAME)
+    try:
+        if args.cache_clear:
+            removed = store.clear()
+            print(f"Removed {removed} cache entries from {store.path}")
+            return
+
+        stats = store.stats()
+        print(f"Cache: {stats.path} ({format_bytes(stats.file_size)})")
+        for namespace, (count, size) in stats.namespaces.items():
+            print(f"  {namespace}: {count} entries, {format_bytes(size)}")
+        print(
+            f"  Total: {stats.entries} entries ({stats.expired} expired), "
+            f"{format_bytes(stats.total_bytes)} of {format_bytes(stats.max_bytes)} limit"
+        )
+    finally:
+        store.close()
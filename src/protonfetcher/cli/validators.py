@@ -61,6 +61,38 @@ def validate_keep_value(args: argparse.Namespace) -> None:
         raise SystemExit(1)
 
 
+def validate_jobs_value(args: argparse.Namespace) -> None:
+    """Validate --jobs value is at least 1."""
+    jobs = getattr(args, "jobs", 1)
+    if isinstance(jobs, int) and jobs < 1:
+        print("Error: --jobs must be at least 1")
+        raise SystemExit(1)
+
+
+def validate_connections_value(args: argparse.Namespace) -> None:
+    """Validate --connections value is at least 1."""
+    connections = getattr(args, "connections", 1)
+    if isinstance(connections, int) and connections < 1:
+        print("Error: --connections must be at least 1")
+        raise SystemExit(1)
+
+
+def validate_extract_threads_value(args: argparse.Namespace) -> None:
+    """Validate --extract-threads value is at least 1."""
+    extract_threads = getattr(args, "extract_threads", 1)
+    if isinstance(extract_threads, int) and extract_threads < 1:
+        print("Error: --extract-threads must be at least 1")
+        raise SystemExit(1)
+
+
+def validate_delete_threads_value(args: argparse.Namespace) -> None:
+    """Validate --delete-threads value is at least 1."""
+    delete_threads = getattr(args, "delete_threads", 1)
+    if isinstance(delete_threads, int) and delete_threads < 1:
+        print("Error: --delete-threads must be at least 1")
+        raise SystemExit(1)
+
+
 def validate_dry_run_conflicts(args: argparse.Namespace) -> None:
     """Validate --dry-run conflicts with read-only operations."""
     if args.dry_run and (args.list or args.ls or args.relink):
@@ -68,13 +100,25 @@ def validate_dry_run_conflicts(args: argparse.Namespace) -> None:
         raise SystemExit(1)
 
 
+def validate_json_requires_ls(args: argparse.Namespace) -> None:
+    """Validate that --json is only used with --ls."""
+    if getattr(args, "json", False) and not args.ls:
+        print("Error: --json can only be used with --ls")
+        raise SystemExit(1)
+
+
 def validate_mutually_exclusive_args(args: argparse.Namespace) -> None:
     """Validate mutually exclusive arguments."""
     validate_check_vs_dry_run(args)
     validate_check_vs_list(args)
     validate_prune_vs_check(args)
     validate_keep_value(args)
+    validate_jobs_value(args)
+    validate_connections_value(args)
+    validate_extract_threads_value(args)
+    validate_delete_threads_value(args)
     validate_dry_run_conflicts(args)
+    validate_json_requires_ls(args)
     validate_relink_requires_fork(args)
 
 
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import dataclasses
-import subprocess
+import re
 from enum import StrEnum
 from pathlib import Path
-from typing import Iterator, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Protocol, Sequence
+
+if TYPE_CHECKING:
+    import subprocess
 
 
 class ForkName(StrEnum):
@@ -18,7 +21,8 @@ class ForkName(StrEnum):
 
 # Type aliases for better readability
 Headers = dict[str, str]
-ProcessResult = subprocess.CompletedProcess[str]
+if TYPE_CHECKING:
+    ProcessResult = subprocess.CompletedProcess[str]
 AssetInfo = tuple[str, int]  # (name, size)
 VersionTuple = tuple[str, int, int, int]  # (prefix, major, minor, patch)
 LinkNamesTuple = tuple[Path, Path, Path]
@@ -83,6 +87,47 @@ class ForkConfig:
     dir_name_templates: tuple[str, ...] = ("{tag}",)
     # Platform type: "github" or "forgejo"
     platform: str = "github"
+    # Installed directory names, matched in full: group 1 is the release tag,
+    # the remaining groups are the same numbers version_pattern captures
+    dir_name_patterns: tuple[str, ...] = ()
+    # Compiled from the patterns above
+    version_regex: re.Pattern[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    dir_name_regexes: tuple[re.Pattern[str], ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "version_regex", re.compile(self.version_pattern))
+        object.__setattr__(
+            self,
+            "dir_name_regexes",
+            tuple(re.compile(pattern) for pattern in self.dir_name_patterns),
+        )
+
+    def version_from_groups(self, groups: Sequence[str]) -> VersionTuple:
+        """Build the comparable version tuple from captured version numbers."""
+        numbers = [int(group) for group in groups]
+        if self.is_ge_proton:
+            # GE-Proton: (major, minor) → (prefix, major, 0, minor)
+            major, minor = numbers
+            return (self.version_prefix, major, 0, minor)
+        # Others: (major, minor, patch) → (prefix, major, minor, patch)
+        major, minor, patch = numbers
+        return (self.version_prefix, major, minor, patch)
+
+    def match_dir_name(self, name: str) -> Optional[tuple[str, VersionTuple]]:
+        """Match an installed directory name against this fork's patterns.
+
+        Returns:
+            (tag, version) if the name belongs to this fork, otherwise None
+        """
+        for regex in self.dir_name_regexes:
+            match = regex.fullmatch(name)
+            if match:
+                return match.group(1), self.version_from_groups(match.groups()[1:])
+        return None
 
 
 @dataclasses.dataclass
@@ -96,6 +141,33 @@ class SymlinkSpec:
 LinkSpecList = list[SymlinkSpec]
 
 
+@dataclasses.dataclass(frozen=True)
+class ScanEntry:
+    """A directory entry with the type information ``os.scandir`` provides.
+
+    ``is_dir`` does not follow symlinks, so a symlink to a directory has
+    ``is_dir=False`` and ``is_symlink=True``.
+    """
+
+    path: Path
+    is_dir: bool
+    is_symlink: bool
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+@dataclasses.dataclass(frozen=True)
+class ReleaseAsset:
+    """A release's downloadable archive, as described by the releases API."""
+
+    tag: str
+    name: str
+    size: Optional[int]
+    download_url: str
+
+
 class NetworkClientProtocol(Protocol):
     """Protocol for network operations with timeout support.
 
@@ -112,7 +184,11 @@ class NetworkClientProtocol(Protocol):
     PROTOCOL_VERSION: str = "1.0"
 
     def get(
-        self, url: str, headers: Optional[Headers] = None, stream: bool = False
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        stream: bool = False,
+        include_headers: bool = False,
     ) -> ProcessResult:
         """Perform HTTP GET request.
 
@@ -120,6 +196,8 @@ class NetworkClientProtocol(Protocol):
             url: URL to request
             headers: Optional request headers as key-value pairs
             stream: Whether to stream the response (default: False)
+            include_headers: Prefix stdout with the response header blocks,
+                like ``curl -i`` (default: False)
 
         Returns:
             ProcessResult containing stdout, stderr, and returncode
@@ -183,6 +261,57 @@ class NetworkClientProtocol(Protocol):
         ...
 
 
+class AsyncNetworkClientProtocol(Protocol):
+    """Protocol for non-blocking network requests.
+
+    The async counterpart of NetworkClientProtocol's GET and HEAD, used to
+    issue release discovery requests for several forks at once. Results
+    have the same shape as the synchronous client's, so response parsing
+    is shared.
+
+    Attributes:
+        PROTOCOL_VERSION: Version identifier for protocol compatibility
+    """
+
+    PROTOCOL_VERSION: str = "1.0"
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        include_headers: bool = False,
+    ) -> ProcessResult:
+        """Perform HTTP GET request without blocking the event loop.
+
+        Args:
+            url: URL to request
+            headers: Optional request headers as key-value pairs
+            include_headers: Prefix stdout with the response header blocks
+
+        Returns:
+            ProcessResult containing response body and status
+        """
+        ...
+
+    async def head(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        follow_redirects: bool = False,
+    ) -> ProcessResult:
+        """Perform HTTP HEAD request without blocking the event loop.
+
+        Args:
+            url: URL to request
+            headers: Optional request headers as key-value pairs
+            follow_redirects: Whether to follow HTTP redirects
+
+        Returns:
+            ProcessResult containing response headers
+        """
+        ...
+
+
 class FileSystemClientProtocol(Protocol):
     """Protocol for filesystem operations.
 
@@ -367,6 +496,23 @@ class FileSystemClientProtocol(Protocol):
         """
         ...
 
+    def readlink(self, path: Path) -> Path:
+        """Return the target a symbolic link points to, without following it.
+
+        Args:
+            path: Symbolic link to read
+
+        Returns:
+            The link's target as stored (may be relative to the link's directory)
+
+        Raises:
+            OSError: If the path is not a symbolic link or cannot be read
+
+        Example:
+            >>> target = file_system.readlink(Path("/tmp/GE-Proton"))
+        """
+        ...
+
     def unlink(self, path: Path) -> None:
         """Remove a file or symbolic link.
 
@@ -413,6 +559,41 @@ class FileSystemClientProtocol(Protocol):
         """
         ...
 
+    def scandir(self, path: Path) -> list[ScanEntry]:
+        """List a directory with each entry's type, in one pass.
+
+        Unlike ``iterdir`` followed by ``is_dir``/``is_symlink``, the types
+        come from the directory listing itself, without a stat per entry.
+
+        Args:
+            path: Directory path to list
+
+        Returns:
+            One ScanEntry per directory entry
+
+        Raises:
+            OSError: If the directory doesn't exist or cannot be read
+
+        Example:
+            >>> dirs = [e.path for e in file_system.scandir(Path("/tmp")) if e.is_dir]
+        """
+        ...
+
+    def rename(self, source: Path, destination: Path) -> None:
+        """Atomically rename a file or directory on the same filesystem.
+
+        Args:
+            source: Existing path to move
+            destination: New path; must not be an existing non-empty directory
+
+        Raises:
+            OSError: If the rename fails (e.g. destination exists, cross-device)
+
+        Example:
+            >>> file_system.rename(Path("/tmp/.staging/dir"), Path("/tmp/dir"))
+        """
+        ...
+
 
 # Constants
 DEFAULT_TIMEOUT = 30
@@ -422,6 +603,16 @@ DEFAULT_USER_AGENT = (
 )
 GITHUB_URL_PATTERN = r"/releases/tag/([^/?#]+)"
 
+# Defaults of the CLI options, kept here so building the parser imports no
+# download, extraction or removal code
+DEFAULT_WRITERS = 4
+DEFAULT_REMOVE_WORKERS = 4
+DEDUP_MODES = ("hardlink", "reflink")
+DECOMPRESSOR_ENV = "PROTONFETCHER_DECOMPRESSOR"
+DECOMPRESSORS: tuple[str, ...] = ("auto", "python", "pigz", "xz", "zstd")
+NETWORK_BACKEND_ENV = "PROTONFETCHER_NETWORK_BACKEND"
+NETWORK_BACKENDS: tuple[str, ...] = ("curl", "http")
+
 # Constants for ProtonGE forks
 FORKS: dict[ForkName, ForkConfig] = {
     ForkName.GE_PROTON: ForkConfig(
@@ -437,6 +628,7 @@ FORKS: dict[ForkName, ForkConfig] = {
         asset_template="{tag}.tar.gz",
         dir_name_templates=("{tag}",),
         platform="github",
+        dir_name_patterns=(r"(GE-Proton(\d+)-(\d+)(?:-.*)?)",),
     ),
     ForkName.PROTON_EM: ForkConfig(
         repo="Etaash-mathamsetty/Proton",
@@ -451,6 +643,7 @@ FORKS: dict[ForkName, ForkConfig] = {
         asset_template="proton-{tag}.tar.xz",
         dir_name_templates=("proton-{tag}", "{tag}"),
         platform="github",
+        dir_name_patterns=(r"(?:proton-)?(EM-(\d+)\.(\d+)-(\d+)(?:-.*)?)",),
     ),
     ForkName.CACHYOS: ForkConfig(
         repo="CachyOS/proton-cachyos",
@@ -463,6 +656,11 @@ FORKS: dict[ForkName, ForkConfig] = {
         asset_template="proton-{tag}-x86_64.tar.xz",
         dir_name_templates=("proton-{tag}-x86_64", "proton-{tag}", "{tag}"),
         platform="github",
+        # The proton- prefix and -x86_64 suffix are not part of the tag
+        dir_name_patterns=(
+            r"proton-(cachyos-(\d+)\.(\d+)-(\d+)-slr(?:-.*?)??)(?:-x86_64)?",
+            r"(cachyos-(\d+)\.(\d+)-(\d+)-slr(?:-.*)?)",
+        ),
     ),
     ForkName.DW_PROTON: ForkConfig(
         repo="dawn-winery/dwproton",
@@ -479,6 +677,67 @@ FORKS: dict[ForkName, ForkConfig] = {
         asset_template="{tag}-x86_64.tar.xz",
         dir_name_templates=("{tag}-x86_64", "{tag}"),
         platform="forgejo",
+        # A trailing -x86_64 is not part of the tag
+        dir_name_patterns=(
+            r"(dwproton-(\d+)\.(\d+)-(\d+)(?:-x86_64-.*)?)-x86_64",
+            r"(dwproton-(\d+)\.(\d+)-(\d+)-x86_64-.*)",
+        ),
     ),
 }
 DEFAULT_FORK: ForkName = ForkName.GE_PROTON
+
+
+def _compile_dir_name_registry(
+    forks: dict[ForkName, ForkConfig],
+) -> tuple[re.Pattern[str], dict[str, tuple[ForkConfig, ForkName, int, int]]]:
+    """Join every fork's directory name patterns into one alternation.
+
+    Each alternative is wrapped in a named group; the fork whose group
+    matched is the group closed last, and its tag and version numbers are
+    the unnamed groups that immediately follow it.
+    """
+    alternatives: list[str] = []
+    for fork, cfg in forks.items():
+        for i, regex in enumerate(cfg.dir_name_regexes):
+            alternatives.append(f"(?P<{fork.name}_{i}>{regex.pattern})")
+    combined = re.compile("|".join(alternatives))
+
+    groups: dict[str, tuple[ForkConfig, ForkName, int, int]] = {}
+    for fork, cfg in forks.items():
+        for i, regex in enumerate(cfg.dir_name_regexes):
+            index = combined.groupindex[f"{fork.name}_{i}"]
+            groups[f"{fork.name}_{i}"] = (cfg, fork, index + 1, regex.groups)
+    return combined, groups
+
+
+_DIR_NAME_REGEX, _DIR_NAME_GROUPS = _compile_dir_name_registry(FORKS)
+
+
+def classify_dir_name(name: str) -> Optional[tuple[ForkName, str, VersionTuple]]:
+    """Identify which fork an installed directory belongs to.
+
+    One precompiled match covers all forks; the forks' names are disjoint,
+    so at most one can match.
+
+    Args:
+        name: Directory name (e.g. "proton-EM-10.0-30")
+
+    Returns:
+        (fork, tag, version), or None if the name is not a Proton build
+    """
+    match = _DIR_NAME_REGEX.fullmatch(name)
+    if match is None or match.lastgroup is None:
+        return None
+    cfg, fork, first, count = _DIR_NAME_GROUPS[match.lastgroup]
+    groups = match.groups()[first - 1 : first - 1 + count]
+    return fork, groups[0], cfg.version_from_groups(groups[1:])
+
+
+def __getattr__(name: str) -> Any:
+    # ProcessResult is only needed by network code; resolving it on first
+    # access keeps subprocess out of offline runs
+    if name == "ProcessResult":
+        import subprocess
+
+        return subprocess.CompletedProcess[str]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,259 @@
+"""Pluggable decompression backends for archive extraction.
+
+Python's gzip/lzma modules decompress inside the extracting thread, so
+decoding and writing files take turns on one core. When ``pigz``, ``xz``
+or ``zstd`` is installed, the archive is decompressed out of process
+instead and the uncompressed tar stream is read from the tool's stdout, so
+decoding runs on another core while Python writes files. Only xz 5.4 and
+later also decodes on several threads (for multi-block archives); gzip and
+zstd decoding is single-threaded whatever the tool.
+"""
+
+import contextlib
+import functools
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tarfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from .common import DECOMPRESSOR_ENV, DECOMPRESSORS
+from .exceptions import ExtractionError
+
+logger = logging.getLogger(__name__)
+
+# Archive format (as returned by ArchiveExtractor._get_archive_format) →
+# external tool able to decompress it
+_FORMAT_TOOLS: dict[str, str] = {
+    "tar.gz": "pigz",
+    "tar.xz": "xz",
+    "tar.zst": "zstd",
+}
+
+# Archive format → tarfile stream mode for the in-process backend
+_PYTHON_STREAM_MODES: dict[str, str] = {
+    "tar.gz": "r|gz",
+    "tar.xz": "r|xz",
+}
+
+_PIPE_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _find_tool(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
+def xz_supports_threaded_decoding() -> bool:
+    """Return True if the installed xz decodes multi-block files in parallel (5.4+)."""
+    xz = _find_tool("xz")
+    if xz is None:
+        return False
+    try:
+        result = subprocess.run(
+            [xz, "--version"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    match = re.search(r"(\d+)\.(\d+)", result.stdout or "")
+    return bool(match) and (int(match.group(1)), int(match.group(2))) >= (5, 4)
+
+
+def _drain(stream: BinaryIO) -> None:
+    """Read a decompressor's remaining output.
+
+    tarfile stops at the end-of-archive marker; the padding after it must
+    still be consumed so the tool can exit cleanly instead of on SIGPIPE.
+    """
+    while stream.read(_PIPE_CHUNK_SIZE):
+        pass
+
+
+@dataclass(frozen=True)
+class DecompressionBackend:
+    """A way of turning a compressed tar archive into a readable TarFile.
+
+    Attributes:
+        name: Backend identifier ("python", "pigz", "xz", "zstd")
+        command: Decompressor argv writing the tar stream to stdout, or None
+            to let ``tarfile`` decompress in-process
+        threads: Number of threads the backend decodes with
+    """
+
+    name: str
+    command: Optional[tuple[str, ...]] = None
+    threads: int = 1
+
+    @property
+    def description(self) -> str:
+        if self.command is None:
+            return "python (in-process, 1 thread)"
+        plural = "s" if self.threads != 1 else ""
+        return f"{' '.join(self.command)} ({self.threads} decoding thread{plural})"
+
+    @property
+    def tar_program(self) -> Optional[str]:
+        """Program string for ``tar --use-compress-program``, if external."""
+        if self.command is None:
+            return None
+        # tar supplies -d itself and reads the archive from the tool's stdout
+        return " ".join(arg for arg in self.command if arg not in ("-dc", "-q"))
+
+    @contextlib.contextmanager
+    def open_tar(self, archive_path: Path) -> Iterator[tarfile.TarFile]:
+        """Open an archive file for sequential reading."""
+        if self.command is None:
+            with tarfile.open(archive_path, "r:*") as tar:
+                yield tar
+            return
+
+        with self._run([*self.command, str(archive_path)], stdin=None) as proc:
+            assert proc.stdout is not None
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                yield tar
+
+    @contextlib.contextmanager
+    def open_tar_stream(
+        self, source: BinaryIO, format_type: str
+    ) -> Iterator[tarfile.TarFile]:
+        """Open a compressed, non-seekable stream for sequential reading."""
+        if self.command is None:
+            mode = _PYTHON_STREAM_MODES.get(format_type, "r|*")
+            with tarfile.open(fileobj=source, mode=mode) as tar:
+                yield tar
+            return
+
+        feed_errors: list[BaseException] = []
+        with self._run(list(self.command), stdin=subprocess.PIPE) as proc:
+            assert proc.stdin is not None and proc.stdout is not None
+            feeder = threading.Thread(
+                target=self._feed,
+                args=(source, proc.stdin, feed_errors),
+                name=f"{self.name}-feeder",
+                daemon=True,
+            )
+            feeder.start()
+            try:
+                with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                    yield tar
+                _drain(proc.stdout)
+            except BaseException:
+                # Unblock the feeder before waiting for it
+                proc.kill()
+                raise
+            finally:
+                feeder.join()
+                # A failed source read (e.g. a truncated download) is the root
+                # cause, even if tarfile only saw an early end of stream.
+                for error in feed_errors:
+                    if not isinstance(error, BrokenPipeError):
+                        raise error
+
+    @staticmethod
+    def _feed(source: BinaryIO, sink: BinaryIO, errors: list[BaseException]) -> None:
+        """Copy the compressed source into the decompressor's stdin."""
+        try:
+            while chunk := source.read(_PIPE_CHUNK_SIZE):
+                sink.write(chunk)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            with contextlib.suppress(OSError):
+                sink.close()
+
+    @contextlib.contextmanager
+    def _run(
+        self, argv: list[str], stdin: Optional[int]
+    ) -> Iterator[subprocess.Popen[bytes]]:
+        """Run the decompressor, failing if it exits non-zero."""
+        proc = subprocess.Popen(
+            argv, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        try:
+            yield proc
+            _drain(proc.stdout)
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        if proc.wait() != 0:
+            message = stderr.decode(errors="replace").strip()
+            raise ExtractionError(
+                f"{self.name} exited with status {proc.returncode}: {message}"
+            )
+
+
+PYTHON_BACKEND = DecompressionBackend("python")
+
+
+def _tool_backend(tool: str, cpus: int) -> Optional[DecompressionBackend]:
+    """Build the backend for an external tool if it is installed."""
+    path = _find_tool(tool)
+    if path is None:
+        return None
+    if tool == "pigz":
+        # Inflating is inherently serial; pigz -p only affects compression
+        return DecompressionBackend("pigz", (path, "-dc"))
+    if tool == "xz":
+        threads = cpus if xz_supports_threaded_decoding() else 1
+        return DecompressionBackend("xz", (path, "-dc", "-T0"), threads)
+    # zstd ignores -T when decompressing
+    return DecompressionBackend("zstd", (path, "-dc", "-q"))
+
+
+def select_decompressor(
+    format_type: str, preference: Optional[str] = None
+) -> DecompressionBackend:
+    """Pick the decompression backend for an archive format.
+
+    With ``auto`` an external tool is used only when it can run alongside
+    the extracting thread (more than one CPU) and, for xz, decodes on several
+    threads (5.4+); otherwise the in-process backend is used. Naming a
+    tool forces it whenever it supports the format and is installed.
+
+    Args:
+        format_type: Archive format ("tar.gz", "tar.xz", "tar.zst", "other")
+        preference: Backend name from DECOMPRESSORS; defaults to the value of
+            ``PROTONFETCHER_DECOMPRESSOR``, then "auto"
+
+    Returns:
+        The backend to use
+
+    Raises:
+        ValueError: If the preference is not a known backend name
+    """
+    name = (preference or os.environ.get(DECOMPRESSOR_ENV) or "auto").lower()
+    if name not in DECOMPRESSORS:
+        raise ValueError(
+            f"Unknown decompressor '{name}' (expected one of: {', '.join(DECOMPRESSORS)})"
+        )
+
+    tool = _FORMAT_TOOLS.get(format_type)
+    if name == "python" or tool is None:
+        return PYTHON_BACKEND
+
+    cpus = os.cpu_count() or 1
+    if name == "auto":
+        if cpus <= 1 or (tool == "xz" and not xz_supports_threaded_decoding()):
+            return PYTHON_BACKEND
+    elif name != tool:
+        logger.debug(f"Decompressor {name} cannot handle {format_type}, using {tool}")
+
+    backend = _tool_backend(tool, cpus)
+    if backend is None:
+        if name != "auto":
+            logger.warning(f"{tool} not found, decompressing in-process instead")
+        return PYTHON_BACKEND
+    return backend
@@ -0,0 +1,279 @@
+"""Content-addressed deduplication of installed Proton releases.
+
+Consecutive builds of a fork share most of their files byte for byte. With
+deduplication enabled, every newly extracted release is hashed into a
+content store kept in ``extract_dir`` and identical files are replaced:
+
+- Store objects are hard links named by the SHA-512 digest and mode of the
+  content, so files that differ only in permissions are never merged.
+- ``hardlink`` mode replaces a duplicate with another hard link to the
+  object: one inode, one copy on disk and in the page cache.
+- ``reflink`` mode clones the object's extents into a new inode with
+  ``FICLONE`` where the filesystem supports it (btrfs, XFS), and falls back
+  to hard links where it does not.
+
+Replacements are created under a temporary name and renamed over the
+original, so a file is never missing. Removing a release only drops link
+counts; ``collect_garbage`` deletes objects no release links to anymore.
+"""
+
+import errno
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .checksums import hash_file
+from .common import DEDUP_MODES, classify_dir_name
+
+logger = logging.getLogger(__name__)
+
+STORE_NAME = ".protonfetcher-store"
+DEFAULT_HASH_WORKERS = 4
+
+# Files smaller than this save at most a block or two and are not deduplicated
+MIN_DEDUP_SIZE = 4096
+
+# _IOW(0x94, 9, int) from linux/fs.h
+_FICLONE = 0x40049409
+_REFLINK_UNSUPPORTED = {
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+}
+
+
+@dataclass
+class DedupStats:
+    """Outcome of deduplicating one or more release trees."""
+
+    files: int = 0
+    stored: int = 0
+    linked: int = 0
+    reflinked: int = 0
+    bytes_saved: int = 0
+
+
+def store_path(extract_dir: Path) -> Path:
+    return extract_dir / STORE_NAME
+
+
+def _object_path(store: Path, digest: str, mode: int) -> Path:
+    # Fan out on the first digest byte to keep directories small
+    return store / digest[:2] / f"{digest}-{mode & 0o7777:o}"
+
+
+def _candidate_files(root: Path) -> list[tuple[Path, os.stat_result]]:
+    """List regular files under root worth deduplicating.
+
+    Files that already have more than one link are skipped: they are either
+    deduplicated already or hard links shipped in the archive.
+    """
+    found: list[tuple[Path, os.stat_result]] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_size >= MIN_DEDUP_SIZE and st.st_nlink == 1:
+                        found.append((Path(entry.path), st))
+    return found
+
+
+def _temp_name(path: Path) -> Path:
+    return path.with_name(f".{path.name}.dedup{os.getpid()}")
+
+
+def _replace_with_link(obj: Path, path: Path) -> None:
+    tmp = _temp_name(path)
+    os.link(obj, tmp)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        os.unlink(tmp)
+        raise
+
+
+def _replace_with_clone(obj: Path, path: Path, st: os.stat_result) -> None:
+    import fcntl
+
+    tmp = _temp_name(path)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with open(obj, "rb") as src:
+            fcntl.ioctl(fd, _FICLONE, src.fileno())
+        os.fchmod(fd, st.st_mode & 0o7777)
+        os.utime(fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+
+
+class Deduplicator:
+    """Links identical files of release trees to objects in a content store.
+
+    Args:
+        store: Store directory; must be on the same filesystem as the trees
+        mode: One of ``DEDUP_MODES``
+        workers: Number of threads hashing files
+    """
+
+    def __init__(
+        self, store: Path, mode: str = "hardlink", workers: int = DEFAULT_HASH_WORKERS
+    ) -> None:
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown deduplication mode: {mode}")
+        self.store = store
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.stats = DedupStats()
+        self._reflink = mode == "reflink"
+
+    def add_tree(self, root: Path) -> None:
+        """Deduplicate every eligible file under root against the store."""
+        files = _candidate_files(root)
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dedup-hash"
+        ) as pool:
+            digests = list(pool.map(lambda item: hash_file(item[0]), files))
+
+        for (path, st), digest in zip(files, digests):
+            self.stats.files += 1
+            self._add_file(path, st, _object_path(self.store, digest, st.st_mode))
+
+    def _add_file(self, path: Path, st: os.stat_result, obj: Path) -> None:
+        try:
+            obj_size: Optional[int] = os.stat(obj).st_size
+        except FileNotFoundError:
+            obj_size = None
+
+        if obj_size is None:
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, obj)
+                self.stats.stored += 1
+                return
+            except FileExistsError:
+                # Stored concurrently by another release
+                obj_size = os.stat(obj).st_size
+
+        if obj_size != st.st_size:
+            logger.warning(f"Store object {obj} has the wrong size, skipping {path}")
+            return
+
+        if self._reflink:
+            try:
+                _replace_with_clone(obj, path, st)
+                self.stats.reflinked += 1
+                self.stats.bytes_saved += st.st_size
+                return
+            except OSError as e:
+                if e.errno not in _REFLINK_UNSUPPORTED:
+                    raise
+                logger.info(f"Reflinks are not supported here ({e}), using hard links")
+                self._reflink = False
+
+        _replace_with_link(obj, path)
+        self.stats.linked += 1
+        self.stats.bytes_saved += st.st_size
+
+
+def _installed_releases(extract_dir: Path, exclude: Path) -> list[Path]:
+    releases: list[Path] = []
+    with os.scandir(extract_dir) as entries:
+        for entry in entries:
+            path = Path(entry.path)
+            if (
+                path != exclude
+                and entry.is_dir(follow_symlinks=False)
+                and classify_dir_name(entry.name) is not None
+            ):
+                releases.append(path)
+    return sorted(releases)
+
+
+def deduplicate_release(
+    extract_dir: Path,
+    release_dir: Path,
+    mode: str = "hardlink",
+    workers: int = DEFAULT_HASH_WORKERS,
+) -> DedupStats:
+    """Deduplicate a newly extracted release against the installed ones.
+
+    When the store does not exist yet, the releases already installed in
+    extract_dir are added to it first, so the new release can share files
+    with them.
+
+    Args:
+        extract_dir: Directory holding the installed releases and the store
+        release_dir: Freshly extracted tree (may be a staging directory
+            inside extract_dir)
+        mode: One of ``DEDUP_MODES``
+        workers: Number of threads hashing files
+
+    Returns:
+        What was stored and replaced
+
+    Raises:
+        OSError: If a file cannot be read or replaced
+    """
+    store = store_path(extract_dir)
+    deduplicator = Deduplicator(store, mode, workers)
+    try:
+        store.mkdir()
+    except FileExistsError:
+        pass
+    else:
+        for installed in _installed_releases(extract_dir, release_dir):
+            logger.info(f"Adding {installed.name} to the deduplication store")
+            deduplicator.add_tree(installed)
+    deduplicator.add_tree(release_dir)
+
+    stats = deduplicator.stats
+    logger.debug(
+        f"Deduplication: {stats.files} files, {stats.stored} stored, "
+        f"{stats.linked} hard-linked, {stats.reflinked} reflinked"
+    )
+    return stats
+
+
+def collect_garbage(extract_dir: Path) -> int:
+    """Delete store objects that no installed release links to anymore.
+
+    Returns:
+        Number of objects deleted
+    """
+    store = store_path(extract_dir)
+    removed = 0
+    try:
+        buckets = list(os.scandir(store))
+    except FileNotFoundError:
+        return 0
+    for bucket in buckets:
+        if not bucket.is_dir(follow_symlinks=False):
+            continue
+        with os.scandir(bucket.path) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat(follow_symlinks=False).st_nlink <= 1:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        try:
+            os.rmdir(bucket.path)
+        except OSError:
+            pass  # Still holds objects
+    if removed:
+        logger.debug(f"Removed {removed} unreferenced object(s) from {store}")
+    return removed
@@ -1,9 +1,12 @@
 """File system client implementation for ProtonFetcher."""
 
+import os
 import shutil
 from pathlib import Path
 from typing import Iterator
 
+from .common import FileSystemClientProtocol, ScanEntry
+
 
 class FileSystemClient:
     """Concrete implementation of FileSystemClientProtocol.
@@ -48,6 +51,9 @@ class FileSystemClient:
     def resolve(self, path: Path) -> Path:
         return path.resolve()
 
+    def readlink(self, path: Path) -> Path:
+        return Path(os.readlink(path))
+
     def unlink(self, path: Path) -> None:
         path.unlink()
 
@@ -56,3 +62,27 @@ class FileSystemClient:
 
     def iterdir(self, path: Path) -> Iterator[Path]:
         return path.iterdir()
+
+    def scandir(self, path: Path) -> list[ScanEntry]:
+        # DirEntry caches the d_type from readdir, so no per-entry stat
+        with os.scandir(path) as entries:
+            return [
+                ScanEntry(
+                    path / entry.name,
+                    entry.is_dir(follow_symlinks=False),
+                    entry.is_symlink(),
+                )
+                for entry in entries
+            ]
+
+    def rename(self, source: Path, destination: Path) -> None:
+        source.rename(destination)
+
+
+def is_real_filesystem(file_system: FileSystemClientProtocol) -> bool:
+    """Whether file_system is the real filesystem rather than a test double.
+
+    Deduplication, store garbage collection and background deletion work on
+    paths with ``os`` calls directly and only run on the real filesystem.
+    """
+    return isinstance(file_system, FileSystemClient)
@@ -8,7 +8,13 @@ import logging
 from typing import Any, Optional
 
 from .base_release_fetcher import BaseReleaseFetcher
-from .common import DEFAULT_TIMEOUT, FileSystemClientProtocol, NetworkClientProtocol
+from .common import (
+    DEFAULT_REMOVE_WORKERS,
+    DEFAULT_TIMEOUT,
+    DEFAULT_WRITERS,
+    FileSystemClientProtocol,
+    NetworkClientProtocol,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +33,22 @@ class GitHubReleaseFetcher(BaseReleaseFetcher):
         network_client: Optional[NetworkClientProtocol] = None,
         file_system_client: Optional[FileSystemClientProtocol] = None,
         spinner_cls: Optional[Any] = None,
+        download_connections: int = 1,
+        decompressor: Optional[str] = None,
+        extract_threads: int = DEFAULT_WRITERS,
+        remove_workers: int = DEFAULT_REMOVE_WORKERS,
+        background_delete: bool = False,
+        dedup: Optional[str] = None,
     ) -> None:
         super().__init__(
             timeout=timeout,
             network_client=network_client,
             file_system_client=file_system_client,
             spinner_cls=spinner_cls,
+            download_connections=download_connections,
+            decompressor=decompressor,
+            extract_threads=extract_threads,
+            remove_workers=remove_workers,
+            background_delete=background_delete,
+            dedup=dedup,
         )
@@ -1,11 +1,15 @@
 """Link manager implementation for ProtonFetcher."""
 
+from __future__ import annotations
+
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
+from . import tracing
 from .candidate_selection import select_top_3_candidates as _select_top_3
 from .common import (
+    DEFAULT_REMOVE_WORKERS,
     DEFAULT_TIMEOUT,
     FORKS,
     FileSystemClientProtocol,
@@ -13,6 +17,9 @@ from .common import (
     VersionCandidateList,
 )
 from .exceptions import LinkManagementError
+from .link_status import (
+    LinkSnapshot,
+)
 from .link_status import (
     build_expected_link_mapping as _build_expected_link_mapping,
 )
@@ -25,6 +32,9 @@ from .link_status import (
 from .link_status import (
     list_links as _list_links,
 )
+from .link_status import (
+    snapshot_links as _snapshot_links,
+)
 from .prune_operations import prune_releases as _prune_releases
 from .release_operations import remove_release as _remove_release
 from .symlink_operations import create_symlinks as _create_symlinks
@@ -33,6 +43,9 @@ from .version_finder import (
     find_version_candidates,
 )
 
+if TYPE_CHECKING:
+    from .removal import TreeRemover
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,9 +109,20 @@ class LinkManager:
         self,
         file_system_client: FileSystemClientProtocol,
         timeout: int = DEFAULT_TIMEOUT,
+        remove_workers: int = DEFAULT_REMOVE_WORKERS,
+        background_delete: bool = False,
     ) -> None:
         self.file_system_client = file_system_client
         self.timeout = timeout
+        self.remove_workers = remove_workers
+        self.background_delete = background_delete
+
+    def _tree_remover(self) -> TreeRemover:
+        from .removal import TreeRemover
+
+        return TreeRemover(
+            self.file_system_client, self.remove_workers, self.background_delete
+        )
 
     def get_link_names_for_fork(
         self,
@@ -189,6 +213,7 @@ class LinkManager:
             raise ValueError(f"Unsupported fork: {fork}")
         return self._find_tag_directory(extract_dir, tag, fork)
 
+    @tracing.traced("find_versions", "links")
     def find_version_candidates(
         self, extract_dir: Path, fork: ForkName
     ) -> VersionCandidateList:
@@ -198,6 +223,7 @@ class LinkManager:
         """
         return find_version_candidates(extract_dir, fork, self.file_system_client)
 
+    @tracing.traced("create_symlinks", "links")
     def create_symlinks(
         self, main: Path, fb1: Path, fb2: Path, top_3: VersionCandidateList
     ) -> bool:
@@ -230,6 +256,23 @@ class LinkManager:
         """
         return _list_links(extract_dir, fork, self.file_system_client)
 
+    @tracing.traced("snapshot_links", "links")
+    def snapshot_links(
+        self, extract_dir: Path, forks: Optional[Iterable[ForkName]] = None
+    ) -> LinkSnapshot:
+        """Capture the links and installed builds of several forks at once.
+
+        Delegates to the link_status submodule.
+
+        Args:
+            extract_dir: Directory containing the links and builds
+            forks: Forks to include (default: all)
+
+        Returns:
+            LinkSnapshot with one entry per fork
+        """
+        return _snapshot_links(extract_dir, self.file_system_client, forks)
+
     def has_managed_links(
         self, extract_dir: Path, fork: ForkName = ForkName.GE_PROTON
     ) -> bool:
@@ -246,6 +289,7 @@ class LinkManager:
         """
         return _has_managed_links(extract_dir, fork, self.file_system_client)
 
+    @tracing.traced("remove_release", "links")
     def remove_release(
         self, extract_dir: Path, tag: str, fork: ForkName = ForkName.GE_PROTON
     ) -> bool:
@@ -261,7 +305,8 @@ class LinkManager:
         Returns:
             True if the removal was successful, False otherwise
         """
-        _remove_release(extract_dir, tag, fork, self.file_system_client)
+        with self._tree_remover() as remover:
+            _remove_release(extract_dir, tag, fork, self.file_system_client, remover)
         # Regenerate the link management system to ensure consistency
         self.manage_proton_links(extract_dir, tag, fork)
         return True
@@ -362,6 +407,7 @@ class LinkManager:
         """
         return _compare_link_targets(current_links, expected_links)
 
+    @tracing.traced("check_links", "links")
     def are_links_up_to_date(
         self,
         extract_dir: Path,
@@ -403,6 +449,7 @@ class LinkManager:
 
         return self._compare_link_targets(current_links, expected_links)
 
+    @tracing.traced("link", "links")
     def manage_proton_links(
         self,
         extract_dir: Path,
@@ -417,6 +464,7 @@ class LinkManager:
         Returns:
             True if the operation was successful
         """
+        tracing.annotate(fork=str(fork), tag=tag)
         main, fb1, fb2 = self._get_link_names(extract_dir, fork)
 
         tag_dir = self._handle_manual_release_directory(
@@ -482,6 +530,7 @@ class LinkManager:
 
         return _compute(extract_dir, fork, keep, self.file_system_client)
 
+    @tracing.traced("prune", "links")
     def prune_releases(
         self,
         extract_dir: Path,
@@ -507,5 +556,10 @@ class LinkManager:
             ValueError: If keep is less than 0
         """
         return _prune_releases(
-            extract_dir, fork, keep, dry_run, self.file_system_client
+            extract_dir,
+            fork,
+            keep,
+            dry_run,
+            self.file_system_client,
+            None if dry_run else self._tree_remover(),
         )
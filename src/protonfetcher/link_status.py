@@ -2,12 +2,165 @@
 
 Provides read-only functions to inspect the current state of symlinks
 and determine whether they match expected targets.
+
+``snapshot_links`` reports every fork at once from a single listing of the
+extract directory: link entries are recognised from the listing and each
+one is read with one ``readlink``.
 """
 
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
+
+from .common import (
+    FORKS,
+    FileSystemClientProtocol,
+    ForkName,
+    ScanEntry,
+    VersionCandidateList,
+)
+from .prune_operations import installed_tags
+from .version_finder import DirectoryIndex, get_directory_index
+
+
+@dataclass(frozen=True)
+class LinkState:
+    """State of one managed link.
+
+    Attributes:
+        name: Link file name (e.g. "GE-Proton-Fallback")
+        path: Link path
+        target: Absolute, normalised link target, or None if there is no link
+        exists: Whether the target exists
+    """
+
+    name: str
+    path: Path
+    target: Optional[Path] = None
+    exists: bool = False
+
+    @property
+    def resolved_target(self) -> Optional[Path]:
+        """The target if the link exists and is not dangling."""
+        return self.target if self.exists else None
+
+
+@dataclass(frozen=True)
+class ForkLinkState:
+    """Managed links and installed builds of one fork.
+
+    Attributes:
+        fork: The Proton fork name
+        links: Main, fallback and fallback2 links, in that order
+        installed: Installed build directory names, newest first
+        prunable: Installed builds not referenced by any link
+    """
 
-from .common import FileSystemClientProtocol, ForkName, VersionCandidateList
+    fork: ForkName
+    links: tuple[LinkState, ...]
+    installed: tuple[str, ...] = ()
+    prunable: tuple[str, ...] = ()
+
+    @property
+    def has_links(self) -> bool:
+        return any(link.exists for link in self.links)
+
+
+@dataclass(frozen=True)
+class LinkSnapshot:
+    """Link state of every requested fork, taken from one directory listing."""
+
+    extract_dir: Path
+    forks: dict[ForkName, ForkLinkState] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation."""
+        return {
+            "extract_dir": str(self.extract_dir),
+            "forks": {
+                fork.value: {
+                    "links": [
+                        {
+                            "name": link.name,
+                            "path": str(link.path),
+                            "target": str(link.target) if link.target else None,
+                            "exists": link.exists,
+                        }
+                        for link in state.links
+                    ],
+                    "installed": list(state.installed),
+                    "prunable": list(state.prunable),
+                }
+                for fork, state in self.forks.items()
+            },
+        }
+
+
+def snapshot_links(
+    extract_dir: Path,
+    file_system: FileSystemClientProtocol,
+    forks: Optional[Iterable[ForkName]] = None,
+) -> LinkSnapshot:
+    """Capture the managed links and installed builds of several forks.
+
+    Args:
+        extract_dir: Directory containing the links and builds
+        file_system: File system client
+        forks: Forks to include (default: all)
+
+    Returns:
+        Snapshot with one entry per fork, in the order given
+    """
+    try:
+        index = get_directory_index(extract_dir, file_system)
+    except OSError:
+        index = DirectoryIndex(extract_dir, [])
+    entries = {entry.name: entry for entry in index.entries}
+    base = Path(os.path.normpath(extract_dir))
+
+    states: dict[ForkName, ForkLinkState] = {}
+    for fork in forks if forks is not None else FORKS:
+        links = tuple(
+            _read_link(link_path, base, entries, file_system)
+            for link_path in _get_link_names(extract_dir, fork)
+        )
+        installed = tuple(installed_tags(list(index.candidates[fork])))
+        linked = {link.target.name for link in links if link.target and link.exists}
+        states[fork] = ForkLinkState(
+            fork,
+            links,
+            installed,
+            tuple(tag for tag in installed if tag not in linked),
+        )
+    return LinkSnapshot(extract_dir, states)
+
+
+def _read_link(
+    link_path: Path,
+    base: Path,
+    entries: dict[str, ScanEntry],
+    file_system: FileSystemClientProtocol,
+) -> LinkState:
+    """Read one managed link using the directory listing for existence checks."""
+    entry = entries.get(link_path.name)
+    if entry is None or not entry.is_symlink:
+        return LinkState(link_path.name, link_path)
+    try:
+        target = file_system.readlink(link_path)
+    except OSError:
+        return LinkState(link_path.name, link_path)
+
+    target = Path(os.path.normpath(base / target))
+    if target.parent == base:
+        # The usual case: the target is a sibling, already in the listing
+        found = entries.get(target.name)
+        exists = found is not None and (
+            not found.is_symlink or file_system.exists(target)
+        )
+    else:
+        exists = file_system.exists(target)
+    return LinkState(link_path.name, link_path, target, exists)
 
 
 def list_links(
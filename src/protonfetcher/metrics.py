@@ -0,0 +1,355 @@
+"""Prometheus textfile-collector export for ProtonFetcher.
+
+``--metrics-file PATH`` records the run with a ``tracing.Tracer`` and, when
+the run ends, turns its spans into metrics for node-exporter's textfile
+collector (``--collector.textfile.directory``; the file name must end in
+``.prom``):
+
+- downloads: bytes, transfer seconds and throughput per host, from the
+  ``transfer`` spans and, for ``--stream``, the ``transfer_stream`` spans
+  (timed by their ``transfer_seconds``, which leaves out the extraction
+  the span also covers)
+- extraction: duration, bytes and throughput per fork, from the
+  ``extract``/``extract_stream`` spans
+- HTTP requests by host, endpoint and status, from the ``http`` spans
+- size, metadata and directory-index cache lookups, from the tracer totals
+- outcome of each fork's fetch, from the ``fetch_and_extract`` spans
+- installed releases and disk usage per fork, from the extract directory
+
+Values describe the last run only. The file is replaced atomically, so the
+collector never reads a half-written file.
+"""
+
+import contextlib
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from urllib.parse import urlsplit
+
+from .common import FORKS
+from .filesystem import FileSystemClient
+from .tracing import Tracer
+from .version_finder import DirectoryIndex
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "protonfetcher"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class MetricFamily:
+    """One metric with its HELP/TYPE header and labelled samples."""
+
+    name: str
+    help: str
+    type: str = "gauge"
+    samples: dict[Labels, float] = field(default_factory=dict)
+
+    def set(self, value: float, **labels: str) -> None:
+        self.samples[tuple(sorted(labels.items()))] = value
+
+    def add(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        self.samples[key] = self.samples.get(key, 0) + value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render(families: list[MetricFamily]) -> str:
+    """Render metric families in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for family in families:
+        name = f"{PREFIX}_{family.name}"
+        lines.append(f"# HELP {name} {family.help}")
+        lines.append(f"# TYPE {name} {family.type}")
+        for labels, value in sorted(family.samples.items()):
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+            selector = f"{name}{{{label_text}}}" if label_text else name
+            lines.append(f"{selector} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def classify_endpoint(url: str) -> str:
+    """Name the kind of request a URL makes, for the endpoint label.
+
+    Covers the GitHub and Forgejo URLs the fetchers use; anything else
+    (e.g. redirects to object storage) is "other".
+    """
+    path = urlsplit(url).path
+    if "/releases/download/" in path:
+        return "checksum" if path.endswith(".sha512sum") else "asset"
+    api = path.startswith("/repos/") or path.startswith("/api/")
+    if path.endswith("/releases/latest"):
+        return "api_latest" if api else "latest_redirect"
+    if "/releases/tags/" in path:
+        return "api_release"
+    if path.endswith("/releases"):
+        return "api_releases" if api else "releases_page"
+    if "/releases/tag/" in path:
+        return "release_page"
+    return "other"
+
+
+def _request_status(args: dict[str, Any]) -> str:
+    """HTTP status of a request span, or curl_<code> for a transport error."""
+    status = args.get("status")
+    if status is not None:
+        return str(status)
+    returncode = args.get("returncode")
+    if returncode is not None:
+        return "ok" if returncode == 0 else f"curl_{returncode}"
+    return "error" if "error" in args else "unknown"
+
+
+def _owning_fork(event: dict[str, Any], fetches: list[dict[str, Any]]) -> str:
+    """Fork of the fetch_and_extract span enclosing event on its thread."""
+    end = event["ts"] + event["dur"]
+    for fetch in fetches:
+        if (
+            fetch["tid"] == event["tid"]
+            and fetch["ts"] <= event["ts"]
+            and end <= fetch["ts"] + fetch["dur"]
+        ):
+            return str(fetch["args"].get("fork", "unknown"))
+    return "unknown"
+
+
+def _tree_usage(root: Path, seen: set[tuple[int, int]]) -> int:
+    """Bytes allocated to the files under root whose inodes were not seen yet."""
+    used = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) in seen:
+                continue
+            seen.add((st.st_dev, st.st_ino))
+            used += st.st_blocks * 512
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+    return used
+
+
+def _transfer_metrics(spans: list[dict[str, Any]]) -> list[MetricFamily]:
+    downloaded = MetricFamily(
+        "download_bytes", "Bytes downloaded in the last run, by host"
+    )
+    seconds = MetricFamily(
+        "download_seconds", "Seconds spent transferring downloads, by host"
+    )
+    throughput = MetricFamily(
+        "download_throughput_bytes_per_second",
+        "Download throughput of the last run, by host",
+    )
+    failures = MetricFamily(
+        "download_failures", "Downloads that failed in the last run, by host"
+    )
+    for event in spans:
+        if event["name"] not in ("transfer", "transfer_stream"):
+            continue
+        host = str(event["args"].get("host", "unknown"))
+        downloaded.add(event["args"].get("bytes", 0), host=host)
+        seconds.add(
+            event["args"].get("transfer_seconds", event["dur"] / 1e6), host=host
+        )
+        failures.add(1 if "error" in event["args"] else 0, host=host)
+    for labels, elapsed in seconds.samples.items():
+        if elapsed > 0:
+            throughput.samples[labels] = downloaded.samples[labels] / elapsed
+    return [downloaded, seconds, throughput, failures]
+
+
+def _extract_metrics(spans: list[dict[str, Any]]) -> list[MetricFamily]:
+    extracted = MetricFamily(
+        "extract_bytes", "Uncompressed bytes extracted in the last run, by fork"
+    )
+    seconds = MetricFamily(
+        "extract_seconds", "Seconds spent extracting in the last run, by fork"
+    )
+    throughput = MetricFamily(
+        "extract_throughput_bytes_per_second",
+        "Extraction throughput of the last run, by fork",
+    )
+    fetches = [e for e in spans if e["name"] == "fetch_and_extract"]
+    for event in spans:
+        if event["name"] not in ("extract", "extract_stream"):
+            continue
+        fork = _owning_fork(event, fetches)
+        extracted.add(event["args"].get("extracted_bytes", 0), fork=fork)
+        seconds.add(event["dur"] / 1e6, fork=fork)
+    for labels, elapsed in seconds.samples.items():
+        if elapsed > 0:
+            throughput.samples[labels] = extracted.samples[labels] / elapsed
+    return [extracted, seconds, throughput]
+
+
+def _request_metrics(spans: list[dict[str, Any]]) -> list[MetricFamily]:
+    requests = MetricFamily(
+        "http_requests",
+        "HTTP requests made in the last run, by host, endpoint and status "
+        "(curl_<code> for curl transport errors, which have no status)",
+    )
+    for event in spans:
+        if event["cat"] != "http":
+            continue
+        url = str(event["args"].get("url", ""))
+        requests.add(
+            1,
+            host=urlsplit(url).netloc,
+            endpoint=classify_endpoint(url),
+            status=_request_status(event["args"]),
+        )
+    return [requests]
+
+
+def _cache_metrics(tracer: Tracer) -> list[MetricFamily]:
+    lookups = MetricFamily(
+        "cache_lookups", "Cache lookups in the last run, by cache and result"
+    )
+    for cache in ("size_cache", "metadata_cache", "directory_index"):
+        lookups.set(tracer.totals[f"{cache}_hits"], cache=cache, result="hit")
+        lookups.set(tracer.totals[f"{cache}_misses"], cache=cache, result="miss")
+    return [lookups]
+
+
+def _fetch_metrics(spans: list[dict[str, Any]]) -> list[MetricFamily]:
+    succeeded = MetricFamily(
+        "fetch_success", "1 if the fork's fetch in the last run succeeded"
+    )
+    for event in spans:
+        if event["name"] == "fetch_and_extract":
+            fork = str(event["args"].get("fork", "unknown"))
+            succeeded.set(0 if "error" in event["args"] else 1, fork=fork)
+    return [succeeded]
+
+
+def _install_metrics(extract_dir: Path) -> list[MetricFamily]:
+    installed = MetricFamily(
+        "installed_versions", "Number of releases installed, by fork"
+    )
+    releases = MetricFamily(
+        "installed_release_info", "1 for every installed release directory"
+    )
+    disk = MetricFamily(
+        "disk_usage_bytes",
+        "Bytes allocated to installed releases, by fork; hard links count "
+        "once per fork",
+    )
+    try:
+        index = DirectoryIndex.scan(extract_dir, FileSystemClient())
+    except OSError as e:
+        logger.warning(f"Could not list {extract_dir} for metrics: {e}")
+        return [installed, releases, disk]
+    for fork in FORKS:
+        candidates = index.candidates[fork]
+        installed.set(len(candidates), fork=str(fork))
+        seen: set[tuple[int, int]] = set()
+        used = 0
+        for _, path in candidates:
+            releases.set(1, fork=str(fork), release=path.name)
+            used += _tree_usage(path, seen)
+        disk.set(used, fork=str(fork))
+    return [installed, releases, disk]
+
+
+def collect(
+    tracer: Tracer,
+    extract_dir: Path,
+    succeeded: bool,
+    now: Optional[float] = None,
+) -> list[MetricFamily]:
+    """Build the metrics of a run from its tracer and the extract directory.
+
+    Args:
+        tracer: Tracer that recorded the run
+        extract_dir: Directory the releases are installed in
+        succeeded: Whether the run finished without an error
+        now: Wall-clock end of the run (default: now)
+    """
+    spans = [e for e in tracer.events() if e["ph"] == "X"]
+    finished = MetricFamily(
+        "last_run_timestamp_seconds", "Unix time the last run finished"
+    )
+    finished.set(time.time() if now is None else now)
+    success = MetricFamily("last_run_success", "1 if the last run succeeded")
+    success.set(1 if succeeded else 0)
+    duration = MetricFamily("last_run_duration_seconds", "Duration of the last run")
+    duration.set((tracer.clock() - tracer.origin) / 1e9)
+
+    return (
+        [finished, success, duration]
+        + _fetch_metrics(spans)
+        + _transfer_metrics(spans)
+        + _extract_metrics(spans)
+        + _request_metrics(spans)
+        + _cache_metrics(tracer)
+        + _install_metrics(extract_dir)
+    )
+
+
+def write_textfile(path: Path, families: list[MetricFamily]) -> None:
+    """Write metrics to path atomically, readable by the collector."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(render(families))
+        tmp_path.chmod(0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextlib.contextmanager
+def export(
+    path: Optional[Path], tracer: Optional[Tracer], extract_dir: Path
+) -> Iterator[None]:
+    """Write the metrics of the enclosed block to path when it ends.
+
+    Metrics are written even if the block raises; a SystemExit with a
+    non-zero code or any other exception marks the run as failed.
+
+    Args:
+        path: Metrics file to write, or None to do nothing
+        tracer: Tracer recording the block
+        extract_dir: Directory the releases are installed in
+    """
+    if path is None or tracer is None:
+        yield
+        return
+    succeeded = False
+    try:
+        yield
+        succeeded = True
+    except SystemExit as e:
+        succeeded = e.code in (None, 0)
+        raise
+    finally:
+        try:
+            write_textfile(path, collect(tracer, extract_dir, succeeded))
+            logger.info(f"Wrote metrics to {path}")
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {path}: {e}")
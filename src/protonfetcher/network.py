@@ -1,10 +1,47 @@
 """Network client implementation for ProtonFetcher."""
 
+import asyncio
+import gzip
+import http.client
+import os
+import re
+import socket
 import subprocess
+import threading
+import urllib.parse
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
-from .common import Headers, ProcessResult
+from . import tracing
+from .common import (
+    DEFAULT_USER_AGENT,
+    NETWORK_BACKEND_ENV,
+    NETWORK_BACKENDS,
+    Headers,
+    NetworkClientProtocol,
+    ProcessResult,
+)
+
+# curl -f reports the status of a failed request only on stderr
+_CURL_ERROR_STATUS = re.compile(r"returned error: (\d{3})")
+
+
+def _trace_curl_result(trace_span: tracing.Span, result: ProcessResult) -> None:
+    """Record curl's exit code and, where the output shows it, the HTTP status.
+
+    The status comes from stderr for ``-f`` failures (exit code 22) and from
+    the header block when curl printed one (HEAD, ``-i``); transport errors
+    such as connection failures and timeouts have none.
+    """
+    status: Optional[int] = None
+    if result.returncode == CURL_HTTP_ERROR:
+        match = _CURL_ERROR_STATUS.search(result.stderr or "")
+        status = int(match.group(1)) if match else None
+    elif result.returncode == 0 and (result.stdout or "").startswith("HTTP/"):
+        status = split_response_headers(result.stdout)[0]
+    trace_span.set(returncode=result.returncode)
+    if status is not None:
+        trace_span.set(status=status)
 
 
 class NetworkClient:
@@ -15,6 +52,7 @@ class NetworkClient:
     """
 
     PROTOCOL_VERSION: str = "1.0"
+    requires_curl: bool = True
 
     def __init__(self, timeout: int = 30) -> None:
         self.timeout = timeout
@@ -40,33 +78,29 @@ class NetworkClient:
                 cmd.extend(["-H", f"{key}: {value}"])
         return cmd
 
-    def get(
-        self, url: str, headers: Optional[Headers] = None, stream: bool = False
-    ) -> ProcessResult:
+    def get_command(
+        self, url: str, headers: Optional[Headers] = None, include_headers: bool = False
+    ) -> list[str]:
+        """Build the curl command for a GET request."""
         base_cmd = [
             "-L",  # Follow redirects
             "-s",  # Silent mode
             "-S",  # Show errors
             "-f",  # Fail on HTTP error
         ]
+        if include_headers:
+            base_cmd.append("-i")  # Include response headers in output
         base_cmd = self._add_headers(base_cmd, headers)
-
-        if stream:
-            # For streaming, we'll handle differently
-            pass
-
         base_cmd.append(url)
-        cmd = self._build_curl_cmd(base_cmd)
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result
+        return self._build_curl_cmd(base_cmd)
 
-    def head(
+    def head_command(
         self,
         url: str,
         headers: Optional[Headers] = None,
         follow_redirects: bool = False,
-    ) -> ProcessResult:
+    ) -> list[str]:
+        """Build the curl command for a HEAD request."""
         base_cmd = [
             "-I",  # Header only
             "-s",  # Silent mode
@@ -79,9 +113,31 @@ class NetworkClient:
 
         base_cmd = self._add_headers(base_cmd, headers)
         base_cmd.append(url)
-        cmd = self._build_curl_cmd(base_cmd)
+        return self._build_curl_cmd(base_cmd)
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        stream: bool = False,
+        include_headers: bool = False,
+    ) -> ProcessResult:
+        cmd = self.get_command(url, headers, include_headers)
+        with tracing.request_span("GET", url) as trace_span:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            _trace_curl_result(trace_span, result)
+        return result
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+    def head(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        follow_redirects: bool = False,
+    ) -> ProcessResult:
+        cmd = self.head_command(url, headers, follow_redirects)
+        with tracing.request_span("HEAD", url) as trace_span:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            _trace_curl_result(trace_span, result)
         return result
 
     def download(
@@ -100,5 +156,436 @@ class NetworkClient:
         base_cmd.append(url)
         cmd = self._build_curl_cmd(base_cmd)
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        with tracing.request_span("GET", url) as trace_span:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            _trace_curl_result(trace_span, result)
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Pure-Python backend with keep-alive connection pooling
+# ---------------------------------------------------------------------------
+
+# curl exit codes reproduced by PooledNetworkClient so callers that inspect
+# ProcessResult.returncode/stderr behave the same with either backend.
+CURL_COULDNT_CONNECT = 7
+CURL_HTTP_ERROR = 22
+CURL_WRITE_ERROR = 23
+CURL_TIMEOUT = 28
+CURL_TOO_MANY_REDIRECTS = 47
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+_CHUNK_SIZE = 64 * 1024
+
+PoolKey = tuple[str, str, int]
+
+
+class ConnectionPool:
+    """Bounded pool of idle keep-alive connections, keyed by (scheme, host, port).
+
+    Connections are checked out for the duration of one request/response
+    exchange and handed back once the body has been fully consumed. At most
+    ``max_per_host`` idle connections are retained per host; extras are closed.
+    """
+
+    def __init__(self, timeout: int, max_per_host: int = 4) -> None:
+        self.timeout = timeout
+        self.max_per_host = max(1, max_per_host)
+        self._idle: dict[PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: PoolKey) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection for *key* and whether it was reused from the pool."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+
+        scheme, host, port = key
+        if scheme == "https":
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                host, port, timeout=self.timeout
+            )
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        return conn, False
+
+    def release(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_lists:
+            for conn in idle:
+                conn.close()
+
+
+class PooledNetworkClient:
+    """Pure-Python implementation of NetworkClientProtocol.
+
+    Uses ``http.client`` with a bounded per-host keep-alive pool instead of
+    spawning one curl process per request, so repeated API calls, redirect
+    probes and size checks against the same host share a TLS session.
+    Results mimic the curl backend (``-f`` error codes, ``-I`` header output)
+    so ReleaseManager and AssetDownloader work unchanged.
+    """
+
+    PROTOCOL_VERSION: str = "1.0"
+    requires_curl: bool = False
+
+    def __init__(self, timeout: int = 30, max_connections_per_host: int = 4) -> None:
+        self.timeout = timeout
+        self.pool = ConnectionPool(timeout, max_connections_per_host)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.pool.close()
+
+    @staticmethod
+    def _pool_key(url: str) -> tuple[PoolKey, str]:
+        """Split *url* into its pool key and request target (path + query)."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        return (scheme, parts.hostname, port), target
+
+    def _send(
+        self, method: str, url: str, headers: Headers
+    ) -> tuple[PoolKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a single request, retrying once if a pooled connection went stale."""
+        key, target = self._pool_key(url)
+        request_headers = {"User-Agent": DEFAULT_USER_AGENT, **headers}
+        while True:
+            conn, reused = self.pool.acquire(key)
+            try:
+                conn.request(method, target, headers=request_headers)
+                return key, conn, conn.getresponse()
+            except (
+                http.client.RemoteDisconnected,
+                BrokenPipeError,
+                ConnectionResetError,
+            ):
+                conn.close()
+                if not reused:
+                    raise
+            except BaseException:
+                conn.close()
+                raise
+
+    def _finish(
+        self,
+        key: PoolKey,
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        """Hand the connection back to the pool once the response is drained."""
+        if response.will_close:
+            conn.close()
+        else:
+            self.pool.release(key, conn)
+
+    @staticmethod
+    def _format_status_block(response: http.client.HTTPResponse) -> str:
+        """Render a response status line and headers the way ``curl -I`` prints them."""
+        version = "HTTP/1.0" if response.version == 10 else "HTTP/1.1"
+        lines = [f"{version} {response.status} {response.reason}".rstrip()]
+        lines.extend(f"{name}: {value}" for name, value in response.getheaders())
+        return "\r\n".join(lines) + "\r\n\r\n"
+
+    @staticmethod
+    def _error_result(
+        args: list[str], returncode: int, message: str, stdout: str = ""
+    ) -> ProcessResult:
+        return ProcessResult(
+            args=args,
+            returncode=returncode,
+            stdout=stdout,
+            stderr=f"curl: ({returncode}) {message}",
+        )
+
+    @staticmethod
+    def _exception_result(args: list[str], url: str, exc: Exception) -> ProcessResult:
+        """Translate a transport exception into a curl-style failure result."""
+        if isinstance(exc, (TimeoutError, socket.timeout)):
+            code, message = CURL_TIMEOUT, f"Operation timed out: {url}"
+        elif isinstance(exc, OSError):
+            code, message = CURL_COULDNT_CONNECT, f"Failed to connect to {url}: {exc}"
+        else:
+            code, message = CURL_COULDNT_CONNECT, f"Request to {url} failed: {exc}"
+        return PooledNetworkClient._error_result(args, code, message)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Headers],
+        follow_redirects: bool,
+        sink: Optional[BinaryIO] = None,
+        include_headers: bool = False,
+    ) -> ProcessResult:
+        """Perform *method* on *url*, optionally following redirects.
+
+        The body of the final response is written to *sink* when given,
+        otherwise it is decoded and returned as stdout (HEAD returns the
+        accumulated header blocks instead, like ``curl -I``; with
+        *include_headers* the blocks precede the body, like ``curl -i``).
+        """
+        with tracing.request_span(method, url) as trace_span:
+            args = [method, url]
+            header_blocks: list[str] = []
+            current_url = url
+            try:
+                for _ in range(_MAX_REDIRECTS + 1):
+                    key, conn, response = self._send(method, current_url, headers or {})
+                    body = b""
+                    location = response.getheader("Location")
+                    redirect = (
+                        follow_redirects
+                        and response.status in _REDIRECT_STATUSES
+                        and bool(location)
+                    )
+                    try:
+                        if method == "HEAD":
+                            response.read()
+                        elif redirect or response.status >= 400 or sink is None:
+                            body = response.read()
+                        else:
+                            while chunk := response.read(_CHUNK_SIZE):
+                                sink.write(chunk)
+                    except BaseException:
+                        conn.close()
+                        raise
+                    self._finish(key, conn, response)
+
+                    header_blocks.append(self._format_status_block(response))
+                    trace_span.set(
+                        status=response.status, redirects=len(header_blocks) - 1
+                    )
+                    if redirect and location:
+                        current_url = urllib.parse.urljoin(current_url, location)
+                        continue
+
+                    headers_out = method == "HEAD" or include_headers
+                    stdout = "".join(header_blocks) if headers_out else ""
+                    if response.status >= 400:
+                        return self._error_result(
+                            args,
+                            CURL_HTTP_ERROR,
+                            f"The requested URL returned error: {response.status}",
+                            stdout,
+                        )
+                    if method != "HEAD" and sink is None:
+                        if response.getheader("Content-Encoding", "").lower() == "gzip":
+                            body = gzip.decompress(body)
+                        stdout += body.decode("utf-8", errors="replace")
+                    return ProcessResult(
+                        args=args, returncode=0, stdout=stdout, stderr=""
+                    )
+
+                return self._error_result(
+                    args,
+                    CURL_TOO_MANY_REDIRECTS,
+                    f"Maximum ({_MAX_REDIRECTS}) redirects followed",
+                )
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                return self._exception_result(args, current_url, e)
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        stream: bool = False,
+        include_headers: bool = False,
+    ) -> ProcessResult:
+        request_headers = {"Accept-Encoding": "gzip", **(headers or {})}
+        return self._request(
+            "GET",
+            url,
+            request_headers,
+            follow_redirects=True,
+            include_headers=include_headers,
+        )
+
+    def head(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        follow_redirects: bool = False,
+    ) -> ProcessResult:
+        return self._request("HEAD", url, headers, follow_redirects=follow_redirects)
+
+    def download(
+        self, url: str, output_path: Path, headers: Optional[Headers] = None
+    ) -> ProcessResult:
+        try:
+            with open(output_path, "wb") as f:
+                result = self._request("GET", url, headers, True, sink=f)
+        except OSError as e:
+            return self._error_result(
+                ["GET", url], CURL_WRITE_ERROR, f"Failed writing body: {e}"
+            )
+        if result.returncode != 0:
+            output_path.unlink(missing_ok=True)
         return result
+
+
+# ---------------------------------------------------------------------------
+# asyncio front end for concurrent release discovery
+# ---------------------------------------------------------------------------
+
+DEFAULT_ASYNC_CONCURRENCY = 8
+
+
+class AsyncNetworkClient:
+    """Implementation of AsyncNetworkClientProtocol on top of a sync client.
+
+    With the curl backend each request runs as an asyncio subprocess, so
+    many requests are in flight without a thread each. Other backends
+    (the pooled ``http.client`` one, test doubles) are run in the default
+    thread pool. At most ``max_concurrency`` requests run at once.
+    """
+
+    PROTOCOL_VERSION: str = "1.0"
+
+    def __init__(
+        self,
+        client: NetworkClientProtocol,
+        max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    ) -> None:
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self._limit: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = (
+            None
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to one event loop; each asyncio.run() gets its own
+        loop = asyncio.get_running_loop()
+        if self._limit is None or self._limit[0] is not loop:
+            self._limit = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._limit[1]
+
+    @staticmethod
+    async def _run_curl(method: str, url: str, cmd: list[str]) -> ProcessResult:
+        with tracing.request_span(method, url) as trace_span:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await proc.communicate()
+            result = ProcessResult(
+                args=cmd,
+                returncode=proc.returncode if proc.returncode is not None else -1,
+                stdout=stdout.decode("utf-8", errors="replace"),
+                stderr=stderr.decode("utf-8", errors="replace"),
+            )
+            _trace_curl_result(trace_span, result)
+        return result
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        include_headers: bool = False,
+    ) -> ProcessResult:
+        async with self._semaphore():
+            if isinstance(self.client, NetworkClient):
+                return await self._run_curl(
+                    "GET", url, self.client.get_command(url, headers, include_headers)
+                )
+            return await asyncio.to_thread(
+                self.client.get, url, headers=headers, include_headers=include_headers
+            )
+
+    async def head(
+        self,
+        url: str,
+        headers: Optional[Headers] = None,
+        follow_redirects: bool = False,
+    ) -> ProcessResult:
+        async with self._semaphore():
+            if isinstance(self.client, NetworkClient):
+                return await self._run_curl(
+                    "HEAD",
+                    url,
+                    self.client.head_command(url, headers, follow_redirects),
+                )
+            return await asyncio.to_thread(
+                self.client.head,
+                url,
+                headers=headers,
+                follow_redirects=follow_redirects,
+            )
+
+
+def split_response_headers(output: str) -> tuple[int | None, dict[str, str], str]:
+    """Split ``curl -i`` style output into status, headers and body.
+
+    Redirect and interim (1xx) header blocks are skipped; the status and
+    headers of the final response are returned with lower-cased names.
+    Output that does not start with a status line is treated as a bare body.
+
+    Args:
+        output: stdout from a GET made with ``include_headers=True``
+
+    Returns:
+        Tuple of (status code or None, headers, body)
+    """
+    status: int | None = None
+    headers: dict[str, str] = {}
+    body = output
+    while body.startswith("HTTP/"):
+        block, sep, remainder = body.partition("\r\n\r\n")
+        if not sep:
+            block, sep, remainder = body.partition("\n\n")
+        lines = block.splitlines()
+        parts = lines[0].split()
+        status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
+        headers = {}
+        for line in lines[1:]:
+            name, colon, value = line.partition(":")
+            if colon:
+                headers[name.strip().lower()] = value.strip()
+        body = remainder
+    return status, headers, body
+
+
+def create_network_client(
+    backend: Optional[str] = None, timeout: int = 30
+) -> NetworkClientProtocol:
+    """Create a network client for the requested backend.
+
+    Args:
+        backend: ``"curl"`` (one subprocess per request) or ``"http"``
+            (pooled keep-alive connections). Defaults to the value of the
+            ``PROTONFETCHER_NETWORK_BACKEND`` environment variable, then curl.
+        timeout: Timeout in seconds for network operations
+
+    Returns:
+        A NetworkClientProtocol implementation
+
+    Raises:
+        ValueError: If the backend name is not recognised
+    """
+    name = (backend or os.environ.get(NETWORK_BACKEND_ENV) or "curl").lower()
+    if name == "curl":
+        return NetworkClient(timeout=timeout)
+    if name == "http":
+        return PooledNetworkClient(timeout=timeout)
+    raise ValueError(
+        f"Unknown network backend '{name}' (expected one of: {', '.join(NETWORK_BACKENDS)})"
+    )
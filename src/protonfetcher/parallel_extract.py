@@ -0,0 +1,193 @@
+"""Producer/consumer tar extraction for ProtonFetcher.
+
+Extracting a Proton build means writing thousands of small files. With
+``TarFile.extract`` every open/write/chmod/utime happens on the thread
+that also drives decompression, so the decompressor sits idle during
+filesystem syscalls. Here the decompressing thread only reads member
+payloads and hands them to a pool of writer threads:
+
+- Every member goes through ``tarfile.data_filter`` first, so the same
+  safety guarantees apply as with ``filter="data"`` (no absolute paths,
+  no escaping the destination, no device files, sanitised modes, no
+  ownership changes).
+- Directories are created as soon as they are seen; their modes and
+  mtimes are applied in a final pass once everything inside is written.
+- Regular files are written by the pool with ``O_EXCL | O_NOFOLLOW`` after
+  unlinking whatever was there, so a pre-existing symlink is never
+  written through. Mode and mtime are set on the open descriptor.
+- Symlinks, hard links and other members are extracted by ``tarfile``
+  after all files are written, so hard-link targets always exist.
+"""
+
+import logging
+import os
+import shutil
+import tarfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Union
+
+from . import tracing
+from .common import DEFAULT_WRITERS
+
+logger = logging.getLogger(__name__)
+
+# Payloads waiting for a writer are held in memory up to this many bytes
+MAX_BUFFERED_BYTES = 64 * 1024 * 1024
+
+# Files larger than this are streamed to disk by the reading thread
+# instead of being buffered for the pool
+LARGE_FILE_THRESHOLD = 8 * 1024 * 1024
+
+_OPEN_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_EXCL
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+
+class _ByteBudget:
+    """Bounds the payload bytes queued for writers."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, size: int) -> int:
+        # A payload larger than the whole budget waits until the queue is empty
+        size = min(size, self.limit)
+        with self._cond:
+            self._cond.wait_for(lambda: self._used + size <= self.limit)
+            self._used += size
+        return size
+
+    def release(self, size: int) -> None:
+        with self._cond:
+            self._used -= size
+            self._cond.notify_all()
+
+
+def _write_file(
+    path: str, payload: Union[bytes, BinaryIO], info: tarfile.TarInfo
+) -> None:
+    """Create a regular file from a filtered member and apply its metadata."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, _OPEN_FLAGS, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        if isinstance(payload, bytes):
+            f.write(payload)
+        else:
+            shutil.copyfileobj(payload, f)
+        f.flush()
+        if info.mode is not None:
+            os.fchmod(f.fileno(), info.mode)
+        if info.mtime is not None:
+            os.utime(f.fileno(), (info.mtime, info.mtime))
+
+
+def _apply_directory_metadata(path: str, info: tarfile.TarInfo) -> None:
+    if info.mode is not None:
+        os.chmod(path, info.mode)
+    if info.mtime is not None:
+        os.utime(path, (info.mtime, info.mtime))
+
+
+def extract_members(
+    tar: tarfile.TarFile,
+    target_dir: Path,
+    writers: int = DEFAULT_WRITERS,
+    on_member: Optional[Callable[[tarfile.TarInfo], None]] = None,
+) -> None:
+    """Extract every member of a (possibly streaming) tar archive.
+
+    Args:
+        tar: Archive opened for sequential reading
+        target_dir: Directory to extract into (must exist)
+        writers: Number of writer threads; 1 extracts sequentially with
+            ``TarFile.extract``
+        on_member: Called on the reading thread after each member is queued
+
+    Raises:
+        tarfile.FilterError: If a member is rejected by the ``data`` filter
+        OSError: If a file cannot be written
+    """
+    if writers <= 1:
+        for member in tar:
+            tar.extract(member, path=target_dir, filter="data")
+            if on_member is not None:
+                on_member(member)
+        return
+
+    dest = os.path.realpath(target_dir)
+    directories: list[tuple[str, tarfile.TarInfo]] = []
+    deferred: list[tarfile.TarInfo] = []
+    budget = _ByteBudget(MAX_BUFFERED_BYTES)
+    failures: list[BaseException] = []
+
+    def _on_done(future: Future[None]) -> None:
+        error = future.exception()
+        if error is not None:
+            failures.append(error)
+
+    def _write_buffered(
+        path: str, data: bytes, info: tarfile.TarInfo, held: int
+    ) -> None:
+        try:
+            with tracing.span("write", "extract", bytes=len(data)):
+                _write_file(path, data, info)
+        finally:
+            budget.release(held)
+
+    # Leaving the with-block waits for queued writes, even on error
+    with ThreadPoolExecutor(
+        max_workers=writers, thread_name_prefix="extract-writer"
+    ) as pool:
+        for member in tar:
+            if failures:
+                raise failures[0]
+            info = tarfile.data_filter(member, dest)
+            path = os.path.join(dest, info.name)
+
+            if info.isdir():
+                os.makedirs(path, exist_ok=True)
+                directories.append((path, info))
+            elif info.isreg():
+                source = tar.extractfile(member)
+                assert source is not None
+                if info.size > LARGE_FILE_THRESHOLD:
+                    with tracing.span("write", "extract", bytes=info.size):
+                        _write_file(path, source, info)
+                else:
+                    data = source.read()
+                    held = budget.acquire(len(data))
+                    pool.submit(
+                        _write_buffered, path, data, info, held
+                    ).add_done_callback(_on_done)
+            else:
+                deferred.append(member)
+
+            if on_member is not None:
+                on_member(member)
+
+    if failures:
+        raise failures[0]
+
+    for member in deferred:
+        tar.extract(member, path=target_dir, filter="data")
+
+    # Deepest directories first, after their contents are complete
+    for path, info in sorted(directories, key=lambda item: item[0], reverse=True):
+        _apply_directory_metadata(path, info)
+
+    logger.debug(
+        f"Wrote {len(directories)} directories and {len(deferred)} links "
+        f"with {writers} writer threads"
+    )
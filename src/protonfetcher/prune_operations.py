@@ -4,8 +4,11 @@ Provides standalone functions for computing prune plans and executing
 prune removals, independent of the LinkManager class.
 """
 
+from __future__ import annotations
+
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from .common import (
     FORKS,
@@ -18,6 +21,9 @@ from .exceptions import LinkManagementError
 from .filesystem import FileSystemClient
 from .version_finder import find_version_candidates
 
+if TYPE_CHECKING:
+    from .removal import TreeRemover
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,8 +43,18 @@ def get_installed_versions(
     Returns:
         List of version tag strings, sorted newest first
     """
-    candidates = find_version_candidates(extract_dir, fork, file_system)
+    return installed_tags(find_version_candidates(extract_dir, fork, file_system))
+
+
+def installed_tags(candidates: VersionCandidateList) -> list[str]:
+    """Return the directory names of version candidates, newest first.
+
+    Args:
+        candidates: List of (version, path) tuples
 
+    Returns:
+        Directory names with duplicate versions removed
+    """
     if not candidates:
         return []
 
@@ -191,25 +207,39 @@ def execute_prune_removals(
     fork: ForkName,
     pruned_versions: list[str],
     file_system: FileSystemClientProtocol,
+    remover: Optional[TreeRemover] = None,
 ) -> None:
     """Execute the actual removal of pruned versions.
 
+    Every release is moved to the trash first; the trees are then deleted
+    together so the removal of one large release overlaps with the others.
+
     Args:
         extract_dir: Directory containing Proton installations
         fork: The Proton fork name to prune
         pruned_versions: List of version tags to remove
         file_system: File system client
+        remover: Deletion batch to use (default: a foreground one)
     """
     from .release_operations import remove_release as _remove_release
+    from .removal import TreeRemover
+
+    if remover is None:
+        remover = TreeRemover(file_system)
 
     logger.info(f"Pruning {len(pruned_versions)} old {fork.value} release(s)...")
     for version in pruned_versions:
         try:
-            _remove_release(extract_dir, version, fork, file_system)
+            _remove_release(extract_dir, version, fork, file_system, remover)
             logger.info(f"  Removed: {version}")
         except LinkManagementError as e:
             logger.warning(f"  Failed to remove {version}: {e}")
 
+    try:
+        remover.finish()
+    except LinkManagementError as e:
+        logger.warning(f"  {e}")
+
 
 def prune_releases(
     extract_dir: Path,
@@ -217,6 +247,7 @@ def prune_releases(
     keep: int = 1,
     dry_run: bool = False,
     file_system: FileSystemClientProtocol | None = None,
+    remover: Optional[TreeRemover] = None,
 ) -> tuple[list[str], list[str]]:
     """Remove old Proton releases beyond the keep count.
 
@@ -232,6 +263,7 @@ def prune_releases(
         keep: Number of symlinked versions to retain (0 = prune all)
         dry_run: If True, only report what would be removed
         file_system: File system client (uses default if None)
+        remover: Deletion batch for the pruned directories
 
     Returns:
         Tuple of (kept_versions, pruned_versions) lists
@@ -253,5 +285,5 @@ def prune_releases(
     if dry_run:
         return kept, pruned
 
-    execute_prune_removals(extract_dir, fork, pruned, file_system)
+    execute_prune_removals(extract_dir, fork, pruned, file_system, remover)
     return kept, pruned
@@ -1,33 +1,43 @@
 """Release manager implementation for ProtonFetcher."""
 
-import hashlib
 import json
 import logging
-import os
 import re
-import time
+import threading
 import urllib.parse
 import urllib.request
-from pathlib import Path
 from typing import Any, Optional
 
+from . import tracing
+from .cache_store import CACHE_DB_NAME, CacheStore, default_cache_dir
 from .common import (
     FORKS,
     GITHUB_URL_PATTERN,
+    AsyncNetworkClientProtocol,
     FileSystemClientProtocol,
     ForkName,
+    Headers,
     NetworkClientProtocol,
     PlatformAdapter,
     ProcessResult,
+    ReleaseAsset,
     ReleaseTagsList,
     VersionTuple,
 )
 from .exceptions import NetworkError
+from .network import AsyncNetworkClient, split_response_headers
 from .platform_adapters import github_adapter
 from .utils import format_bytes, get_proton_asset_name, parse_version
 
 logger = logging.getLogger(__name__)
 
+ASSET_SIZE_NAMESPACE = "asset-size"
+ASSET_SIZE_TTL = 3600
+# Metadata is always revalidated; the TTL only bounds how long unused
+# entries linger before eviction.
+METADATA_NAMESPACE = "release-metadata"
+METADATA_TTL = 7 * 24 * 3600
+
 
 class ReleaseManager:
     """Manages release discovery and selection."""
@@ -48,15 +58,27 @@ class ReleaseManager:
             platform_adapter if platform_adapter is not None else github_adapter
         )
 
-        # Initialize cache directory
-        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
-        if xdg_cache_home:
-            self._cache_dir = Path(xdg_cache_home) / "protonfetcher"
-        else:
-            self._cache_dir = Path.home() / ".cache" / "protonfetcher"
-
-        # Create cache directory if it doesn't exist
-        self.file_system_client.mkdir(self._cache_dir, parents=True, exist_ok=True)
+        # The cache database is opened lazily on first lookup
+        self._cache_dir = default_cache_dir()
+        self.cache_store = CacheStore(self._cache_dir / CACHE_DB_NAME)
+
+        # Assets resolved from release API documents during this run, so
+        # later lookups of the same asset need no further requests
+        self._resolved_lock = threading.Lock()
+        self._resolved_releases: dict[tuple[str, str, ForkName], ReleaseAsset] = {}
+        self._latest_releases: dict[tuple[str, ForkName], ReleaseAsset] = {}
+        self._known_assets: dict[tuple[str, str, str], ReleaseAsset] = {}
+        self._async_client: Optional[AsyncNetworkClient] = None
+
+    @property
+    def async_network_client(self) -> AsyncNetworkClientProtocol:
+        """Async front end for the current network client."""
+        # Rebuilt if network_client was swapped after construction
+        if self._async_client is None or self._async_client.client is not (
+            self.network_client
+        ):
+            self._async_client = AsyncNetworkClient(self.network_client)
+        return self._async_client
 
     def _extract_redirect_url(self, response_stdout: str, original_url: str) -> str:
         """Extract the redirected URL from HEAD response headers.
@@ -106,6 +128,7 @@ class ReleaseManager:
             raise NetworkError(f"Could not determine latest tag from URL: {url_path}")
         return match.group(1)
 
+    @tracing.traced("fetch_latest_tag")
     def fetch_latest_tag(self, repo: str) -> str:
         """Get the latest release tag by following the redirect from /releases/latest.
 
@@ -127,7 +150,23 @@ class ReleaseManager:
                 )
         except Exception as e:
             raise NetworkError(f"Failed to fetch latest tag for {repo}: {e}")
+        return self._parse_latest_tag(response, url)
 
+    async def fetch_latest_tag_async(self, repo: str) -> str:
+        """Async variant of fetch_latest_tag, for checking many forks at once."""
+        url = self.platform_adapter.build_host_url(repo, "releases", "latest")
+        try:
+            response = await self.async_network_client.head(url)
+            if response.returncode != 0:
+                raise NetworkError(
+                    f"Failed to fetch latest tag for {repo}: {response.stderr}"
+                )
+        except Exception as e:
+            raise NetworkError(f"Failed to fetch latest tag for {repo}: {e}")
+        return self._parse_latest_tag(response, url)
+
+    def _parse_latest_tag(self, response: ProcessResult, url: str) -> str:
+        """Read the latest tag from the /releases/latest redirect."""
         # Extract redirected URL from response
         redirected_url = self._extract_redirect_url(response.stdout, url)
 
@@ -136,66 +175,133 @@ class ReleaseManager:
         logger.debug(f"Found latest tag: {tag}")
         return tag
 
-    def _get_cache_path(self, repo: str, tag: str, asset_name: str) -> Path:
-        """Get the cache file path for a given asset.
-
-        Args:
-            repo: Repository in format 'owner/repo'
-            tag: Release tag
-            asset_name: Asset filename
-
-        Returns:
-            Path to the cache file
-        """
-        key_data = f"{repo}_{tag}_{asset_name}_size"
-        cache_key = hashlib.md5(key_data.encode()).hexdigest()
-        return self._cache_dir / cache_key
-
-    def _is_cache_valid(self, cache_path: Path, max_age: int = 3600) -> bool:
-        """Check if cached data is still valid (not expired)."""
-        if not self.file_system_client.exists(cache_path):
-            return False
-
-        age = time.time() - self.file_system_client.mtime(cache_path)
-        return age < max_age
+    @staticmethod
+    def _asset_size_key(repo: str, tag: str, asset_name: str) -> str:
+        """Build the cache key for an asset's size."""
+        return f"{repo}/{tag}/{asset_name}"
 
     def _get_cached_asset_size(
         self, repo: str, tag: str, asset_name: str
     ) -> Optional[int]:
         """Get cached asset size if available and not expired."""
-        cache_path = self._get_cache_path(repo, tag, asset_name)
-
-        if self._is_cache_valid(cache_path):
-            try:
-                cached_data_bytes = self.file_system_client.read(cache_path)
-                cached_data = json.loads(cached_data_bytes.decode("utf-8"))
-                size = cached_data.get("size")
-                # Validate that size is an integer
-                if isinstance(size, int):
-                    return size
-            except (json.JSONDecodeError, KeyError, IOError):
-                # If cache file is invalid, return None to force a fresh fetch
-                pass
-        return None
+        value = self.cache_store.get(
+            ASSET_SIZE_NAMESPACE, self._asset_size_key(repo, tag, asset_name)
+        )
+        if value is None or not value.isdigit():
+            tracing.count(size_cache_misses=1)
+            return None
+        tracing.count(size_cache_hits=1)
+        return int(value)
 
     def _cache_asset_size(
         self, repo: str, tag: str, asset_name: str, size: int
     ) -> None:
         """Cache the asset size."""
-        cache_path = self._get_cache_path(repo, tag, asset_name)
+        self.cache_store.set(
+            ASSET_SIZE_NAMESPACE,
+            self._asset_size_key(repo, tag, asset_name),
+            str(size),
+            ttl=ASSET_SIZE_TTL,
+        )
 
+    def _get_cached_metadata(self, url: str) -> dict[str, str] | None:
+        """Load a cached response body and its validators, if present."""
+        value = self.cache_store.get(METADATA_NAMESPACE, url)
+        if value is None:
+            return None
         try:
-            cache_data = {
-                "size": size,
-                "timestamp": time.time(),
-                "repo": repo,
-                "tag": tag,
-                "asset_name": asset_name,
-            }
-            cache_data_bytes = json.dumps(cache_data).encode("utf-8")
-            self.file_system_client.write(cache_path, cache_data_bytes)
-        except IOError as e:
-            logger.debug(f"Failed to write to cache: {e}")
+            entry = json.loads(value)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Ignoring unreadable metadata cache entry for {url}: {e}")
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("body"), str):
+            return None
+        return entry
+
+    def _cache_metadata(self, url: str, body: str, headers: dict[str, str]) -> None:
+        """Store a response body with the validators needed to revalidate it."""
+        entry = {
+            "etag": headers.get("etag", ""),
+            "last_modified": headers.get("last-modified", ""),
+            "body": body,
+        }
+        self.cache_store.set(
+            METADATA_NAMESPACE, url, json.dumps(entry), ttl=METADATA_TTL
+        )
+
+    def _get_with_revalidation(
+        self, url: str, headers: Optional[Headers] = None
+    ) -> ProcessResult:
+        """GET a release API document, revalidating any cached copy.
+
+        A cached body is sent back with ``If-None-Match``/``If-Modified-Since``;
+        a ``304 Not Modified`` answer is served from the cache and does not
+        count against the GitHub API rate limit. Works the same for every
+        platform adapter since only standard HTTP validators are used.
+
+        Args:
+            url: API URL to fetch
+            headers: Optional request headers
+
+        Returns:
+            ProcessResult whose stdout is the response body
+        """
+        if not self._cache_enabled:
+            return self.network_client.get(url, headers=headers)
+
+        cached, request_headers = self._conditional_headers(url, headers)
+        response = self.network_client.get(
+            url, headers=request_headers or None, include_headers=True
+        )
+        return self._finish_revalidation(url, cached, response)
+
+    async def _get_with_revalidation_async(
+        self, url: str, headers: Optional[Headers] = None
+    ) -> ProcessResult:
+        """Async variant of _get_with_revalidation."""
+        client = self.async_network_client
+        if not self._cache_enabled:
+            return await client.get(url, headers=headers)
+
+        cached, request_headers = self._conditional_headers(url, headers)
+        response = await client.get(
+            url, headers=request_headers or None, include_headers=True
+        )
+        return self._finish_revalidation(url, cached, response)
+
+    def _conditional_headers(
+        self, url: str, headers: Optional[Headers]
+    ) -> tuple[dict[str, str] | None, dict[str, str]]:
+        """Load the cached copy of url and build revalidation headers for it."""
+        cached = self._get_cached_metadata(url)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+        return cached, request_headers
+
+    def _finish_revalidation(
+        self, url: str, cached: dict[str, str] | None, response: ProcessResult
+    ) -> ProcessResult:
+        """Serve a 304 from the cache, or cache a fresh response body."""
+        if response.returncode != 0:
+            return response
+
+        status, response_headers, body = split_response_headers(response.stdout)
+        if status == 304 and cached is not None:
+            logger.debug(f"Release metadata not modified, using cache: {url}")
+            tracing.count(metadata_cache_hits=1)
+            body = cached["body"]
+        else:
+            tracing.count(metadata_cache_misses=1)
+            if response_headers.get("etag") or response_headers.get("last-modified"):
+                self._cache_metadata(url, body, response_headers)
+
+        return ProcessResult(
+            args=response.args, returncode=0, stdout=body, stderr=response.stderr
+        )
 
     def _get_expected_extension(self, fork: ForkName | str) -> str:
         """Get the expected archive extension based on the fork."""
@@ -242,46 +348,127 @@ class ReleaseManager:
 
         return None
 
-    def _handle_api_response(
+    def _select_api_asset(
         self,
         assets: list[dict[str, Any]],
         expected_extension: str,
         fork: Optional[ForkName] = None,
         tag: Optional[str] = None,
-    ) -> str:
-        """Handle the API response to find the appropriate asset."""
+    ) -> dict[str, Any]:
+        """Pick the Proton archive among a release's API assets."""
         # For CachyOS, specifically look for the x86_64 asset
         if fork == ForkName.CACHYOS and tag is not None:
             cachyos_asset = self._find_asset_for_cachyos(assets, tag)
             if cachyos_asset:
                 logger.debug(f"Found CachyOS x86_64 asset via API: {cachyos_asset}")
-                return cachyos_asset
+                return next(a for a in assets if a["name"] == cachyos_asset)
 
         matching_assets = self._find_matching_assets(assets, expected_extension)
 
         if matching_assets:
-            # Return the name of the first matching asset
-            asset_name = matching_assets[0]["name"]
-            logger.debug(f"Found asset via API: {asset_name}")
-            return asset_name
+            # Use the first matching asset
+            logger.debug(f"Found asset via API: {matching_assets[0]['name']}")
+            return matching_assets[0]
         else:
             # If no matching extension assets found, use the first available asset as fallback
             if assets:
-                asset_name = assets[0]["name"]
                 logger.debug(
-                    f"Found asset (non-matching extension) via API: {asset_name}"
+                    f"Found asset (non-matching extension) via API: {assets[0]['name']}"
                 )
-                return asset_name
+                return assets[0]
             else:
                 raise NetworkError("No assets found in release")
 
-    def _try_api_approach(self, repo: str, tag: str, fork: ForkName) -> str:
-        """Try to find the asset using the platform API."""
-        api_url = self.platform_adapter.build_api_url(repo, "releases", "tags", tag)
+    def _remember_asset(
+        self, repo: str, fork: ForkName, asset: ReleaseAsset, latest: bool = False
+    ) -> None:
+        """Keep a resolved asset for later lookups during this run."""
+        with self._resolved_lock:
+            if latest:
+                self._latest_releases[(repo, fork)] = asset
+            self._resolved_releases[(repo, asset.tag, fork)] = asset
+            self._known_assets[(repo, asset.tag, asset.name)] = asset
+        if asset.size and self._cache_enabled:
+            self._cache_asset_size(repo, asset.tag, asset.name, asset.size)
+
+    def get_known_asset(
+        self, repo: str, tag: str, asset_name: str
+    ) -> Optional[ReleaseAsset]:
+        """Return an asset already described by a release API response."""
+        with self._resolved_lock:
+            return self._known_assets.get((repo, tag, asset_name))
+
+    @tracing.traced("resolve_release")
+    def resolve_release(
+        self, repo: str, fork: ForkName, tag: Optional[str] = None
+    ) -> ReleaseAsset:
+        """Resolve tag, asset name, size and download URL from one API request.
+
+        The release document lists every asset with its name, size and
+        download URL, so a single request replaces the latest-tag redirect,
+        the asset lookup and the size HEAD requests. The result is kept for
+        the rest of the run and answers ``find_asset_by_name`` and
+        ``get_remote_asset_size`` for the same release.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            fork: The fork, which determines the archive to pick
+            tag: Release tag, or None for the latest release
+
+        Returns:
+            The release's Proton archive
+
+        Raises:
+            NetworkError: If the API request fails or the response is unusable
+        """
+        resolved = self._get_resolved_release(repo, fork, tag)
+        if resolved is not None:
+            tracing.annotate(source="memory", tag=resolved.tag)
+            return resolved
+        api_url = self._release_api_url(repo, tag)
         logger.debug(f"Fetching release info from API: {api_url}")
 
         headers = dict(self.platform_adapter.default_headers)
-        response = self.network_client.get(api_url, headers=headers)
+        response = self._get_with_revalidation(api_url, headers=headers)
+        asset = self._parse_release(response, repo, fork, tag)
+        tracing.annotate(source="api", tag=asset.tag, asset=asset.name)
+        return asset
+
+    async def resolve_release_async(
+        self, repo: str, fork: ForkName, tag: Optional[str] = None
+    ) -> ReleaseAsset:
+        """Async variant of resolve_release; the result is kept the same way."""
+        resolved = self._get_resolved_release(repo, fork, tag)
+        if resolved is not None:
+            return resolved
+        api_url = self._release_api_url(repo, tag)
+        logger.debug(f"Fetching release info from API: {api_url}")
+
+        headers = dict(self.platform_adapter.default_headers)
+        response = await self._get_with_revalidation_async(api_url, headers=headers)
+        return self._parse_release(response, repo, fork, tag)
+
+    def _get_resolved_release(
+        self, repo: str, fork: ForkName, tag: Optional[str]
+    ) -> Optional[ReleaseAsset]:
+        with self._resolved_lock:
+            if tag is None:
+                return self._latest_releases.get((repo, fork))
+            return self._resolved_releases.get((repo, tag, fork))
+
+    def _release_api_url(self, repo: str, tag: Optional[str]) -> str:
+        if tag is None:
+            return self.platform_adapter.build_api_url(repo, "releases", "latest")
+        return self.platform_adapter.build_api_url(repo, "releases", "tags", tag)
+
+    def _parse_release(
+        self,
+        response: ProcessResult,
+        repo: str,
+        fork: ForkName,
+        tag: Optional[str],
+    ) -> ReleaseAsset:
+        """Build a ReleaseAsset from a release API response and remember it."""
         if response.returncode != 0:
             logger.debug(f"API request failed: {response.stderr}")
             raise NetworkError(
@@ -294,13 +481,39 @@ class ReleaseManager:
             logger.debug(f"Failed to parse JSON response: {e}")
             raise NetworkError(f"Failed to parse JSON: {e}")
 
+        if not isinstance(release_data, dict):
+            raise NetworkError("Unexpected release API response")
+        release_tag = release_data.get("tag_name") or tag
+        if not isinstance(release_tag, str):
+            raise NetworkError("No tag name in release API response")
+
         # Look for assets (attachments) in the release data
         if "assets" not in release_data:
             raise NetworkError("No assets found in release API response")
 
         assets: list[dict[str, Any]] = release_data["assets"]
         expected_extension = self._get_expected_extension(fork)
-        return self._handle_api_response(assets, expected_extension, fork, tag)
+        selected = self._select_api_asset(assets, expected_extension, fork, release_tag)
+        size = selected.get("size")
+        asset = ReleaseAsset(
+            tag=release_tag,
+            name=selected["name"],
+            size=size if isinstance(size, int) and size > 0 else None,
+            download_url=selected.get("browser_download_url")
+            or self.platform_adapter.build_download_url(
+                repo, release_tag, selected["name"]
+            ),
+        )
+        self._remember_asset(repo, fork, asset, latest=tag is None)
+        logger.debug(
+            f"Resolved {repo} {asset.tag}: {asset.name}"
+            + (f" ({format_bytes(asset.size)})" if asset.size else "")
+        )
+        return asset
+
+    def _try_api_approach(self, repo: str, tag: str, fork: ForkName) -> str:
+        """Try to find the asset using the platform API."""
+        return self.resolve_release(repo, fork, tag).name
 
     def _try_html_fallback(self, repo: str, tag: str, fork: ForkName) -> str:
         """Try to find the asset by HTML parsing if API fails."""
@@ -333,6 +546,7 @@ class ReleaseManager:
 
         raise NetworkError(f"Asset '{expected_asset_name}' not found in {repo}/{tag}")
 
+    @tracing.traced("find_asset")
     def find_asset_by_name(
         self, repo: str, tag: str, fork: ForkName = ForkName.GE_PROTON
     ) -> str | None:
@@ -506,6 +720,7 @@ class ReleaseManager:
         )
         return size
 
+    @tracing.traced("asset_size")
     def get_remote_asset_size(self, repo: str, tag: str, asset_name: str) -> int:
         """Get the size of a remote asset using HEAD request.
 
@@ -520,6 +735,11 @@ class ReleaseManager:
         Raises:
             FetchError: If unable to get asset size
         """
+        known = self.get_known_asset(repo, tag, asset_name)
+        if known is not None and known.size:
+            tracing.annotate(source="release")
+            return known.size
+
         # Try cache first (skip when caching is disabled)
         if self._cache_enabled:
             cached_size = self._get_cached_asset_size(repo, tag, asset_name)
@@ -527,8 +747,11 @@ class ReleaseManager:
                 logger.debug(
                     f"Using cached size for {asset_name}: {format_bytes(cached_size)}"
                 )
+                tracing.annotate(source="cache")
                 return cached_size
 
+        tracing.annotate(source="network")
+
         url = self.platform_adapter.build_download_url(repo, tag, asset_name)
         logger.debug(f"Getting remote asset size from: {url}")
 
@@ -549,6 +772,7 @@ class ReleaseManager:
         except Exception as e:
             raise NetworkError(f"Failed to get remote asset size for {asset_name}: {e}")
 
+    @tracing.traced("list_releases")
     def list_recent_releases(self, repo: str) -> ReleaseTagsList:
         """Fetch and return a list of recent release tags from the GitHub API.
 
@@ -564,19 +788,39 @@ class ReleaseManager:
         url = self.platform_adapter.build_api_url(repo, "releases")
 
         try:
-            response = self.network_client.get(url)
-            if response.returncode != 0:
-                # Check if it's a rate limit error (HTTP 403) or contains rate limit message
-                if "403" in response.stderr or "rate limit" in response.stderr.lower():
-                    raise NetworkError(
-                        "API rate limit exceeded. Please wait a few minutes before trying again."
-                    )
-                raise NetworkError(
-                    f"Failed to fetch releases for {repo}: {response.stderr}"
-                )
+            response = self._get_with_revalidation(url)
+            self._check_releases_response(response, repo)
         except Exception as e:
             raise NetworkError(f"Failed to fetch releases for {repo}: {e}")
+        return self._parse_release_tags(response)
 
+    async def list_recent_releases_async(self, repo: str) -> ReleaseTagsList:
+        """Async variant of list_recent_releases, for listing many forks at once."""
+        url = self.platform_adapter.build_api_url(repo, "releases")
+
+        try:
+            response = await self._get_with_revalidation_async(url)
+            self._check_releases_response(response, repo)
+        except Exception as e:
+            raise NetworkError(f"Failed to fetch releases for {repo}: {e}")
+        return self._parse_release_tags(response)
+
+    @staticmethod
+    def _check_releases_response(response: ProcessResult, repo: str) -> None:
+        """Raise NetworkError if the release list request failed."""
+        if response.returncode != 0:
+            # Check if it's a rate limit error (HTTP 403) or contains rate limit message
+            if "403" in response.stderr or "rate limit" in response.stderr.lower():
+                raise NetworkError(
+                    "API rate limit exceeded. Please wait a few minutes before trying again."
+                )
+            raise NetworkError(
+                f"Failed to fetch releases for {repo}: {response.stderr}"
+            )
+
+    @staticmethod
+    def _parse_release_tags(response: ProcessResult) -> ReleaseTagsList:
+        """Read the 20 most recent tag names from a release list response."""
         # Check for rate limiting in stdout as well
         if "rate limit" in response.stdout.lower():
             raise NetworkError(
@@ -596,6 +840,7 @@ class ReleaseManager:
 
         return tag_names[:20]
 
+    @tracing.traced("check_for_update")
     def check_for_newer_release(
         self, repo: str, current_versions: list[str], fork: ForkName
     ) -> str | None:
@@ -613,12 +858,23 @@ class ReleaseManager:
         Returns:
             Latest release tag if newer than installed versions, None otherwise
         """
+        return self._newer_release(self.fetch_latest_tag(repo), current_versions, fork)
+
+    async def check_for_newer_release_async(
+        self, repo: str, current_versions: list[str], fork: ForkName
+    ) -> str | None:
+        """Async variant of check_for_newer_release."""
+        return self._newer_release(
+            await self.fetch_latest_tag_async(repo), current_versions, fork
+        )
+
+    def _newer_release(
+        self, latest_tag: str, current_versions: list[str], fork: ForkName
+    ) -> str | None:
+        """Return latest_tag if it is newer than every installed version."""
         if not current_versions:
             # No versions installed, latest is "newer"
-            return self.fetch_latest_tag(repo)
-
-        # Fetch the latest tag
-        latest_tag = self.fetch_latest_tag(repo)
+            return latest_tag
 
         # Parse the latest version
         try:
@@ -4,12 +4,18 @@ Provides functions to remove specific Proton releases and their
 associated symbolic links.
 """
 
+from __future__ import annotations
+
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from .common import FileSystemClientProtocol, ForkName
 from .exceptions import LinkManagementError
 
+if TYPE_CHECKING:
+    from .removal import TreeRemover
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +24,7 @@ def remove_release(
     tag: str,
     fork: ForkName,
     file_system: FileSystemClientProtocol,
+    remover: Optional[TreeRemover] = None,
 ) -> bool:
     """Remove a specific Proton fork release folder and its associated symbolic links.
 
@@ -26,6 +33,8 @@ def remove_release(
         tag: The release tag to remove
         fork: The Proton fork name to determine link naming
         file_system: File system client
+        remover: Batch to add the directory to; the caller finishes it. If
+            None, the directory is deleted before returning.
 
     Returns:
         True if the removal was successful
@@ -44,7 +53,7 @@ def remove_release(
     )
 
     # Remove the release directory
-    _remove_release_directory(release_path, file_system)
+    _remove_release_directory(release_path, file_system, remover)
 
     # Remove the associated symbolic links that point to this release
     _remove_symbolic_links(links_to_remove, file_system)
@@ -122,18 +131,29 @@ def _identify_links_to_remove(
 def _remove_release_directory(
     release_path: Path,
     file_system: FileSystemClientProtocol,
+    remover: Optional[TreeRemover] = None,
 ) -> None:
     """Remove the release directory.
 
+    The directory is renamed into the trash right away. It is deleted here
+    when no remover is given, otherwise when the remover is finished.
+
     Args:
         release_path: Path of the directory to remove
         file_system: File system client
+        remover: Batch to add the directory to
 
     Raises:
         LinkManagementError: If the directory cannot be removed
     """
     try:
-        file_system.rmtree(release_path)
+        if remover is None:
+            from .removal import TreeRemover
+
+            with TreeRemover(file_system) as own_remover:
+                own_remover.discard(release_path)
+        else:
+            remover.discard(release_path)
         logger.info("Removed release directory: %s", release_path)
     except Exception as e:
         raise LinkManagementError(
@@ -0,0 +1,326 @@
+"""Fast removal of Proton release directories.
+
+A Proton build is a tree of thousands of files, and removing several of
+them one ``rmtree`` after another is slow on network-attached home
+directories. Removal here happens in two steps:
+
+- Each doomed directory is first renamed to a hidden trash name next to
+  it. The rename is atomic and instant, so the release disappears from
+  Steam's view (and from version scans) immediately.
+- The trash trees are then deleted by a bounded thread pool. The top
+  levels of every tree are listed with ``scandir`` and split into
+  independent subtrees and file batches, so one large tree keeps all
+  workers busy. Each subtree is removed with ``FileSystemClient.rmtree``,
+  i.e. ``shutil.rmtree``, which walks with ``os.scandir`` on directory
+  descriptors and deletes with ``unlinkat``.
+
+With ``background=True`` the deletion is handed to a detached
+``python -m protonfetcher.removal`` process, so the CLI can return as soon
+as the renames are done. Once the trees are gone, the deduplication store
+next to them is garbage-collected, by whichever process deleted them. Trash
+left behind by an interrupted run is picked
+up by the next removal in the same directory. That trash may still be
+being deleted by a background process of an earlier run, so entries that
+vanish during deletion count as deleted.
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import subprocess
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence
+
+from . import tracing
+from .common import DEFAULT_REMOVE_WORKERS, FileSystemClientProtocol
+from .exceptions import LinkManagementError
+from .filesystem import FileSystemClient, is_real_filesystem
+
+logger = logging.getLogger(__name__)
+
+TRASH_PREFIX = ".protonfetcher-trash-"
+
+# Trees are split until there are this many subtrees per worker, or this
+# many levels have been listed
+_UNITS_PER_WORKER = 4
+_MAX_SPLIT_DEPTH = 3
+# Files found while splitting are unlinked in batches of this size
+_FILE_BATCH = 256
+
+_trash_counter = itertools.count()
+
+
+def trash_path_for(path: Path) -> Path:
+    """Return a unique hidden name next to path to move it to before deletion."""
+    return path.with_name(
+        f"{TRASH_PREFIX}{path.name}.{os.getpid()}.{next(_trash_counter)}"
+    )
+
+
+def is_trash(path: Path) -> bool:
+    return path.name.startswith(TRASH_PREFIX)
+
+
+def _remove_tree(path: Path, file_system: FileSystemClientProtocol) -> None:
+    """rmtree that treats entries deleted concurrently by another process as gone."""
+    while True:
+        try:
+            file_system.rmtree(path)
+            return
+        except FileNotFoundError:
+            if not file_system.exists(path):
+                return
+
+
+def _rmtree(path: Path, file_system: FileSystemClientProtocol) -> None:
+    with tracing.span("rmtree", "remove", path=path.name):
+        _remove_tree(path, file_system)
+
+
+def _unlink_all(paths: list[Path], file_system: FileSystemClientProtocol) -> None:
+    with tracing.span("unlink", "remove", files=len(paths)):
+        for path in paths:
+            try:
+                file_system.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+def _split_tree(
+    path: Path, file_system: FileSystemClientProtocol, target_units: int
+) -> tuple[list[Path], list[Path], list[Path]]:
+    """List the top levels of a tree and split it into independent pieces.
+
+    Returns:
+        (shells, subtrees, files): directories that will be empty once the
+        subtrees and files are gone (outermost first), subtrees to remove
+        whole, and files to unlink
+    """
+    shells: list[Path] = []
+    files: list[Path] = []
+    frontier = [path]
+    for _ in range(_MAX_SPLIT_DEPTH):
+        subdirs: list[Path] = []
+        for directory in frontier:
+            try:
+                entries = file_system.scandir(directory)
+            except FileNotFoundError:
+                continue
+            shells.append(directory)
+            for entry in entries:
+                (subdirs if entry.is_dir else files).append(entry.path)
+        frontier = subdirs
+        if not frontier or len(frontier) >= target_units:
+            break
+    return shells, frontier, files
+
+
+@tracing.traced("delete_trees", "remove")
+def delete_trees(
+    paths: Sequence[Path],
+    file_system: FileSystemClientProtocol,
+    workers: int = DEFAULT_REMOVE_WORKERS,
+) -> list[tuple[Path, BaseException]]:
+    """Delete directory trees using a shared pool of worker threads.
+
+    Args:
+        paths: Directories to delete
+        file_system: File system client
+        workers: Maximum number of deleting threads; 1 deletes each tree
+            with a single ``rmtree`` call
+
+    Returns:
+        (path, error) for every tree that could not be deleted completely
+    """
+    failures: list[tuple[Path, BaseException]] = []
+    if workers <= 1:
+        for path in paths:
+            try:
+                _remove_tree(path, file_system)
+            except OSError as e:
+                failures.append((path, e))
+        return failures
+
+    plans: dict[Path, list[Path]] = {}
+    pending: dict[Path, list[Future[None]]] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="remove") as pool:
+        for path in paths:
+            try:
+                shells, subtrees, files = _split_tree(
+                    path, file_system, workers * _UNITS_PER_WORKER
+                )
+            except OSError as e:
+                failures.append((path, e))
+                continue
+            plans[path] = shells
+            pending[path] = [pool.submit(_rmtree, d, file_system) for d in subtrees]
+            pending[path] += [
+                pool.submit(_unlink_all, files[i : i + _FILE_BATCH], file_system)
+                for i in range(0, len(files), _FILE_BATCH)
+            ]
+
+    for path, shells in plans.items():
+        error = next(
+            (f.exception() for f in pending[path] if f.exception() is not None),
+            None,
+        )
+        if error is not None:
+            failures.append((path, error))
+            continue
+        try:
+            # Innermost first; each is empty by now
+            for shell in reversed(shells):
+                _remove_tree(shell, file_system)
+        except OSError as e:
+            failures.append((path, e))
+    return failures
+
+
+def collect_store_garbage(paths: Sequence[Path]) -> None:
+    """Drop deduplicated content that only the deleted trees linked to."""
+    from .dedup import collect_garbage
+
+    for directory in sorted({path.parent for path in paths}):
+        try:
+            collect_garbage(directory)
+        except OSError as e:
+            logger.warning(f"Could not collect garbage in {directory}: {e}")
+
+
+def spawn_background_delete(paths: Sequence[Path], workers: int) -> bool:
+    """Delete paths in a detached process that outlives the CLI.
+
+    The child gets the parent's ``sys.path`` as ``PYTHONPATH``, so it finds
+    the package when it runs from the ``protonfetcher.pyz`` zipapp.
+
+    Returns:
+        True if the process was started
+    """
+    argv = [
+        sys.executable,
+        "-m",
+        "protonfetcher.removal",
+        "--workers",
+        str(workers),
+        *(str(path) for path in paths),
+    ]
+    try:
+        subprocess.Popen(
+            argv,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+    except OSError as e:
+        logger.warning(f"Could not start background deletion: {e}")
+        return False
+    logger.debug(f"Deleting {len(paths)} trashed director(ies) in the background")
+    return True
+
+
+class TreeRemover:
+    """Collects directories to remove and deletes them in one batch.
+
+    ``discard`` renames a directory into the trash immediately; ``finish``
+    deletes everything discarded so far. Usable as a context manager, which
+    calls ``finish`` on exit.
+    """
+
+    def __init__(
+        self,
+        file_system: FileSystemClientProtocol,
+        workers: int = DEFAULT_REMOVE_WORKERS,
+        background: bool = False,
+    ) -> None:
+        self.file_system = file_system
+        self.workers = workers
+        self.background = background
+        self._trash: list[Path] = []
+        self._swept: set[Path] = set()
+
+    def discard(self, path: Path) -> Path:
+        """Move a directory out of the way; it is deleted by ``finish``.
+
+        Args:
+            path: Directory to remove
+
+        Returns:
+            The trash path the directory was renamed to
+
+        Raises:
+            OSError: If the directory cannot be renamed
+        """
+        self._sweep(path.parent)
+        trash = trash_path_for(path)
+        self.file_system.rename(path, trash)
+        self._trash.append(trash)
+        return trash
+
+    def _sweep(self, directory: Path) -> None:
+        """Queue trash left in a directory by an earlier, interrupted run."""
+        if directory in self._swept:
+            return
+        self._swept.add(directory)
+        try:
+            entries = self.file_system.scandir(directory)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir and is_trash(entry.path):
+                logger.debug(f"Found leftover trash: {entry.path}")
+                self._trash.append(entry.path)
+
+    def finish(self) -> None:
+        """Delete all discarded directories.
+
+        In background mode the deletion is handed to a detached process when
+        the real filesystem is used; otherwise it happens here. On the real
+        filesystem, the deduplication store is garbage-collected afterwards.
+
+        Raises:
+            LinkManagementError: If a directory could not be deleted
+        """
+        trash, self._trash = self._trash, []
+        if not trash:
+            return
+        real_filesystem = is_real_filesystem(self.file_system)
+        if (
+            self.background
+            and real_filesystem
+            and spawn_background_delete(trash, self.workers)
+        ):
+            return
+
+        failures = delete_trees(trash, self.file_system, self.workers)
+        if real_filesystem:
+            collect_store_garbage(trash)
+        if failures:
+            details = "; ".join(f"{path}: {error}" for path, error in failures)
+            raise LinkManagementError(f"Failed to delete {details}")
+
+    def __enter__(self) -> "TreeRemover":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.finish()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the background deletion process."""
+    parser = argparse.ArgumentParser(prog="python -m protonfetcher.removal")
+    parser.add_argument("--workers", type=int, default=DEFAULT_REMOVE_WORKERS)
+    parser.add_argument("paths", nargs="+", type=Path)
+    args = parser.parse_args(argv)
+    failures = delete_trees(args.paths, FileSystemClient(), args.workers)
+    collect_store_garbage(args.paths)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,9 +2,14 @@
 
 Provides self-contained filesystem operations for creating, cleaning up,
 and managing symbolic links that point to Proton version directories.
+
+Links are replaced by creating the new link under a temporary name and
+renaming it over the old one, so a link path never disappears while it
+is being updated.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Dict
 
@@ -71,76 +76,74 @@ def cleanup_unwanted_links(
             file_system.rmtree(link)
 
 
-def compare_targets(
-    current_target: Path, expected_target: Path, file_system: FileSystemClientProtocol
-) -> bool:
-    """Compare if two targets are the same by checking the resolved paths.
+def symlink_value(link: Path, target: Path) -> Path:
+    """Return what a link to target should contain: relative when possible.
 
     Args:
-        current_target: Currently resolved target path
-        expected_target: Expected target path
-        file_system: File system client
+        link: Symlink path
+        target: Directory the link points to
 
     Returns:
-        True if targets match, False otherwise
+        Target relative to the link's directory, or the absolute target if it
+        lies outside that directory
     """
     try:
-        resolved_current = file_system.resolve(current_target)
-        resolved_expected = file_system.resolve(expected_target)
-        return resolved_current == resolved_expected
-    except OSError:
-        # The target directory doesn't exist yet (common case)
-        # We can't directly compare resolved paths, so return False to update the symlink
-        return False
+        return target.relative_to(link.parent)
+    except ValueError:
+        return target
 
 
-def handle_existing_symlink(
-    link: Path, expected_target: Path, file_system: FileSystemClientProtocol
-) -> None:
-    """Handle an existing symlink to check if it points to the correct target.
+def points_to(link: Path, target: Path, file_system: FileSystemClientProtocol) -> bool:
+    """Check with a single readlink whether a symlink already points at target.
+
+    The stored value is compared lexically (after joining it to the link's
+    directory), so neither side is resolved.
 
     Args:
-        link: Path to the existing symlink
-        expected_target: Expected target path
+        link: Symlink path
+        target: Expected target directory
         file_system: File system client
+
+    Returns:
+        True if link is a symlink to target, False otherwise (including when
+        link does not exist or is not a symlink)
     """
     try:
-        current_target = file_system.resolve(link)
-        paths_match = compare_targets(current_target, expected_target, file_system)
-        if paths_match:
-            return  # already correct
-        else:
-            # Paths don't match, remove symlink to update to new target
-            file_system.unlink(link)
+        current = file_system.readlink(link)
     except OSError:
-        # If resolve fails on the current symlink (broken symlink), remove it
-        file_system.unlink(link)
+        return False
+    current_abs = os.path.normpath(link.parent / current)
+    return current_abs == os.path.normpath(link.parent / target)
 
 
-def cleanup_existing_path_before_symlink(
-    link: Path, expected_target: Path, file_system: FileSystemClientProtocol
+def swap_symlink(
+    link: Path, value: Path, file_system: FileSystemClientProtocol
 ) -> None:
-    """Clean up existing path before creating a symlink.
+    """Atomically point link at value, replacing any existing symlink.
 
     Args:
-        link: Path where the symlink will be created
-        expected_target: Expected target path
+        link: Symlink path
+        value: Link contents (relative or absolute target)
         file_system: File system client
+
+    Raises:
+        OSError: If the temporary link cannot be created or renamed
     """
-    # Double check: If link exists as a real directory, remove it before creating symlink
-    if file_system.exists(link) and not file_system.is_symlink(link):
-        file_system.rmtree(link)
-    # If link is a symlink, check if it points to the correct target
-    elif file_system.is_symlink(link):
-        handle_existing_symlink(link, expected_target, file_system)
-
-    # Final check: make sure there's nothing at link path before creating symlink
-    if file_system.exists(link):
-        # This should not happen with correct logic above, but for safety
-        if file_system.is_symlink(link):
-            file_system.unlink(link)
-        else:
-            file_system.rmtree(link)
+    tmp_link = link.with_name(f".{link.name}.tmp{os.getpid()}")
+    try:
+        # Left behind by an interrupted run
+        file_system.unlink(tmp_link)
+    except FileNotFoundError:
+        pass
+    file_system.symlink_to(tmp_link, value, target_is_directory=True)
+    try:
+        file_system.rename(tmp_link, link)
+    except OSError:
+        try:
+            file_system.unlink(tmp_link)
+        except OSError:
+            pass
+        raise
 
 
 def create_symlinks(
@@ -152,6 +155,9 @@ def create_symlinks(
 ) -> bool:
     """Create symlinks for the top 3 Proton versions.
 
+    Links that already point at the right directory are left untouched;
+    the others are swapped in with an atomic rename.
+
     Args:
         main: Main symlink path
         fb1: First fallback symlink path
@@ -170,28 +176,24 @@ def create_symlinks(
         spec.link_path: spec.target_path for spec in wanted_specs
     }
 
-    # First pass: Remove unwanted symlinks and any real directories that conflict with wanted symlinks
+    # Remove unwanted symlinks and any real directories that conflict with wanted
+    # symlinks (a symlink cannot be renamed over a directory)
     cleanup_unwanted_links(main, fb1, fb2, wants, file_system)
 
     for link, target in wants.items():
-        cleanup_existing_path_before_symlink(link, target, file_system)
-        # Calculate relative path from the link location to the target for relative symlinks
-        # If target is not in a subdirectory of link's parent, use absolute path
-        try:
-            relative_target = target.relative_to(link.parent)
-        except ValueError:
-            # If target is not a subpath of link.parent, use absolute path
-            relative_target = target
-        # Use target_is_directory=True to correctly handle directory symlinks
+        if points_to(link, target, file_system):
+            logger.debug("Symlink %s already points to %s", link.name, target.name)
+            continue
+
+        value = symlink_value(link, target)
         try:
-            file_system.symlink_to(link, relative_target, target_is_directory=True)
-            logger.info("Created symlink %s -> %s", link.name, relative_target)
+            swap_symlink(link, value, file_system)
+            logger.info("Created symlink %s -> %s", link.name, value)
         except OSError as e:
             logger.error(
                 "Failed to create symlink %s -> %s: %s", link.name, target.name, e
             )
-            # Don't re-raise to handle gracefully as expected by test
-            # The function should complete without crashing even if symlink creation fails
-            continue  # Continue to the next link instead of failing the entire function
+            # Keep going so one bad link doesn't leave the others stale
+            continue
 
     return True
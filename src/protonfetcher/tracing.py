@@ -0,0 +1,301 @@
+"""Chrome trace-event recording for ProtonFetcher.
+
+Spans mark the phases of a run (tag resolution, asset lookup, size check,
+download, extraction, link management) and the work done on pool threads
+(range segments, extraction writers, deletion workers). While no tracer is
+active, ``span()`` returns a shared no-op context manager, so instrumented
+code costs one global lookup per span.
+
+``start_tracing()`` installs a process-wide ``Tracer``; its events are
+written in the Chrome trace-event JSON format, which Perfetto
+(https://ui.perfetto.dev) and ``chrome://tracing`` load directly. Each
+thread gets its own track, named after the Python thread.
+
+Span args carry what was measured: ``annotate()`` sets values on the
+innermost open span of the calling thread (cache hit or miss, HTTP status),
+and ``count()`` adds to a value on every open span of the calling thread,
+so an HTTP request is counted by the phase and the run that issued it.
+Open spans are kept in a context variable, so concurrent asyncio tasks on
+one thread each see their own stack.
+"""
+
+import contextlib
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """An open span; args set while it is open are written when it closes."""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict[str, Any], start: int) -> None:
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = start
+
+    def set(self, **args: Any) -> None:
+        """Attach args to the span, replacing earlier values."""
+        self.args.update(args)
+
+    def add(self, **amounts: int) -> None:
+        """Add to numeric args of the span."""
+        for key, amount in amounts.items():
+            self.args[key] = self.args.get(key, 0) + amount
+
+
+class _NullSpan(Span):
+    """Span handed out while tracing is off; discards everything."""
+
+    def __init__(self) -> None:
+        super().__init__("", "", {}, 0)
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def add(self, **amounts: int) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_NULL_CONTEXT = contextlib.nullcontext(_NULL_SPAN)
+
+
+class Tracer:
+    """Collects complete-span events from any thread.
+
+    Args:
+        clock: Monotonic clock in nanoseconds (default: ``time.perf_counter_ns``)
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        self.clock = clock
+        self.origin = clock()
+        self.pid = os.getpid()
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        # Sum of every count() made on any thread
+        self.totals: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        # New threads start with an empty context; asyncio tasks get a copy
+        self._open: contextvars.ContextVar[tuple[Span, ...]] = contextvars.ContextVar(
+            f"open_spans_{id(self)}", default=()
+        )
+
+    def _stack(self) -> tuple[Span, ...]:
+        return self._open.get()
+
+    def _micros(self, ns: int) -> float:
+        return (ns - self.origin) / 1000
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[Span]:
+        """Record the enclosed block as a span on the calling thread."""
+        current = Span(name, cat, args, self.clock())
+        token = self._open.set(self._stack() + (current,))
+        try:
+            yield current
+        except BaseException as e:
+            current.args.setdefault("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            end = self.clock()
+            self._open.reset(token)
+            thread = threading.current_thread()
+            tid = thread.native_id or threading.get_ident()
+            event = {
+                "name": current.name,
+                "cat": current.cat,
+                "ph": "X",
+                "ts": self._micros(current.start),
+                "dur": (end - current.start) / 1000,
+                "pid": self.pid,
+                "tid": tid,
+                "args": current.args,
+            }
+            with self._lock:
+                self._events.append(event)
+                self._threads.setdefault(tid, thread.name)
+
+    def annotate(self, **args: Any) -> None:
+        """Set args on the innermost open span of the calling thread."""
+        stack = self._stack()
+        if stack:
+            stack[-1].set(**args)
+
+    def count(self, **amounts: int) -> None:
+        """Add amounts to every open span of the calling thread and the totals."""
+        for open_span in self._stack():
+            open_span.add(**amounts)
+        with self._lock:
+            self.totals.update(amounts)
+
+    def events(self) -> list[dict[str, Any]]:
+        """Recorded events, preceded by process and thread name metadata."""
+        with self._lock:
+            spans = sorted(self._events, key=lambda event: event["ts"])
+            threads = dict(self._threads)
+        metadata: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": 0,
+                "args": {"name": "protonfetcher"},
+            }
+        ]
+        metadata += [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in sorted(threads.items())
+        ]
+        return metadata + spans
+
+    def write(self, path: Path) -> None:
+        """Write the trace as Chrome trace-event JSON, atomically."""
+        import json
+
+        document = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(document, default=str))
+        os.replace(tmp_path, path)
+
+
+_active: Optional[Tracer] = None
+
+
+def start_tracing(tracer: Optional[Tracer] = None) -> Tracer:
+    """Install a tracer that records spans from every thread."""
+    global _active
+    _active = tracer or Tracer()
+    return _active
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording and return the tracer that was active, if any."""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, or None while tracing is off."""
+    return _active
+
+
+def span(
+    name: str, cat: str = "fetch", **args: Any
+) -> contextlib.AbstractContextManager[Span]:
+    """Record the enclosed block as a span, if tracing is on.
+
+    Args:
+        name: Span name shown on the timeline
+        cat: Category, used for filtering in the trace viewer
+        **args: Initial span args
+
+    Returns:
+        Context manager yielding the Span (a no-op span while tracing is off)
+    """
+    tracer = _active
+    if tracer is None:
+        return _NULL_CONTEXT
+    return tracer.span(name, cat, **args)
+
+
+def request_span(method: str, url: str) -> contextlib.AbstractContextManager[Span]:
+    """Span for one HTTP request, counted as a request by the enclosing spans."""
+    tracer = _active
+    if tracer is None:
+        return _NULL_CONTEXT
+    from urllib.parse import urlsplit
+
+    tracer.count(requests=1)
+    return tracer.span(f"{method} {urlsplit(url).netloc}", "http", url=url)
+
+
+def annotate(**args: Any) -> None:
+    """Set args on the innermost open span of the calling thread."""
+    tracer = _active
+    if tracer is not None:
+        tracer.annotate(**args)
+
+
+def count(**amounts: int) -> None:
+    """Add amounts to every open span of the calling thread."""
+    tracer = _active
+    if tracer is not None:
+        tracer.count(**amounts)
+
+
+def traced(name: str, cat: str = "fetch") -> Callable[[F], F]:
+    """Decorator recording every call of the function as a span."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _active
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, cat):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+@contextlib.contextmanager
+def record(
+    path: Optional[Path],
+    name: str = "protonfetcher",
+    force: bool = False,
+    **args: Any,
+) -> Iterator[Optional[Tracer]]:
+    """Trace the enclosed block and write the trace to path when it ends.
+
+    The trace is written even if the block raises. With path None and force
+    False, nothing is recorded.
+
+    Args:
+        path: Trace file to write, or None
+        name: Name of the span covering the whole block
+        force: Record without a path too, for callers that read the tracer
+            themselves (e.g. to export metrics)
+        **args: Args of that span
+
+    Yields:
+        The active Tracer, or None if nothing is recorded
+    """
+    if path is None and not force:
+        yield None
+        return
+    tracer = start_tracing()
+    try:
+        with span(name, "cli", **args):
+            yield tracer
+    finally:
+        stop_tracing()
+        if path is not None:
+            try:
+                tracer.write(path)
+                logger.info(f"Wrote trace to {path}")
+            except OSError as e:
+                logger.warning(f"Could not write trace to {path}: {e}")
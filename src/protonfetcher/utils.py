@@ -1,9 +1,14 @@
 """Utility functions for ProtonFetcher."""
 
-import re
+import functools
+import sys
 from typing import Type
 
-from .common import FORKS, ForkName
+from .common import FORKS, ForkName, VersionTuple
+
+# Distinct (tag, fork) pairs kept by parse_version; far more than the
+# releases and installed builds a run ever sees
+PARSE_VERSION_CACHE_SIZE = 4096
 
 
 def validate_protocol_instance(obj: object, protocol: Type) -> bool:
@@ -53,12 +58,15 @@ def validate_protocol_instance(obj: object, protocol: Type) -> bool:
         return False
 
 
-def parse_version(
-    tag: str, fork: ForkName = ForkName.GE_PROTON
-) -> tuple[str, int, int, int]:
+@functools.lru_cache(maxsize=PARSE_VERSION_CACHE_SIZE)
+def parse_version(tag: str, fork: ForkName = ForkName.GE_PROTON) -> VersionTuple:
     """
     Parse a version tag to extract the numeric components for comparison.
 
+    Results are memoized, so repeated lookups of a tag return the same tuple
+    object. The prefix string is shared by every version of a fork, which
+    lets tuple comparisons skip it by identity and compare only integers.
+
     Args:
         tag: The release tag (e.g., 'GE-Proton10-20' or 'EM-10.0-30')
         fork: The fork name to determine parsing logic
@@ -67,27 +75,11 @@ def parse_version(
         A tuple of (prefix, major, minor, patch) for comparison purposes, or a fallback tuple if parsing fails
     """
     cfg = FORKS.get(fork)
-    if cfg is None:
-        pattern, prefix, is_ge_proton = r"", tag, False
-    else:
-        pattern, prefix, is_ge_proton = (
-            cfg.version_pattern,
-            cfg.version_prefix,
-            cfg.is_ge_proton,
-        )
-    match_result = re.match(pattern, tag)
-    if match_result:
-        groups = list(map(int, match_result.groups()))
-        if is_ge_proton:
-            # GE-Proton: (major, minor) → (prefix, major, 0, minor)
-            major, minor = groups
-            return (prefix, major, 0, minor)
-        else:
-            # Others: (major, minor, patch) → (prefix, major, minor, patch)
-            major, minor, patch = groups
-            return (prefix, major, minor, patch)
+    match_result = cfg.version_regex.match(tag) if cfg is not None else None
+    if match_result and cfg is not None:
+        return cfg.version_from_groups(match_result.groups())
     # If no match, return a tuple that will put this tag at the end for comparison
-    return (tag, 0, 0, 0)
+    return (sys.intern(tag), 0, 0, 0)
 
 
 def compare_versions(tag1: str, tag2: str, fork: ForkName = ForkName.GE_PROTON) -> int:
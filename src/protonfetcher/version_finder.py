@@ -2,26 +2,40 @@
 
 Scans a directory for Proton build directories, parses their versions,
 filters by fork, and deduplicates candidates.
+
+A directory is listed once with ``scandir`` and every entry is classified
+for all forks in the same pass. The resulting index is shared by every
+caller (linking, pruning, candidate selection) until the directory's
+mtime changes.
 """
 
 from __future__ import annotations
 
 import logging
-import re
+import threading
+import time
+import weakref
 from pathlib import Path
+from typing import Optional
 
+from . import tracing
 from .common import (
     FORKS,
     FileSystemClientProtocol,
     ForkName,
+    ScanEntry,
     VersionCandidateList,
     VersionGroups,
     VersionTuple,
+    classify_dir_name,
 )
-from .utils import parse_version
 
 logger = logging.getLogger(__name__)
 
+# A directory modified this close to the moment it was listed may change
+# again within the same mtime tick, so its index is not reused
+_RACY_WINDOW = 1.0
+
 
 def _get_tag_name(entry: Path, fork: ForkName) -> str:
     """Get the tag name from the directory entry, handling fork-specific prefixes.
@@ -33,19 +47,8 @@ def _get_tag_name(entry: Path, fork: ForkName) -> str:
     Returns:
         Cleaned tag name suitable for version parsing
     """
-    if fork == ForkName.PROTON_EM and entry.name.startswith("proton-"):
-        return entry.name[7:]  # Remove "proton-" prefix
-    elif fork == ForkName.CACHYOS and entry.name.startswith("proton-"):
-        # Remove "proton-" prefix and "-x86_64" suffix if present
-        name = entry.name[7:]  # Remove "proton-" prefix
-        if name.endswith("-x86_64"):
-            name = name[:-7]  # Remove "-x86_64" suffix
-        return name
-    elif fork == ForkName.DW_PROTON and entry.name.endswith("-x86_64"):
-        # Remove "-x86_64" suffix for DW-Proton
-        return entry.name[:-7]
-    else:
-        return entry.name
+    matched = FORKS[fork].match_dir_name(entry.name)
+    return matched[0] if matched else entry.name
 
 
 def _should_skip_directory(tag_name: str, fork: ForkName) -> bool:
@@ -74,26 +77,128 @@ def _is_valid_proton_directory(entry: Path, fork: ForkName) -> bool:
     Returns:
         True if the directory matches the fork's naming pattern
     """
-    match fork:
-        case ForkName.GE_PROTON:
-            ge_pattern = r"^GE-Proton\d+-\d+(?:-.*)?$"
-            return bool(re.match(ge_pattern, entry.name))
-        case ForkName.PROTON_EM:
-            em_pattern1 = r"^proton-EM-\d+\.\d+-\d+(?:-.*)?$"
-            em_pattern2 = r"^EM-\d+\.\d+-\d+(?:-.*)?$"
-            return bool(
-                re.match(em_pattern1, entry.name) or re.match(em_pattern2, entry.name)
-            )
-        case ForkName.CACHYOS:
-            cachyos_pattern1 = r"^proton-cachyos-\d+\.\d+-\d+-slr(?:-x86_64)?(?:-.*)?$"
-            cachyos_pattern2 = r"^cachyos-\d+\.\d+-\d+-slr(?:-.*)?$"
-            return bool(
-                re.match(cachyos_pattern1, entry.name)
-                or re.match(cachyos_pattern2, entry.name)
-            )
-        case ForkName.DW_PROTON:
-            dwproton_pattern = r"^dwproton-\d+\.\d+-\d+-x86_64(?:-.*)?$"
-            return bool(re.match(dwproton_pattern, entry.name))
+    return FORKS[fork].match_dir_name(entry.name) is not None
+
+
+class DirectoryIndex:
+    """One listing of an extract directory, classified for every fork.
+
+    Attributes:
+        directory: The directory that was listed
+        entries: Every entry of the listing, including files and symlinks
+        candidates: Parsed (version, path) candidates per fork; only real
+            directories (not symlinks) are considered
+        mtime: Directory mtime taken before listing, or None if unknown
+        scanned_at: Wall-clock time of the listing
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        entries: list[ScanEntry],
+        mtime: Optional[float] = None,
+        scanned_at: Optional[float] = None,
+    ) -> None:
+        self.directory = directory
+        self.entries = entries
+        self.mtime = mtime
+        self.scanned_at = time.time() if scanned_at is None else scanned_at
+        self.candidates: dict[ForkName, VersionCandidateList] = {
+            fork: [] for fork in FORKS
+        }
+        for entry in entries:
+            if entry.is_dir and not entry.is_symlink:
+                classified = classify_dir_name(entry.name)
+                if classified is not None:
+                    fork, _, version = classified
+                    self.candidates[fork].append((version, entry.path))
+
+    @classmethod
+    def scan(
+        cls, directory: Path, file_system: FileSystemClientProtocol
+    ) -> DirectoryIndex:
+        """List a directory once and classify its entries."""
+        mtime = _directory_mtime(directory, file_system)
+        return cls(directory, list(file_system.scandir(directory)), mtime)
+
+    def is_current(self, file_system: FileSystemClientProtocol) -> bool:
+        """Return True if the directory is known not to have changed since the scan."""
+        if self.mtime is None or self.mtime > self.scanned_at - _RACY_WINDOW:
+            return False
+        return _directory_mtime(self.directory, file_system) == self.mtime
+
+
+def _directory_mtime(
+    directory: Path, file_system: FileSystemClientProtocol
+) -> Optional[float]:
+    try:
+        mtime = file_system.mtime(directory)
+    except (OSError, TypeError):
+        return None
+    # Test doubles may return arbitrary objects; only real timestamps count
+    if isinstance(mtime, bool) or not isinstance(mtime, (int, float)):
+        return None
+    return float(mtime)
+
+
+_index_lock = threading.Lock()
+_indexes: weakref.WeakKeyDictionary[
+    FileSystemClientProtocol, dict[Path, DirectoryIndex]
+] = weakref.WeakKeyDictionary()
+
+
+def get_directory_index(
+    extract_dir: Path, file_system: FileSystemClientProtocol
+) -> DirectoryIndex:
+    """Return the index of a directory, listing it again only if it changed.
+
+    Indexes are kept per filesystem client, so callers sharing a client
+    share the listing.
+
+    Args:
+        extract_dir: Directory to index
+        file_system: File system client used for listing
+
+    Returns:
+        The directory's index
+    """
+    with _index_lock:
+        try:
+            cached = _indexes.get(file_system, {}).get(extract_dir)
+        except TypeError:  # client not weak-referenceable or hashable
+            cached = None
+    if cached is not None and cached.is_current(file_system):
+        tracing.count(directory_index_hits=1)
+        return cached
+
+    tracing.count(directory_index_misses=1)
+    index = DirectoryIndex.scan(extract_dir, file_system)
+    with _index_lock:
+        try:
+            _indexes.setdefault(file_system, {})[extract_dir] = index
+        except TypeError:
+            pass
+    return index
+
+
+def invalidate_directory_index(
+    extract_dir: Optional[Path] = None,
+    file_system: Optional[FileSystemClientProtocol] = None,
+) -> None:
+    """Drop cached indexes, for one directory or all of them."""
+    with _index_lock:
+        if file_system is None:
+            clients = list(_indexes.values())
+        else:
+            try:
+                clients = [_indexes.get(file_system, {})]
+            except TypeError:
+                return
+        for cache in clients:
+            if extract_dir is None:
+                cache.clear()
+            else:
+                cache.pop(extract_dir, None)
 
 
 def find_version_candidates(
@@ -103,8 +208,8 @@ def find_version_candidates(
 ) -> VersionCandidateList:
     """Find all directories that look like Proton builds and parse their versions.
 
-    Scans the extract directory, filters by fork-specific patterns, parses
-    version numbers, and returns a list of (version_tuple, path) tuples.
+    Uses the shared directory index, so repeated calls for different forks
+    list the directory only once.
 
     Args:
         extract_dir: Base directory to search
@@ -114,16 +219,9 @@ def find_version_candidates(
     Returns:
         List of (version_tuple, directory_path) tuples
     """
-    candidates: list[tuple[VersionTuple, Path]] = []
-    for entry in file_system.iterdir(extract_dir):
-        if file_system.is_dir(entry) and not file_system.is_symlink(entry):
-            tag_name = _get_tag_name(entry, fork)
-
-            if _should_skip_directory(tag_name, fork):
-                continue
-
-            if _is_valid_proton_directory(entry, fork):
-                candidates.append((parse_version(tag_name, fork), entry))
+    candidates: list[tuple[VersionTuple, Path]] = list(
+        get_directory_index(extract_dir, file_system).candidates[fork]
+    )
     return candidates
 
 
@@ -18,7 +18,9 @@ from protonfetcher.common import (
     DEFAULT_TIMEOUT,
     FileSystemClientProtocol,
     NetworkClientProtocol,
+    ScanEntry,
 )
+from protonfetcher.filesystem import FileSystemClient
 
 # =============================================================================
 # Factory Fixtures (Network, Filesystem, Archive)
@@ -143,10 +145,13 @@ def mock_filesystem_factory(mocker: Any, tmp_path: Path) -> Callable[..., Any]:
             mock_fs.iterdir.side_effect = lambda p: p.iterdir()
             mock_fs.symlink_to.side_effect = lambda p, t, **kwargs: p.symlink_to(t)
             mock_fs.resolve.side_effect = lambda p: p.resolve()
+            mock_fs.readlink.side_effect = lambda p: p.readlink()
             mock_fs.unlink.side_effect = lambda p: p.unlink()
             mock_fs.rmtree.side_effect = lambda p: (
                 p.rmdir() if p.is_dir() else p.unlink()
             )
+            mock_fs.rename.side_effect = lambda s, d: s.rename(d)
+            mock_fs.scandir.side_effect = FileSystemClient().scandir
         else:
             # Default: return True for exists/is_dir unless explicitly overridden
             exists_map = exists_map or {}
@@ -170,6 +175,18 @@ def mock_filesystem_factory(mocker: Any, tmp_path: Path) -> Callable[..., Any]:
             mock_fs.resolve.side_effect = lambda p: p
             mock_fs.unlink.return_value = None
             mock_fs.rmtree.return_value = None
+            mock_fs.rename.return_value = None
+            mock_fs.readlink.side_effect = lambda p: mock_fs.resolve(p)
+            # Derived from the iterdir/is_dir/is_symlink mocks, so tests that
+            # configure those see the same entries through scandir
+            mock_fs.scandir.side_effect = lambda p: [
+                ScanEntry(
+                    e,
+                    mock_fs.is_dir(e) and not mock_fs.is_symlink(e),
+                    mock_fs.is_symlink(e),
+                )
+                for e in mock_fs.iterdir(p)
+            ]
 
         return mock_fs
 
@@ -27,6 +27,24 @@ class SymlinkEnvironment(TypedDict):
     fork: ForkName
 
 
+# =============================================================================
+# Isolation Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: Any
+) -> Path:
+    """Point XDG_CACHE_HOME at a per-test directory so caches never leak."""
+    cache_home = tmp_path_factory.mktemp("xdg-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    # Decompress in-process unless a test picks a backend, so results do not
+    # depend on which tools the host has installed
+    monkeypatch.setenv("PROTONFETCHER_DECOMPRESSOR", "python")
+    return cache_home
+
+
 # =============================================================================
 # Backward Compatibility Fixtures (use factories internally)
 # =============================================================================
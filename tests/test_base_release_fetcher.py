@@ -1,13 +1,24 @@
 """Tests for BaseReleaseFetcher shared workflow methods."""
 
+import asyncio
+import os
+import threading
 from pathlib import Path
 from typing import Any, cast
 from unittest.mock import MagicMock
 
 import pytest
 
+from protonfetcher.archive_extractor import STAGING_PREFIX
+from protonfetcher.base_release_fetcher import update_managed_forks
 from protonfetcher.common import ForkName
-from protonfetcher.exceptions import LinkManagementError, ProtonFetcherError
+from protonfetcher.exceptions import (
+    ExtractionError,
+    LinkManagementError,
+    NetworkError,
+    ProtonFetcherError,
+)
+from protonfetcher.filesystem import FileSystemClient
 from protonfetcher.forgejo_fetcher import ForgejoReleaseFetcher
 from protonfetcher.github_fetcher import GitHubReleaseFetcher
 
@@ -552,6 +563,398 @@ class TestUpdateAllManagedForksPlatformFiltering:
         assert ForkName.GE_PROTON not in result
 
 
+class TestStreamingFetch:
+    """Tests for fetch_and_extract in streaming mode."""
+
+    def _make_fetcher(
+        self, mocker: Any, mock_network_factory: Any, mock_filesystem_factory: Any
+    ) -> GitHubReleaseFetcher:
+        mocker.patch("shutil.which", return_value="/usr/bin/curl")
+        fetcher = GitHubReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=mock_filesystem_factory(use_tmp_path=True),
+        )
+        mocker.patch.object(
+            fetcher, "find_asset_by_name", return_value="GE-Proton10-20.tar.gz"
+        )
+        mocker.patch.object(fetcher.link_manager, "manage_proton_links")
+        return fetcher
+
+    def test_stream_extracts_without_separate_download(
+        self,
+        mocker: Any,
+        mock_network_factory: Any,
+        mock_filesystem_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test stream=True feeds the download into the extractor directly."""
+        fetcher = self._make_fetcher(
+            mocker, mock_network_factory, mock_filesystem_factory
+        )
+        extract_dir = tmp_path / "compatibilitytools.d"
+        output_dir = tmp_path / "downloads"
+
+        stream = object()
+        open_stream = mocker.patch.object(fetcher.asset_downloader, "open_stream")
+        open_stream.return_value.__enter__.return_value = stream
+        open_stream.return_value.__exit__.return_value = False
+
+        def fake_extract(source: Any, target: Path, name: str) -> Path:
+            assert source is stream
+            (target / "GE-Proton10-20").mkdir(parents=True)
+            return target
+
+        extract_stream = mocker.patch.object(
+            fetcher.archive_extractor, "extract_stream", side_effect=fake_extract
+        )
+        download = mocker.patch.object(fetcher.asset_downloader, "download_asset")
+
+        result = fetcher.fetch_and_extract(
+            "GloriousEggroll/proton-ge-custom",
+            output_dir,
+            extract_dir,
+            release_tag="GE-Proton10-20",
+            fork=ForkName.GE_PROTON,
+            stream=True,
+            keep_archive=False,
+        )
+
+        assert result == extract_dir / "GE-Proton10-20"
+        extract_stream.assert_called_once()
+        download.assert_not_called()
+        assert open_stream.call_args.kwargs["tee_path"] is None
+
+    def test_stream_reuses_archive_already_on_disk(
+        self,
+        mocker: Any,
+        mock_network_factory: Any,
+        mock_filesystem_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test stream=True falls back to the regular path for a local archive."""
+        fetcher = self._make_fetcher(
+            mocker, mock_network_factory, mock_filesystem_factory
+        )
+        extract_dir = tmp_path / "compatibilitytools.d"
+        output_dir = tmp_path / "downloads"
+        output_dir.mkdir()
+        (output_dir / "GE-Proton10-20.tar.gz").write_bytes(b"archive")
+
+        open_stream = mocker.patch.object(fetcher.asset_downloader, "open_stream")
+        download = mocker.patch.object(fetcher.asset_downloader, "download_asset")
+        mocker.patch.object(
+            fetcher.archive_extractor,
+            "extract_archive",
+            side_effect=lambda archive, target, *a: (target / "GE-Proton10-20").mkdir(
+                parents=True
+            ),
+        )
+
+        fetcher.fetch_and_extract(
+            "GloriousEggroll/proton-ge-custom",
+            output_dir,
+            extract_dir,
+            release_tag="GE-Proton10-20",
+            fork=ForkName.GE_PROTON,
+            stream=True,
+        )
+
+        open_stream.assert_not_called()
+        download.assert_called_once()
+
+
+class TestStagedExtraction:
+    """Tests for extracting into a staging directory and renaming into place."""
+
+    def _make_fetcher(self, mocker: Any, mock_network_factory: Any) -> Any:
+        mocker.patch("shutil.which", return_value="/usr/bin/curl")
+        fetcher = GitHubReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=FileSystemClient(),
+        )
+        mocker.patch.object(
+            fetcher, "find_asset_by_name", return_value="GE-Proton10-20.tar.gz"
+        )
+        mocker.patch.object(fetcher.link_manager, "manage_proton_links")
+        return fetcher
+
+    def test_interrupted_extraction_leaves_nothing_installed(
+        self, mocker: Any, mock_network_factory: Any, tmp_path: Path
+    ) -> None:
+        """A failed extraction never leaves a partial release directory."""
+        fetcher = self._make_fetcher(mocker, mock_network_factory)
+        extract_dir = tmp_path / "compatibilitytools.d"
+        output_dir = tmp_path / "downloads"
+        mocker.patch.object(
+            fetcher,
+            "_download_asset",
+            return_value=output_dir / "GE-Proton10-20.tar.gz",
+        )
+
+        def fail_midway(archive: Path, target: Path, *args: Any) -> Path:
+            (target / "GE-Proton10-20").mkdir()
+            (target / "GE-Proton10-20" / "proton").write_text("partial")
+            raise ExtractionError("disk full")
+
+        mocker.patch.object(
+            fetcher.archive_extractor, "extract_archive", side_effect=fail_midway
+        )
+
+        with pytest.raises(ExtractionError):
+            fetcher.fetch_and_extract(
+                "GloriousEggroll/proton-ge-custom",
+                output_dir,
+                extract_dir,
+                release_tag="GE-Proton10-20",
+            )
+
+        assert list(extract_dir.iterdir()) == []
+
+    def test_release_is_renamed_into_place(
+        self, mocker: Any, mock_network_factory: Any, tmp_path: Path
+    ) -> None:
+        """The release directory appears complete, and the stage is gone."""
+        fetcher = self._make_fetcher(mocker, mock_network_factory)
+        extract_dir = tmp_path / "compatibilitytools.d"
+        output_dir = tmp_path / "downloads"
+        mocker.patch.object(
+            fetcher,
+            "_download_asset",
+            return_value=output_dir / "GE-Proton10-20.tar.gz",
+        )
+        targets: list[Path] = []
+
+        def extract(archive: Path, target: Path, *args: Any) -> Path:
+            targets.append(target)
+            (target / "GE-Proton10-20").mkdir()
+            (target / "GE-Proton10-20" / "proton").write_text("complete")
+            return target
+
+        mocker.patch.object(
+            fetcher.archive_extractor, "extract_archive", side_effect=extract
+        )
+
+        result = fetcher.fetch_and_extract(
+            "GloriousEggroll/proton-ge-custom",
+            output_dir,
+            extract_dir,
+            release_tag="GE-Proton10-20",
+        )
+
+        assert result == extract_dir / "GE-Proton10-20"
+        assert targets[0].parent == extract_dir
+        assert targets[0].name.startswith(STAGING_PREFIX)
+        assert [p.name for p in extract_dir.iterdir()] == ["GE-Proton10-20"]
+        assert (result / "proton").read_text() == "complete"
+
+    def test_stale_stages_are_swept_on_startup(
+        self, mocker: Any, mock_network_factory: Any, tmp_path: Path
+    ) -> None:
+        """Stages from dead processes are removed; live ones are kept."""
+        fetcher = self._make_fetcher(mocker, mock_network_factory)
+        extract_dir = tmp_path / "compatibilitytools.d"
+        dead = extract_dir / f"{STAGING_PREFIX}999999999-deadbeef"
+        live = extract_dir / f"{STAGING_PREFIX}{os.getpid()}-cafebabe"
+        for stage in (dead, live):
+            (stage / "GE-Proton10-20").mkdir(parents=True)
+        (extract_dir / "GE-Proton10-20").mkdir()
+
+        mocker.patch.object(fetcher.link_manager, "are_links_up_to_date")
+        fetcher.fetch_and_extract(
+            "GloriousEggroll/proton-ge-custom",
+            tmp_path / "downloads",
+            extract_dir,
+            release_tag="GE-Proton10-20",
+        )
+
+        assert not dead.exists()
+        assert live.exists()
+
+
+class TestParallelManagedForkUpdates:
+    """Tests for the parallel multi-fork update engine."""
+
+    def _make_env(self, tmp_path: Path) -> tuple[Path, Path]:
+        extract_dir = tmp_path / "compatibilitytools.d"
+        extract_dir.mkdir()
+        output_dir = tmp_path / "downloads"
+        output_dir.mkdir()
+        for link, target in [
+            ("GE-Proton", "GE-Proton10-20"),
+            ("Proton-EM", "proton-EM-10.0-30"),
+            ("DW-Proton", "dwproton-10.0-26-x86_64"),
+        ]:
+            (extract_dir / target).mkdir()
+            (extract_dir / link).symlink_to(extract_dir / target)
+        return extract_dir, output_dir
+
+    def test_forks_run_concurrently_across_fetchers(
+        self,
+        mocker: Any,
+        mock_network_factory: Any,
+        mock_filesystem_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test jobs > 1 runs every managed fork at the same time, without spinners."""
+        extract_dir, output_dir = self._make_env(tmp_path)
+        mocker.patch("shutil.which", return_value="/usr/bin/curl")
+        github = GitHubReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=mock_filesystem_factory(use_tmp_path=True),
+        )
+        forgejo = ForgejoReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=mock_filesystem_factory(use_tmp_path=True),
+        )
+
+        # Every worker waits at the barrier, so this only completes when all
+        # three forks are in flight simultaneously.
+        barrier = threading.Barrier(3, timeout=5)
+        calls: list[dict[str, Any]] = []
+
+        def fake_fetch(repo: str, out: Path, ext: Path, **kwargs: Any) -> Path:
+            calls.append(kwargs)
+            barrier.wait()
+            return ext / kwargs["fork"].value
+
+        mocker.patch.object(github, "fetch_and_extract", side_effect=fake_fetch)
+        mocker.patch.object(forgejo, "fetch_and_extract", side_effect=fake_fetch)
+
+        results = update_managed_forks(
+            [github, forgejo], output_dir, extract_dir, jobs=4
+        )
+
+        assert set(results) == {
+            ForkName.GE_PROTON,
+            ForkName.PROTON_EM,
+            ForkName.DW_PROTON,
+        }
+        assert all(call["show_progress"] is False for call in calls)
+
+    def test_serial_updates_resolve_releases_up_front(
+        self,
+        mocker: Any,
+        mock_network_factory: Any,
+        mock_filesystem_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test jobs == 1 resolves every fork's latest release concurrently first."""
+        extract_dir, output_dir = self._make_env(tmp_path)
+        mocker.patch("shutil.which", return_value="/usr/bin/curl")
+        github = GitHubReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=mock_filesystem_factory(use_tmp_path=True),
+        )
+        events: list[str] = []
+
+        async def fake_resolve(repo: str, fork: ForkName) -> Any:
+            events.append(f"resolve {fork}")
+            await asyncio.sleep(0)
+            if fork == ForkName.PROTON_EM:
+                raise NetworkError("API request failed")
+
+        def fake_fetch(repo: str, out: Path, ext: Path, **kwargs: Any) -> Path:
+            events.append(f"fetch {kwargs['fork']}")
+            return ext / kwargs["fork"].value
+
+        mocker.patch.object(
+            github.release_manager, "resolve_release_async", side_effect=fake_resolve
+        )
+        mocker.patch.object(github, "fetch_and_extract", side_effect=fake_fetch)
+
+        results = github.update_all_managed_forks(output_dir, extract_dir, jobs=1)
+
+        assert set(results) == {ForkName.GE_PROTON, ForkName.PROTON_EM}
+        assert events == [
+            f"resolve {ForkName.GE_PROTON}",
+            f"resolve {ForkName.PROTON_EM}",
+            f"fetch {ForkName.GE_PROTON}",
+            f"fetch {ForkName.PROTON_EM}",
+        ]
+
+    def test_failed_fork_does_not_stop_others(
+        self,
+        mocker: Any,
+        mock_network_factory: Any,
+        mock_filesystem_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test a failing fork is reported as None while the rest still update."""
+        extract_dir, output_dir = self._make_env(tmp_path)
+        mocker.patch("shutil.which", return_value="/usr/bin/curl")
+        github = GitHubReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=mock_filesystem_factory(use_tmp_path=True),
+        )
+
+        def fake_fetch(repo: str, out: Path, ext: Path, **kwargs: Any) -> Path:
+            if kwargs["fork"] == ForkName.PROTON_EM:
+                raise ProtonFetcherError("download failed")
+            return ext / kwargs["fork"].value
+
+        mocker.patch.object(github, "fetch_and_extract", side_effect=fake_fetch)
+
+        results = github.update_all_managed_forks(output_dir, extract_dir, jobs=2)
+
+        assert results[ForkName.PROTON_EM] is None
+        assert results[ForkName.GE_PROTON] == extract_dir / "GE-Proton"
+
+    def test_link_management_is_serialized(
+        self,
+        mocker: Any,
+        mock_network_factory: Any,
+        mock_filesystem_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Test symlink updates from parallel workers never overlap."""
+        github = GitHubReleaseFetcher(
+            network_client=mock_network_factory(),
+            file_system_client=mock_filesystem_factory(use_tmp_path=True),
+        )
+        mocker.patch.object(github.archive_extractor, "extract_archive")
+        mocker.patch.object(
+            github, "_find_extracted_directory", return_value=tmp_path / "x"
+        )
+
+        active = 0
+        max_active = 0
+        guard = threading.Lock()
+
+        def fake_manage(*args: Any, **kwargs: Any) -> bool:
+            nonlocal active, max_active
+            with guard:
+                active += 1
+                max_active = max(max_active, active)
+            threading.Event().wait(0.02)
+            with guard:
+                active -= 1
+            return True
+
+        mocker.patch.object(
+            github.link_manager, "manage_proton_links", side_effect=fake_manage
+        )
+
+        threads = [
+            threading.Thread(
+                target=github._extract_and_manage_links,
+                args=(tmp_path / "a.tar.gz", tmp_path, "GE-Proton10-20"),
+                kwargs={
+                    "fork": ForkName.GE_PROTON,
+                    "is_manual_release": False,
+                    "show_progress": False,
+                    "show_file_details": False,
+                },
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max_active == 1
+
+
 # =============================================================================
 # Dry-Run Workflow Tests (moved from test_cli.py)
 # =============================================================================
@@ -0,0 +1,203 @@
+"""Smoke tests for the benchmark harness in benchmarks/.
+
+Runs a tiny end-to-end fetch against the local fake release server and a
+small link/prune scale run so the harness keeps working as the fetcher
+changes, and checks the in-memory filesystem against the real client.
+"""
+
+import json
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from benchmarks.archives import ArchiveSpec, build_archive
+from benchmarks.bench_fetch import main as bench_main
+from benchmarks.bench_links import main as bench_links_main
+from benchmarks.fake_server import FakeRelease, FakeReleaseServer
+from benchmarks.memfs import MemoryFileSystem
+from protonfetcher.common import FORKS, FileSystemClientProtocol, ForkName
+from protonfetcher.filesystem import FileSystemClient
+
+
+class TestFakeReleaseServer:
+    """Test the release endpoints the fake server emulates."""
+
+    def test_latest_redirect_and_range_download(self, tmp_path: Path) -> None:
+        """The latest-release redirect and Range requests behave like GitHub."""
+        asset = tmp_path / "GE-Proton10-99.tar.gz"
+        asset.write_bytes(bytes(range(256)) * 16)
+        repo = FORKS[ForkName.GE_PROTON].repo
+        release = FakeRelease(repo, "GE-Proton10-99", {asset.name: asset})
+
+        with FakeReleaseServer([release]) as server:
+            with urllib.request.urlopen(
+                f"{server.origin}/{repo}/releases/latest"
+            ) as response:
+                assert response.geturl().endswith("/releases/tag/GE-Proton10-99")
+
+            request = urllib.request.Request(
+                f"{server.origin}/{repo}/releases/download/GE-Proton10-99/{asset.name}",
+                headers={"Range": "bytes=10-19"},
+            )
+            with urllib.request.urlopen(request) as response:
+                assert response.status == 206
+                assert response.headers["Content-Range"] == "bytes 10-19/4096"
+                assert response.read() == bytes(range(10, 20))
+
+            with urllib.request.urlopen(
+                f"{server.api_base}/repos/{repo}/releases/latest"
+            ) as response:
+                data = json.load(response)
+        assert data["tag_name"] == "GE-Proton10-99"
+        assert data["assets"][0]["size"] == 4096
+        assert server.requests["latest 302"] == 1
+
+
+class TestBenchFetch:
+    """Test the end-to-end benchmark runner."""
+
+    @pytest.mark.parametrize("fork", [ForkName.GE_PROTON, ForkName.PROTON_EM])
+    def test_generated_archive_has_release_layout(
+        self, tmp_path: Path, fork: ForkName
+    ) -> None:
+        """Generated archives extract to a directory named like the release."""
+        import tarfile
+
+        spec = ArchiveSpec(fork, size_mb=1)
+        archive = build_archive(spec, tmp_path)
+        assert archive.name == spec.asset_name
+
+        with tarfile.open(archive) as tar:
+            names = tar.getnames()
+        assert f"{spec.root_name}/proton" in names
+        assert all(name.startswith(spec.root_name) for name in names)
+
+    def test_writes_results(self, tmp_path: Path) -> None:
+        """A minimal run writes per-phase timings and request counts."""
+        output = tmp_path / "results.json"
+
+        status = bench_main(
+            [
+                "--size-mb=1",
+                "--forks=GE-Proton",
+                "--backends=http",
+                "--repeat=1",
+                f"--archive-cache={tmp_path / 'archives'}",
+                f"--output={output}",
+            ]
+        )
+
+        assert status == 0
+        report = json.loads(output.read_text())
+        (run,) = report["runs"]
+        assert run["config"] == "GE-Proton/http/auto/1conn"
+        assert {"download", "extract"} <= run["phases"].keys()
+        assert run["requests"]["api/latest 200"] == 1
+        assert report["summary"][0]["median_total"] > 0
+
+
+def _exercise(fs: FileSystemClientProtocol, root: Path) -> dict[str, object]:
+    """Run the same operations on a filesystem client and record the outcome."""
+    fs.mkdir(root / "GE-Proton10-2" / "files", parents=True)
+    fs.mkdir(root / "GE-Proton10-1")
+    fs.write(root / "GE-Proton10-2" / "version", b"10-2")
+    fs.symlink_to(root / "GE-Proton", Path("GE-Proton10-2"))
+    fs.symlink_to(root / "GE-Proton-Fallback", Path("GE-Proton10-0"))
+    fs.rename(root / "GE-Proton10-1", root / "renamed")
+
+    outcome: dict[str, object] = {
+        "listing": sorted((e.name, e.is_dir, e.is_symlink) for e in fs.scandir(root)),
+        "iterdir": sorted(p.name for p in fs.iterdir(root)),
+        "link_is_dir": fs.is_dir(root / "GE-Proton"),
+        "link_is_symlink": fs.is_symlink(root / "GE-Proton"),
+        "dangling_exists": fs.exists(root / "GE-Proton-Fallback"),
+        "readlink": fs.readlink(root / "GE-Proton"),
+        "resolve": fs.resolve(root / "GE-Proton" / "version").relative_to(
+            fs.resolve(root)
+        ),
+        "read_through_link": fs.read(root / "GE-Proton" / "version"),
+        "size": fs.size(root / "GE-Proton10-2" / "version"),
+    }
+    for name, op in [
+        ("mkdir_existing", lambda: fs.mkdir(root / "renamed")),
+        ("unlink_missing", lambda: fs.unlink(root / "missing")),
+        ("rmtree_file", lambda: fs.rmtree(root / "GE-Proton10-2" / "version")),
+        ("scandir_file", lambda: fs.scandir(root / "GE-Proton10-2" / "version")),
+    ]:
+        try:
+            op()
+            outcome[name] = None
+        except OSError as e:
+            outcome[name] = type(e).__name__
+    fs.rmtree(root / "GE-Proton10-2")
+    outcome["after_rmtree"] = sorted(p.name for p in fs.iterdir(root))
+    return outcome
+
+
+class TestMemoryFileSystem:
+    """Test the in-memory filesystem used by the scale benchmark."""
+
+    def test_behaves_like_the_real_client(self, tmp_path: Path) -> None:
+        """The same operations give the same results as FileSystemClient."""
+        real = _exercise(FileSystemClient(), tmp_path / "real")
+        memory = _exercise(MemoryFileSystem(), Path("/compat"))
+        assert memory == real
+
+    def test_counts_system_calls(self) -> None:
+        """Each call is charged with the system calls it stands for."""
+        fs = MemoryFileSystem()
+        fs.mkdir(Path("/a/b/c"), parents=True)
+        fs.symlink_to(Path("/a/link"), Path("b"))
+        fs.reset_counts()
+
+        fs.exists(Path("/a/link/c"))
+        fs.is_symlink(Path("/a/link"))
+        fs.scandir(Path("/a"))
+        fs.resolve(Path("/a/link/c"))
+
+        assert fs.ops == {
+            "stat": 1,
+            "lstat": 1 + 3,
+            "open": 1,
+            "getdents": 1,
+            "readlink": 1,
+        }
+
+    def test_directory_mtime_changes_with_entries(self) -> None:
+        """Adding or removing entries updates the directory mtime."""
+        now = [100.0]
+        fs = MemoryFileSystem(clock=lambda: now[0])
+        fs.mkdir(Path("/d"))
+        now[0] = 200.0
+        fs.write(Path("/d/f"), b"")
+        assert fs.mtime(Path("/d")) == 200.0
+
+        fs.backdate(50)
+        assert fs.mtime(Path("/d")) == 150.0
+
+
+class TestBenchLinks:
+    """Test the link/prune scale benchmark runner."""
+
+    def test_writes_results(self, tmp_path: Path) -> None:
+        """A small run reports time and system calls for every scenario."""
+        output = tmp_path / "links.json"
+
+        status = bench_links_main(["--entries=200", "--repeat=1", f"--output={output}"])
+
+        assert status == 0
+        report = json.loads(output.read_text())
+        summary = {entry["config"]: entry for entry in report["summary"]}
+        assert set(summary) == {
+            "ls-cold/200",
+            "ls-warm/200",
+            "relink/200",
+            "link-new/200",
+            "prune-dry-run/200",
+            "prune/200",
+        }
+        # The warm listing reuses the directory index instead of rescanning
+        assert "getdents" not in summary["ls-warm/200"]["ops"]
+        assert summary["ls-cold/200"]["ops"]["getdents"] == 1
+        assert summary["prune/200"]["ops"]["rename"] > 0
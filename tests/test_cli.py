@@ -28,10 +28,11 @@ from protonfetcher.cli.validators import (
     set_default_fork,
     validate_mutually_exclusive_args,
 )
-from protonfetcher.common import ForkName
+from protonfetcher.common import FORKS, ForkName
 from protonfetcher.exceptions import NetworkError, ProtonFetcherError
 from protonfetcher.github_fetcher import GitHubReleaseFetcher
 from protonfetcher.link_manager import LinkManager
+from protonfetcher.link_status import ForkLinkState, LinkSnapshot, LinkState
 
 # =============================================================================
 # Argument Parsing Tests
@@ -555,26 +556,27 @@ class TestListLinksOperation:
         mock_fetcher = mocker.MagicMock()
         mock_forgejo_fetcher = mocker.MagicMock()
 
-        def list_links_side_effect(extract_dir, fork):
-            if fork == ForkName.GE_PROTON:
-                return {"GE-Proton": "/path/to/GE-Proton10-20"}
-            elif fork == ForkName.PROTON_EM:
-                return {"Proton-EM": None}
-            elif fork == ForkName.CACHYOS:
-                return {"CachyOS": None}
-            elif fork == ForkName.DW_PROTON:
-                return {"DW-Proton": None}
-            return {}
-
-        mock_fetcher.link_manager.list_links.side_effect = list_links_side_effect
-        mock_forgejo_fetcher.link_manager.list_links.side_effect = (
-            list_links_side_effect
-        )
-        # No prunable versions for any fork
-        mock_fetcher.link_manager.get_installed_versions.return_value = []
-        mock_fetcher.link_manager.get_linked_versions.return_value = []
-        mock_forgejo_fetcher.link_manager.get_installed_versions.return_value = []
-        mock_forgejo_fetcher.link_manager.get_linked_versions.return_value = []
+        def snapshot_side_effect(extract_dir, forks):
+            # Only GE-Proton has a link; no fork has prunable versions
+            return LinkSnapshot(
+                extract_dir,
+                {
+                    fork: ForkLinkState(
+                        fork,
+                        (
+                            LinkState(
+                                FORKS[fork].link_names[0],
+                                extract_dir / FORKS[fork].link_names[0],
+                                Path("/path/to/GE-Proton10-20"),
+                                exists=fork == ForkName.GE_PROTON,
+                            ),
+                        ),
+                    )
+                    for fork in forks
+                },
+            )
+
+        mock_fetcher.link_manager.snapshot_links.side_effect = snapshot_side_effect
 
         mocker.patch(
             "protonfetcher.cli.core.GitHubReleaseFetcher", return_value=mock_fetcher
@@ -599,11 +601,18 @@ class TestListLinksOperation:
         """Test listing links for a specific fork."""
         mock_fetcher = mocker.MagicMock()
         mock_forgejo_fetcher = mocker.MagicMock()
-        mock_fetcher.link_manager.list_links.return_value = {
-            "GE-Proton": "/path/to/GE-Proton10-20",
-            "GE-Proton-Fallback": "/path/to/GE-Proton10-19",
-            "GE-Proton-Fallback2": "/path/to/GE-Proton10-18",
-        }
+        links = tuple(
+            LinkState(name, Path("/links") / name, Path(f"/path/to/{target}"), True)
+            for name, target in (
+                ("GE-Proton", "GE-Proton10-20"),
+                ("GE-Proton-Fallback", "GE-Proton10-19"),
+                ("GE-Proton-Fallback2", "GE-Proton10-18"),
+            )
+        )
+        mock_fetcher.link_manager.snapshot_links.return_value = LinkSnapshot(
+            Path("/links"),
+            {ForkName.GE_PROTON: ForkLinkState(ForkName.GE_PROTON, links)},
+        )
 
         mocker.patch(
             "protonfetcher.cli.core.GitHubReleaseFetcher", return_value=mock_fetcher
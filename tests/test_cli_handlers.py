@@ -5,6 +5,8 @@ handler functions in protonfetcher.cli.handlers.
 """
 
 import argparse
+import asyncio
+import json
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -12,15 +14,20 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from protonfetcher.cache_store import CACHE_DB_NAME, CacheStore
 from protonfetcher.cli.handlers import (
+    handle_cache_operation,
     handle_check_operation,
     handle_list_operation,
     handle_ls_operation,
+    handle_multi_fork_update,
     handle_prune_operation,
     handle_relink_operation,
     handle_rm_operation,
 )
+from protonfetcher.common import FORKS
 from protonfetcher.github_fetcher import GitHubReleaseFetcher
+from protonfetcher.link_manager import LinkManager
 
 # =============================================================================
 # handle_check_operation Tests
@@ -114,6 +121,41 @@ class TestHandleCheckOperation:
         captured = capsys.readouterr()
         assert "GE-Proton: up-to-date" in captured.out
 
+    def test_check_all_forks_runs_concurrently(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test every managed fork is checked at once and reported in order."""
+        in_flight = 0
+        peak = 0
+
+        async def check(extract_dir: Path, fork: Any) -> str | None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"{fork.value}-new" if fork == next(iter(FORKS)) else None
+
+        fetcher = MagicMock()
+        forgejo_fetcher = MagicMock()
+        for mock in (fetcher, forgejo_fetcher):
+            mock.link_manager.has_managed_links.return_value = True
+            mock.check_for_updates_async = check
+
+        args = argparse.Namespace(fork=None, check=True)
+
+        with pytest.raises(SystemExit) as exc_info:
+            handle_check_operation(fetcher, forgejo_fetcher, args, tmp_path)
+
+        assert exc_info.value.code == 0
+        assert peak == len(FORKS)
+        lines = capsys.readouterr().out.splitlines()
+        first = next(iter(FORKS))
+        assert lines[0] == f"New release available for {first}: {first.value}-new!"
+        assert lines[1:] == [f"{fork}: up-to-date" for fork in list(FORKS)[1:]]
+
 
 # =============================================================================
 # handle_ls_operation Tests
@@ -146,20 +188,8 @@ class TestHandleLsOperation:
 
         mock_fetcher = MagicMock()
         mock_forgejo_fetcher = MagicMock()
-        mock_fetcher.link_manager.list_links.return_value = {
-            "GE-Proton": str(version_dir),
-            "GE-Proton-Fallback": None,
-            "GE-Proton-Fallback2": None,
-        }
-        mock_forgejo_fetcher.link_manager.list_links.return_value = {
-            "Proton-EM": None,
-            "Proton-EM-Fallback": None,
-            "Proton-EM-Fallback2": None,
-        }
-        mock_fetcher.link_manager.get_installed_versions.return_value = []
-        mock_fetcher.link_manager.get_linked_versions.return_value = []
-        mock_forgejo_fetcher.link_manager.get_installed_versions.return_value = []
-        mock_forgejo_fetcher.link_manager.get_linked_versions.return_value = []
+        mock_fetcher.link_manager = LinkManager(fs)
+        (extract_dir / "GE-Proton10-19").mkdir()
 
         args = argparse.Namespace(ls=True, fork=None)
 
@@ -167,6 +197,10 @@ class TestHandleLsOperation:
 
         captured = capsys.readouterr()
         assert "Links for GE-Proton" in captured.out
+        assert f"  GE-Proton -> {version_dir}" in captured.out
+        assert "  GE-Proton-Fallback -> (not found)" in captured.out
+        assert "Prunable GE-Proton versions (1):\n  ○ GE-Proton10-19" in captured.out
+        assert "Links for Proton-EM" not in captured.out
 
     def test_ls_with_fork_filter(
         self,
@@ -190,13 +224,8 @@ class TestHandleLsOperation:
 
         mock_fetcher = MagicMock()
         mock_forgejo_fetcher = MagicMock()
-        mock_fetcher.link_manager.list_links.return_value = {
-            "GE-Proton": str(version_dir),
-            "GE-Proton-Fallback": None,
-            "GE-Proton-Fallback2": None,
-        }
-        mock_fetcher.link_manager.get_installed_versions.return_value = []
-        mock_fetcher.link_manager.get_linked_versions.return_value = []
+        mock_fetcher.link_manager = LinkManager(fs)
+        (extract_dir / "EM-10.0-30").mkdir()
 
         args = argparse.Namespace(ls=True, fork="GE-Proton")
 
@@ -204,6 +233,54 @@ class TestHandleLsOperation:
 
         captured = capsys.readouterr()
         assert "Links for GE-Proton" in captured.out
+        assert "Proton-EM" not in captured.out
+
+    def test_ls_json_output(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test --ls --json prints the snapshot of every fork as JSON."""
+        from protonfetcher.filesystem import FileSystemClient
+
+        extract_dir = tmp_path / "compatibilitytools.d"
+        extract_dir.mkdir()
+        (extract_dir / "GE-Proton10-20").mkdir()
+        (extract_dir / "GE-Proton10-19").mkdir()
+        (extract_dir / "GE-Proton").symlink_to("GE-Proton10-20")
+        (extract_dir / "GE-Proton-Fallback").symlink_to("GE-Proton10-18")
+
+        mock_fetcher = MagicMock()
+        mock_fetcher.link_manager = LinkManager(FileSystemClient())
+        args = argparse.Namespace(ls=True, fork=None, json=True)
+
+        handle_ls_operation(mock_fetcher, MagicMock(), args, extract_dir)
+
+        data = json.loads(capsys.readouterr().out)
+        assert list(data["forks"]) == [fork.value for fork in FORKS]
+        ge = data["forks"]["GE-Proton"]
+        assert ge["links"] == [
+            {
+                "name": "GE-Proton",
+                "path": str(extract_dir / "GE-Proton"),
+                "target": str(extract_dir / "GE-Proton10-20"),
+                "exists": True,
+            },
+            {
+                "name": "GE-Proton-Fallback",
+                "path": str(extract_dir / "GE-Proton-Fallback"),
+                "target": str(extract_dir / "GE-Proton10-18"),
+                "exists": False,
+            },
+            {
+                "name": "GE-Proton-Fallback2",
+                "path": str(extract_dir / "GE-Proton-Fallback2"),
+                "target": None,
+                "exists": False,
+            },
+        ]
+        assert ge["installed"] == ["GE-Proton10-20", "GE-Proton10-19"]
+        assert ge["prunable"] == ["GE-Proton10-19"]
 
 
 # =============================================================================
@@ -484,3 +561,78 @@ class TestHandlePruneOperation:
 
         # Should be called for each fork
         assert mock_fetcher.prune_releases.call_count >= 1
+
+
+# =============================================================================
+# handle_multi_fork_update Tests
+# =============================================================================
+
+
+class TestHandleMultiForkUpdate:
+    """Tests for handle_multi_fork_update()."""
+
+    def test_serial_mode_updates_each_fetcher(self, tmp_path: Path) -> None:
+        """Test the default job count keeps the per-fetcher serial updates."""
+        fetcher, forgejo_fetcher = MagicMock(), MagicMock()
+
+        handle_multi_fork_update(fetcher, forgejo_fetcher, tmp_path, tmp_path, False)
+
+        fetcher.update_all_managed_forks.assert_called_once()
+        forgejo_fetcher.update_all_managed_forks.assert_called_once()
+
+    def test_parallel_mode_shares_one_pool(
+        self, mocker: Any, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --jobs > 1 schedules GitHub and Forgejo forks on one worker pool."""
+        fetcher, forgejo_fetcher = MagicMock(), MagicMock()
+        mock_update = mocker.patch("protonfetcher.cli.handlers.update_managed_forks")
+
+        handle_multi_fork_update(
+            fetcher, forgejo_fetcher, tmp_path, tmp_path, False, jobs=4, stream=True
+        )
+
+        mock_update.assert_called_once_with(
+            [fetcher, forgejo_fetcher], tmp_path, tmp_path, False, 4, True, True
+        )
+        fetcher.update_all_managed_forks.assert_not_called()
+        assert "Done." in capsys.readouterr().out
+
+
+# =============================================================================
+# handle_cache_operation Tests
+# =============================================================================
+
+
+class TestHandleCacheOperation:
+    """Tests for --cache-stats and --cache-clear."""
+
+    def _seed(self, cache_home: Path) -> None:
+        store = CacheStore(cache_home / "protonfetcher" / CACHE_DB_NAME)
+        store.set("asset-size", "owner/repo/GE-Proton10-20/GE-Proton10-20.tar.gz", "1")
+        store.set("release-metadata", "https://api.example/releases", "{}")
+        store.close()
+
+    def test_cache_stats_lists_namespaces(
+        self, isolated_cache_home: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --cache-stats prints per-namespace counts and a total."""
+        self._seed(isolated_cache_home)
+
+        handle_cache_operation(argparse.Namespace(cache_stats=True, cache_clear=False))
+
+        out = capsys.readouterr().out
+        assert "asset-size: 1 entries" in out
+        assert "release-metadata: 1 entries" in out
+        assert "Total: 2 entries (0 expired)" in out
+
+    def test_cache_clear_removes_entries(
+        self, isolated_cache_home: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --cache-clear empties the store."""
+        self._seed(isolated_cache_home)
+
+        handle_cache_operation(argparse.Namespace(cache_stats=False, cache_clear=True))
+
+        assert "Removed 2 cache entries" in capsys.readouterr().out
+        store = CacheStore(isolated_cache_home / "protonfetcher" / CACHE_DB_NAME)
+        assert store.stats().entries == 0
@@ -117,6 +117,11 @@ class TestValidateMutuallyExclusiveArgs:
             ["protonfetcher", "--dry-run", "--list"],
             ["protonfetcher", "--dry-run", "--ls"],
             ["protonfetcher", "--dry-run", "--relink", "--fork", "GE-Proton"],
+            ["protonfetcher", "-f", "--jobs", "0"],
+            ["protonfetcher", "--connections", "0"],
+            ["protonfetcher", "--extract-threads", "0"],
+            ["protonfetcher", "--delete-threads", "0"],
+            ["protonfetcher", "--list", "--json"],
         ],
     )
     def test_check_and_dry_run_conflicts(self, argv: list[str]) -> None:
@@ -6,17 +6,36 @@ Consolidated tests for archive extraction and asset download workflows:
 - System tar fallback
 - Archive info retrieval
 - Asset downloading with progress
+- Decompression backend selection
+- Threaded writer-pool extraction
+- Content-addressed deduplication of extracted releases
 """
 
+import io
+import os
+import shutil
 import tarfile
+import time
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from protonfetcher import tracing
 from protonfetcher.archive_extractor import ArchiveExtractor
 from protonfetcher.asset_downloader import AssetDownloader
+from protonfetcher.common import DEFAULT_USER_AGENT
+from protonfetcher.decompression import PYTHON_BACKEND, select_decompressor
+from protonfetcher.dedup import (
+    MIN_DEDUP_SIZE,
+    STORE_NAME,
+    collect_garbage,
+    deduplicate_release,
+)
 from protonfetcher.exceptions import ExtractionError, NetworkError
+from protonfetcher.filesystem import FileSystemClient
+from protonfetcher.parallel_extract import extract_members
+from protonfetcher.spinner import Spinner
 
 # =============================================================================
 # Archive Extraction Tests
@@ -102,6 +121,41 @@ class TestArchiveExtraction:
                 show_file_details=False,
             )
 
+    @pytest.mark.parametrize("archive_format", ["gz", "xz"])
+    def test_extraction_decompresses_archive_once(
+        self,
+        archive_format: str,
+        mocker: Any,
+        sample_archive_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Extraction opens the archive once, without a member-counting pre-scan."""
+        archive = sample_archive_factory(format=archive_format, tag="GE-Proton10-20")
+        target_dir = tmp_path / "extracted"
+        open_spy = mocker.spy(tarfile, "open")
+
+        extractor = ArchiveExtractor(FileSystemClient())
+        extractor.extract_archive(archive, target_dir, show_progress=False)
+
+        assert open_spy.call_count == 1
+        assert (target_dir / "GE-Proton10-20" / "version").read_text() == (
+            "GE-Proton10-20"
+        )
+
+    def test_extraction_progress_counts_compressed_bytes(
+        self, mocker: Any, sample_archive_factory: Any, tmp_path: Path
+    ) -> None:
+        """Progress is reported against the compressed archive size."""
+        archive = sample_archive_factory(format="xz", tag="proton-EM-10.0-30")
+        progress_spy = mocker.spy(Spinner, "update_progress")
+
+        extractor = ArchiveExtractor(FileSystemClient())
+        extractor.extract_with_tarfile(archive, tmp_path / "extracted", True, False)
+
+        current, total = progress_spy.call_args_list[-1].args[1:3]
+        assert total == archive.stat().st_size
+        assert 0 < current <= total
+
 
 # =============================================================================
 # System Tar Fallback Tests
@@ -163,66 +217,6 @@ class TestSystemTarFallback:
                 )
 
 
-# =============================================================================
-# Archive Info Tests
-# =============================================================================
-
-
-class TestArchiveInfo:
-    """Test archive information retrieval."""
-
-    @pytest.mark.parametrize(
-        "archive_name,members,expected_count,expected_size",
-        [
-            (
-                "test.tar.gz",
-                [{"name": "file.txt", "is_dir": False, "size": 1024}],
-                1,
-                1024,
-            ),
-            ("test.tar.xz", [{"name": "dir", "is_dir": True, "size": 0}], 1, 0),
-            ("empty.tar.gz", [], 0, 0),
-        ],
-    )
-    def test_get_archive_info(
-        self,
-        archive_name: str,
-        members: list[dict],
-        expected_count: int,
-        expected_size: int,
-        mocker: Any,
-        mock_filesystem_client: Any,
-        mock_tarfile_operations: Any,
-    ) -> None:
-        """Test getting info from archives."""
-        extractor = ArchiveExtractor(mock_filesystem_client)
-        archive_path = Path(f"/mock/{archive_name}")
-
-        mock_filesystem_client.exists.return_value = True
-        mock_tarfile_operations(members=members)
-
-        info = extractor.get_archive_info(archive_path)
-
-        assert info["file_count"] == expected_count
-        assert info["total_size"] == expected_size
-
-    def test_get_archive_info_read_error(
-        self,
-        mocker: Any,
-        mock_filesystem_client: Any,
-        mock_tarfile_operations: Any,
-    ) -> None:
-        """Test getting info from corrupted archive raises error."""
-        extractor = ArchiveExtractor(mock_filesystem_client)
-        archive_path = Path("/mock/corrupted.tar.gz")
-
-        mock_filesystem_client.exists.return_value = True
-        mock_tarfile_operations(raise_on_open=tarfile.TarError("corrupted"))
-
-        with pytest.raises(ExtractionError, match="Error reading archive"):
-            extractor.get_archive_info(archive_path)
-
-
 # =============================================================================
 # Asset Download Tests
 # =============================================================================
@@ -301,6 +295,535 @@ class TestAssetDownload:
             assert b"".join(written_data) == b"data"
 
 
+# =============================================================================
+# Streaming Download-and-Extract Tests
+# =============================================================================
+
+
+class _FakeResponse:
+    """Minimal urlopen response serving a byte payload in arbitrary chunks."""
+
+    def __init__(self, payload: bytes, content_length: int | None = None) -> None:
+        self._body = io.BytesIO(payload)
+        length = len(payload) if content_length is None else content_length
+        self.headers = {"Content-Length": str(length)}
+
+    def read(self, size: int = -1) -> bytes:
+        return self._body.read(size)
+
+    def __enter__(self) -> "_FakeResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+class TestStreamingExtraction:
+    """Test extracting archives while they download."""
+
+    @pytest.mark.parametrize("archive_format", ["gz", "xz"])
+    def test_extract_stream_from_non_seekable_source(
+        self,
+        archive_format: str,
+        sample_archive_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """Stream extraction works on a source that only supports read()."""
+        archive = sample_archive_factory(format=archive_format, tag="GE-Proton10-20")
+        target_dir = tmp_path / "extracted"
+
+        extractor = ArchiveExtractor(FileSystemClient())
+        source = _FakeResponse(archive.read_bytes())
+        extractor.extract_stream(source, target_dir, archive.name)  # type: ignore[arg-type]
+
+        assert (target_dir / "GE-Proton10-20" / "version").read_text() == (
+            "GE-Proton10-20"
+        )
+
+    def test_extract_stream_rejects_corrupt_data(
+        self, mock_filesystem_client: Any, tmp_path: Path
+    ) -> None:
+        """Undecodable stream data surfaces as ExtractionError."""
+        extractor = ArchiveExtractor(mock_filesystem_client)
+
+        with pytest.raises(ExtractionError, match="Failed to extract stream"):
+            extractor.extract_stream(
+                io.BytesIO(b"not a tarball"), tmp_path / "out", "broken.tar.gz"
+            )
+
+    def test_open_stream_tees_archive_while_extracting(
+        self,
+        mocker: Any,
+        mock_network_client: Any,
+        sample_archive_factory: Any,
+        tmp_path: Path,
+    ) -> None:
+        """The tee copy is byte-identical to the archive that was extracted."""
+        archive = sample_archive_factory(format="gz", tag="GE-Proton10-20")
+        payload = archive.read_bytes()
+        mocker.patch("urllib.request.urlopen", return_value=_FakeResponse(payload))
+
+        fs = FileSystemClient()
+        downloader = AssetDownloader(mock_network_client, fs)
+        extractor = ArchiveExtractor(fs)
+        tee_path = tmp_path / "downloads" / archive.name
+        tee_path.parent.mkdir()
+        target_dir = tmp_path / "extracted"
+
+        with downloader.open_stream(
+            "https://example.com/GE-Proton10-20.tar.gz",
+            tee_path=tee_path,
+            show_progress=False,
+        ) as stream:
+            extractor.extract_stream(stream, target_dir, archive.name)
+
+        assert tee_path.read_bytes() == payload
+        assert not tee_path.with_name(tee_path.name + ".part").exists()
+        assert (target_dir / "GE-Proton10-20" / "file.txt").exists()
+
+    def test_open_stream_discards_partial_tee_on_truncation(
+        self,
+        mocker: Any,
+        mock_network_client: Any,
+        tmp_path: Path,
+    ) -> None:
+        """A body shorter than Content-Length raises and leaves no archive behind."""
+        mocker.patch(
+            "urllib.request.urlopen",
+            return_value=_FakeResponse(b"partial", content_length=1024),
+        )
+        downloader = AssetDownloader(mock_network_client, FileSystemClient())
+        tee_path = tmp_path / "asset.tar.gz"
+
+        with pytest.raises(NetworkError, match="truncated"):
+            with downloader.open_stream(
+                "https://example.com/asset.tar.gz",
+                tee_path=tee_path,
+                show_progress=False,
+            ) as stream:
+                stream.read(4)
+
+        assert not tee_path.exists()
+        assert not tee_path.with_name(tee_path.name + ".part").exists()
+
+    def test_open_stream_keeps_default_user_agent_with_headers(
+        self, mocker: Any, mock_network_client: Any
+    ) -> None:
+        """Caller headers are sent alongside the default User-Agent."""
+        urlopen = mocker.patch(
+            "urllib.request.urlopen", return_value=_FakeResponse(b"data")
+        )
+        downloader = AssetDownloader(mock_network_client, FileSystemClient())
+
+        with downloader.open_stream(
+            "https://example.com/asset.tar.gz",
+            headers={"Authorization": "token abc"},
+            show_progress=False,
+        ) as stream:
+            stream.read()
+
+        request = urlopen.call_args.args[0]
+        assert request.get_header("Authorization") == "token abc"
+        assert request.get_header("User-agent") == DEFAULT_USER_AGENT
+
+    def test_open_stream_times_transfer_without_consumer_work(
+        self, mocker: Any, mock_network_client: Any
+    ) -> None:
+        """transfer_seconds leaves out the time the consumer spends between reads."""
+        mocker.patch("urllib.request.urlopen", return_value=_FakeResponse(b"data"))
+        downloader = AssetDownloader(mock_network_client, FileSystemClient())
+
+        tracer = tracing.start_tracing()
+        try:
+            with downloader.open_stream(
+                "https://example.com/asset.tar.gz", show_progress=False
+            ) as stream:
+                stream.read(2)
+                time.sleep(0.2)  # e.g. extraction
+        finally:
+            tracing.stop_tracing()
+
+        (span,) = [e for e in tracer.events() if e["name"] == "transfer_stream"]
+        assert span["args"]["bytes"] == 4
+        assert span["args"]["transfer_seconds"] < 0.1
+        assert span["dur"] >= 200_000
+
+    def test_open_stream_wraps_connection_errors(
+        self, mock_network_client: Any, mock_urllib_download: Any
+    ) -> None:
+        """Connection failures are reported as NetworkError."""
+        mock_urllib_download(raise_on_open=Exception("Network failed"))
+        downloader = AssetDownloader(mock_network_client, FileSystemClient())
+
+        with pytest.raises(NetworkError, match="Network failed"):
+            with downloader.open_stream("https://example.com/asset.tar.gz"):
+                pass
+
+
+# =============================================================================
+# Writer Pool Tests
+# =============================================================================
+
+
+def _build_tar(members: list[tuple[str, Any]]) -> bytes:
+    """Build an uncompressed tar from (name, payload-or-TarInfo-kwargs) pairs."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, spec in members:
+            info = tarfile.TarInfo(name)
+            info.mtime = 1_600_000_000
+            if isinstance(spec, bytes):
+                info.size = len(spec)
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(spec))
+            else:
+                for attr, value in spec.items():
+                    setattr(info, attr, value)
+                tar.addfile(info)
+    return buffer.getvalue()
+
+
+def _extract_bytes(data: bytes, target_dir: Path, writers: int) -> None:
+    target_dir.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r|") as tar:
+        extract_members(tar, target_dir, writers)
+
+
+class TestWriterPoolExtraction:
+    """Test the producer/consumer extraction engine."""
+
+    def test_matches_sequential_extraction(self, tmp_path: Path) -> None:
+        """Files, modes, links and directory mtimes come out as with tarfile."""
+        members: list[tuple[str, Any]] = [
+            ("GE-Proton10-20", {"type": tarfile.DIRTYPE, "mode": 0o755}),
+            ("GE-Proton10-20/files/bin", {"type": tarfile.DIRTYPE, "mode": 0o755}),
+        ]
+        members += [
+            (f"GE-Proton10-20/files/bin/tool{i}", bytes([i]) * (i + 1))
+            for i in range(50)
+        ]
+        members += [
+            ("GE-Proton10-20/version", b"GE-Proton10-20"),
+            (
+                "GE-Proton10-20/proton",
+                {"type": tarfile.SYMTYPE, "linkname": "files/bin/tool1"},
+            ),
+            (
+                "GE-Proton10-20/tool-copy",
+                {
+                    "type": tarfile.LNKTYPE,
+                    "linkname": "GE-Proton10-20/files/bin/tool2",
+                },
+            ),
+        ]
+        data = _build_tar(members)
+
+        _extract_bytes(data, tmp_path / "pool", writers=4)
+        _extract_bytes(data, tmp_path / "sequential", writers=1)
+
+        for name, _ in members:
+            pooled = tmp_path / "pool" / name
+            sequential = tmp_path / "sequential" / name
+            assert pooled.lstat().st_mode == sequential.lstat().st_mode, name
+            if pooled.is_symlink():
+                assert pooled.readlink() == sequential.readlink()
+            elif pooled.is_file():
+                assert pooled.read_bytes() == sequential.read_bytes()
+                assert pooled.stat().st_mtime == 1_600_000_000
+        root = tmp_path / "pool" / "GE-Proton10-20"
+        assert root.stat().st_mtime == 1_600_000_000
+        assert (root / "tool-copy").stat().st_nlink == 2
+
+    @pytest.mark.parametrize(
+        "members",
+        [
+            [("../escape", b"x")],
+            [("link", {"type": tarfile.SYMTYPE, "linkname": "../../escape"})],
+            [("dev", {"type": tarfile.CHRTYPE, "devmajor": 1, "devminor": 3})],
+        ],
+    )
+    def test_applies_data_filter(
+        self, members: list[tuple[str, Any]], tmp_path: Path
+    ) -> None:
+        """Members the data filter rejects abort extraction."""
+        with pytest.raises(tarfile.FilterError):
+            _extract_bytes(_build_tar(members), tmp_path / "out", writers=4)
+
+        assert not (tmp_path / "escape").exists()
+
+    def test_does_not_write_through_existing_symlink(self, tmp_path: Path) -> None:
+        """A symlink already at a file's path is replaced, not followed."""
+        target_dir = tmp_path / "out"
+        shared = target_dir / "shared.txt"
+        (target_dir / "GE-Proton10-20").mkdir(parents=True)
+        shared.write_text("keep me")
+        (target_dir / "GE-Proton10-20" / "version").symlink_to(shared)
+
+        _extract_bytes(
+            _build_tar([("GE-Proton10-20/version", b"GE-Proton10-20")]),
+            target_dir,
+            writers=4,
+        )
+
+        version = target_dir / "GE-Proton10-20" / "version"
+        assert not version.is_symlink()
+        assert version.read_text() == "GE-Proton10-20"
+        assert shared.read_text() == "keep me"
+
+    def test_writer_failure_propagates(self, mocker: Any, tmp_path: Path) -> None:
+        """An error in a writer thread is raised on the reading thread."""
+        mocker.patch(
+            "protonfetcher.parallel_extract._write_file",
+            side_effect=OSError("disk full"),
+        )
+
+        with pytest.raises(OSError, match="disk full"):
+            _extract_bytes(
+                _build_tar([(f"file{i}", b"data") for i in range(10)]),
+                tmp_path / "out",
+                writers=2,
+            )
+
+
+# =============================================================================
+# Deduplication Tests
+# =============================================================================
+
+
+def _write_release(root: Path, files: dict[str, bytes]) -> Path:
+    for name, data in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+class TestDeduplication:
+    """Test sharing identical files between installed releases."""
+
+    SHARED = b"s" * MIN_DEDUP_SIZE
+    CHANGED = b"c" * MIN_DEDUP_SIZE
+
+    def _install_two(self, extract_dir: Path) -> tuple[Path, Path]:
+        old = _write_release(
+            extract_dir / "GE-Proton10-1",
+            {"files/lib/wine.so": self.SHARED, "proton": self.CHANGED},
+        )
+        new = _write_release(
+            extract_dir / "GE-Proton10-2",
+            {"files/lib/wine.so": self.SHARED, "proton": b"n" * MIN_DEDUP_SIZE},
+        )
+        return old, new
+
+    def test_links_identical_files_to_installed_release(self, tmp_path: Path) -> None:
+        """Identical files share an inode; changed files stay separate."""
+        old, new = self._install_two(tmp_path)
+
+        stats = deduplicate_release(tmp_path, new)
+
+        old_lib, new_lib = old / "files/lib/wine.so", new / "files/lib/wine.so"
+        assert os.path.samefile(old_lib, new_lib)
+        assert new_lib.read_bytes() == self.SHARED
+        assert not os.path.samefile(old / "proton", new / "proton")
+        assert stats.linked == 1
+        assert stats.bytes_saved == MIN_DEDUP_SIZE
+
+    def test_small_files_and_different_modes_are_kept(self, tmp_path: Path) -> None:
+        """Tiny files and files with other permissions are not merged."""
+        old = _write_release(
+            tmp_path / "GE-Proton10-1", {"tiny": b"x", "tool": self.SHARED}
+        )
+        new = _write_release(
+            tmp_path / "GE-Proton10-2", {"tiny": b"x", "tool": self.SHARED}
+        )
+        (new / "tool").chmod(0o755)
+        (old / "tool").chmod(0o644)
+
+        stats = deduplicate_release(tmp_path, new)
+
+        assert stats.linked == 0
+        assert not os.path.samefile(old / "tiny", new / "tiny")
+        assert (new / "tool").stat().st_mode & 0o777 == 0o755
+
+    def test_reflink_falls_back_to_hardlink(self, tmp_path: Path, mocker: Any) -> None:
+        """Where FICLONE is unsupported, hard links are used instead."""
+        import errno
+
+        old, new = self._install_two(tmp_path)
+        mocker.patch(
+            "fcntl.ioctl", side_effect=OSError(errno.EOPNOTSUPP, "not supported")
+        )
+
+        stats = deduplicate_release(tmp_path, new, mode="reflink")
+
+        assert stats.reflinked == 0
+        assert stats.linked == 1
+        assert os.path.samefile(old / "files/lib/wine.so", new / "files/lib/wine.so")
+        assert not list(new.rglob("*.dedup*"))
+
+    def test_removing_a_sharing_release_keeps_the_other(self, tmp_path: Path) -> None:
+        """Deleting one release leaves shared content intact for the rest."""
+        old, new = self._install_two(tmp_path)
+        deduplicate_release(tmp_path, new)
+
+        shutil.rmtree(old)
+        assert collect_garbage(tmp_path) == 1  # old's private "proton"
+
+        assert (new / "files/lib/wine.so").read_bytes() == self.SHARED
+        shutil.rmtree(new)
+        assert collect_garbage(tmp_path) == 2
+        assert list((tmp_path / STORE_NAME).iterdir()) == []
+
+
+# =============================================================================
+# Decompression Backend Tests
+# =============================================================================
+
+
+requires_xz = pytest.mark.skipif(shutil.which("xz") is None, reason="xz not installed")
+
+
+class TestDecompressionBackends:
+    """Test choosing and running parallel decompressors."""
+
+    @pytest.fixture
+    def fake_tools(self, mocker: Any) -> Any:
+        """Pretend pigz, xz 5.6 and zstd are installed."""
+        mocker.patch(
+            "protonfetcher.decompression._find_tool",
+            side_effect=lambda name: f"/usr/bin/{name}",
+        )
+        return mocker.patch(
+            "protonfetcher.decompression.xz_supports_threaded_decoding",
+            return_value=True,
+        )
+
+    @pytest.mark.parametrize(
+        "format_type,expected",
+        [
+            ("tar.gz", "pigz"),
+            ("tar.xz", "xz"),
+            ("tar.zst", "zstd"),
+            ("other", "python"),
+        ],
+    )
+    def test_auto_prefers_external_tool(
+        self, fake_tools: Any, mocker: Any, format_type: str, expected: str
+    ) -> None:
+        """On a multi-core host auto picks the external tool for each format."""
+        mocker.patch("os.cpu_count", return_value=16)
+
+        backend = select_decompressor(format_type, "auto")
+
+        assert backend.name == expected
+        # Only xz decodes on several threads; gzip and zstd decoding is serial
+        assert backend.threads == (16 if expected == "xz" else 1)
+
+    def test_auto_stays_in_process_on_single_core(
+        self, fake_tools: Any, mocker: Any
+    ) -> None:
+        """A child process only adds overhead when there is one CPU."""
+        mocker.patch("os.cpu_count", return_value=1)
+
+        assert select_decompressor("tar.xz", "auto") is PYTHON_BACKEND
+
+    def test_auto_skips_xz_without_threaded_decoding(
+        self, fake_tools: Any, mocker: Any
+    ) -> None:
+        """xz older than 5.4 decodes on one thread, so auto keeps it in-process."""
+        mocker.patch("os.cpu_count", return_value=16)
+        fake_tools.return_value = False
+
+        assert select_decompressor("tar.xz", "auto") is PYTHON_BACKEND
+        assert select_decompressor("tar.xz", "xz").threads == 1
+
+    def test_missing_tool_falls_back_to_python(self, mocker: Any) -> None:
+        """Requesting a tool that is not installed decompresses in-process."""
+        mocker.patch("protonfetcher.decompression._find_tool", return_value=None)
+
+        assert select_decompressor("tar.gz", "pigz") is PYTHON_BACKEND
+
+    def test_environment_variable_sets_default(
+        self, fake_tools: Any, monkeypatch: Any
+    ) -> None:
+        """PROTONFETCHER_DECOMPRESSOR applies when no preference is passed."""
+        monkeypatch.setenv("PROTONFETCHER_DECOMPRESSOR", "zstd")
+
+        assert select_decompressor("tar.zst").name == "zstd"
+
+    def test_unknown_backend_raises(self) -> None:
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown decompressor"):
+            select_decompressor("tar.gz", "lz4")
+
+    @requires_xz
+    def test_external_xz_extracts_archive(
+        self, sample_archive_factory: Any, tmp_path: Path
+    ) -> None:
+        """Archives decompressed by the xz process extract identically."""
+        archive = sample_archive_factory(format="xz", tag="proton-EM-10.0-30")
+        target_dir = tmp_path / "extracted"
+
+        extractor = ArchiveExtractor(FileSystemClient(), decompressor="xz")
+        extractor.extract_archive(archive, target_dir, show_progress=False)
+
+        assert extractor.last_decompressor is not None
+        assert extractor.last_decompressor.name == "xz"
+        assert (target_dir / "proton-EM-10.0-30" / "version").read_text() == (
+            "proton-EM-10.0-30"
+        )
+
+    @requires_xz
+    def test_external_xz_extracts_stream(
+        self, sample_archive_factory: Any, tmp_path: Path
+    ) -> None:
+        """Streams are piped through the xz process while being read."""
+        archive = sample_archive_factory(format="xz", tag="proton-EM-10.0-30")
+        target_dir = tmp_path / "extracted"
+
+        extractor = ArchiveExtractor(FileSystemClient(), decompressor="xz")
+        source = _FakeResponse(archive.read_bytes())
+        extractor.extract_stream(source, target_dir, archive.name)  # type: ignore[arg-type]
+
+        assert (target_dir / "proton-EM-10.0-30" / "file.txt").exists()
+
+    @requires_xz
+    def test_external_stream_reports_source_errors(
+        self, sample_archive_factory: Any, tmp_path: Path
+    ) -> None:
+        """A failing download is reported instead of the decompressor's EOF error."""
+        archive = sample_archive_factory(format="xz", tag="proton-EM-10.0-30")
+        payload = archive.read_bytes()
+
+        class _BrokenSource:
+            def __init__(self) -> None:
+                self.sent = False
+
+            def read(self, size: int = -1) -> bytes:
+                if self.sent:
+                    raise NetworkError("Download truncated")
+                self.sent = True
+                return payload[: len(payload) // 2]
+
+        extractor = ArchiveExtractor(FileSystemClient(), decompressor="xz")
+        with pytest.raises(ExtractionError, match="Download truncated"):
+            extractor.extract_stream(
+                _BrokenSource(),  # type: ignore[arg-type]
+                tmp_path / "out",
+                archive.name,
+            )
+
+    @requires_xz
+    def test_external_decompressor_failure_raises(self, tmp_path: Path) -> None:
+        """A decompressor exiting non-zero surfaces as ExtractionError."""
+        archive = tmp_path / "broken.tar.xz"
+        archive.write_bytes(b"not an xz stream")
+
+        extractor = ArchiveExtractor(FileSystemClient(), decompressor="xz")
+        with pytest.raises(ExtractionError):
+            extractor.extract_with_tarfile(archive, tmp_path / "out", False, False)
+
+
 # =============================================================================
 # Extraction Edge Cases Tests
 # =============================================================================
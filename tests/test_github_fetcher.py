@@ -150,9 +150,13 @@ class TestFetchAndExtractEdgeCases:
         mocker.patch.object(
             fetcher.release_manager, "_get_cached_asset_size", return_value=None
         )
+        mocker.patch("urllib.request.urlopen", side_effect=OSError("offline"))
+        mock_network_client.download.return_value = subprocess.CompletedProcess(
+            args=[], returncode=22, stdout="", stderr="404 Not Found"
+        )
 
-        # Asset is found but get_remote_asset_size fails (mock doesn't have proper HEAD)
-        with pytest.raises(NetworkError, match="Failed to get remote asset size"):
+        # The size comes from the API response, so the download itself fails
+        with pytest.raises(NetworkError, match="Asset not found: different.tar.gz"):
             fetcher.fetch_and_extract(
                 repo="GloriousEggroll/proton-ge-custom",
                 output_dir=output_dir,
@@ -162,6 +166,9 @@ class TestFetchAndExtractEdgeCases:
                 show_file_details=False,
             )
 
+        # Only the latest-release redirect; no HEAD request for the size
+        assert mock_network_client.head.call_count == 1
+
     def test_fetch_and_extract_curl_not_available_mocked(
         self,
         mocker: Any,
@@ -3,19 +3,44 @@ Integration tests for ProtonFetcher.
 
 Consolidated integration tests for:
 - NetworkClient with mocked subprocess
+- PooledNetworkClient against a local HTTP server
 - Spinner functionality in download/extraction workflows
 """
 
+import asyncio
+import hashlib
 import json
+import os
+import shutil
 import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
 from protonfetcher.archive_extractor import ArchiveExtractor
-from protonfetcher.asset_downloader import AssetDownloader
-from protonfetcher.network import NetworkClient
+from protonfetcher.asset_downloader import AssetDownloader, range_download_paths
+from protonfetcher.checksums import (
+    MANIFEST_NAME,
+    ChecksumManifest,
+    checksum_asset_name,
+    parse_checksum_file,
+)
+from protonfetcher.common import ForkName
+from protonfetcher.exceptions import NetworkError
+from protonfetcher.filesystem import FileSystemClient
+from protonfetcher.network import (
+    AsyncNetworkClient,
+    NetworkClient,
+    PooledNetworkClient,
+    create_network_client,
+    split_response_headers,
+)
+from protonfetcher.platform_adapters import GitHubPlatformAdapter
+from protonfetcher.release_manager import ReleaseManager
 from protonfetcher.spinner import Spinner
 
 # =============================================================================
@@ -242,6 +267,547 @@ class TestNetworkClientIntegration:
         assert data["tag_name"] == "GE-Proton10-20"
 
 
+# =============================================================================
+# PooledNetworkClient Integration Tests
+# =============================================================================
+
+
+class _FakeReleaseHandler(BaseHTTPRequestHandler):
+    """Serves a redirect, a JSON document, a binary asset and a 404."""
+
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    ranged_payload = bytes(range(256)) * 40
+    ranges_served: list[str] = []
+    failing_range_starts: set[int] = set()
+    signatures_issued = 0
+    signatures_used: set[str] = set()
+    checksum_files: dict[str, bytes] = {}
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b"", **headers: str) -> None:
+        type(self).connections.add(id(self.connection))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name.replace("_", "-"), value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _route(self) -> None:
+        if self.path == "/owner/repo/releases/latest":
+            self._send(302, Location="/owner/repo/releases/tag/GE-Proton10-20")
+        elif self.path == "/owner/repo/releases/tag/GE-Proton10-20":
+            self._send(200, b"<html>release</html>")
+        elif self.path == "/api/releases":
+            self._send(200, json.dumps([{"tag_name": "GE-Proton10-20"}]).encode())
+        elif self.path == "/asset.tar.gz":
+            self._send(200, b"x" * 4096)
+        elif self.path == "/api/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304, ETag='"v1"')
+            else:
+                self._send(200, b'{"tag_name": "GE-Proton10-20"}', ETag='"v1"')
+        elif self.path == "/ranged.bin":
+            self._send_ranged(self.ranged_payload)
+        elif self.path == "/signed/ranged.bin":
+            # Like GitHub's hand-off to signed object-storage URLs
+            type(self).signatures_issued += 1
+            self._send(302, Location=f"/object?sig={self.signatures_issued}")
+        elif self.path.startswith("/object?sig="):
+            # Each signature works once, then has expired
+            if self.path in self.signatures_used:
+                self._send(403, b"signature expired")
+            else:
+                type(self).signatures_used.add(self.path)
+                self._send_ranged(self.ranged_payload)
+        elif self.path == "/unranged.bin":
+            self._send(200, self.ranged_payload)
+        elif self.path in self.checksum_files:
+            self._send(200, self.checksum_files[self.path])
+        else:
+            self._send(404, b"not found")
+
+    def _send_ranged(self, payload: bytes) -> None:
+        header = self.headers.get("Range")
+        if not header:
+            self._send(200, payload, ETag='"v1"')
+            return
+        start_s, _, end_s = header.removeprefix("bytes=").partition("-")
+        start, end = int(start_s), min(int(end_s), len(payload) - 1)
+        type(self).ranges_served.append(header)
+        if start in self.failing_range_starts:
+            self._send(500, b"boom")
+            return
+        self._send(
+            206,
+            payload[start : end + 1],
+            ETag='"v1"',
+            Content_Range=f"bytes {start}-{end}/{len(payload)}",
+        )
+
+    do_GET = _route
+    do_HEAD = _route
+
+
+@pytest.fixture
+def fake_release_server() -> Any:
+    """Run a local keep-alive HTTP server for the duration of a test."""
+    _FakeReleaseHandler.connections = set()
+    _FakeReleaseHandler.ranges_served = []
+    _FakeReleaseHandler.failing_range_starts = set()
+    _FakeReleaseHandler.signatures_issued = 0
+    _FakeReleaseHandler.signatures_used = set()
+    _FakeReleaseHandler.checksum_files = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeReleaseHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledNetworkClient:
+    """Test PooledNetworkClient against a real local HTTP server."""
+
+    def test_head_without_redirects_reports_location(
+        self, fake_release_server: str
+    ) -> None:
+        """Test HEAD output mirrors curl -I so tag extraction keeps working."""
+        client = PooledNetworkClient(timeout=5)
+        result = client.head(f"{fake_release_server}/owner/repo/releases/latest")
+
+        assert result.returncode == 0
+        assert "302" in result.stdout.splitlines()[0]
+        assert "Location: /owner/repo/releases/tag/GE-Proton10-20" in result.stdout
+
+    def test_head_follow_redirects_includes_every_block(
+        self, fake_release_server: str
+    ) -> None:
+        """Test HEAD with redirects returns all header blocks, like curl -I -L."""
+        client = PooledNetworkClient(timeout=5)
+        result = client.head(
+            f"{fake_release_server}/owner/repo/releases/latest", follow_redirects=True
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.count("HTTP/1.1") == 2
+        assert "Content-Length: 20" in result.stdout
+
+    def test_get_reuses_connection(self, fake_release_server: str) -> None:
+        """Test consecutive requests to one host share a keep-alive connection."""
+        client = PooledNetworkClient(timeout=5)
+        for _ in range(3):
+            result = client.get(f"{fake_release_server}/api/releases")
+            assert result.returncode == 0
+            assert json.loads(result.stdout)[0]["tag_name"] == "GE-Proton10-20"
+
+        assert len(_FakeReleaseHandler.connections) == 1
+        client.close()
+
+    def test_get_include_headers_supports_conditional_requests(
+        self, fake_release_server: str
+    ) -> None:
+        """Test include_headers exposes validators and 304s come back empty."""
+        client = PooledNetworkClient(timeout=5)
+        url = f"{fake_release_server}/api/etag"
+
+        status, headers, body = split_response_headers(
+            client.get(url, include_headers=True).stdout
+        )
+        assert (status, headers["etag"]) == (200, '"v1"')
+        assert json.loads(body)["tag_name"] == "GE-Proton10-20"
+
+        revalidated = client.get(
+            url, headers={"If-None-Match": '"v1"'}, include_headers=True
+        )
+        assert revalidated.returncode == 0
+        assert split_response_headers(revalidated.stdout)[::2] == (304, "")
+
+    def test_http_error_matches_curl_fail_flag(self, fake_release_server: str) -> None:
+        """Test HTTP errors produce curl's -f exit code and a 404 in stderr."""
+        client = PooledNetworkClient(timeout=5)
+        result = client.get(f"{fake_release_server}/missing")
+
+        assert result.returncode == 22
+        assert "404" in result.stderr
+
+    def test_download_writes_file(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test download streams the body to the output path."""
+        client = PooledNetworkClient(timeout=5)
+        output_path = tmp_path / "asset.tar.gz"
+
+        result = client.download(f"{fake_release_server}/asset.tar.gz", output_path)
+
+        assert result.returncode == 0
+        assert output_path.read_bytes() == b"x" * 4096
+
+    def test_download_failure_removes_partial_file(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a failed download leaves no output file behind."""
+        client = PooledNetworkClient(timeout=5)
+        output_path = tmp_path / "missing.tar.gz"
+
+        result = client.download(f"{fake_release_server}/missing", output_path)
+
+        assert result.returncode == 22
+        assert not output_path.exists()
+
+    def test_connection_refused_returns_curl_error(self) -> None:
+        """Test transport failures map to curl's connect error code."""
+        client = PooledNetworkClient(timeout=5)
+        result = client.get("http://127.0.0.1:1/api")
+
+        assert result.returncode == 7
+        assert result.stderr.startswith("curl: (7)")
+
+    @pytest.mark.parametrize(
+        "backend,expected_type",
+        [("curl", NetworkClient), ("http", PooledNetworkClient)],
+    )
+    def test_create_network_client(self, backend: str, expected_type: type) -> None:
+        """Test the backend factory returns the requested implementation."""
+        assert isinstance(create_network_client(backend), expected_type)
+
+    def test_create_network_client_from_env(self, mocker: Any) -> None:
+        """Test the backend can be selected with an environment variable."""
+        mocker.patch.dict("os.environ", {"PROTONFETCHER_NETWORK_BACKEND": "http"})
+        assert isinstance(create_network_client(), PooledNetworkClient)
+
+    def test_create_network_client_rejects_unknown_backend(self) -> None:
+        """Test an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown network backend"):
+            create_network_client("wget")
+
+
+class TestSplitResponseHeaders:
+    """Test parsing of curl -i style output."""
+
+    def test_skips_redirect_blocks(self) -> None:
+        """Test only the final response's status and headers are returned."""
+        output = (
+            "HTTP/2 302\r\nlocation: /final\r\n\r\n"
+            'HTTP/2 200\r\nETag: "xyz"\r\n\r\n{"ok": true}'
+        )
+
+        assert split_response_headers(output) == (
+            200,
+            {"etag": '"xyz"'},
+            '{"ok": true}',
+        )
+
+    def test_bare_body_passes_through(self) -> None:
+        """Test output without a status line is returned untouched as the body."""
+        assert split_response_headers("[]") == (None, {}, "[]")
+
+
+class TestRangeDownloads:
+    """Test segmented, resumable Range downloads against a local server."""
+
+    def _downloader(self, connections: int = 4) -> AssetDownloader:
+        downloader = AssetDownloader(
+            NetworkClient(), FileSystemClient(), timeout=5, connections=connections
+        )
+        downloader.segment_size = 1024
+        return downloader
+
+    def test_segments_reassemble_into_original_file(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test every segment lands at its offset and the sidecar is removed."""
+        output_path = tmp_path / "ranged.bin"
+
+        self._downloader().download_with_ranges(
+            f"{fake_release_server}/ranged.bin", output_path, show_progress=False
+        )
+
+        assert output_path.read_bytes() == _FakeReleaseHandler.ranged_payload
+        part_path, state_path = range_download_paths(output_path)
+        assert not part_path.exists()
+        assert not state_path.exists()
+        # Probe plus one request per 1 KiB segment
+        assert len(_FakeReleaseHandler.ranges_served) == 1 + 10
+
+    def test_segments_follow_redirect_to_fresh_signed_url(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test segments don't reuse the probe's signed URL once it has expired."""
+        output_path = tmp_path / "ranged.bin"
+
+        self._downloader().download_with_ranges(
+            f"{fake_release_server}/signed/ranged.bin",
+            output_path,
+            show_progress=False,
+        )
+
+        assert output_path.read_bytes() == _FakeReleaseHandler.ranged_payload
+        assert _FakeReleaseHandler.signatures_issued == 1 + 10
+
+    def test_interrupted_download_resumes_missing_segments(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a failed segment keeps state, and the rerun fetches only the rest."""
+        output_path = tmp_path / "ranged.bin"
+        url = f"{fake_release_server}/ranged.bin"
+        _FakeReleaseHandler.failing_range_starts = {5 * 1024}
+
+        with pytest.raises(NetworkError):
+            self._downloader(connections=1).download_with_ranges(
+                url, output_path, show_progress=False
+            )
+
+        part_path, state_path = range_download_paths(output_path)
+        assert part_path.stat().st_size == len(_FakeReleaseHandler.ranged_payload)
+        assert set(json.loads(state_path.read_text())["completed"]) == set(range(5))
+
+        _FakeReleaseHandler.failing_range_starts = set()
+        _FakeReleaseHandler.ranges_served = []
+        self._downloader().download_with_ranges(url, output_path, show_progress=False)
+
+        assert output_path.read_bytes() == _FakeReleaseHandler.ranged_payload
+        fetched = {r for r in _FakeReleaseHandler.ranges_served if r != "bytes=0-0"}
+        assert fetched == {
+            f"bytes={i * 1024}-{min((i + 1) * 1024, 10240) - 1}" for i in range(5, 10)
+        }
+
+    def test_changed_remote_restarts_download(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test stale state for a different validator is discarded."""
+        output_path = tmp_path / "ranged.bin"
+        part_path, state_path = range_download_paths(output_path)
+        part_path.write_bytes(b"\0" * 10240)
+        state_path.write_text(
+            json.dumps(
+                {
+                    "url": f"{fake_release_server}/ranged.bin",
+                    "size": 10240,
+                    "validator": '"old"',
+                    "segment_size": 1024,
+                    "completed": list(range(10)),
+                }
+            )
+        )
+
+        self._downloader().download_with_ranges(
+            f"{fake_release_server}/ranged.bin", output_path, show_progress=False
+        )
+
+        assert output_path.read_bytes() == _FakeReleaseHandler.ranged_payload
+
+    def test_server_without_range_support_falls_back(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a 200 answer to the probe switches to a single stream."""
+        output_path = tmp_path / "unranged.bin"
+
+        self._downloader().download_with_ranges(
+            f"{fake_release_server}/unranged.bin", output_path, show_progress=False
+        )
+
+        assert output_path.read_bytes() == _FakeReleaseHandler.ranged_payload
+        assert not range_download_paths(output_path)[0].exists()
+
+
+class _LocalAdapter(GitHubPlatformAdapter):
+    """Points release discovery at the fake release server."""
+
+    def __init__(self, base_url: str) -> None:
+        self.host_base = base_url
+        self.api_base = base_url
+
+    def build_api_url(self, repo: str, *parts: str) -> str:
+        return f"{self.api_base}/api/{'/'.join(parts)}"
+
+
+class TestAsyncNetworkClient:
+    """Test concurrent release discovery against a local server."""
+
+    @pytest.mark.parametrize("backend", ["curl", "http"])
+    def test_requests_run_on_event_loop(
+        self, fake_release_server: str, backend: str
+    ) -> None:
+        """Test GET and HEAD results match the synchronous client's."""
+        if backend == "curl" and shutil.which("curl") is None:
+            pytest.skip("curl is not installed")
+        client = AsyncNetworkClient(create_network_client(backend), max_concurrency=2)
+
+        async def discover() -> list[Any]:
+            return await asyncio.gather(
+                client.get(f"{fake_release_server}/api/releases"),
+                client.head(f"{fake_release_server}/owner/repo/releases/latest"),
+                client.get(f"{fake_release_server}/missing"),
+            )
+
+        releases, latest, missing = asyncio.run(discover())
+
+        assert json.loads(releases.stdout) == [{"tag_name": "GE-Proton10-20"}]
+        assert "/releases/tag/GE-Proton10-20" in latest.stdout
+        assert missing.returncode == 22
+
+    def test_release_manager_async_discovery(self, fake_release_server: str) -> None:
+        """Test the async ReleaseManager methods parse like the sync ones."""
+        release_manager = ReleaseManager(
+            PooledNetworkClient(),
+            FileSystemClient(),
+            cache_enabled=False,
+            platform_adapter=_LocalAdapter(fake_release_server),
+        )
+
+        async def discover() -> list[Any]:
+            return await asyncio.gather(
+                release_manager.fetch_latest_tag_async("owner/repo"),
+                release_manager.list_recent_releases_async("owner/repo"),
+                release_manager.check_for_newer_release_async(
+                    "owner/repo", ["GE-Proton10-19"], ForkName.GE_PROTON
+                ),
+            )
+
+        latest, releases, newer = asyncio.run(discover())
+
+        assert latest == newer == "GE-Proton10-20"
+        assert releases == ["GE-Proton10-20"]
+        assert release_manager.fetch_latest_tag("owner/repo") == latest
+
+
+class TestChecksumVerification:
+    """Test SHA-512 verification and the offline checksum manifest."""
+
+    digest = hashlib.sha512(_FakeReleaseHandler.ranged_payload).hexdigest()
+
+    def _download(
+        self, base_url: str, tmp_path: Path, connections: int = 1
+    ) -> tuple[Path, MagicMock]:
+        downloader = AssetDownloader(
+            NetworkClient(), FileSystemClient(), timeout=5, connections=connections
+        )
+        downloader.segment_size = 1024
+        release_manager = MagicMock()
+        release_manager.get_remote_asset_size.return_value = len(
+            _FakeReleaseHandler.ranged_payload
+        )
+        out_path = downloader.download_asset(
+            "owner/repo",
+            "GE-Proton10-20",
+            "ranged.bin",
+            tmp_path / "ranged.bin",
+            release_manager,
+            download_url=f"{base_url}/ranged.bin",
+            show_progress=False,
+        )
+        return out_path, release_manager
+
+    def test_parse_checksum_file(self) -> None:
+        """Test sha512sum output is matched by file name."""
+        other = "f" * 128
+        text = f"{other}  other.tar.gz\n{self.digest} *./GE-Proton10-20.tar.gz\n"
+
+        assert (
+            checksum_asset_name("GE-Proton10-20.tar.gz") == "GE-Proton10-20.sha512sum"
+        )
+        assert parse_checksum_file(text, "GE-Proton10-20.tar.gz") == self.digest
+        assert parse_checksum_file(f"{other}\n", "x.tar.gz") == other
+        # A single entry for another asset does not describe this one
+        assert parse_checksum_file(f"{other}  renamed.tar.gz", "x.tar.gz") is None
+        assert parse_checksum_file(text, "missing.tar.gz") is None
+        assert parse_checksum_file("<html>not found</html>", "x.tar.gz") is None
+
+    @pytest.mark.parametrize("connections", [1, 4])
+    def test_download_is_verified_and_recorded(
+        self, fake_release_server: str, tmp_path: Path, connections: int
+    ) -> None:
+        """Test the published checksum is checked and stored in the manifest."""
+        _FakeReleaseHandler.checksum_files = {
+            "/ranged.bin.sha512sum": f"{self.digest}  ranged.bin\n".encode()
+        }
+
+        out_path, _ = self._download(fake_release_server, tmp_path, connections)
+
+        entry = ChecksumManifest(FileSystemClient(), tmp_path).get("ranged.bin")
+        assert entry is not None
+        assert entry.sha512 == self.digest
+        assert entry.verified
+        assert entry.size == out_path.stat().st_size
+
+    def test_checksum_mismatch_removes_download(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a download not matching the published digest is discarded."""
+        _FakeReleaseHandler.checksum_files = {
+            "/ranged.bin.sha512sum": f"{'0' * 128}  ranged.bin\n".encode()
+        }
+
+        with pytest.raises(NetworkError, match="Checksum mismatch"):
+            self._download(fake_release_server, tmp_path)
+
+        assert not (tmp_path / "ranged.bin").exists()
+
+    def test_cached_archive_is_validated_offline(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a recorded archive is reused without asking the server its size."""
+        self._download(fake_release_server, tmp_path)
+        _FakeReleaseHandler.ranges_served = []
+
+        _, release_manager = self._download(fake_release_server, tmp_path)
+
+        release_manager.get_remote_asset_size.assert_not_called()
+
+    def test_touched_archive_is_rehashed(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a changed mtime triggers a local re-hash, not a download."""
+        out_path, _ = self._download(fake_release_server, tmp_path)
+        os.utime(out_path, (1, 1))
+
+        _, release_manager = self._download(fake_release_server, tmp_path)
+
+        release_manager.get_remote_asset_size.assert_not_called()
+        entry = ChecksumManifest(FileSystemClient(), tmp_path).get("ranged.bin")
+        assert entry is not None and entry.mtime == 1
+
+    def test_corrupted_archive_is_downloaded_again(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a cached archive that no longer matches its digest is replaced."""
+        out_path, _ = self._download(fake_release_server, tmp_path)
+        corrupted = bytearray(out_path.read_bytes())
+        corrupted[0] ^= 0xFF
+        out_path.write_bytes(bytes(corrupted))
+
+        self._download(fake_release_server, tmp_path)
+
+        assert out_path.read_bytes() == _FakeReleaseHandler.ranged_payload
+
+    def test_stream_mismatch_keeps_no_archive(
+        self, fake_release_server: str, tmp_path: Path
+    ) -> None:
+        """Test a streamed body failing verification is neither saved nor recorded."""
+        downloader = AssetDownloader(NetworkClient(), FileSystemClient(), timeout=5)
+        tee_path = tmp_path / "unranged.bin"
+
+        with pytest.raises(NetworkError, match="Checksum mismatch"):
+            with downloader.open_stream(
+                f"{fake_release_server}/unranged.bin",
+                tee_path=tee_path,
+                show_progress=False,
+                expected_sha512="0" * 128,
+            ) as stream:
+                while stream.read(4096):
+                    pass
+
+        assert not tee_path.exists()
+        assert not (tmp_path / MANIFEST_NAME).exists()
+
+
 # =============================================================================
 # Spinner Integration Tests
 # =============================================================================
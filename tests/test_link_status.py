@@ -4,14 +4,16 @@ Tests the standalone link status query functions independently of LinkManager.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
-from protonfetcher.common import ForkName
+from protonfetcher.common import FORKS, ForkName
 from protonfetcher.filesystem import FileSystemClient
 from protonfetcher.link_status import (
     build_expected_link_mapping,
     compare_link_targets,
     has_managed_links,
     list_links,
+    snapshot_links,
 )
 from tests.fixtures import SymlinkEnvironment
 
@@ -147,6 +149,63 @@ class TestHasManagedLinks:
         assert result is False
 
 
+class TestSnapshotLinks:
+    """Tests for snapshot_links function."""
+
+    def test_matches_per_fork_queries(
+        self,
+        symlink_environment: SymlinkEnvironment,
+    ) -> None:
+        """The snapshot agrees with list_links for the fork under test."""
+        extract_dir = symlink_environment["extract_dir"]
+        fork = symlink_environment["fork"]
+        fs = FileSystemClient()
+
+        state = snapshot_links(extract_dir, fs).forks[fork]
+
+        expected = list_links(extract_dir, fork, fs)
+        assert {
+            link.name: str(link.resolved_target) if link.resolved_target else None
+            for link in state.links
+        } == expected
+        assert state.has_links is has_managed_links(extract_dir, fork, fs)
+
+    def test_one_listing_and_one_readlink_per_link(self, tmp_path: Path) -> None:
+        """All forks come from one scandir; each present link is read once."""
+        (tmp_path / "GE-Proton10-20").mkdir()
+        (tmp_path / "EM-10.0-30").mkdir()
+        (tmp_path / "GE-Proton").symlink_to(tmp_path / "GE-Proton10-20")
+        (tmp_path / "Proton-EM").symlink_to("EM-10.0-30")
+        (tmp_path / "Proton-EM-Fallback").symlink_to("EM-10.0-29")
+        fs = FileSystemClient()
+
+        with (
+            patch.object(fs, "scandir", wraps=fs.scandir) as scandir,
+            patch.object(fs, "readlink", wraps=fs.readlink) as readlink,
+            patch.object(fs, "resolve") as resolve,
+        ):
+            snapshot = snapshot_links(tmp_path, fs)
+
+        assert scandir.call_count == 1
+        assert readlink.call_count == 3
+        resolve.assert_not_called()
+        assert list(snapshot.forks) == list(FORKS)
+        em = snapshot.forks[ForkName.PROTON_EM]
+        assert [link.exists for link in em.links] == [True, False, False]
+        assert em.links[0].target == tmp_path / "EM-10.0-30"
+        assert em.prunable == ()
+
+    def test_missing_extract_dir(self, tmp_path: Path) -> None:
+        """A missing directory yields empty states instead of an error."""
+        snapshot = snapshot_links(
+            tmp_path / "missing", FileSystemClient(), [ForkName.GE_PROTON]
+        )
+
+        state = snapshot.forks[ForkName.GE_PROTON]
+        assert not state.has_links
+        assert state.installed == ()
+
+
 class TestBuildExpectedLinkMapping:
     """Tests for build_expected_link_mapping function."""
 
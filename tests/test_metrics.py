@@ -0,0 +1,315 @@
+"""Tests for protonfetcher.metrics module."""
+
+import os
+import shutil
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from protonfetcher import metrics, tracing
+from protonfetcher.cli.core import main
+from protonfetcher.common import ForkName
+from protonfetcher.network import NetworkClient
+
+
+class FakeClock:
+    """Nanosecond clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * 1e9)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def tracer(clock: FakeClock) -> Iterator[tracing.Tracer]:
+    """An active tracer on a fake clock, stopped again after the test."""
+    yield tracing.start_tracing(tracing.Tracer(clock))
+    tracing.stop_tracing()
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+class TestRender:
+    """Tests for the text exposition format."""
+
+    def test_renders_headers_labels_and_values(self) -> None:
+        """Every family gets HELP/TYPE lines; label values are escaped."""
+        family = metrics.MetricFamily("download_bytes", "Bytes downloaded")
+        family.add(1024, host="github.com")
+        family.add(1024, host="github.com")
+        family.set(0.5, host='odd"host\\')
+        bare = metrics.MetricFamily("last_run_success", "1 if it worked")
+        bare.set(1)
+
+        text = metrics.render([family, bare])
+
+        assert text.splitlines() == [
+            "# HELP protonfetcher_download_bytes Bytes downloaded",
+            "# TYPE protonfetcher_download_bytes gauge",
+            'protonfetcher_download_bytes{host="github.com"} 2048',
+            'protonfetcher_download_bytes{host="odd\\"host\\\\"} 0.5',
+            "# HELP protonfetcher_last_run_success 1 if it worked",
+            "# TYPE protonfetcher_last_run_success gauge",
+            "protonfetcher_last_run_success 1",
+        ]
+
+    @pytest.mark.parametrize(
+        "url,endpoint",
+        [
+            ("https://api.github.com/repos/o/r/releases/latest", "api_latest"),
+            ("https://api.github.com/repos/o/r/releases/tags/v1", "api_release"),
+            ("https://api.github.com/repos/o/r/releases?per_page=100", "api_releases"),
+            ("https://dawn.wine/api/v1/repos/o/r/releases/latest", "api_latest"),
+            ("https://github.com/o/r/releases/latest", "latest_redirect"),
+            ("https://github.com/o/r/releases/tag/v1", "release_page"),
+            ("https://github.com/o/r/releases/download/v1/a.tar.gz", "asset"),
+            ("https://github.com/o/r/releases/download/v1/a.sha512sum", "checksum"),
+            ("https://objects.githubusercontent.com/abc?sig=1", "other"),
+        ],
+    )
+    def test_classifies_endpoints(self, url: str, endpoint: str) -> None:
+        assert metrics.classify_endpoint(url) == endpoint
+
+
+class TestCollect:
+    """Tests for turning a recorded run into metrics."""
+
+    def test_derives_metrics_from_spans(
+        self, tracer: tracing.Tracer, clock: FakeClock, tmp_path: Path
+    ) -> None:
+        """Transfers, extraction, requests and cache lookups become samples."""
+        url = "https://github.com/o/r/releases/download/v1/a.tar.gz"
+        with tracing.span("fetch_and_extract", fork="GE-Proton"):
+            with tracing.request_span("HEAD", "https://github.com/o/r/releases/latest"):
+                tracing.annotate(returncode=22)
+            tracing.count(size_cache_hits=1, size_cache_misses=2)
+            with tracing.span("transfer", "download", host="github.com"):
+                with tracing.request_span("GET", url) as request:
+                    request.set(status=200)
+                tracing.count(bytes=4_000_000)
+                clock.advance(2)
+            with tracing.span("extract"):
+                tracing.annotate(extracted_bytes=9_000_000)
+                clock.advance(3)
+
+        text = metrics.render(metrics.collect(tracer, tmp_path, True, now=1e9))
+        samples = _samples(text)
+
+        assert samples['protonfetcher_download_bytes{host="github.com"}'] == 4e6
+        assert (
+            samples[
+                'protonfetcher_download_throughput_bytes_per_second{host="github.com"}'
+            ]
+            == 2e6
+        )
+        assert samples['protonfetcher_extract_seconds{fork="GE-Proton"}'] == 3
+        assert (
+            samples[
+                'protonfetcher_extract_throughput_bytes_per_second{fork="GE-Proton"}'
+            ]
+            == 3e6
+        )
+        assert (
+            samples[
+                'protonfetcher_http_requests{endpoint="latest_redirect",'
+                'host="github.com",status="curl_22"}'
+            ]
+            == 1
+        )
+        assert (
+            samples[
+                'protonfetcher_http_requests{endpoint="asset",'
+                'host="github.com",status="200"}'
+            ]
+            == 1
+        )
+        assert (
+            samples['protonfetcher_cache_lookups{cache="size_cache",result="miss"}']
+            == 2
+        )
+        assert samples['protonfetcher_fetch_success{fork="GE-Proton"}'] == 1
+        assert samples["protonfetcher_last_run_success"] == 1
+        assert samples["protonfetcher_last_run_timestamp_seconds"] == 1e9
+        assert samples["protonfetcher_last_run_duration_seconds"] == 5
+
+    def test_streamed_transfer_excludes_extraction_time(
+        self, tracer: tracing.Tracer, clock: FakeClock, tmp_path: Path
+    ) -> None:
+        """A --stream transfer is timed by its reads, not by the whole span."""
+        with tracing.span("transfer_stream", "download", host="github.com"):
+            tracing.count(bytes=4_000_000)
+            tracing.annotate(transfer_seconds=1.0)
+            clock.advance(5)  # extraction between reads
+
+        samples = _samples(
+            metrics.render(metrics.collect(tracer, tmp_path, True, now=1e9))
+        )
+
+        assert samples['protonfetcher_download_seconds{host="github.com"}'] == 1
+        assert (
+            samples[
+                'protonfetcher_download_throughput_bytes_per_second{host="github.com"}'
+            ]
+            == 4e6
+        )
+
+    def test_reports_installed_releases_and_disk_usage(
+        self, tracer: tracing.Tracer, tmp_path: Path
+    ) -> None:
+        """Releases are listed per fork; hard-linked files count once."""
+        release = tmp_path / "GE-Proton10-20"
+        release.mkdir()
+        (release / "proton").write_bytes(b"x" * 100_000)
+        os.link(release / "proton", release / "proton.copy")
+        (tmp_path / "proton-EM-10.0-30").mkdir()
+        (tmp_path / "GE-Proton").symlink_to("GE-Proton10-20")
+
+        samples = _samples(
+            metrics.render(metrics.collect(tracer, tmp_path, succeeded=False))
+        )
+
+        assert samples['protonfetcher_installed_versions{fork="GE-Proton"}'] == 1
+        assert samples['protonfetcher_installed_versions{fork="Proton-EM"}'] == 1
+        assert samples['protonfetcher_installed_versions{fork="CachyOS"}'] == 0
+        assert (
+            samples[
+                'protonfetcher_installed_release_info{fork="GE-Proton",'
+                'release="GE-Proton10-20"}'
+            ]
+            == 1
+        )
+        usage = samples['protonfetcher_disk_usage_bytes{fork="GE-Proton"}']
+        file_blocks = (release / "proton").stat().st_blocks * 512
+        assert file_blocks <= usage < 2 * file_blocks
+        assert samples["protonfetcher_last_run_success"] == 0
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    """Answers HEAD with 200 and GET with 429, like an exhausted API quota."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        self.send_response(429)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class TestRequestStatus:
+    """Tests for the status label of HTTP requests."""
+
+    @pytest.mark.skipif(shutil.which("curl") is None, reason="curl not installed")
+    def test_curl_requests_report_http_status(
+        self, tracer: tracing.Tracer, tmp_path: Path
+    ) -> None:
+        """curl requests carry their HTTP status; only transport errors are curl_N."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _RateLimitedHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host = f"127.0.0.1:{server.server_address[1]}"
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed = f"127.0.0.1:{sock.getsockname()[1]}"
+        client = NetworkClient(timeout=5)
+        try:
+            client.get(f"http://{host}/repos/o/r/releases/latest")
+            client.head(f"http://{host}/o/r/releases/latest")
+            client.get(f"http://{closed}/repos/o/r/releases/latest")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        samples = _samples(metrics.render(metrics.collect(tracer, tmp_path, True)))
+
+        requests = {
+            key: value
+            for key, value in samples.items()
+            if key.startswith("protonfetcher_http_requests")
+        }
+        assert requests == {
+            f'protonfetcher_http_requests{{endpoint="api_latest",host="{host}",'
+            'status="429"}': 1,
+            f'protonfetcher_http_requests{{endpoint="latest_redirect",host="{host}",'
+            'status="200"}': 1,
+            f'protonfetcher_http_requests{{endpoint="api_latest",host="{closed}",'
+            'status="curl_7"}': 1,
+        }
+
+
+class TestExport:
+    """Tests for writing the metrics file."""
+
+    def test_writes_file_when_block_fails(self, tmp_path: Path) -> None:
+        """A failed run is exported as such, without temporary files left over."""
+        path = tmp_path / "textfile" / "protonfetcher.prom"
+
+        with pytest.raises(SystemExit):
+            with (
+                tracing.record(None, force=True) as tracer,
+                metrics.export(path, tracer, tmp_path),
+            ):
+                raise SystemExit(1)
+
+        samples = _samples(path.read_text())
+        assert samples["protonfetcher_last_run_success"] == 0
+        assert os.listdir(path.parent) == ["protonfetcher.prom"]
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def test_no_path_writes_nothing(self, tmp_path: Path) -> None:
+        with metrics.export(None, None, tmp_path):
+            pass
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cli_metrics_file_flag(
+        self, tmp_path: Path, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--metrics-file PATH writes the run's metrics to PATH."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        extract_dir = tmp_path / "compatibilitytools.d"
+        (extract_dir / "GE-Proton10-20").mkdir(parents=True)
+        metrics_path = tmp_path / "protonfetcher.prom"
+        mocker.patch(
+            "sys.argv",
+            [
+                "protonfetcher",
+                "--ls",
+                "-f",
+                ForkName.GE_PROTON.value,
+                "-x",
+                str(extract_dir),
+                "--metrics-file",
+                str(metrics_path),
+            ],
+        )
+
+        main()
+
+        samples = _samples(metrics_path.read_text())
+        assert samples["protonfetcher_last_run_success"] == 1
+        assert samples['protonfetcher_installed_versions{fork="GE-Proton"}'] == 1
+        assert tracing.get_tracer() is None
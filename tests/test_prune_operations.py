@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from protonfetcher.common import ForkName
+from protonfetcher.dedup import MIN_DEDUP_SIZE, STORE_NAME, deduplicate_release
 from protonfetcher.filesystem import FileSystemClient
 from protonfetcher.prune_operations import (
     compute_prune_plan,
@@ -301,6 +302,27 @@ class TestExecutePruneRemovals:
 
         # No error, nothing to do
 
+    def test_keeps_content_shared_with_remaining_versions(self, tmp_path: Path) -> None:
+        """Pruning a deduplicated release keeps the files kept releases share."""
+        extract_dir = tmp_path / "compatibilitytools.d"
+        extract_dir.mkdir()
+        shared = b"s" * MIN_DEDUP_SIZE
+        for i in (1, 2):
+            v = extract_dir / f"GE-Proton10-{i}"
+            v.mkdir()
+            (v / "lib.so").write_bytes(shared)
+            (v / "only").write_bytes(bytes([i]) * MIN_DEDUP_SIZE)
+        deduplicate_release(extract_dir, extract_dir / "GE-Proton10-2")
+
+        execute_prune_removals(
+            extract_dir, ForkName.GE_PROTON, ["GE-Proton10-1"], FileSystemClient()
+        )
+
+        assert (extract_dir / "GE-Proton10-2" / "lib.so").read_bytes() == shared
+        # The pruned release's private file left the store as well
+        objects = list((extract_dir / STORE_NAME).rglob("*-*"))
+        assert len(objects) == 2
+
 
 class TestPruneReleases:
     """Tests for prune_releases function."""
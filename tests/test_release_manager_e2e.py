@@ -7,6 +7,8 @@ Tests the complete release discovery workflow:
 - HTML parsing fallback
 - Listing recent releases
 - Asset size caching
+- Release metadata caching with conditional requests
+- Single-file cache store (TTL, LRU eviction, stats)
 """
 
 import json
@@ -16,6 +18,7 @@ from typing import Any
 
 import pytest
 
+from protonfetcher.cache_store import CacheStore
 from protonfetcher.common import ForkName
 from protonfetcher.exceptions import NetworkError
 from protonfetcher.filesystem import FileSystemClient
@@ -572,26 +575,19 @@ class TestAssetSizeCaching:
         os.environ["XDG_CACHE_HOME"] = str(tmp_path)
 
         try:
-            # Create expired cache
+            # Create expired cache: an entry written 2 hours ago with a 1 hour TTL
             release_manager = ReleaseManager(mock_network_client, fs)
-            cache_path = release_manager._get_cache_path(
+
+            import time
+
+            release_manager.cache_store.clock = lambda: time.time() - 7200
+            release_manager._cache_asset_size(
                 "GloriousEggroll/proton-ge-custom",
                 "GE-Proton10-20",
                 "GE-Proton10-20.tar.gz",
+                1048576,
             )
-
-            import json
-            import time
-
-            expired_data = {
-                "size": 1048576,
-                "timestamp": time.time() - 7200,  # 2 hours ago (expired)
-            }
-            cache_path.write_text(json.dumps(expired_data))
-
-            # Set file mtime to 2 hours ago to trigger cache expiration
-            old_time = time.time() - 7200
-            os.utime(cache_path, (old_time, old_time))
+            release_manager.cache_store.clock = time.time
 
             # Mock fresh network response
             mock_head_response = subprocess.CompletedProcess(
@@ -682,6 +678,291 @@ class TestAssetSizeCaching:
             )
 
 
+class TestCacheStore:
+    """Test the single-file SQLite cache store."""
+
+    def test_round_trip_and_lazy_open(self, tmp_path: Path) -> None:
+        """Test the database file only appears on first use."""
+        store = CacheStore(tmp_path / "cache.sqlite3")
+        assert not store.path.exists()
+
+        store.set("ns", "key", "value")
+
+        assert store.path.exists()
+        assert store.get("ns", "key") == "value"
+        assert store.get("other", "key") is None
+
+    def test_expired_entries_are_misses(self, tmp_path: Path) -> None:
+        """Test an entry past its TTL is not returned."""
+        now = [1000.0]
+        store = CacheStore(tmp_path / "cache.sqlite3", clock=lambda: now[0])
+        store.set("ns", "key", "value", ttl=60)
+
+        now[0] += 59
+        assert store.get("ns", "key") == "value"
+        now[0] += 2
+        assert store.get("ns", "key") is None
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path: Path) -> None:
+        """Test the least recently accessed entries go first when over budget."""
+        now = [0.0]
+
+        def tick() -> float:
+            now[0] += 1
+            return now[0]
+
+        store = CacheStore(tmp_path / "cache.sqlite3", max_bytes=30, clock=tick)
+        store.set("ns", "a", "x" * 10)
+        store.set("ns", "b", "x" * 10)
+        store.set("ns", "c", "x" * 10)
+        store.get("ns", "a")  # a is now more recent than b
+
+        store.set("ns", "d", "x" * 10)
+
+        assert store.get("ns", "b") is None
+        assert store.get("ns", "a") is not None
+        assert store.get("ns", "d") is not None
+        assert store.stats().total_bytes <= 30
+
+    def test_stats_and_clear(self, tmp_path: Path) -> None:
+        """Test per-namespace stats and that clear empties the store."""
+        store = CacheStore(tmp_path / "cache.sqlite3")
+        store.set("asset-size", "a", "123")
+        store.set("asset-size", "b", "456")
+        store.set("release-metadata", "u", "{}")
+
+        stats = store.stats()
+        assert stats.entries == 3
+        assert stats.namespaces == {"asset-size": (2, 6), "release-metadata": (1, 2)}
+
+        assert store.clear() == 3
+        assert store.stats().entries == 0
+
+    def test_corrupt_database_is_recreated(self, tmp_path: Path) -> None:
+        """Test a garbage file is replaced instead of breaking lookups."""
+        path = tmp_path / "cache.sqlite3"
+        path.write_bytes(b"this is not a database" * 100)
+        store = CacheStore(path)
+
+        assert store.get("ns", "key") is None
+        store.set("ns", "key", "value")
+        assert store.get("ns", "key") == "value"
+
+    def test_legacy_json_files_are_removed(self, tmp_path: Path) -> None:
+        """Test per-asset md5 files from older versions are swept on creation."""
+        legacy = tmp_path / "0123456789abcdef0123456789abcdef"
+        legacy_meta = tmp_path / "meta-0123456789abcdef0123456789abcdef.json"
+        unrelated = tmp_path / "notes.txt"
+        for path in (legacy, legacy_meta, unrelated):
+            path.write_text("{}")
+
+        CacheStore(tmp_path / "cache.sqlite3").get("ns", "key")
+
+        assert not legacy.exists()
+        assert not legacy_meta.exists()
+        assert unrelated.exists()
+
+
+class TestReleaseMetadataCache:
+    """Test conditional revalidation of cached release JSON."""
+
+    @staticmethod
+    def _response(status_line: str, body: str = "", **headers: str) -> Any:
+        header_lines = "".join(
+            f"{name.replace('_', '-')}: {value}\r\n" for name, value in headers.items()
+        )
+        return subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout=f"{status_line}\r\n{header_lines}\r\n{body}",
+            stderr="",
+        )
+
+    def test_not_modified_is_served_from_cache(
+        self,
+        mock_network_client: Any,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a 304 answer reuses the cached body and the ETag is sent back."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        release_manager = ReleaseManager(mock_network_client, FileSystemClient())
+        releases = json.dumps([{"tag_name": "GE-Proton10-20"}])
+        mock_network_client.get.side_effect = [
+            self._response("HTTP/2 200", releases, ETag='"abc"'),
+            self._response("HTTP/2 304", ETag='"abc"'),
+        ]
+
+        first = release_manager.list_recent_releases("owner/repo")
+        second = release_manager.list_recent_releases("owner/repo")
+
+        assert first == second == ["GE-Proton10-20"]
+        first_call, second_call = mock_network_client.get.call_args_list
+        assert first_call.kwargs["include_headers"] is True
+        assert second_call.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_forgejo_api_revalidates_with_last_modified(
+        self,
+        mock_network_client: Any,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the Forgejo adapter gets the same caching via Last-Modified."""
+        from protonfetcher.platform_adapters import forgejo_adapter
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        release = json.dumps({"assets": [{"name": "dwproton-10.0-26-x86_64.tar.xz"}]})
+        modified = "Wed, 01 Oct 2025 10:00:00 GMT"
+        mock_network_client.get.side_effect = [
+            self._response("HTTP/1.1 200 OK", release, Last_Modified=modified),
+            self._response("HTTP/1.1 304 Not Modified"),
+        ]
+
+        # One manager per run; within a run the resolved release is reused
+        for _ in range(2):
+            release_manager = ReleaseManager(
+                mock_network_client,
+                FileSystemClient(),
+                platform_adapter=forgejo_adapter,
+            )
+            asset = release_manager.find_asset_by_name(
+                "dawn-winery/dwproton", "dwproton-10.0-26", ForkName.DW_PROTON
+            )
+            assert asset == "dwproton-10.0-26-x86_64.tar.xz"
+
+        second_headers = mock_network_client.get.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-Modified-Since"] == modified
+
+    def test_changed_release_replaces_cache(
+        self,
+        mock_network_client: Any,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a fresh 200 after revalidation overwrites the cached body."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        release_manager = ReleaseManager(mock_network_client, FileSystemClient())
+        old = json.dumps([{"tag_name": "GE-Proton10-20"}])
+        new = json.dumps([{"tag_name": "GE-Proton10-21"}])
+        mock_network_client.get.side_effect = [
+            self._response("HTTP/2 200", old, ETag='"v1"'),
+            self._response("HTTP/2 200", new, ETag='"v2"'),
+            self._response("HTTP/2 304"),
+        ]
+
+        release_manager.list_recent_releases("owner/repo")
+        release_manager.list_recent_releases("owner/repo")
+        latest = release_manager.list_recent_releases("owner/repo")
+
+        assert latest == ["GE-Proton10-21"]
+        third_headers = mock_network_client.get.call_args_list[2].kwargs["headers"]
+        assert third_headers["If-None-Match"] == '"v2"'
+
+    def test_cache_disabled_skips_conditional_requests(
+        self, mock_network_client: Any, mock_filesystem_client: Any
+    ) -> None:
+        """Test cache_enabled=False issues a plain GET."""
+        release_manager = ReleaseManager(
+            mock_network_client, mock_filesystem_client, cache_enabled=False
+        )
+        mock_network_client.get.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="[]", stderr=""
+        )
+
+        release_manager.list_recent_releases("owner/repo")
+
+        assert "include_headers" not in mock_network_client.get.call_args.kwargs
+
+
+class TestResolveRelease:
+    """Test resolving tag, asset, size and URL from one releases API call."""
+
+    latest = {
+        "tag_name": "GE-Proton10-20",
+        "assets": [
+            {
+                "name": "GE-Proton10-20.sha512sum",
+                "size": 160,
+                "browser_download_url": "https://example.invalid/GE-Proton10-20.sha512sum",
+            },
+            {
+                "name": "GE-Proton10-20.tar.gz",
+                "size": 471859200,
+                "browser_download_url": "https://example.invalid/GE-Proton10-20.tar.gz",
+            },
+        ],
+    }
+
+    def _release_manager(self, mock_network_client: Any) -> ReleaseManager:
+        mock_network_client.get.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=json.dumps(self.latest), stderr=""
+        )
+        return ReleaseManager(
+            mock_network_client, FileSystemClient(), cache_enabled=False
+        )
+
+    def test_latest_release_resolved_from_one_request(
+        self, mock_network_client: Any
+    ) -> None:
+        """Test the latest release document answers every later lookup."""
+        release_manager = self._release_manager(mock_network_client)
+        repo = "GloriousEggroll/proton-ge-custom"
+
+        asset = release_manager.resolve_release(repo, ForkName.GE_PROTON)
+
+        assert asset.tag == "GE-Proton10-20"
+        assert asset.name == "GE-Proton10-20.tar.gz"
+        assert asset.size == 471859200
+        assert asset.download_url == "https://example.invalid/GE-Proton10-20.tar.gz"
+        assert mock_network_client.get.call_args.args[0] == (
+            f"https://api.github.com/repos/{repo}/releases/latest"
+        )
+        assert (
+            release_manager.find_asset_by_name(repo, asset.tag, ForkName.GE_PROTON)
+            == asset.name
+        )
+        assert (
+            release_manager.get_remote_asset_size(repo, asset.tag, asset.name)
+            == asset.size
+        )
+        assert mock_network_client.get.call_count == 1
+        mock_network_client.head.assert_not_called()
+
+    def test_release_without_tag_name_is_rejected(
+        self, mock_network_client: Any
+    ) -> None:
+        """Test a latest-release document must name its tag."""
+        release_manager = self._release_manager(mock_network_client)
+        mock_network_client.get.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=json.dumps({"assets": []}), stderr=""
+        )
+
+        with pytest.raises(NetworkError, match="No tag name"):
+            release_manager.resolve_release("owner/repo", ForkName.GE_PROTON)
+
+    def test_fetcher_falls_back_to_latest_redirect(
+        self, mock_network_client: Any, mock_filesystem_client: Any, mocker: Any
+    ) -> None:
+        """Test the latest-release redirect is used when the API fails."""
+        from protonfetcher.github_fetcher import GitHubReleaseFetcher
+
+        fetcher = GitHubReleaseFetcher(
+            network_client=mock_network_client,
+            file_system_client=mock_filesystem_client,
+        )
+        mocker.patch.object(
+            fetcher.release_manager,
+            "resolve_release",
+            side_effect=NetworkError("API request failed with return code 22"),
+        )
+        fetch_latest_tag = mocker.patch.object(
+            fetcher, "fetch_latest_tag", return_value="GE-Proton10-19"
+        )
+
+        assert fetcher._determine_release_tag("owner/repo") == "GE-Proton10-19"
+        fetch_latest_tag.assert_called_once_with("owner/repo")
+
+
 class TestAssetNameExtension:
     """Test asset extension handling based on fork."""
 
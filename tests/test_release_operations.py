@@ -3,11 +3,20 @@
 Tests the standalone release removal functions independently of LinkManager.
 """
 
+import os
+import shutil
+import subprocess
+import sys
+import time
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from protonfetcher.common import ForkName
+from protonfetcher.dedup import MIN_DEDUP_SIZE, STORE_NAME, deduplicate_release
+from protonfetcher.exceptions import LinkManagementError
 from protonfetcher.filesystem import FileSystemClient
 from protonfetcher.release_operations import (
     _check_release_exists,
@@ -18,6 +27,7 @@ from protonfetcher.release_operations import (
     cleanup_stale_symlinks,
     remove_release,
 )
+from protonfetcher.removal import TRASH_PREFIX, TreeRemover, delete_trees
 from tests.fixtures import SymlinkEnvironment
 
 
@@ -206,15 +216,14 @@ class TestRemoveReleaseDirectory:
         """Test that removal failure raises LinkManagementError."""
         release_path = tmp_path / "GE-Proton10-20"
         release_path.mkdir()
+        fs = FileSystemClient()
 
-        # Make directory read-only to force failure
-        release_path.chmod(0o000)
-
-        try:
+        # The directory is moved aside first, so make that step fail
+        with patch.object(fs, "rename", side_effect=PermissionError("denied")):
             with pytest.raises(Exception, match="Failed to remove"):
-                _remove_release_directory(release_path, FileSystemClient())
-        finally:
-            release_path.chmod(0o755)
+                _remove_release_directory(release_path, fs)
+
+        assert release_path.is_dir()
 
 
 class TestRemoveSymbolicLinks:
@@ -359,3 +368,186 @@ class TestCleanupStaleSymlinks:
 
         # Symlink should still point to v1
         assert main_link.resolve() == v1
+
+
+def _make_tree(root: Path, width: int = 3, depth: int = 3) -> int:
+    """Create a nested directory tree and return the number of files in it."""
+    root.mkdir()
+    count = 0
+    for i in range(width):
+        (root / f"file{i}").write_text("x")
+        count += 1
+        if depth > 1:
+            count += _make_tree(root / f"dir{i}", width, depth - 1)
+    return count
+
+
+class TestTreeRemover:
+    """Tests for trash-and-delete removal of release directories."""
+
+    def test_discard_renames_then_finish_deletes(self, tmp_path: Path) -> None:
+        """The directory disappears on discard and its trash on finish."""
+        release = tmp_path / "GE-Proton10-20"
+        _make_tree(release)
+
+        remover = TreeRemover(FileSystemClient())
+        trash = remover.discard(release)
+
+        assert not release.exists()
+        assert trash.parent == tmp_path
+        assert trash.name.startswith(TRASH_PREFIX)
+        assert trash.is_dir()
+
+        remover.finish()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("workers", [1, 2, 8])
+    def test_delete_trees_removes_nested_trees(
+        self, tmp_path: Path, workers: int
+    ) -> None:
+        """Nested trees are deleted whatever the worker count."""
+        trees = [tmp_path / "a", tmp_path / "b"]
+        for tree in trees:
+            _make_tree(tree, width=4, depth=4)
+
+        assert delete_trees(trees, FileSystemClient(), workers) == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sweeps_leftover_trash(self, tmp_path: Path) -> None:
+        """Trash from an interrupted run is deleted with the next removal."""
+        leftover = tmp_path / f"{TRASH_PREFIX}GE-Proton10-1.123.0"
+        _make_tree(leftover)
+        release = tmp_path / "GE-Proton10-20"
+        release.mkdir()
+
+        with TreeRemover(FileSystemClient()) as remover:
+            remover.discard(release)
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_trash_deleted_by_another_process_is_not_a_failure(
+        self, tmp_path: Path, workers: int
+    ) -> None:
+        """Swept trash that an earlier background deleter removes first is gone."""
+        leftover = tmp_path / f"{TRASH_PREFIX}GE-Proton10-1.123.0"
+        _make_tree(leftover)
+        release = tmp_path / "GE-Proton10-20"
+        _make_tree(release)
+        remover = TreeRemover(FileSystemClient(), workers=workers)
+        remover.discard(release)
+
+        shutil.rmtree(leftover)
+        remover.finish()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_delete_trees_tolerates_concurrent_deletion(self, tmp_path: Path) -> None:
+        """Subtrees and files that vanish mid-deletion count as deleted."""
+
+        class RacingFileSystem(FileSystemClient):
+            """Another deleter removes every entry just before this one does."""
+
+            def rmtree(self, path: Path) -> None:
+                shutil.rmtree(path, ignore_errors=True)
+                super().rmtree(path)
+
+            def unlink(self, path: Path) -> None:
+                path.unlink(missing_ok=True)
+                super().unlink(path)
+
+        tree = tmp_path / "tree"
+        _make_tree(tree, width=4, depth=4)
+
+        assert delete_trees([tree], RacingFileSystem(), workers=4) == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_finish_raises_on_failure(self, tmp_path: Path) -> None:
+        """A tree that cannot be deleted is reported as LinkManagementError."""
+        release = tmp_path / "GE-Proton10-20"
+        _make_tree(release)
+        fs = FileSystemClient()
+        remover = TreeRemover(fs, workers=1)
+        remover.discard(release)
+
+        with patch.object(fs, "rmtree", side_effect=OSError("busy")):
+            with pytest.raises(LinkManagementError, match="Failed to delete"):
+                remover.finish()
+
+    def test_background_spawns_detached_process(self, tmp_path: Path) -> None:
+        """Background mode hands the trash to a detached subprocess."""
+        release = tmp_path / "GE-Proton10-20"
+        release.mkdir()
+
+        with patch("protonfetcher.removal.subprocess.Popen") as mock_popen:
+            with TreeRemover(FileSystemClient(), workers=3, background=True) as r:
+                trash = r.discard(release)
+
+        argv = mock_popen.call_args.args[0]
+        assert argv[-3:] == ["--workers", "3", str(trash)]
+        assert argv[2] == "protonfetcher.removal"
+        assert mock_popen.call_args.kwargs["start_new_session"] is True
+        # Deletion was left to the subprocess
+        assert trash.exists()
+
+    def test_background_child_deletes_trash_from_zipapp(self, tmp_path: Path) -> None:
+        """The real child process finds the package inside the zipapp."""
+        package = Path(__file__).resolve().parent.parent / "src" / "protonfetcher"
+        archive = tmp_path / "protonfetcher.pyz"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for source in package.rglob("*.py"):
+                zf.write(source, source.relative_to(package.parent))
+        extract_dir = tmp_path / "compatibilitytools.d"
+        extract_dir.mkdir()
+        _make_tree(extract_dir / "GE-Proton10-20")
+        code = (
+            f"import sys; sys.path.insert(0, {str(archive)!r})\n"
+            "from pathlib import Path\n"
+            "from protonfetcher.filesystem import FileSystemClient\n"
+            "from protonfetcher.removal import TreeRemover\n"
+            "with TreeRemover(FileSystemClient(), background=True) as remover:\n"
+            f"    remover.discard(Path({str(extract_dir / 'GE-Proton10-20')!r}))\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+
+        subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True)
+
+        deadline = time.monotonic() + 30
+        while any(extract_dir.iterdir()) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert list(extract_dir.iterdir()) == []
+
+    def test_background_child_collects_store_garbage(self, tmp_path: Path) -> None:
+        """Objects only the deleted release used leave the store once it is gone."""
+        for i in (1, 2):
+            release = tmp_path / f"GE-Proton10-{i}"
+            release.mkdir()
+            (release / "lib.so").write_bytes(b"s" * MIN_DEDUP_SIZE)
+            (release / "only").write_bytes(bytes([i]) * MIN_DEDUP_SIZE)
+        deduplicate_release(tmp_path, tmp_path / "GE-Proton10-2")
+        store = tmp_path / STORE_NAME
+
+        with TreeRemover(FileSystemClient(), background=True) as remover:
+            remover.discard(tmp_path / "GE-Proton10-1")
+
+        deadline = time.monotonic() + 30
+        while len(list(store.rglob("*-*"))) > 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(list(store.rglob("*-*"))) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            STORE_NAME,
+            "GE-Proton10-2",
+        ]
+
+    def test_background_falls_back_when_spawn_fails(self, tmp_path: Path) -> None:
+        """If the subprocess cannot start, the trash is deleted in-process."""
+        release = tmp_path / "GE-Proton10-20"
+        _make_tree(release)
+
+        with patch(
+            "protonfetcher.removal.subprocess.Popen", side_effect=OSError("no exec")
+        ):
+            with TreeRemover(FileSystemClient(), background=True) as remover:
+                remover.discard(release)
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,156 @@
+"""Import-time budget for the CLI.
+
+Status bars and shell hooks run ``--ls`` and ``--check`` constantly, so the
+CLI must not pay for the download, extraction and network stacks before an
+operation needs them. Each check runs in a fresh interpreter.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import protonfetcher
+from protonfetcher.github_fetcher import GitHubReleaseFetcher
+
+SRC_DIR = Path(protonfetcher.__file__).resolve().parent.parent
+
+# Modules that only fetching, extracting, removing or caching may load
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "hashlib",
+    "http.client",
+    "importlib.metadata",
+    "json",
+    "sqlite3",
+    "ssl",
+    "subprocess",
+    "tarfile",
+    "urllib.request",
+    "protonfetcher.archive_extractor",
+    "protonfetcher.asset_downloader",
+    "protonfetcher.cache_store",
+    "protonfetcher.checksums",
+    "protonfetcher.decompression",
+    "protonfetcher.dedup",
+    "protonfetcher.metrics",
+    "protonfetcher.network",
+    "protonfetcher.parallel_extract",
+    "protonfetcher.release_manager",
+    "protonfetcher.removal",
+)
+
+# Cumulative import time of protonfetcher.cli.core, with bytecode cached.
+# Generous, so slow CI machines pass while a regression to eagerly importing
+# the fetch stack (several times this) does not.
+IMPORT_BUDGET_MS = 150
+
+_LOADED_MODULES = """
+import sys
+{setup}
+{code}
+print("\\n" + repr(sorted(name for name in {heavy!r} if name in sys.modules)))
+"""
+
+
+def _python(code: str, *args: str) -> "subprocess.CompletedProcess[str]":
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def _loaded_heavy_modules(code: str, setup: str = "") -> list[str]:
+    output = _python(
+        _LOADED_MODULES.format(setup=setup, code=code, heavy=HEAVY_MODULES)
+    )
+    return eval(output.stdout.strip().splitlines()[-1])
+
+
+class TestImportBudget:
+    """Tests for what starting the CLI costs."""
+
+    def test_cli_import_loads_no_heavy_modules(self) -> None:
+        assert _loaded_heavy_modules("import protonfetcher.cli.core") == []
+
+    @pytest.mark.parametrize("operation", ["--ls", "--relink", "--prune"])
+    def test_offline_operations_load_no_heavy_modules(
+        self, operation: str, tmp_path: Path
+    ) -> None:
+        """Offline operations build neither a network client nor fetch components."""
+        extract_dir = tmp_path / "compatibilitytools.d"
+        (extract_dir / "GE-Proton10-20").mkdir(parents=True)
+        (extract_dir / "GE-Proton").symlink_to("GE-Proton10-20")
+        argv = ["protonfetcher", operation, "-f", "GE-Proton", "-x", str(extract_dir)]
+        setup = (
+            f"sys.argv = {argv!r}\n"
+            # --prune asks for confirmation
+            "sys.stdin = __import__('io').StringIO('n\\n')"
+        )
+        code = (
+            "from protonfetcher.cli.core import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+
+        assert _loaded_heavy_modules(code, setup) == []
+
+    def test_json_listing_loads_json_only(self, tmp_path: Path) -> None:
+        """--ls --json needs json, and nothing else from the fetch stack."""
+        argv = ["protonfetcher", "--ls", "--json", "-x", str(tmp_path)]
+        code = "from protonfetcher.cli.core import main\nmain()"
+        output = _loaded_heavy_modules(code, f"sys.argv = {argv!r}")
+        assert output == ["json"]
+
+    def test_cli_import_time_within_budget(self) -> None:
+        """Importing the CLI stays within IMPORT_BUDGET_MS (best of 3)."""
+        code = "import protonfetcher.cli.core"
+        _python(code)  # warm the bytecode cache
+        timings = []
+        for _ in range(3):
+            lines = _python(code, "-X", "importtime").stderr.splitlines()
+            core = next(
+                line for line in lines if line.endswith("| protonfetcher.cli.core")
+            )
+            timings.append(int(core.split("|")[1]) / 1000)
+
+        assert min(timings) < IMPORT_BUDGET_MS, (
+            f"importing protonfetcher.cli.core took {min(timings):.1f}ms"
+        )
+
+
+class TestLazyComponents:
+    """Tests for building fetcher components on first use."""
+
+    def test_components_are_built_once_on_first_use(self) -> None:
+        fetcher = GitHubReleaseFetcher(download_connections=2)
+
+        assert "release_manager" not in vars(fetcher)
+        assert "asset_downloader" not in vars(fetcher)
+        downloader = fetcher.asset_downloader
+        assert fetcher.asset_downloader is downloader
+        assert downloader.connections == 2
+        # The downloader needed the network client, but not the release manager
+        assert vars(fetcher)["network_client"] is downloader.network_client
+        assert "release_manager" not in vars(fetcher)
+
+    def test_assigned_components_replace_built_ones(self) -> None:
+        """Tests and callers can still swap a component by assignment."""
+        fetcher = GitHubReleaseFetcher()
+        replacement = object()
+
+        fetcher.link_manager = replacement  # type: ignore[assignment]
+
+        assert fetcher.link_manager is replacement
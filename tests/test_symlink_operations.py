@@ -4,15 +4,19 @@ Tests the standalone symlink creation, cleanup, and comparison functions
 independently of LinkManager orchestration.
 """
 
+import os
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from protonfetcher.filesystem import FileSystemClient
 from protonfetcher.symlink_operations import (
     cleanup_unwanted_links,
-    compare_targets,
     create_symlink_specs,
     create_symlinks,
-    handle_existing_symlink,
+    points_to,
+    swap_symlink,
 )
 
 
@@ -181,6 +185,82 @@ class TestCreateSymlinks:
         assert fb1.is_symlink() and fb1.resolve() == v2
 
 
+class TestSymlinkSwap:
+    """Tests for the rename-based link update."""
+
+    @staticmethod
+    def _setup(tmp_path: Path) -> tuple[Path, Path, Path]:
+        v1 = tmp_path / "GE-Proton10-20"
+        v2 = tmp_path / "GE-Proton10-19"
+        v1.mkdir()
+        v2.mkdir()
+        return tmp_path / "GE-Proton", v1, v2
+
+    def test_points_to_compares_stored_value(self, tmp_path: Path) -> None:
+        link, v1, v2 = self._setup(tmp_path)
+        link.symlink_to(v1.name)
+        fs = FileSystemClient()
+
+        with patch.object(fs, "resolve") as resolve:
+            assert points_to(link, v1, fs) is True
+            assert points_to(link, v2, fs) is False
+            assert points_to(tmp_path / "missing", v1, fs) is False
+        resolve.assert_not_called()
+
+    def test_existing_link_is_replaced_without_unlink(self, tmp_path: Path) -> None:
+        link, v1, v2 = self._setup(tmp_path)
+        link.symlink_to(v2.name)
+        fs = FileSystemClient()
+
+        with patch.object(fs, "unlink", wraps=fs.unlink) as unlink:
+            create_symlinks(link, tmp_path / "fb1", tmp_path / "fb2", [((), v1)], fs)
+
+        assert os.readlink(link) == v1.name
+        # Only the (absent) temporary name is cleared; the link itself never is
+        assert all(call.args[0] != link for call in unlink.call_args_list)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "GE-Proton",
+            "GE-Proton10-19",
+            "GE-Proton10-20",
+        ]
+
+    def test_correct_links_are_skipped(self, tmp_path: Path) -> None:
+        link, v1, v2 = self._setup(tmp_path)
+        fb1 = tmp_path / "GE-Proton-Fallback"
+        link.symlink_to(v1.name)
+        fb1.symlink_to(v1)  # absolute, wrong target
+        fs = FileSystemClient()
+
+        with patch.object(fs, "symlink_to", wraps=fs.symlink_to) as symlink_to:
+            create_symlinks(link, fb1, tmp_path / "fb2", [((), v1), ((), v2)], fs)
+
+        assert symlink_to.call_count == 1
+        assert os.readlink(fb1) == v2.name
+
+    def test_stale_temporary_link_is_replaced(self, tmp_path: Path) -> None:
+        link, v1, _ = self._setup(tmp_path)
+        stale = tmp_path / f".GE-Proton.tmp{os.getpid()}"
+        stale.symlink_to("elsewhere")
+
+        swap_symlink(link, Path(v1.name), FileSystemClient())
+
+        assert os.readlink(link) == v1.name
+        assert not os.path.lexists(stale)
+
+    def test_failed_rename_removes_temporary_link(self, tmp_path: Path) -> None:
+        link, v1, _ = self._setup(tmp_path)
+        fs = FileSystemClient()
+
+        with patch.object(fs, "rename", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                swap_symlink(link, Path(v1.name), fs)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "GE-Proton10-19",
+            "GE-Proton10-20",
+        ]
+
+
 class TestCleanupUnwantedLinks:
     """Tests for cleanup_unwanted_links function."""
 
@@ -220,76 +300,3 @@ class TestCleanupUnwantedLinks:
         cleanup_unwanted_links(main, fb1, fb2, wants, fs)
 
         assert not fb1.exists()
-
-
-class TestCompareTargets:
-    """Tests for compare_targets function."""
-
-    def test_matching_targets(self, tmp_path: Path) -> None:
-        """Test that matching paths return True."""
-        fs = FileSystemClient()
-        v1 = tmp_path / "GE-Proton10-20"
-        v1.mkdir()
-        assert compare_targets(v1, v1, fs) is True
-
-    def test_different_targets(self, tmp_path: Path) -> None:
-        """Test that different paths return False."""
-        fs = FileSystemClient()
-        v1 = tmp_path / "GE-Proton10-20"
-        v2 = tmp_path / "GE-Proton10-19"
-        v1.mkdir()
-        v2.mkdir()
-        assert compare_targets(v1, v2, fs) is False
-
-    def test_nonexistent_target_returns_false(self, tmp_path: Path) -> None:
-        """Test that nonexistent target returns False."""
-        fs = FileSystemClient()
-        v1 = tmp_path / "GE-Proton10-20"
-        v1.mkdir()
-        nonexistent = tmp_path / "GE-Proton99-99"
-        assert compare_targets(v1, nonexistent, fs) is False
-
-
-class TestHandleExistingSymlink:
-    """Tests for handle_existing_symlink function."""
-
-    def test_correct_symlink_unchanged(self, tmp_path: Path) -> None:
-        """Test that correct symlink is not modified."""
-        fs = FileSystemClient()
-        link = tmp_path / "GE-Proton"
-        v1 = tmp_path / "GE-Proton10-20"
-        v1.mkdir()
-        fs.symlink_to(link, v1, target_is_directory=True)
-
-        handle_existing_symlink(link, v1, fs)
-
-        assert link.is_symlink()
-        assert link.resolve() == v1
-
-    def test_wrong_symlink_removed(self, tmp_path: Path) -> None:
-        """Test that wrong symlink is removed."""
-        fs = FileSystemClient()
-        link = tmp_path / "GE-Proton"
-        v1 = tmp_path / "GE-Proton10-20"
-        v2 = tmp_path / "GE-Proton10-19"
-        v1.mkdir()
-        v2.mkdir()
-        fs.symlink_to(link, v1, target_is_directory=True)
-
-        handle_existing_symlink(link, v2, fs)
-
-        assert not link.exists()
-
-    def test_broken_symlink_removed(self, tmp_path: Path) -> None:
-        """Test that broken symlink is removed."""
-        fs = FileSystemClient()
-        link = tmp_path / "GE-Proton"
-        v1 = tmp_path / "GE-Proton10-20"
-        v1.mkdir()
-        fs.symlink_to(link, v1, target_is_directory=True)
-        # Remove the target to create a broken symlink
-        v1.rmdir()
-
-        handle_existing_symlink(link, v1, fs)
-
-        assert not link.exists()
@@ -0,0 +1,219 @@
+"""Tests for protonfetcher.tracing module."""
+
+import asyncio
+import json
+import shutil
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from protonfetcher import tracing
+from protonfetcher.cli.core import main
+from protonfetcher.common import ForkName, ProcessResult
+from protonfetcher.filesystem import FileSystemClient
+from protonfetcher.network import AsyncNetworkClient, NetworkClient
+from protonfetcher.release_manager import ReleaseManager
+
+
+@pytest.fixture
+def tracer() -> Iterator[tracing.Tracer]:
+    """An active tracer, stopped again after the test."""
+    yield tracing.start_tracing()
+    tracing.stop_tracing()
+
+
+def _spans(tracer: tracing.Tracer) -> dict[str, dict[str, Any]]:
+    return {e["name"]: e for e in tracer.events() if e["ph"] == "X"}
+
+
+class TestTracer:
+    """Tests for span recording."""
+
+    def test_nested_spans_carry_args_and_counts(self, tracer: tracing.Tracer) -> None:
+        """annotate() targets the innermost span, count() every open span."""
+        with tracing.span("outer", repo="owner/repo"):
+            with tracing.span("inner", "http"):
+                tracing.annotate(status=200)
+                tracing.count(requests=1)
+            tracing.count(requests=1, bytes=10)
+
+        spans = _spans(tracer)
+        assert spans["outer"]["args"] == {
+            "repo": "owner/repo",
+            "requests": 2,
+            "bytes": 10,
+        }
+        assert spans["inner"]["args"] == {"status": 200, "requests": 1}
+        assert spans["inner"]["cat"] == "http"
+        outer, inner = spans["outer"], spans["inner"]
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_records_errors(self, tracer: tracing.Tracer) -> None:
+        """A span left by an exception records it and re-raises."""
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+
+        assert _spans(tracer)["failing"]["args"]["error"] == "ValueError: boom"
+
+    def test_threads_get_named_tracks(self, tracer: tracing.Tracer) -> None:
+        """Spans from worker threads land on their own, named track."""
+
+        def work() -> None:
+            with tracing.span("segment", "download"):
+                tracing.count(bytes=5)
+
+        worker = threading.Thread(target=work, name="range-download_0")
+        with tracing.span("download"):
+            worker.start()
+            worker.join()
+
+        events = tracer.events()
+        spans = _spans(tracer)
+        names = {e["tid"]: e["args"]["name"] for e in events if e["ph"] == "M"}
+        assert names[spans["segment"]["tid"]] == "range-download_0"
+        assert spans["segment"]["tid"] != spans["download"]["tid"]
+        # Counts stay on the thread that made them
+        assert "bytes" not in spans["download"]["args"]
+
+    def test_spans_are_noops_while_off(self) -> None:
+        """Without a tracer, spans and annotations record nothing."""
+        assert tracing.get_tracer() is None
+
+        @tracing.traced("decorated")
+        def double(value: int) -> int:
+            tracing.annotate(value=value)
+            return value * 2
+
+        with tracing.span("ignored") as span:
+            span.set(status=200)
+            tracing.count(requests=1)
+            assert double(2) == 4
+        assert span.args == {}
+
+
+class TestRecord:
+    """Tests for writing a trace file."""
+
+    def test_writes_trace_event_json(self, tmp_path: Path) -> None:
+        """The file is Chrome trace-event JSON covering the whole block."""
+        path = tmp_path / "trace.json"
+
+        with tracing.record(path, argv=["--ls"]):
+            with tracing.span("work"):
+                pass
+
+        assert tracing.get_tracer() is None
+        document = json.loads(path.read_text())
+        assert document["displayTimeUnit"] == "ms"
+        events = document["traceEvents"]
+        assert events[0]["name"] == "process_name"
+        spans = {e["name"]: e for e in events if e["ph"] == "X"}
+        assert spans["protonfetcher"]["args"] == {"argv": ["--ls"]}
+        assert set(spans["work"]) >= {"ts", "dur", "pid", "tid", "cat"}
+
+    def test_writes_trace_when_block_fails(self, tmp_path: Path) -> None:
+        """A failing run still leaves its trace behind."""
+        path = tmp_path / "trace.json"
+
+        with pytest.raises(SystemExit):
+            with tracing.record(path):
+                raise SystemExit(1)
+
+        spans = json.loads(path.read_text())["traceEvents"]
+        assert any(e.get("args", {}).get("error") for e in spans)
+
+    def test_no_path_records_nothing(self) -> None:
+        """Without a path no tracer is installed."""
+        with tracing.record(None):
+            assert tracing.get_tracer() is None
+
+
+class TestInstrumentation:
+    """Tests for the spans recorded by fetcher components."""
+
+    def test_asset_size_records_cache_hits_and_misses(
+        self,
+        tracer: tracing.Tracer,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The size lookup says where the size came from."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        network = MagicMock()
+        network.head.return_value = ProcessResult(
+            args=[],
+            returncode=0,
+            stdout="HTTP/1.1 200 OK\r\nContent-Length: 4096\r\n\r\n",
+            stderr="",
+        )
+        manager = ReleaseManager(network, FileSystemClient())
+
+        with tracing.span("first"):
+            manager.get_remote_asset_size("owner/repo", "v1", "a.tar.gz")
+        with tracing.span("second"):
+            manager.get_remote_asset_size("owner/repo", "v1", "a.tar.gz")
+
+        spans = [e for e in tracer.events() if e["ph"] == "X"]
+        first, second = (e["args"] for e in spans if e["name"] == "asset_size")
+        assert first == {"size_cache_misses": 1, "source": "network"}
+        assert second == {"size_cache_hits": 1, "source": "cache"}
+        assert network.head.call_count == 1
+
+    @pytest.mark.skipif(shutil.which("curl") is None, reason="curl not installed")
+    def test_async_curl_requests_are_spans(self, tracer: tracing.Tracer) -> None:
+        """Concurrent curl requests (--check) are spans counted by their phase."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            url = f"http://127.0.0.1:{sock.getsockname()[1]}/releases/latest"
+        client = AsyncNetworkClient(NetworkClient(timeout=5))
+
+        async def check() -> None:
+            await asyncio.gather(client.get(url), client.head(url))
+
+        with tracing.span("check"):
+            asyncio.run(check())
+
+        spans = [e for e in tracer.events() if e["ph"] == "X"]
+        http_spans = [e for e in spans if e["cat"] == "http"]
+        assert sorted(e["name"].split()[0] for e in http_spans) == ["GET", "HEAD"]
+        # Nothing listens on the port: curl's "couldn't connect"
+        assert {e["args"]["returncode"] for e in http_spans} == {7}
+        # Concurrent requests do not count each other
+        assert all("requests" not in e["args"] for e in http_spans)
+        assert _spans(tracer)["check"]["args"]["requests"] == 2
+        assert tracer.totals["requests"] == 2
+
+    def test_cli_trace_flag_writes_trace(
+        self, tmp_path: Path, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--trace FILE writes the phases of the run to FILE."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        extract_dir = tmp_path / "compatibilitytools.d"
+        (extract_dir / "GE-Proton10-20").mkdir(parents=True)
+        (extract_dir / "GE-Proton").symlink_to("GE-Proton10-20")
+        trace_path = tmp_path / "trace.json"
+        mocker.patch(
+            "sys.argv",
+            [
+                "protonfetcher",
+                "--ls",
+                "-f",
+                ForkName.GE_PROTON.value,
+                "-x",
+                str(extract_dir),
+                "--trace",
+                str(trace_path),
+            ],
+        )
+
+        main()
+
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        names = {e["name"] for e in events if e["ph"] == "X"}
+        assert {"protonfetcher", "snapshot_links"} <= names
@@ -3,7 +3,11 @@
 import pytest
 
 from protonfetcher.common import ForkName
-from protonfetcher.utils import parse_version
+from protonfetcher.utils import (
+    PARSE_VERSION_CACHE_SIZE,
+    compare_versions,
+    parse_version,
+)
 
 
 class TestParseVersion:
@@ -127,3 +131,39 @@ class TestParseVersion:
                 "proton-cachyos-10.0-20260227-slr-x86_64", ForkName.CACHYOS
             )
             assert v2 > v1
+
+    class TestMemoization:
+        """Tests for the parse_version cache."""
+
+        def test_repeated_tags_share_one_tuple(self) -> None:
+            v1 = parse_version("GE-Proton10-20", ForkName.GE_PROTON)
+            v2 = parse_version("GE-Proton10-20", ForkName.GE_PROTON)
+            assert v1 is v2
+
+        def test_versions_of_a_fork_share_the_prefix(self) -> None:
+            v1 = parse_version("EM-10.0-30", ForkName.PROTON_EM)
+            v2 = parse_version("proton-EM-10.0-31", ForkName.PROTON_EM)
+            assert v1[0] is v2[0]
+
+        def test_same_tag_is_parsed_per_fork(self) -> None:
+            assert parse_version("EM-10.0-30", ForkName.PROTON_EM) == (
+                "EM",
+                10,
+                0,
+                30,
+            )
+            assert parse_version("EM-10.0-30", ForkName.GE_PROTON) == (
+                "EM-10.0-30",
+                0,
+                0,
+                0,
+            )
+
+        def test_cache_is_bounded(self) -> None:
+            assert parse_version.cache_info().maxsize == PARSE_VERSION_CACHE_SIZE
+
+        def test_compare_versions_uses_cached_results(self) -> None:
+            parse_version.cache_clear()
+            for _ in range(3):
+                assert compare_versions("GE-Proton10-21", "GE-Proton10-20") == 1
+            assert parse_version.cache_info().misses == 2
@@ -4,18 +4,23 @@ Tests version discovery, fork-specific filtering, and deduplication
 as standalone functions (no LinkManager dependency).
 """
 
+import os
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from protonfetcher.common import ForkName
+from protonfetcher.common import FORKS, ForkName, classify_dir_name
 from protonfetcher.filesystem import FileSystemClient
+from protonfetcher.utils import parse_version
 from protonfetcher.version_finder import (
     _deduplicate_candidates,
     _get_tag_name,
     _is_valid_proton_directory,
     _should_skip_directory,
     find_version_candidates,
+    get_directory_index,
 )
 
 
@@ -111,6 +116,72 @@ class TestIsValidProtonDirectory:
             assert _is_valid_proton_directory(tmp_path / name, fork) is False
 
 
+class TestClassifyDirName:
+    """Test the combined directory name matcher."""
+
+    @pytest.mark.parametrize(
+        "dir_name,expected",
+        [
+            (
+                "GE-Proton10-20-RC1",
+                (ForkName.GE_PROTON, "GE-Proton10-20-RC1", ("GE-Proton", 10, 0, 20)),
+            ),
+            (
+                "proton-EM-10.0-36-HDRTEST",
+                (ForkName.PROTON_EM, "EM-10.0-36-HDRTEST", ("EM", 10, 0, 36)),
+            ),
+            (
+                "proton-cachyos-10.0-20260207-slr-x86_64",
+                (
+                    ForkName.CACHYOS,
+                    "cachyos-10.0-20260207-slr",
+                    ("cachyos", 10, 0, 20260207),
+                ),
+            ),
+            (
+                "cachyos-10.0-20260207-slr-x86_64",
+                (
+                    ForkName.CACHYOS,
+                    "cachyos-10.0-20260207-slr-x86_64",
+                    ("cachyos", 10, 0, 20260207),
+                ),
+            ),
+            (
+                "dwproton-10.0-26-x86_64",
+                (ForkName.DW_PROTON, "dwproton-10.0-26", ("dwproton", 10, 0, 26)),
+            ),
+            ("dwproton-10.0-26", None),
+            ("proton-cachyos-10.0-20260207-slrx", None),
+            ("LegacyRuntime", None),
+        ],
+    )
+    def test_classification(self, dir_name: str, expected: tuple | None) -> None:
+        assert classify_dir_name(dir_name) == expected
+
+    @pytest.mark.parametrize(
+        "dir_name",
+        [
+            "GE-Proton10-20",
+            "EM-10.0-30",
+            "proton-EM-10.0-30",
+            "cachyos-10.0-20260207-slr",
+            "proton-cachyos-10.0-20260207-slr-x86_64",
+            "dwproton-10.0-26-x86_64",
+            "dwproton-10.0-26-x86_64-hotfix",
+        ],
+    )
+    def test_agrees_with_per_fork_helpers(self, tmp_path: Path, dir_name: str) -> None:
+        entry = tmp_path / dir_name
+        matching = [f for f in FORKS if _is_valid_proton_directory(entry, f)]
+        classified = classify_dir_name(dir_name)
+
+        assert classified is not None
+        fork, tag, version = classified
+        assert matching == [fork]
+        assert tag == _get_tag_name(entry, fork)
+        assert version == parse_version(tag, fork)
+
+
 class TestFindVersionCandidates:
     """Test find_version_candidates function."""
 
@@ -249,6 +320,81 @@ class TestFindVersionCandidates:
         assert hdrtest_candidate[0][3] == 36
 
 
+class TestDirectoryIndex:
+    """Test the shared single-scan directory index."""
+
+    @staticmethod
+    def _populate(directory: Path) -> None:
+        for name in (
+            "GE-Proton10-20",
+            "proton-EM-10.0-30",
+            "proton-cachyos-10.0-20260102-slr-x86_64",
+            "dwproton-10.0-14-x86_64",
+            "LegacyRuntime",
+        ):
+            (directory / name).mkdir()
+        (directory / "GE-Proton").symlink_to(directory / "GE-Proton10-20")
+        (directory / "notes.txt").write_text("x")
+
+    @staticmethod
+    def _age(directory: Path) -> None:
+        """Move the directory mtime out of the racy window."""
+        past = time.time() - 60
+        os.utime(directory, (past, past))
+
+    def test_index_matches_per_fork_classification(self, tmp_path: Path) -> None:
+        self._populate(tmp_path)
+        index = get_directory_index(tmp_path, FileSystemClient())
+
+        assert len(index.entries) == 7
+        for fork in FORKS:
+            names = [path.name for _, path in index.candidates[fork]]
+            assert len(names) == 1
+            assert all(_is_valid_proton_directory(tmp_path / n, fork) for n in names)
+
+    def test_one_listing_shared_across_forks(self, tmp_path: Path) -> None:
+        self._populate(tmp_path)
+        self._age(tmp_path)
+        fs = FileSystemClient()
+
+        with patch.object(fs, "scandir", wraps=fs.scandir) as scandir:
+            results = {
+                fork: find_version_candidates(tmp_path, fork, fs) for fork in FORKS
+            }
+
+        assert scandir.call_count == 1
+        assert all(len(candidates) == 1 for candidates in results.values())
+
+    def test_changed_directory_is_rescanned(self, tmp_path: Path) -> None:
+        self._populate(tmp_path)
+        self._age(tmp_path)
+        fs = FileSystemClient()
+        assert len(find_version_candidates(tmp_path, ForkName.GE_PROTON, fs)) == 1
+
+        (tmp_path / "GE-Proton10-21").mkdir()
+
+        assert len(find_version_candidates(tmp_path, ForkName.GE_PROTON, fs)) == 2
+
+    def test_recently_modified_directory_is_not_reused(self, tmp_path: Path) -> None:
+        self._populate(tmp_path)
+        fs = FileSystemClient()
+
+        with patch.object(fs, "scandir", wraps=fs.scandir) as scandir:
+            find_version_candidates(tmp_path, ForkName.GE_PROTON, fs)
+            find_version_candidates(tmp_path, ForkName.GE_PROTON, fs)
+
+        assert scandir.call_count == 2
+
+    def test_returned_list_is_a_copy(self, tmp_path: Path) -> None:
+        self._populate(tmp_path)
+        self._age(tmp_path)
+        fs = FileSystemClient()
+
+        find_version_candidates(tmp_path, ForkName.GE_PROTON, fs).clear()
+
+        assert len(find_version_candidates(tmp_path, ForkName.GE_PROTON, fs)) == 1
+
+
 class TestDeduplicateCandidates:
     """Test _deduplicate_candidates function."""
 